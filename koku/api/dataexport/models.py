@@ -34,6 +34,16 @@ class DataExportRequest(models.Model):
     class Meta:
         ordering = ("created_timestamp",)
 
+    def get_synced_keys(self):
+        """Get the keys already copied to the customer bucket by previous attempts."""
+        return set(self.synced_keys.values_list("key", flat=True))
+
+    def save_synced_keys(self, synced_keys):
+        """Checkpoint keys newly copied to the customer bucket."""
+        DataExportSyncedKey.objects.bulk_create(
+            [DataExportSyncedKey(data_export_request=self, key=key) for key in synced_keys], ignore_conflicts=True
+        )
+
     def __str__(self):
         """Get the string representation."""
         return self.__repr__()
@@ -54,3 +64,15 @@ class DataExportRequest(models.Model):
             f"bucket_name: {self.bucket_name}, created_by: {created_by}, "
             f"created_timestamp: {created_timestamp}, updated_timestamp: {updated_timestamp}"
         )
+
+
+class DataExportSyncedKey(models.Model):
+    """A file already copied to the customer bucket, so that a retried sync resumes where it stopped."""
+
+    data_export_request = models.ForeignKey(
+        "DataExportRequest", null=False, on_delete=models.CASCADE, related_name="synced_keys"
+    )
+    key = models.TextField(null=False)
+
+    class Meta:
+        unique_together = ("data_export_request", "key")
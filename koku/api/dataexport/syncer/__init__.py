@@ -1,7 +1,11 @@
 """Data export syncer."""
 import logging
+import time
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from datetime import timedelta
 from itertools import product
 
@@ -14,8 +18,11 @@ from django.conf import settings
 from django.utils.translation import gettext as _
 
 from api.provider.models import Provider
+from masu.prometheus_stats import DATA_EXPORT_SYNCED_BYTES_COUNTER
+from masu.prometheus_stats import DATA_EXPORT_SYNCED_OBJECTS_COUNTER
 
 LOG = logging.getLogger(__name__)
+SYNC_CHECKPOINT_INTERVAL = 100  # copied files between checkpoints of the synced keys
 
 
 class SyncedFileInColdStorageError(Exception):
@@ -35,7 +42,7 @@ class SyncerInterface(ABC):
     """Data syncer interface."""
 
     @abstractmethod
-    def sync_bucket(self, schema_name, destination_bucket_name, date_range):
+    def sync_bucket(self, schema_name, destination_bucket_name, date_range, synced_keys=None, checkpoint=None):
         """
         Sync all files in our bucket for one account to customer account.
 
@@ -43,6 +50,8 @@ class SyncerInterface(ABC):
             schema_name (str): account schema name to sync
             destination_bucket_name (str): name of the customer bucket
             date_range (tuple): Pair of date objects of inclusive start and exclusive end dates for which to sync data.
+            synced_keys (set): keys copied by a previous attempt, which are skipped. Updated with the copied keys.
+            checkpoint (callable): called with the keys copied since its last call, periodically and when the sync stops
 
         Returns:
             None
@@ -63,28 +72,33 @@ class AwsS3Syncer(SyncerInterface):
         """
         self.s3_resource = boto3.resource("s3", settings.S3_REGION)
         self.s3_source_bucket = self.s3_resource.Bucket(s3_source_bucket_name)
+        # resources are not thread safe, so the copy threads share the low level client instead
+        self.s3_client = self.s3_resource.meta.client
 
-    def _copy_object(self, s3_destination_bucket, source_object):
+    def _copy_object(self, s3_destination_bucket_name, source_object):
         """
         Copy a source object to the destination bucket.
 
         Args:
-            s3_destination_bucket (boto3.s3.Bucket): the destination bucket object
-            source_object (boto3.s3.Object): our source object
+            s3_destination_bucket_name (str): name of the destination bucket
+            source_object (boto3.s3.ObjectSummary): our source object
 
         """
-        LOG.debug("copying S3 object %s to %s", source_object.key, s3_destination_bucket)
+        LOG.debug("copying S3 object %s to %s", source_object.key, s3_destination_bucket_name)
         try:
-            destination_object = s3_destination_bucket.Object(source_object.key)
-            destination_object.copy_from(
+            self.s3_client.copy_object(
                 ACL="bucket-owner-full-control",
+                Bucket=s3_destination_bucket_name,
+                Key=source_object.key,
                 CopySource={"Bucket": source_object.bucket_name, "Key": source_object.key},
             )
         except ClientError as e:
             # If we run into an InvalidObjectState error, and object is in glacier, retrieve it
             if source_object.storage_class == "GLACIER" and e.response["Error"]["Code"] == "InvalidObjectState":
                 request = {"Days": 2, "GlacierJobParameters": {"Tier": "Standard"}}
-                source_object.restore_object(RestoreRequest=request)
+                self.s3_client.restore_object(
+                    Bucket=source_object.bucket_name, Key=source_object.key, RestoreRequest=request
+                )
                 LOG.info(_("Glacier Storage restore for %s is in progress."), source_object.key)
                 raise SyncedFileInColdStorageError(
                     f"Requested file {source_object.key} is currently in AWS Glacier Storage, "
@@ -99,14 +113,87 @@ class AwsS3Syncer(SyncerInterface):
                 )
             raise e
 
-    def sync_bucket(self, schema_name, s3_destination_bucket_name, date_range):
+    def _source_objects(self, schema_name, date_range):
+        """
+        Generate the source objects of the month level and day files of every provider in the date range.
+
+        Args:
+            schema_name (str): account schema name to sync
+            date_range (tuple): Pair of date objects of inclusive start and exclusive end dates for which to sync data.
+
+        """
+        start_date, end_date = date_range
+        # rrule is inclusive for both dates, so we need to make end_date exclusive
+        end_date = end_date - timedelta(days=1)
+        days = rrule(DAILY, dtstart=start_date, until=end_date)
+        months = rrule(MONTHLY, dtstart=start_date, until=end_date)
+        providers = Provider.objects.filter(customer__schema_name=schema_name).all()
+
+        # The month level files have the 00 day, followed by all the day files
+        prefix_dates = [(month, 0) for month in months] + [(day, day.day) for day in days]
+        for (prefix_date, day), provider in product(prefix_dates, providers):
+            # We need to normalize capitalization and "-local" dev providers.
+            provider_slug = provider.type.lower().split("-")[0]
+            prefix = (
+                f"{settings.S3_BUCKET_PATH}/{schema_name}/"
+                f"{provider_slug}/{provider.uuid}/"
+                f"{prefix_date.year:04d}/{prefix_date.month:02d}/{day:02d}/"
+            )
+            LOG.debug("sync_bucket checking prefix %s", prefix)
+            yield from self.s3_source_bucket.objects.filter(Prefix=prefix)
+
+    def _record_copies(self, done, pending, synced_keys, progress, checkpoint):
+        """
+        Record the finished copies, checkpointing the newly synced keys every SYNC_CHECKPOINT_INTERVAL copies.
+
+        Args:
+            done (set): finished copy futures
+            pending (dict): source objects keyed by their copy future
+            synced_keys (set): keys copied to the destination bucket
+            progress (dict): copied objects and bytes, keys not yet checkpointed and keys waiting on cold storage
+            checkpoint (callable): called with the keys copied since its last call to save them
+
+        Raises:
+            The first copy error, after the successful copies among the finished futures are recorded
+
+        """
+        first_error = None
+        for future in done:
+            source_object = pending.pop(future)
+            try:
+                future.result()
+            except SyncedFileInColdStorageError:
+                progress["cold"].append(source_object.key)
+                continue
+            except Exception as error:
+                first_error = first_error or error
+                continue
+            synced_keys.add(source_object.key)
+            progress["unsaved"].append(source_object.key)
+            progress["objects"] += 1
+            progress["bytes"] += source_object.size
+            DATA_EXPORT_SYNCED_OBJECTS_COUNTER.inc()
+            DATA_EXPORT_SYNCED_BYTES_COUNTER.inc(source_object.size)
+            if checkpoint and len(progress["unsaved"]) >= SYNC_CHECKPOINT_INTERVAL:
+                checkpoint(progress["unsaved"])
+                progress["unsaved"] = []
+        if first_error:
+            raise first_error
+
+    def sync_bucket(self, schema_name, s3_destination_bucket_name, date_range, synced_keys=None, checkpoint=None):
         """
         Sync buckets if the ENABLE_S3_ARCHIVING flag is set.
 
+        Objects are copied server side by up to DATA_EXPORT_SYNC_MAX_WORKERS threads while the source prefixes
+        are listed. Files in cold storage do not stop the sync: their restores are requested, the other files
+        are copied, and SyncedFileInColdStorageError is raised at the end.
+
         Args:
             schema_name (str): account schema name to sync
             s3_destination_bucket_name (str): name of the customer bucket
             date_range (tuple): Pair of date objects of inclusive start and exclusive end dates for which to sync data.
+            synced_keys (set): keys copied by a previous attempt, which are skipped. Updated with the copied keys.
+            checkpoint (callable): called with the keys copied since its last call, periodically and when the sync stops
 
         """
         if settings.ENABLE_S3_ARCHIVING:
@@ -117,39 +204,47 @@ class AwsS3Syncer(SyncerInterface):
                 date_range[0],
                 date_range[1],
             )
-            start_date, end_date = date_range
-            # rrule is inclusive for both dates, so we need to make end_date exclusive
-            end_date = end_date - timedelta(days=1)
-            days = rrule(DAILY, dtstart=start_date, until=end_date)
-            months = rrule(MONTHLY, dtstart=start_date, until=end_date)
-            s3_destination_bucket = self.s3_resource.Bucket(s3_destination_bucket_name)
-            providers = Provider.objects.filter(customer__schema_name=schema_name).all()
-
-            # Copy the specific month level files
-            for month, provider in product(months, providers):
-                # We need to normalize capitalization and "-local" dev providers.
-                provider_slug = provider.type.lower().split("-")[0]
-                prefix = (
-                    f"{settings.S3_BUCKET_PATH}/{schema_name}/"
-                    f"{provider_slug}/{provider.uuid}/"
-                    f"{month.year:04d}/{month.month:02d}/00/"
-                )
-                LOG.debug("sync_bucket checking prefix %s", prefix)
-                for source_object in self.s3_source_bucket.objects.filter(Prefix=prefix):
-                    self._copy_object(s3_destination_bucket, source_object)
-
-            # Copy all the day files
-            for day, provider in product(days, providers):
-                # We need to normalize capitalization and "-local" dev providers.
-                provider_slug = provider.type.lower().split("-")[0]
-                prefix = (
-                    f"{settings.S3_BUCKET_PATH}/{schema_name}/"
-                    f"{provider_slug}/{provider.uuid}/"
-                    f"{day.year:04d}/{day.month:02d}/{day.day:02d}/"
+            if synced_keys is None:
+                synced_keys = set()
+            if synced_keys:
+                LOG.info("Resuming sync_bucket, skipping %s already synced files", len(synced_keys))
+            max_workers = max(settings.DATA_EXPORT_SYNC_MAX_WORKERS, 1)
+            progress = {"objects": 0, "bytes": 0, "unsaved": [], "cold": []}
+            pending = {}
+            t1 = time.time()
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="koku-export-sync") as executor:
+                    queued_keys = set()
+                    for source_object in self._source_objects(schema_name, date_range):
+                        if source_object.key in synced_keys or source_object.key in queued_keys:
+                            continue
+                        queued_keys.add(source_object.key)
+                        # two copies per worker keep the workers busy while the next prefix is listed
+                        if len(pending) >= max_workers * 2:
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            self._record_copies(done, pending, synced_keys, progress, checkpoint)
+                        future = executor.submit(self._copy_object, s3_destination_bucket_name, source_object)
+                        pending[future] = source_object
+                    done, _ = wait(pending)
+                    self._record_copies(done, pending, synced_keys, progress, checkpoint)
+            finally:
+                if checkpoint and progress["unsaved"]:
+                    checkpoint(progress["unsaved"])
+
+            duration = max(time.time() - t1, 0.001)
+            LOG.info(
+                "Copied %s files (%s bytes) to %s in %.2f seconds (%.1f files/s)",
+                progress["objects"],
+                progress["bytes"],
+                s3_destination_bucket_name,
+                duration,
+                progress["objects"] / duration,
+            )
+            if progress["cold"]:
+                raise SyncedFileInColdStorageError(
+                    f"{len(progress['cold'])} requested files are in AWS Glacier Storage "
+                    f"and waiting to be restored, including {progress['cold'][0]}."
                 )
-                LOG.debug("sync_bucket checking prefix %s", prefix)
-                for source_object in self.s3_source_bucket.objects.filter(Prefix=prefix):
-                    self._copy_object(s3_destination_bucket, source_object)
 
             LOG.info(
                 "Completed sync_bucket to %s for %s from %s to %s",
@@ -1,4 +1,5 @@
 """Collection of tests for the data export syncer."""
+from concurrent.futures import Future
 from datetime import date
 from datetime import timedelta
 from itertools import product
@@ -37,7 +38,7 @@ class AwsS3SyncerTest(TestCase):
         end_date = date(2019, 3, 1)
         date_range = (start_date, end_date)
 
-        source_object = Mock()
+        source_object = Mock(size=1024)
         source_object.key = f"{settings.S3_BUCKET_PATH}/{account}{fake.file_path()}"
         source_object.bucket_name = source_bucket_name
 
@@ -47,8 +48,8 @@ class AwsS3SyncerTest(TestCase):
         mock_buckets = mock_resource.return_value.Bucket
         mock_filter = mock_buckets.return_value.objects.filter
         mock_filter.return_value = (source_object,)
-        mock_destination_object = mock_buckets.return_value.Object
-        mock_copy_from = mock_destination_object.return_value.copy_from
+        mock_client = mock_resource.return_value.meta.client
+        mock_copy_object = mock_client.copy_object
 
         with self.settings(ENABLE_S3_ARCHIVING=False):
             syncer = AwsS3Syncer(source_bucket_name)
@@ -57,8 +58,7 @@ class AwsS3SyncerTest(TestCase):
         mock_resource.assert_called_with("s3", settings.S3_REGION)
         mock_buckets.assert_called_once_with(source_bucket_name)
         mock_filter.assert_not_called()
-        mock_destination_object.assert_not_called()
-        mock_copy_from.assert_not_called()
+        mock_copy_object.assert_not_called()
 
 
 @override_settings(ENABLE_S3_ARCHIVING=True)
@@ -131,7 +131,7 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         days = rrule(DAILY, dtstart=start_date, until=end_date)
         months = rrule(MONTHLY, dtstart=start_date, until=end_date)
 
-        source_object = Mock()
+        source_object = Mock(size=1024)
         source_object.key = f"{settings.S3_BUCKET_PATH}/{schema_name}{fake.file_path()}"
         source_object.bucket_name = source_bucket_name
 
@@ -141,23 +141,24 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         mock_buckets = mock_resource.return_value.Bucket
         mock_filter = mock_buckets.return_value.objects.filter
         mock_filter.return_value = (source_object,)
-        mock_destination_object = mock_buckets.return_value.Object
-        mock_copy_from = mock_destination_object.return_value.copy_from
+        mock_client = mock_resource.return_value.meta.client
+        mock_copy_object = mock_client.copy_object
 
         syncer = AwsS3Syncer(source_bucket_name)
         syncer.sync_bucket(schema_name, destination_bucket_name, date_range)
 
         mock_resource.assert_called_with("s3", settings.S3_REGION)
         mock_buckets.assert_any_call(source_bucket_name)
-        mock_buckets.assert_any_call(destination_bucket_name)
 
         expected_filter_calls = self.get_expected_filter_calls(schema_name, days, months)
         mock_filter.assert_has_calls(expected_filter_calls, any_order=True)
         self.assertEqual(len(mock_filter.call_args_list), len(expected_filter_calls))
 
-        mock_destination_object.assert_called_with(source_object.key)
-        mock_copy_from.assert_called_with(
-            ACL="bucket-owner-full-control", CopySource={"Bucket": source_bucket_name, "Key": source_object.key}
+        mock_copy_object.assert_called_once_with(
+            ACL="bucket-owner-full-control",
+            Bucket=destination_bucket_name,
+            Key=source_object.key,
+            CopySource={"Bucket": source_bucket_name, "Key": source_object.key},
         )
 
     @patch("api.dataexport.syncer.boto3")
@@ -181,22 +182,20 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         mock_buckets = mock_resource.return_value.Bucket
         mock_filter = mock_buckets.return_value.objects.filter
         mock_filter.return_value = ()
-        mock_destination_object = mock_buckets.return_value.Object
-        mock_copy_from = mock_destination_object.return_value.copy_from
+        mock_client = mock_resource.return_value.meta.client
+        mock_copy_object = mock_client.copy_object
 
         syncer = AwsS3Syncer(source_bucket_name)
         syncer.sync_bucket(schema_name, destination_bucket_name, date_range)
 
         mock_resource.assert_called_with("s3", settings.S3_REGION)
         mock_buckets.assert_any_call(source_bucket_name)
-        mock_buckets.assert_any_call(destination_bucket_name)
 
         expected_filter_calls = self.get_expected_filter_calls(schema_name, days, months)
         mock_filter.assert_has_calls(expected_filter_calls, any_order=True)
         self.assertEqual(len(mock_filter.call_args_list), len(expected_filter_calls))
 
-        mock_destination_object.assert_not_called()
-        mock_copy_from.assert_not_called()
+        mock_copy_object.assert_not_called()
 
     @patch("api.dataexport.syncer.boto3")
     def test_sync_file_in_glacier(self, mock_boto3):
@@ -212,7 +211,7 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         end_date = date(2019, 3, 1)
         date_range = (start_date, end_date)
 
-        source_object = Mock()
+        source_object = Mock(size=1024)
         source_object.key = f"{settings.S3_BUCKET_PATH}/{schema_name}{fake.file_path()}"
         source_object.bucket_name = source_bucket_name
         source_object.storage_class = "GLACIER"
@@ -223,13 +222,13 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         mock_buckets = mock_resource.return_value.Bucket
         mock_filter = mock_buckets.return_value.objects.filter
         mock_filter.return_value = (source_object,)
-        mock_destination_object = mock_buckets.return_value.Object
-        mock_copy_from = mock_destination_object.return_value.copy_from
-        mock_copy_from.side_effect = client_error_glacier
+        mock_client = mock_resource.return_value.meta.client
+        mock_copy_object = mock_client.copy_object
+        mock_copy_object.side_effect = client_error_glacier
         with self.assertRaises(SyncedFileInColdStorageError):
             syncer = AwsS3Syncer(source_bucket_name)
             syncer.sync_bucket(schema_name, destination_bucket_name, date_range)
-        source_object.restore_object.assert_called()
+        mock_client.restore_object.assert_called_once()
 
     @patch("api.dataexport.syncer.boto3")
     def test_sync_glacier_file_restore_in_progress(self, mock_boto3):
@@ -245,7 +244,7 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         end_date = date(2019, 3, 1)
         date_range = (start_date, end_date)
 
-        source_object = Mock()
+        source_object = Mock(size=1024)
         source_object.key = f"{settings.S3_BUCKET_PATH}/{schema_name}{fake.file_path()}"
         source_object.bucket_name = source_bucket_name
         source_object.storage_class = "GLACIER"
@@ -256,14 +255,14 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         mock_buckets = mock_resource.return_value.Bucket
         mock_filter = mock_buckets.return_value.objects.filter
         mock_filter.return_value = (source_object,)
-        mock_destination_object = mock_buckets.return_value.Object
-        mock_copy_from = mock_destination_object.return_value.copy_from
-        mock_copy_from.side_effect = restore_in_progress_error
+        mock_client = mock_resource.return_value.meta.client
+        mock_copy_object = mock_client.copy_object
+        mock_copy_object.side_effect = restore_in_progress_error
 
         with self.assertRaises(SyncedFileInColdStorageError):
             syncer = AwsS3Syncer(source_bucket_name)
             syncer.sync_bucket(schema_name, destination_bucket_name, date_range)
-        source_object.restore_object.assert_not_called()
+        mock_client.restore_object.assert_not_called()
 
     @patch("api.dataexport.syncer.boto3")
     def test_sync_fail_boto3_client_exception(self, mock_boto3):
@@ -277,7 +276,7 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         end_date = date(2019, 3, 1)
         date_range = (start_date, end_date)
 
-        source_object = Mock()
+        source_object = Mock(size=1024)
         source_object.key = f"{settings.S3_BUCKET_PATH}/{schema_name}{fake.file_path()}"
         source_object.bucket_name = source_bucket_name
         self.assertNotEqual(source_bucket_name, destination_bucket_name)
@@ -286,11 +285,112 @@ class AwsS3SyncerTestWithData(MasuTestCase):
         mock_buckets = mock_resource.return_value.Bucket
         mock_filter = mock_buckets.return_value.objects.filter
         mock_filter.return_value = (source_object,)
-        mock_destination_object = mock_buckets.return_value.Object
-        mock_copy_from = mock_destination_object.return_value.copy_from
-        mock_copy_from.side_effect = client_error
+        mock_client = mock_resource.return_value.meta.client
+        mock_copy_object = mock_client.copy_object
+        mock_copy_object.side_effect = client_error
 
         with self.assertRaises(ClientError):
             syncer = AwsS3Syncer(source_bucket_name)
             syncer.sync_bucket(schema_name, destination_bucket_name, date_range)
-        source_object.restore_object.assert_not_called()
+        mock_client.restore_object.assert_not_called()
+
+    @patch("api.dataexport.syncer.boto3")
+    def test_sync_resumes_from_synced_keys(self, mock_boto3):
+        """Test that files synced by a previous attempt are skipped and the progress is checkpointed."""
+        source_bucket_name = fake.slug()
+        destination_bucket_name = fake.slug()
+        date_range = (date(2019, 1, 1), date(2019, 1, 3))
+
+        synced_object = Mock(size=1024, key=f"{settings.S3_BUCKET_PATH}/{self.schema}{fake.file_path()}")
+        new_object = Mock(size=1024, key=f"{settings.S3_BUCKET_PATH}/{self.schema}{fake.file_path()}")
+
+        mock_resource = mock_boto3.resource
+        mock_resource.return_value.Bucket.return_value.objects.filter.return_value = (synced_object, new_object)
+        mock_copy_object = mock_resource.return_value.meta.client.copy_object
+        mock_checkpoint = Mock()
+
+        synced_keys = {synced_object.key}
+        syncer = AwsS3Syncer(source_bucket_name)
+        syncer.sync_bucket(
+            self.schema, destination_bucket_name, date_range, synced_keys=synced_keys, checkpoint=mock_checkpoint
+        )
+
+        mock_copy_object.assert_called_once()
+        self.assertEqual(mock_copy_object.call_args[1]["Key"], new_object.key)
+        self.assertEqual(synced_keys, {synced_object.key, new_object.key})
+        mock_checkpoint.assert_called_once_with([new_object.key])
+
+    @patch("api.dataexport.syncer.SYNC_CHECKPOINT_INTERVAL", 1)
+    @patch("api.dataexport.syncer.boto3")
+    def test_sync_checkpoints_only_new_keys(self, mock_boto3):
+        """Test that each checkpoint receives only the keys copied since the previous one."""
+        destination_bucket_name = fake.slug()
+        date_range = (date(2019, 1, 1), date(2019, 1, 2))
+
+        objects = [Mock(size=1024, key=f"{settings.S3_BUCKET_PATH}/{self.schema}{fake.file_path()}") for _ in range(3)]
+        mock_boto3.resource.return_value.Bucket.return_value.objects.filter.return_value = objects
+        mock_checkpoint = Mock()
+
+        syncer = AwsS3Syncer(fake.slug())
+        syncer.sync_bucket(self.schema, destination_bucket_name, date_range, checkpoint=mock_checkpoint)
+
+        checkpointed = [key for args in mock_checkpoint.call_args_list for key in args[0][0]]
+        self.assertEqual(mock_checkpoint.call_count, 3)
+        self.assertCountEqual(checkpointed, [obj.key for obj in objects])
+
+    @patch("api.dataexport.syncer.boto3")
+    def test_sync_copies_other_files_while_in_glacier(self, mock_boto3):
+        """Test that a file in glacier does not stop the other files from being copied."""
+        client_error_glacier = ClientError(
+            error_response={"Error": {"Code": "InvalidObjectState"}}, operation_name=Mock()
+        )
+        source_bucket_name = fake.slug()
+        destination_bucket_name = fake.slug()
+        date_range = (date(2019, 1, 1), date(2019, 1, 3))
+
+        glacier_object = Mock(size=1024, key=f"{settings.S3_BUCKET_PATH}/{self.schema}{fake.file_path()}")
+        glacier_object.storage_class = "GLACIER"
+        new_object = Mock(size=1024, key=f"{settings.S3_BUCKET_PATH}/{self.schema}{fake.file_path()}")
+
+        def copy_object(**kwargs):
+            if kwargs["Key"] == glacier_object.key:
+                raise client_error_glacier
+
+        mock_resource = mock_boto3.resource
+        mock_resource.return_value.Bucket.return_value.objects.filter.return_value = (glacier_object, new_object)
+        mock_client = mock_resource.return_value.meta.client
+        mock_client.copy_object.side_effect = copy_object
+        mock_checkpoint = Mock()
+
+        synced_keys = set()
+        with self.assertRaises(SyncedFileInColdStorageError):
+            syncer = AwsS3Syncer(source_bucket_name)
+            syncer.sync_bucket(
+                self.schema, destination_bucket_name, date_range, synced_keys=synced_keys, checkpoint=mock_checkpoint
+            )
+        mock_client.restore_object.assert_called_once()
+        self.assertEqual(synced_keys, {new_object.key})
+        mock_checkpoint.assert_called_once_with([new_object.key])
+
+    @patch("api.dataexport.syncer.boto3")
+    def test_record_copies_records_successes_before_raising(self, mock_boto3):
+        """Test that a failed copy does not drop the other finished copies from the progress."""
+        client_error = ClientError(error_response={"Error": {"Code": fake.word()}}, operation_name=Mock())
+        failed_object = Mock(size=1024, key=f"{settings.S3_BUCKET_PATH}/{self.schema}{fake.file_path()}")
+        copied_object = Mock(size=2048, key=f"{settings.S3_BUCKET_PATH}/{self.schema}{fake.file_path()}")
+        failed_future, copied_future = Future(), Future()
+        failed_future.set_exception(client_error)
+        copied_future.set_result(None)
+        pending = {failed_future: failed_object, copied_future: copied_object}
+        progress = {"objects": 0, "bytes": 0, "unsaved": [], "cold": []}
+        synced_keys = set()
+
+        syncer = AwsS3Syncer(fake.slug())
+        with self.assertRaises(ClientError):
+            syncer._record_copies([failed_future, copied_future], pending, synced_keys, progress, None)
+
+        self.assertEqual(pending, {})
+        self.assertEqual(synced_keys, {copied_object.key})
+        self.assertEqual(progress["unsaved"], [copied_object.key])
+        self.assertEqual(progress["objects"], 1)
+        self.assertEqual(progress["bytes"], copied_object.size)
@@ -33,3 +33,16 @@ class DataExportRequestTest(TestCase):
         self.assertIn(data_export_request.bucket_name, the_str)
         self.assertIn("2019-01-01", the_str)
         self.assertIn("2019-02-01", the_str)
+
+    def test_save_synced_keys(self):
+        """Test that checkpointed keys are added to those saved by previous checkpoints."""
+        user = User.objects.create(username=fake.name())
+        data_export_request = DataExportRequest.objects.create(
+            start_date=date(2019, 1, 1), end_date=date(2019, 2, 1), created_by=user, bucket_name="my-test-bucket"
+        )
+        self.assertEqual(data_export_request.get_synced_keys(), set())
+
+        data_export_request.save_synced_keys(["a.csv.gz", "b.csv.gz"])
+        data_export_request.save_synced_keys(["b.csv.gz", "c.csv.gz"])
+
+        self.assertEqual(data_export_request.get_synced_keys(), {"a.csv.gz", "b.csv.gz", "c.csv.gz"})
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:47
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0058_exchangeratedictionary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataExportSyncedKey",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("key", models.TextField()),
+                (
+                    "data_export_request",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="synced_keys",
+                        to="api.dataexportrequest",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("data_export_request", "key")},
+            },
+        ),
+    ]
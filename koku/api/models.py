@@ -6,6 +6,7 @@
 # flake8: noqa
 from api.currency.models import ExchangeRates
 from api.dataexport.models import DataExportRequest
+from api.dataexport.models import DataExportSyncedKey
 from api.iam.models import Customer
 from api.iam.models import Tenant
 from api.iam.models import User
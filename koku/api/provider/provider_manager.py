@@ -321,6 +321,12 @@ def provider_post_delete_callback(*args, **kwargs):
     customer.date_updated = DateHelper().now_utc
     customer.save()
 
+    # Local import of forecast module to avoid potential import cycle.
+    from forecast.forecast import invalidate_forecasts
+
+    LOG.info("Invalidating cached forecasts")
+    transaction.on_commit(partial(invalidate_forecasts, customer.schema_name, provider.type))
+
     LOG.debug("Deleting any related CostModelMap records")
     execute_delete_sql(CostModelMap.objects.filter(provider_uuid=provider.uuid))
 
@@ -315,7 +315,9 @@ class ProviderManagerTest(IamTestCase):
             manager = ProviderManager(provider_uuid)
             # We use this context manager to get on_commit to fire inside
             # the unit test transaction that is not committed
-            with self.captureOnCommitCallbacks(execute=True):
+            with self.captureOnCommitCallbacks(execute=True), patch(
+                "forecast.forecast.invalidate_forecasts"
+            ) as mock_invalidate:
                 manager.remove(self._create_delete_request(other_user))
 
         provider_query = Provider.objects.all().filter(uuid=provider_uuid)
@@ -324,6 +326,7 @@ class ProviderManagerTest(IamTestCase):
         self.assertFalse(provider_query)
         self.assertEqual(auth_count, iniitial_auth_count)
         self.assertEqual(billing_count, initial_billing_count)
+        mock_invalidate.assert_called_once_with(self.customer.schema_name, provider.type)
 
     @patch("api.provider.provider_manager.ProviderManager.get_is_provider_processing")
     def test_remove_still_processing(self, mock_is_processing):
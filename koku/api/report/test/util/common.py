@@ -7,6 +7,7 @@ from tenant_schemas.utils import schema_context
 
 from reporting.provider.ocp.models import OCPCluster
 from reporting.provider.ocp.models import OCPNode
+from reporting.provider.ocp.models import OCPProject
 from reporting.provider.ocp.models import OCPUsageLineItemDailySummary
 
 
@@ -18,9 +19,20 @@ def populate_ocp_topology(schema, provider, cluster_id):
             .values_list("node", "resource_id")
             .distinct()
         )
-        cluster = OCPCluster(cluster_id=cluster_id, provider=provider)
+        projects = (
+            OCPUsageLineItemDailySummary.objects.filter(cluster_id=cluster_id, namespace__isnull=False)
+            .values_list("namespace", flat=True)
+            .distinct()
+        )
+        cluster_alias = (
+            OCPUsageLineItemDailySummary.objects.filter(cluster_id=cluster_id)
+            .values_list("cluster_alias", flat=True)
+            .first()
+        )
+        cluster = OCPCluster(cluster_id=cluster_id, cluster_alias=cluster_alias, provider=provider)
         cluster.save()
         for node in nodes:
             if node[0]:
                 n = OCPNode(node=node[0], resource_id=node[1], cluster=cluster)
                 n.save()
+        OCPProject.objects.bulk_create([OCPProject(project=project, cluster=cluster) for project in projects])
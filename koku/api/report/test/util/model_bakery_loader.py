@@ -217,6 +217,7 @@ class ModelBakeryDataLoader(DataLoader):
         with AWSReportDBAccessor(self.schema) as accessor:
             accessor.populate_tags_summary_table(bill_ids, self.first_start_date, self.last_end_date)
             accessor.populate_ui_summary_tables(self.first_start_date, self.last_end_date, provider.uuid)
+            accessor.populate_resource_dimension_tables(self.first_start_date, self.last_end_date, provider.uuid)
         return bills
 
     def load_azure_data(self, linked_openshift_provider=None):
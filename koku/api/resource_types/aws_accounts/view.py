@@ -17,7 +17,7 @@ from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.pagination import ResourceTypeViewPaginator
 from api.common.permissions.aws_access import AwsAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.aws.models import AWSCostSummaryByAccountP
+from reporting.provider.aws.models import AWSAccount
 from reporting.provider.aws.openshift.models import OCPAWSCostSummaryByAccountP
 
 
@@ -25,7 +25,7 @@ class AWSAccountView(generics.ListAPIView):
     """API GET list view for AWS accounts."""
 
     queryset = (
-        AWSCostSummaryByAccountP.objects.annotate(
+        AWSAccount.objects.annotate(
             **(
                 {
                     "value": F("usage_account_id"),
@@ -16,18 +16,13 @@ from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.pagination import ResourceTypeViewPaginator
 from api.common.permissions.aws_access import AwsAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.aws.models import AWSCostSummaryByRegionP
+from reporting.provider.aws.models import AWSRegion
 
 
 class AWSAccountRegionView(generics.ListAPIView):
     """API GET list view for AWS by region"""
 
-    queryset = (
-        AWSCostSummaryByRegionP.objects.annotate(**{"value": F("region")})
-        .values("value")
-        .distinct()
-        .filter(region__isnull=False)
-    )
+    queryset = AWSRegion.objects.annotate(**{"value": F("region")}).values("value").distinct()
     serializer_class = ResourceTypeSerializer
     permission_classes = [AwsAccessPermission]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
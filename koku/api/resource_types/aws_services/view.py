@@ -16,18 +16,13 @@ from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.pagination import ResourceTypeViewPaginator
 from api.common.permissions.aws_access import AwsAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.aws.models import AWSCostSummaryByServiceP
+from reporting.provider.aws.models import AWSService
 
 
 class AWSServiceView(generics.ListAPIView):
     """API GET list view for AWS Services."""
 
-    queryset = (
-        AWSCostSummaryByServiceP.objects.annotate(**{"value": F("product_code")})
-        .values("value")
-        .distinct()
-        .filter(product_code__isnull=False)
-    )
+    queryset = AWSService.objects.annotate(**{"value": F("product_code")}).values("value").distinct()
     serializer_class = ResourceTypeSerializer
     permission_classes = [AwsAccessPermission]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
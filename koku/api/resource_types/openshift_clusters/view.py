@@ -17,19 +17,18 @@ from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.pagination import ResourceTypeViewPaginator
 from api.common.permissions.openshift_access import OpenShiftAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.ocp.models import OCPCostSummaryP
+from reporting.provider.ocp.models import OCPCluster
 
 
 class OCPClustersView(generics.ListAPIView):
     """API GET list view for Openshift clusters."""
 
     queryset = (
-        OCPCostSummaryP.objects.annotate(
+        OCPCluster.objects.annotate(
             **{"value": F("cluster_id"), "ocp_cluster_alias": Coalesce(F("cluster_alias"), "cluster_id")}
         )
         .values("value", "ocp_cluster_alias")
         .distinct()
-        .filter(cluster_id__isnull=False)
     )
     serializer_class = ResourceTypeSerializer
     permission_classes = [OpenShiftAccessPermission]
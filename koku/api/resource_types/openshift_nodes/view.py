@@ -17,18 +17,13 @@ from api.common.pagination import ResourceTypeViewPaginator
 from api.common.permissions.openshift_access import OpenShiftAccessPermission
 from api.common.permissions.openshift_access import OpenShiftNodePermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.ocp.models import OCPCostSummaryByNodeP
+from reporting.provider.ocp.models import OCPNode
 
 
 class OCPNodesView(generics.ListAPIView):
     """API GET list view for Openshift nodes."""
 
-    queryset = (
-        OCPCostSummaryByNodeP.objects.annotate(**{"value": F("node")})
-        .values("value")
-        .distinct()
-        .filter(node__isnull=False)
-    )
+    queryset = OCPNode.objects.annotate(**{"value": F("node")}).values("value").distinct()
     serializer_class = ResourceTypeSerializer
     permission_classes = [OpenShiftNodePermission | OpenShiftAccessPermission]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
@@ -57,6 +52,6 @@ class OCPNodesView(generics.ListAPIView):
             if ocp_node_access and ocp_node_access[0] != "*":
                 query_holder = query_holder.filter(node__in=ocp_node_access)
             if ocp_cluster_access and ocp_cluster_access[0] != "*":
-                query_holder = query_holder.filter(cluster_id__in=ocp_cluster_access)
+                query_holder = query_holder.filter(cluster__cluster_id__in=ocp_cluster_access)
         self.queryset = query_holder
         return super().list(request)
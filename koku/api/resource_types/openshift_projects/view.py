@@ -17,18 +17,13 @@ from api.common.pagination import ResourceTypeViewPaginator
 from api.common.permissions.openshift_access import OpenShiftAccessPermission
 from api.common.permissions.openshift_access import OpenShiftProjectPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.ocp.models import OCPCostSummaryByProjectP
+from reporting.provider.ocp.models import OCPProject
 
 
 class OCPProjectsView(generics.ListAPIView):
     """API GET list view for Openshift projects."""
 
-    queryset = (
-        OCPCostSummaryByProjectP.objects.annotate(**{"value": F("namespace")})
-        .values("value")
-        .distinct()
-        .filter(namespace__isnull=False)
-    )
+    queryset = OCPProject.objects.annotate(**{"value": F("project")}).values("value").distinct()
     serializer_class = ResourceTypeSerializer
     permission_classes = [OpenShiftProjectPermission | OpenShiftAccessPermission]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
@@ -55,8 +50,8 @@ class OCPProjectsView(generics.ListAPIView):
             ocp_cluster_access = request.user.access.get("openshift.cluster", {}).get("read", [])
             query_holder = self.queryset
             if ocp_project_access and ocp_project_access[0] != "*":
-                query_holder = query_holder.filter(namespace__in=ocp_project_access)
+                query_holder = query_holder.filter(project__in=ocp_project_access)
             if ocp_cluster_access and ocp_cluster_access[0] != "*":
-                query_holder = query_holder.filter(cluster_id__in=ocp_cluster_access)
+                query_holder = query_holder.filter(cluster__cluster_id__in=ocp_cluster_access)
         self.queryset = query_holder
         return super().list(request)
@@ -12,7 +12,7 @@ from tenant_schemas.utils import schema_context
 from api.iam.test.iam_test_case import IamTestCase
 from api.iam.test.iam_test_case import RbacPermissions
 from api.report.test.util.constants import OCP_NAMESPACES
-from reporting.provider.ocp.models import OCPCostSummaryByProjectP
+from reporting.provider.ocp.models import OCPProject
 
 RBAC_PROJECT = OCP_NAMESPACES[1]
 
@@ -30,10 +30,10 @@ class ResourceTypesViewTestOpenshiftProjects(IamTestCase):
         """Test endpoint runs with a customer owner."""
         with schema_context(self.schema_name):
             expected = (
-                OCPCostSummaryByProjectP.objects.annotate(**{"value": F("namespace")})
+                OCPProject.objects.annotate(**{"value": F("project")})
                 .values("value")
                 .distinct()
-                .filter(namespace__in=[RBAC_PROJECT])
+                .filter(project__in=[RBAC_PROJECT])
                 .count()
             )
         # check that the expected is not zero
@@ -51,10 +51,10 @@ class ResourceTypesViewTestOpenshiftProjects(IamTestCase):
         """Test endpoint runs with a customer owner."""
         with schema_context(self.schema_name):
             expected = (
-                OCPCostSummaryByProjectP.objects.annotate(**{"value": F("namespace")})
+                OCPProject.objects.annotate(**{"value": F("project")})
                 .values("value")
                 .distinct()
-                .filter(cluster_id__in=["OCP-on-AWS"])
+                .filter(cluster__cluster_id__in=["OCP-on-AWS"])
                 .count()
             )
         # check that the expected is not zero
@@ -72,10 +72,10 @@ class ResourceTypesViewTestOpenshiftProjects(IamTestCase):
         """Test endpoint runs with a customer owner."""
         with schema_context(self.schema_name):
             expected = (
-                OCPCostSummaryByProjectP.objects.annotate(**{"value": F("namespace")})
+                OCPProject.objects.annotate(**{"value": F("project")})
                 .values("value")
                 .distinct()
-                .filter(namespace__in=[RBAC_PROJECT], cluster_id__in=["OCP-on-AWS"])
+                .filter(project__in=[RBAC_PROJECT], cluster__cluster_id__in=["OCP-on-AWS"])
                 .count()
             )
         # check that the expected is not zero
@@ -93,10 +93,10 @@ class ResourceTypesViewTestOpenshiftProjects(IamTestCase):
         """Test endpoint runs with a customer owner."""
         with schema_context(self.schema_name):
             expected = (
-                OCPCostSummaryByProjectP.objects.annotate(**{"value": F("namespace")})
+                OCPProject.objects.annotate(**{"value": F("project")})
                 .values("value")
                 .distinct()
-                .filter(cluster_id__in=["OCP-on-AWS"])
+                .filter(cluster__cluster_id__in=["OCP-on-AWS"])
                 .count()
             )
         # check that the expected is not zero
@@ -114,10 +114,10 @@ class ResourceTypesViewTestOpenshiftProjects(IamTestCase):
         """Test endpoint runs with a customer owner."""
         with schema_context(self.schema_name):
             expected = (
-                OCPCostSummaryByProjectP.objects.annotate(**{"value": F("namespace")})
+                OCPProject.objects.annotate(**{"value": F("project")})
                 .values("value")
                 .distinct()
-                .filter(namespace__in=[RBAC_PROJECT])
+                .filter(project__in=[RBAC_PROJECT])
                 .count()
             )
         # check that the expected is not zero
@@ -19,6 +19,9 @@ from api.provider.models import Provider
 from cost_models.models import CostModel
 from cost_models.models import CostModelMap
 from masu.test import MasuTestCase
+from reporting.provider.aws.models import AWSCostSummaryByAccountP
+from reporting.provider.aws.models import AWSCostSummaryByRegionP
+from reporting.provider.aws.models import AWSCostSummaryByServiceP
 
 
 FAKE = Faker()
@@ -211,6 +214,27 @@ class ResourceTypesViewTest(IamTestCase):
         self.assertIsInstance(json_result.get("data"), list)
         self.assertEqual(json_result.get("data"), [])
 
+    @RbacPermissions({"aws.account": {"read": ["*"]}})
+    def test_aws_endpoints_match_summary_values(self):
+        """Test that the AWS dimension tables list the same values as the summary tables."""
+        summaries = {
+            "aws-accounts": (AWSCostSummaryByAccountP, "usage_account_id"),
+            "aws-regions": (AWSCostSummaryByRegionP, "region"),
+            "aws-services": (AWSCostSummaryByServiceP, "product_code"),
+        }
+        for endpoint, (model, field) in summaries.items():
+            with self.subTest(endpoint=endpoint):
+                with tenant_context(self.tenant):
+                    expected = set(
+                        model.objects.filter(**{f"{field}__isnull": False}).values_list(field, flat=True).distinct()
+                    )
+                url = reverse(endpoint) + f"?limit={len(expected) + 1}"
+                response = self.client.get(url, **self.headers)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                values = {row.get("value") for row in response.json().get("data")}
+                self.assertTrue(expected)
+                self.assertEqual(values, expected)
+
     def test_incorrect_query_all_endpoints(self):
         """Test invalid delta value."""
         self.ENDPOINTS = self.ENDPOINTS_AWS + self.ENDPOINTS_AZURE + self.ENDPOINTS_OPENSHIFT + self.ENDPOINTS_GCP
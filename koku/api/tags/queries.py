@@ -305,38 +305,41 @@ class TagQueryHandler(QueryHandler):
         elif type_filter:
             type_filter_array.append(type_filter)
 
-        final_data = []
+        final_data = {}
         with tenant_context(self.tenant):
-            tag_keys = {}
-            vals = ["key", "values"]
             for source in sources:
                 if type_filter and source.get("type") not in type_filter_array:
                     continue
+                vals = ["key", "values"]
                 tag_keys_query = source.get("db_table").objects
                 annotations = source.get("annotations")
                 if annotations:
                     tag_keys_query = tag_keys_query.annotate(**annotations)
-                    for annotation_key in annotations.keys():
-                        vals.append(annotation_key)
+                    vals.extend(annotations)
                 exclusion = self._get_exclusions("key")
-                tag_keys = list(tag_keys_query.filter(self.query_filter).exclude(exclusion).values_list(*vals).all())
-                converted = self._convert_to_dict(tag_keys, vals)
+                # identical (key, values) rows of different accounts and days are collapsed by the database
+                tag_keys_query = (
+                    tag_keys_query.filter(self.query_filter)
+                    .exclude(exclusion)
+                    .values_list(*vals)
+                    .order_by()
+                    .distinct()
+                )
+                converted = self._convert_to_dict(tag_keys_query.iterator(), vals)
                 if type_filter and source.get("type"):
                     self.append_to_final_data_with_type(final_data, converted, source)
                 else:
                     self.append_to_final_data_without_type(final_data, converted)
 
         # sort the values and deduplicate before returning
-        self.deduplicate_and_sort(final_data)
-        return final_data
+        return self.deduplicate_and_sort(list(final_data.values()))
 
     def get_tag_values(self):
         """
         Gets the values associated with a tag when filtering on a value.
         """
-        final_data = []
+        final_data = {}
         with tenant_context(self.tenant):
-            tag_keys = {}
             for source in self.TAGS_VALUES_SOURCE:
                 vals_filter = QueryFilterCollection()
                 for key_field in source.get("fields"):
@@ -347,12 +350,10 @@ class TagQueryHandler(QueryHandler):
                     )
                 tag_values_query = source.get("db_table").objects
                 filt = self.query_filter & vals_filter.compose()
-                tag_keys = list(tag_values_query.filter(filt))
-                tag_tup = self._value_filter_dict(tag_keys)
-                converted = self._convert_to_dict(tag_tup)
+                tag_values = list(tag_values_query.filter(filt).values_list("value", flat=True))
+                converted = self._convert_to_dict([(self.key, tag_values)])
                 self.append_to_final_data_without_type(final_data, converted)
-        self.deduplicate_and_sort(final_data)
-        return final_data
+        return self.deduplicate_and_sort(list(final_data.values()))
 
     def deduplicate_and_sort(self, data):
         for dikt in data:
@@ -363,48 +364,34 @@ class TagQueryHandler(QueryHandler):
     def _convert_to_dict(tup, vals=["key", "values"]):
         tag_map = {}
         for result in tup:
-            tag = {}
-            for idx in range(len(vals)):
-                tag[vals[idx]] = result[idx]
-            if tag_map.get(tag.get("key")):
+            tag = dict(zip(vals, result))
+            if tag.get("key") in tag_map:
                 tag_map[tag.get("key")].get("values").extend(tag.get("values"))
             else:
                 tag_map[tag.get("key")] = tag
         return tag_map
 
-    def _value_filter_dict(self, t_keys):
-        values_list = []
-        for obj in t_keys:
-            values_list.append(obj.value)
-        return [(self.key, values_list)]
-
     @staticmethod
-    def _get_dictionary_for_key(dictionary_list, key):
-        """Get dictionary matching key from list of dictionaries."""
-        for di in dictionary_list:
-            if key == di.get("key"):
-                return di
-        return None
-
-    def append_to_final_data_with_type(self, final_data, converted_data, source):
-        """Convert data to final list with a source type."""
+    def _merge_into_final_data(final_data, converted_data, tag_type):
+        """Merge the converted tags into the final data entries indexed by (key, type)."""
         for k, v in converted_data.items():
-            dikt = self._get_dictionary_for_key(final_data, k)
-            if dikt and dikt.get("type") == source.get("type"):
+            dikt = final_data.get((k, tag_type))
+            if dikt:
                 dikt["values"].extend(v.get("values"))
             else:
-                copy_value = copy.deepcopy(v)
-                copy_value["type"] = source.get("type")
-                final_data.append(copy_value)
+                # only the values list is mutated by later merges, so it is the only thing copied
+                dikt = {**v, "values": list(v.get("values"))}
+                if tag_type:
+                    dikt["type"] = tag_type
+                final_data[(k, tag_type)] = dikt
+
+    def append_to_final_data_with_type(self, final_data, converted_data, source):
+        """Merge data into the final data dict with a source type."""
+        self._merge_into_final_data(final_data, converted_data, source.get("type"))
 
     def append_to_final_data_without_type(self, final_data, converted_data):
-        """Convert data to final list without a source type."""
-        for k, v in converted_data.items():
-            dikt = self._get_dictionary_for_key(final_data, k)
-            if dikt and dikt.get("type") is None:
-                dikt["values"].extend(v.get("values"))
-            elif not dikt:
-                final_data.append(copy.deepcopy(v))
+        """Merge data into the final data dict without a source type."""
+        self._merge_into_final_data(final_data, converted_data, None)
 
     def execute_query(self):
         """Execute query and return provided data.
@@ -21,7 +21,7 @@ class AzureTagQueryHandlerTest(IamTestCase):
         tagHandler = AzureTagQueryHandler(query_params)
 
         # Test no source type
-        final = []
+        final = {}
         source = {}
         qs1 = [("ms-resource-usage", ["azure-cloud-shell"]), ("project", ["p1", "p2"]), ("cost", ["management"])]
         tag_keys = tagHandler._convert_to_dict(qs1)
@@ -38,10 +38,10 @@ class AzureTagQueryHandlerTest(IamTestCase):
             {"key": "cost", "values": ["management"]},
         ]
         tagHandler.append_to_final_data_without_type(final, tag_keys)
-        self.assertEqual(final, expected_1)
+        self.assertEqual(list(final.values()), expected_1)
 
         # Test with source type
-        final = []
+        final = {}
         source = {"type": "storage"}
         tagHandler.append_to_final_data_with_type(final, tag_keys, source)
         expected_2 = [
@@ -49,9 +49,9 @@ class AzureTagQueryHandlerTest(IamTestCase):
             {"key": "project", "values": ["p1", "p2"], "type": "storage"},
             {"key": "cost", "values": ["management"], "type": "storage"},
         ]
-        self.assertEqual(final, expected_2)
+        self.assertEqual(list(final.values()), expected_2)
 
-        final = []
+        final = {}
         tagHandler.append_to_final_data_without_type(final, tag_keys)
         tagHandler.append_to_final_data_with_type(final, tag_keys, source)
 
@@ -63,7 +63,7 @@ class AzureTagQueryHandlerTest(IamTestCase):
             {"key": "project", "values": ["p1", "p2"], "type": "storage"},
             {"key": "cost", "values": ["management"], "type": "storage"},
         ]
-        self.assertEqual(final, expected_3)
+        self.assertEqual(list(final.values()), expected_3)
 
         qs2 = [("ms-resource-usage", ["azure-cloud-shell2"]), ("project", ["p1", "p3"])]
         tag_keys2 = tagHandler._convert_to_dict(qs2)
@@ -82,10 +82,10 @@ class AzureTagQueryHandlerTest(IamTestCase):
             {"key": "project", "values": ["p1", "p2"], "type": "storage"},
             {"key": "cost", "values": ["management"], "type": "storage"},
         ]
-        self.assertEqual(final, expected_4)
+        self.assertEqual(list(final.values()), expected_4)
 
         with patch("api.tags.azure.queries.AzureTagQueryHandler.order_direction", return_value="not-default"):
-            final = tagHandler.deduplicate_and_sort(final)
+            final = tagHandler.deduplicate_and_sort(list(final.values()))
         expected_5 = [
             {"key": "ms-resource-usage", "values": ["azure-cloud-shell", "azure-cloud-shell2"]},
             {"key": "project", "values": ["p1", "p2", "p3"]},
@@ -96,3 +96,20 @@ class AzureTagQueryHandlerTest(IamTestCase):
         ]
 
         self.assertEqual(final, expected_5)
+
+    def test_merge_tags_same_type(self):
+        """Test that tags of several sources of the same type are merged into one entry per key."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=monthly"
+        query_params = self.mocked_query_params(url, AzureTagView)
+        tagHandler = AzureTagQueryHandler(query_params)
+
+        final = {}
+        source = {"type": "storage"}
+        tagHandler.append_to_final_data_without_type(final, tagHandler._convert_to_dict([("project", ["p1"])]))
+        tagHandler.append_to_final_data_with_type(final, tagHandler._convert_to_dict([("project", ["p2"])]), source)
+        tagHandler.append_to_final_data_with_type(final, tagHandler._convert_to_dict([("project", ["p3"])]), source)
+        expected = [
+            {"key": "project", "values": ["p1"]},
+            {"key": "project", "values": ["p2", "p3"], "type": "storage"},
+        ]
+        self.assertEqual(list(final.values()), expected)
@@ -12,13 +12,14 @@ from decimal import Decimal
 from functools import reduce
 
 import numpy as np
-import statsmodels.api as sm
+from django.core.cache import caches
 from django.db.models import Q
-from statsmodels.sandbox.regression.predstd import wls_prediction_std
-from statsmodels.tools.sm_exceptions import ValueWarning
+from scipy import stats
 from tenant_schemas.utils import tenant_context
 
+from api.forecast.serializers import AWSCostForecastParamSerializer
 from api.models import Provider
+from api.models import Tenant
 from api.query_filter import QueryFilter
 from api.query_filter import QueryFilterCollection
 from api.report.all.openshift.provider_map import OCPAllProviderMap
@@ -39,6 +40,8 @@ LOG = logging.getLogger(__name__)
 COST_FIELD_NAMES = ["total_cost", "infrastructure_cost", "supplementary_cost"]
 ZERO_RESULT = [{}, 0, [0]]
 DEFAULT_RESULT = {"total_cost": 0, "confidence_min": 0, "confidence_max": 0}
+FORECAST_CACHE_PREFIX = "forecast"
+FORECAST_CACHE_TIMEOUT = 86400  # forecasts are keyed by day, so they are never read after a day
 
 
 class Forecast:
@@ -47,7 +50,7 @@ class Forecast:
     # the minimum number of data points needed to use the current month's data.
     # if we have fewer than this many data points, fall back to using the previous month's data.
     #
-    # this number is chosen in part because statsmodels.stats.stattools.omni_normtest() needs at least eight data
+    # this number was chosen in part because statsmodels.stats.stattools.omni_normtest() needs at least eight data
     # points to test for normal distribution.
     MINIMUM = 8
 
@@ -56,6 +59,9 @@ class Forecast:
 
     REPORT_TYPE = "costs"
 
+    # the cost types precomputed by precompute_forecasts()
+    CACHED_COST_TYPES = (None,)
+
     def __init__(self, query_params):  # noqa: C901
         """Class Constructor.
 
@@ -128,9 +134,49 @@ class Forecast:
         """Return the provider map value for total inftrastructure cost."""
         return self.provider_map.report_type_map.get("aggregates", {}).get("infra_total")
 
+    @property
+    def cache_key(self):
+        """Return the key of the precomputed forecast.
+
+        Forecasts only depend on the provider, the cost type and the user's access. Forecasts restricted by
+        access are not precomputed, so None is returned for them.
+        """
+        if self.params.get("access"):
+            return None
+        return ":".join(
+            (
+                FORECAST_CACHE_PREFIX,
+                self.params.tenant.schema_name,
+                self.provider,
+                getattr(self, "cost_type", None) or "",
+                str(self.dh.today.date()),
+            )
+        )
+
     def predict(self):
+        """Return the precomputed forecast, or run the forecast when it was not precomputed.
+
+        Unrestricted forecasts computed here are cached until the tenant's data changes.
+        """
+        cache_key = self.cache_key
+        if not cache_key:
+            return self._run_predict()
+        with tenant_context(self.params.tenant):
+            output = caches["default"].get(cache_key)
+        if output is not None:
+            LOG.debug("Forecast read from cache: %s", cache_key)
+            return output
+        return self.refresh_cache()
+
+    def refresh_cache(self):
+        """Run the forecast and store it for the API to read."""
+        output = self._run_predict()
+        with tenant_context(self.params.tenant):
+            caches["default"].set(self.cache_key, output, FORECAST_CACHE_TIMEOUT)
+        return output
+
+    def _run_predict(self):
         """Define ORM query to run forecast and return prediction."""
-        cost_predictions = {}
         with tenant_context(self.params.tenant):
             data = (
                 self.cost_summary_table.objects.filter(self.filters.compose())
@@ -143,73 +189,67 @@ class Forecast:
                 )
             )
 
-            for fieldname in COST_FIELD_NAMES:
-                uniq_data = self._uniquify_qset(data.values("usage_start", fieldname), field=fieldname)
-                cost_predictions[fieldname] = self._predict(uniq_data)
+            # every cost field is read from the same grouped query and forecast in one batch
+            uniq_data = self._uniquify_qset(data.values("usage_start", *COST_FIELD_NAMES), fields=COST_FIELD_NAMES)
+            cost_predictions = self._predict_series([uniq_data[field] for field in COST_FIELD_NAMES])
 
-            cost_predictions = self._key_results_by_date(cost_predictions)
+            cost_predictions = self._key_results_by_date(dict(zip(COST_FIELD_NAMES, cost_predictions)))
             return self.format_result(cost_predictions)
 
     def _predict(self, data):
-        """Handle pre and post prediction work.
-
-        This function handles arranging incoming data to conform with statsmodels requirements.
-        Then after receiving the forecast output, this function handles formatting to conform to
-        API reponse requirements.
+        """Handle pre and post prediction work for a single series.
 
         Args:
             data (list) a list of (datetime, float) tuples
 
         Returns:
-            (LinearForecastResult) linear forecast results object
+            (tuple) the forecast keyed by date, the R-squared value and the P-values
         """
-        LOG.debug("Forecast input data: %s", data)
-
-        if len(data) < self.MINIMUM:
-            LOG.warning(
-                "Number of data elements (%s) is fewer than the minimum (%s). Unable to generate forecast.",
-                len(data),
-                self.MINIMUM,
-            )
-            return ZERO_RESULT
-
-        dates, costs = zip(*data)
+        return self._predict_series([data])[0]
 
-        X = self._enumerate_dates(dates)
-        Y = [float(c) for c in costs]
+    def _predict_series(self, series):
+        """Handle pre and post prediction work for every cost field series at once.
 
-        # difference in days between the first day to be predicted and the last day of data after outlier removal
-        day_gap = (
-            datetime.combine(self.dh.today.date(), self.dh.midnight) - datetime.combine(dates[-1], self.dh.midnight)
-        ).days
-        # calculate x-values for the prediction range
-        pred_x = [i for i in range(X[-1] + day_gap, X[-1] + day_gap + self.forecast_days_required)]
+        This function handles arranging incoming data to conform with the regression requirements.
+        Then after receiving the forecast output, this function handles formatting to conform to
+        API reponse requirements.
 
-        # run the forecast
-        results = self._run_forecast(X, Y, to_predict=pred_x)
-
-        result_dict = {}
-        for i, value in enumerate(results.prediction):
-            # extrapolate confidence intervals to align with prediction.
-            # this reduces the confidence interval below 95th percentile, but is a better UX.
-            if i < len(results.confidence_lower):
-                lower = results.confidence_lower[i]
-            else:
-                lower = results.confidence_lower[-1] + results.slope * (i - len(results.confidence_lower))
+        Args:
+            series (list) a list of lists of (datetime, float) tuples
 
-            if i < len(results.confidence_upper):
-                upper = results.confidence_upper[i]
+        Returns:
+            (list) the forecast keyed by date, the R-squared value and the P-values of each series
+        """
+        LOG.debug("Forecast input data: %s", series)
+
+        predictions = [None] * len(series)
+        to_forecast = {}
+        for i, data in enumerate(series):
+            if len(data) < self.MINIMUM:
+                LOG.warning(
+                    "Number of data elements (%s) is fewer than the minimum (%s). Unable to generate forecast.",
+                    len(data),
+                    self.MINIMUM,
+                )
+                predictions[i] = ZERO_RESULT
             else:
-                upper = results.confidence_upper[-1] + results.slope * (i - len(results.confidence_upper))
-
-            # ensure that there are no negative numbers.
-            result_dict[self.dh.today.date() + timedelta(days=i)] = {
-                "total_cost": max((value, 0)),
-                "confidence_min": max((lower, 0)),
-                "confidence_max": max((upper, 0)),
-            }
+                to_forecast[i] = data
+        if not to_forecast:
+            return predictions
 
-        return (result_dict, results.rsquared, results.pvalues)
+        # run the forecast
+        for i, results in zip(to_forecast, self._run_forecast(list(to_forecast.values()))):
+            result_dict = {}
+            for day, value in enumerate(results.prediction):
+                # ensure that there are no negative numbers.
+                result_dict[self.dh.today.date() + timedelta(days=day)] = {
+                    "total_cost": max((value, 0)),
+                    "confidence_min": max((results.confidence_lower[day], 0)),
+                    "confidence_max": max((results.confidence_upper[day], 0)),
+                }
+            predictions[i] = (result_dict, results.rsquared, results.pvalues)
+
+        return predictions
 
     def _enumerate_dates(self, date_list):
         """Given a list of dates, return a list of integers.
@@ -222,11 +262,7 @@ class Forecast:
             If _remove_outliers() returns {"2000-01-01": 1.0, "2000-01-03": 1.5}
             then _enumerate_dates() returns [0, 2]
         """
-        days = self.dh.list_days(
-            datetime.combine(date_list[0], self.dh.midnight), datetime.combine(date_list[-1], self.dh.midnight)
-        )
-        out = [i for i, day in enumerate(days) if day.date() in date_list]
-        return out
+        return [(day - date_list[0]).days for day in date_list]
 
     def _remove_outliers(self, data):
         """Remove outliers from our dateset before predicting.
@@ -334,49 +370,80 @@ class Forecast:
             response.append(dikt)
         return response
 
-    def _run_forecast(self, x, y, to_predict=None):
-        """Apply the forecast model.
+    def _run_forecast(self, series):
+        """Apply the forecast model to every series with one batched least-squares solve.
 
         Args:
-            x (list) a list of exogenous variables
-            y (list) a list of endogenous variables
-            to_predict (list) a list of exogenous variables used in the forecast results
-
-        Note:
-            both x and y MUST be the same number of elements
+            series (list) a list of lists of (date, cost) tuples, each sorted by date
 
         Returns:
-            (tuple)
-                (numpy.ndarray) prediction values
-                (numpy.ndarray) confidence interval lower bound
-                (numpy.ndarray) confidence interval upper bound
-                (float) R-squared value
-                (list) P-values
+            (list) a LinearForecastResult for each series
         """
-        x = sm.add_constant(x)
-        to_predict = sm.add_constant(to_predict)
-        model = sm.OLS(y, x)
-        results = model.fit()
-        return LinearForecastResult(results, exog=to_predict)
+        length = max(len(data) for data in series)
+        x = np.zeros((len(series), length))
+        y = np.zeros((len(series), length))
+        mask = np.zeros((len(series), length))
+        to_predict = np.zeros((len(series), self.forecast_days_required))
+        today = datetime.combine(self.dh.today.date(), self.dh.midnight)
+        for i, data in enumerate(series):
+            dates, costs = zip(*data)
+            x[i, : len(data)] = self._enumerate_dates(dates)
+            y[i, : len(data)] = [float(c) for c in costs]
+            mask[i, : len(data)] = 1
+            # difference in days between the first day to be predicted and the first day of data
+            first_day = (today - datetime.combine(dates[0], self.dh.midnight)).days
+            to_predict[i] = np.arange(first_day, first_day + self.forecast_days_required)
+
+        # padded observations have an all zero row in the design matrix, so they do not affect the fit
+        exog = np.stack([mask, x * mask], axis=-1)
+        xtx = exog.transpose(0, 2, 1) @ exog
+        params = np.linalg.solve(xtx, exog.transpose(0, 2, 1) @ (y * mask)[..., None])[..., 0]
+
+        nobs = mask.sum(axis=1)
+        df_resid = nobs - 2
+        resid = (y - params[:, :1] - params[:, 1:] * x) * mask
+        ssr = (resid**2).sum(axis=1)
+        centered_tss = (((y - (y * mask).sum(axis=1, keepdims=True) / nobs[:, None]) * mask) ** 2).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = ssr / df_resid
+            rsquared = 1 - ssr / centered_tss
+            cov_params = np.linalg.inv(xtx) * scale[:, None, None]
+            tvalues = params / np.sqrt(np.diagonal(cov_params, axis1=1, axis2=2))
+        pvalues = stats.t.sf(np.abs(tvalues), df_resid[:, None]) * 2
+
+        # closed-form 95% prediction intervals: var = scale + x' cov x
+        pred_exog = np.stack([np.ones_like(to_predict), to_predict], axis=-1)
+        prediction = params[:, :1] + params[:, 1:] * to_predict
+        predict_std = np.sqrt(scale[:, None] + np.einsum("spi,sij,spj->sp", pred_exog, cov_params, pred_exog))
+        interval = stats.t.isf(0.025, df_resid)[:, None] * predict_std
+
+        return [
+            LinearForecastResult(
+                params[i],
+                pvalues[i],
+                rsquared[i],
+                prediction[i],
+                prediction[i] - interval[i],
+                prediction[i] + interval[i],
+            )
+            for i in range(len(series))
+        ]
 
-    def _uniquify_qset(self, qset, field="total_cost"):
-        """Take a QuerySet list, sum costs within the same day, and arrange it into a list of tuples.
+    def _uniquify_qset(self, qset, fields=COST_FIELD_NAMES):
+        """Take a QuerySet list, sum costs within the same day, and arrange it into lists of tuples.
 
         Args:
             qset (QuerySet)
-            field (str) - field name in the QuerySet to be summed
+            fields (list) - field names in the QuerySet to be summed
 
         Returns:
-            [(date, cost), ...]
+            {field: [(date, cost), ...], ...}
         """
-        # FIXME: this QuerySet->dict->list conversion probably isn't ideal.
-        # FIXME: there's probably a way to aggregate multiple sources by date using just the ORM.
-        result = defaultdict(Decimal)
+        results = {field: defaultdict(Decimal) for field in fields}
         for item in qset:
-            result[item.get("usage_start")] += Decimal(item.get(field, 0.0))
-        result = self._remove_outliers(result)
-        out = [(k, v) for k, v in result.items()]
-        return out
+            for field in fields:
+                results[field][item.get("usage_start")] += Decimal(item.get(field) or 0.0)
+        return {field: list(self._remove_outliers(result).items()) for field, result in results.items()}
 
     def set_access_filters(self, access, filt, filters):
         """Set access filters to ensure RBAC restrictions adhere to user's access and filters.
@@ -399,28 +466,48 @@ class Forecast:
             filters.add(q_filter)
 
 
+class CachedForecastParams:
+    """Query parameters of the unrestricted forecasts precomputed outside of a request."""
+
+    def __init__(self, tenant, cost_type=None):
+        """Class constructor."""
+        self.tenant = tenant
+        self.parameters = {"cost_type": cost_type}
+
+    def get(self, item, default=None):
+        """Get parameter data, return default if param value is None or empty."""
+        return self.parameters.get(item) or default
+
+    def get_access(self, filt, default=None):
+        """Get an access parameter."""
+        return default
+
+
 class LinearForecastResult:
     """Container class for linear forecast results.
 
     Note: this class should be considered read-only
     """
 
-    def __init__(self, regression_result, exog=None):
+    def __init__(self, params, pvalues, rsquared, prediction, confidence_lower, confidence_upper):
         """Class constructor.
 
         Args:
-            regression_result (RegressionResult) the results of a statsmodels regression
-            exog (array-like) future exogenous variables; points to predict
+            params (array-like) the Y-intercept and slope estimates
+            pvalues (array-like) the P-values of the estimates
+            rsquared (float) the R-squared value of the fit
+            prediction (array-like) the predicted values
+            confidence_lower (array-like) the prediction interval lower-bound
+            confidence_upper (array-like) the prediction interval upper-bound
         """
-        self._exog = exog
-        self._regression_result = regression_result
-        self._std_err, self._conf_lower, self._conf_upper = wls_prediction_std(regression_result, exog=exog)
-
-        try:
-            LOG.debug(regression_result.summary())
-        except (ValueWarning, UserWarning) as exc:
-            LOG.warning(exc)
-
+        self._params = params
+        self._pvalues = pvalues
+        self._rsquared = rsquared
+        self._prediction = prediction
+        self._conf_lower = confidence_lower
+        self._conf_upper = confidence_upper
+
+        LOG.debug("Forecast prediction: %s", self.prediction)
         LOG.debug("Forecast interval lower-bound: %s", self.confidence_lower)
         LOG.debug("Forecast interval upper-bound: %s", self.confidence_upper)
 
@@ -428,23 +515,10 @@ class LinearForecastResult:
     def prediction(self):
         """Forecast prediction.
 
-        Args:
-            to_predict (array-like) - values to predict; uses model training values if not set.
-
         Returns:
-            (array-like) - an nparray of prediction values or empty list
+            (array-like) - an nparray of prediction values
         """
-        # predict() returns the same number of elements as the number of input observations
-        prediction = []
-        try:
-            if self._exog is not None:
-                prediction = self._regression_result.predict(sm.add_constant(self._exog))
-            else:
-                prediction = self._regression_result.predict()
-        except ValueError as exc:
-            LOG.error(exc)
-        LOG.debug("Forecast prediction: %s", prediction)
-        return prediction
+        return self._prediction
 
     @property
     def confidence_lower(self):
@@ -459,7 +533,7 @@ class LinearForecastResult:
     @property
     def rsquared(self):
         """Forecast R-squared value."""
-        return self._regression_result.rsquared
+        return self._rsquared
 
     @property
     def pvalues(self):
@@ -471,34 +545,33 @@ class LinearForecastResult:
             (str) or [(str), (str)]
         """
         f_format = f"%.{Forecast.PRECISION}f"  # avoid converting floats to e-notation
-        if len(self._regression_result.pvalues.tolist()) == 1:
-            return f_format % self._regression_result.pvalues.tolist()[0]
+        pvalues = list(self._pvalues)
+        if len(pvalues) == 1:
+            return f_format % pvalues[0]
         else:
-            return [f_format % item for item in self._regression_result.pvalues.tolist()]
+            return [f_format % item for item in pvalues]
 
     @property
     def slope(self):
         """Slope estimate of linear regression.
 
         For a basic linear regression, params is always a list of two values - the slope and the Y-intercept.
-        This assumption is not true for more advanced cases using other types of least-squares regressions.
 
         Returns:
             (float) the estimated slope param
         """
-        return self._regression_result.params[1]
+        return self._params[1]
 
     @property
     def intercept(self):
         """Y-intercept estimate of linear regression.
 
         For a basic linear regression, params is always a list of two values - the slope and the Y-intercept.
-        This assumption is not true for more advanced cases using other types of least-squares regressions.
 
         Returns:
             (float) the estimated Y-intercept param
         """
-        return self._regression_result.params[0]
+        return self._params[0]
 
 
 class AWSForecast(Forecast):
@@ -506,6 +579,7 @@ class AWSForecast(Forecast):
 
     provider = Provider.PROVIDER_AWS
     provider_map_class = AWSProviderMap
+    CACHED_COST_TYPES = tuple(choice for choice, _ in AWSCostForecastParamSerializer.COST_TYPE_CHOICE)
 
     def set_access_filters(self, access, filt, filters):
         """Set access filters to ensure RBAC restrictions adhere to user's access and filters.
@@ -592,3 +666,58 @@ class OCIForecast(Forecast):
 
     provider = Provider.PROVIDER_OCI
     provider_map_class = OCIProviderMap
+
+
+# the forecasts whose data changes when a source of each type is summarized
+SOURCE_TYPE_FORECASTS = {
+    Provider.PROVIDER_AWS: (AWSForecast, OCPAWSForecast, OCPAllForecast),
+    Provider.PROVIDER_AWS_LOCAL: (AWSForecast, OCPAWSForecast, OCPAllForecast),
+    Provider.PROVIDER_AZURE: (AzureForecast, OCPAzureForecast, OCPAllForecast),
+    Provider.PROVIDER_AZURE_LOCAL: (AzureForecast, OCPAzureForecast, OCPAllForecast),
+    Provider.PROVIDER_GCP: (GCPForecast, OCPGCPForecast, OCPAllForecast),
+    Provider.PROVIDER_GCP_LOCAL: (GCPForecast, OCPGCPForecast, OCPAllForecast),
+    Provider.PROVIDER_OCI: (OCIForecast,),
+    Provider.PROVIDER_OCI_LOCAL: (OCIForecast,),
+    Provider.PROVIDER_OCP: (OCPForecast, OCPAWSForecast, OCPAzureForecast, OCPGCPForecast, OCPAllForecast),
+}
+
+
+def _cached_forecasts(schema_name, source_type):
+    """Yield the unrestricted forecasts of a tenant whose data depends on sources of the given type."""
+    forecast_classes = SOURCE_TYPE_FORECASTS.get(source_type, ())
+    if not forecast_classes:
+        LOG.info("No cached forecasts for source type %s.", source_type)
+        return
+
+    tenant = Tenant.objects.filter(schema_name=schema_name).first()
+    if not tenant:
+        LOG.info("No tenant found for schema %s.", schema_name)
+        return
+    for forecast_class in forecast_classes:
+        for cost_type in forecast_class.CACHED_COST_TYPES:
+            yield forecast_class(CachedForecastParams(tenant, cost_type))
+
+
+def precompute_forecasts(schema_name, source_type):
+    """Precompute the unrestricted forecasts of a tenant after a source of the given type was summarized."""
+    for forecast in _cached_forecasts(schema_name, source_type):
+        LOG.info(
+            "Refreshing %s forecast for %s (cost type: %s).",
+            forecast.provider,
+            schema_name,
+            getattr(forecast, "cost_type", None),
+        )
+        forecast.refresh_cache()
+
+
+def invalidate_forecasts(schema_name, source_type):
+    """Drop the cached forecasts of a tenant after costs of a source of the given type changed outside ingestion.
+
+    The next request for each forecast computes and caches it again.
+    """
+    forecasts = list(_cached_forecasts(schema_name, source_type))
+    if not forecasts:
+        return
+    LOG.info("Invalidating %d cached forecasts for %s (source type: %s).", len(forecasts), schema_name, source_type)
+    with tenant_context(forecasts[0].params.tenant):
+        caches["default"].delete_many([forecast.cache_key for forecast in forecasts])
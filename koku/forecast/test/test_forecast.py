@@ -12,7 +12,9 @@ from decimal import Decimal
 from unittest.mock import Mock
 from unittest.mock import patch
 
-from statsmodels.tools.sm_exceptions import ValueWarning
+import numpy as np
+from django.core.cache import caches
+from django.test import override_settings
 
 from api.forecast.views import AWSCostForecastView
 from api.forecast.views import AzureCostForecastView
@@ -23,6 +25,8 @@ from api.forecast.views import OCPAWSCostForecastView
 from api.forecast.views import OCPAzureCostForecastView
 from api.forecast.views import OCPCostForecastView
 from api.iam.test.iam_test_case import IamTestCase
+from api.models import Provider
+from api.models import Tenant
 from api.query_filter import QueryFilter
 from api.query_filter import QueryFilterCollection
 from api.report.test.test_queries import assertSameQ
@@ -35,7 +39,11 @@ from forecast import OCPAllForecast
 from forecast import OCPAWSForecast
 from forecast import OCPAzureForecast
 from forecast import OCPForecast
+from forecast.forecast import CachedForecastParams
+from forecast.forecast import Forecast
+from forecast.forecast import invalidate_forecasts
 from forecast.forecast import LinearForecastResult
+from forecast.forecast import precompute_forecasts
 from forecast.forecast import ZERO_RESULT
 from reporting.provider.aws.models import AWSCostSummaryByAccountP
 from reporting.provider.gcp.models import GCPCostSummaryByAccountP
@@ -48,6 +56,7 @@ from reporting.provider.ocp.models import OCPCostSummaryP
 from reporting.provider.ocp.models import OCPUsageLineItemDailySummary
 
 LOG = logging.getLogger(__name__)
+AWS_COST_TYPES = AWSForecast.CACHED_COST_TYPES
 
 
 class MockQuerySet:
@@ -441,12 +450,16 @@ class AWSForecastTest(IamTestCase):
 
     @patch("forecast.forecast.Forecast.format_result", return_value="FAKE RESULTS")
     @patch("forecast.forecast.Forecast._run_forecast")
-    @patch("forecast.forecast.Forecast._enumerate_dates", return_value=[0, 1, 2, 3, 4])
-    def test_negative_values(self, mock_enumerate_dates, mock_run_forecast, mock_format_result):
+    def test_negative_values(self, mock_run_forecast, mock_format_result):
         """COST-1110: ensure that the forecast response does not include negative numbers."""
-        mock_run_forecast.return_value = Mock(
-            prediction=[1, 0, -1, -2, -3], confidence_lower=[2, 1, 0, -1, -2], confidence_upper=[3, 2, 1, 0, -1]
-        )
+        mock_run_forecast.side_effect = lambda series: [
+            Mock(
+                prediction=[1, 0, -1, -2, -3],
+                confidence_lower=[2, 1, 0, -1, -2],
+                confidence_upper=[3, 2, 1, 0, -1],
+            )
+            for _ in series
+        ]
         params = self.mocked_query_params("?", AWSCostForecastView)
         instance = AWSForecast(params)
         instance.predict()
@@ -459,6 +472,58 @@ class AWSForecastTest(IamTestCase):
                     self.assertGreaterEqual(inner_val[0]["confidence_min"], 0)
                     self.assertGreaterEqual(inner_val[0]["confidence_max"], 0)
 
+    def test_run_forecast_batched(self):
+        """Test that a batch of series gets the same fit as each series forecast on its own."""
+        dh = DateHelper()
+        series = []
+        for slope in (0.5, 2, -1):
+            series.append(
+                [
+                    (dh.n_days_ago(dh.today, 20 - n).date(), Decimal(100 + slope * n + random.random()))
+                    for n in range(0, 20)
+                    if n % (abs(int(slope)) + 2)
+                ]
+            )
+
+        params = self.mocked_query_params("?", AWSCostForecastView)
+        instance = AWSForecast(params)
+        results = instance._run_forecast(series)
+
+        self.assertEqual(len(results), len(series))
+        for data, result in zip(series, results):
+            with self.subTest(data=data):
+                single = instance._run_forecast([data])[0]
+                x = instance._enumerate_dates([day for day, _ in data])
+                slope, intercept = np.polyfit(x, [float(cost) for _, cost in data], 1)
+                self.assertAlmostEqual(result.slope, slope)
+                self.assertAlmostEqual(result.intercept, intercept)
+                self.assertEqual(len(result.prediction), instance.forecast_days_required)
+                np.testing.assert_allclose(result.prediction, single.prediction)
+                np.testing.assert_allclose(result.confidence_lower, single.confidence_lower)
+                np.testing.assert_allclose(result.confidence_upper, single.confidence_upper)
+                self.assertTrue(all(np.less(result.confidence_lower, result.prediction)))
+                self.assertTrue(all(np.greater(result.confidence_upper, result.prediction)))
+
+    def test_run_forecast_reference_values(self):
+        """Test the fit against reference values from statsmodels OLS and wls_prediction_std."""
+        dh = DateHelper()
+        costs = [10.0, 12.5, 11.0, 14.0, 15.5, 14.5, 17.0, 18.5, 18.0, 21.0]
+        data = [(dh.n_days_ago(dh.today, len(costs) - n).date(), Decimal(cost)) for n, cost in enumerate(costs)]
+
+        params = self.mocked_query_params("?", AWSCostForecastView)
+        instance = AWSForecast(params)
+        instance.forecast_days_required = 2
+        result = instance._run_forecast([data])[0]
+
+        # statsmodels 0.15: sm.OLS(costs, sm.add_constant(range(10))).fit(), predicted for x = 10 and 11
+        self.assertAlmostEqual(result.intercept, 10.20909091)
+        self.assertAlmostEqual(result.slope, 1.10909091)
+        self.assertAlmostEqual(result.rsquared, 0.92592900)
+        self.assertEqual(result.pvalues, ["0.00000013", "0.00000849"])
+        np.testing.assert_allclose(result.prediction, [21.3, 22.40909091])
+        np.testing.assert_allclose(result.confidence_lower, [18.48673796, 19.4596254])
+        np.testing.assert_allclose(result.confidence_upper, [24.11326204, 25.35855641])
+
     def test__key_results_by_date(self):
         table = [
             {
@@ -1036,25 +1101,108 @@ class OCPAzureForecastTest(IamTestCase):
 class LinearForecastResultTest(IamTestCase):
     """Tests the LinearForecastResult class."""
 
-    @patch("forecast.forecast.wls_prediction_std", return_value=(1, 2, 3))
-    def test_constructor_logging(self, _):
-        """Test that the constructor logs messages."""
-        fake_results = Mock(summary=Mock(side_effect=ValueWarning("test")))
-
-        with self.assertLogs(logger="forecast.forecast", level=logging.WARNING):
-            LinearForecastResult(fake_results)
-
-    @patch("forecast.forecast.wls_prediction_std", return_value=(1, 2, 3))
-    def test_pvalues_slope_intercept(self, _):
+    def test_pvalues_slope_intercept(self):
         """Test the slope, intercept, and pvalues properties."""
-        fake_results = Mock(
-            summary=Mock(return_value="this is a test summary"),
-            pvalues=Mock(tolist=Mock(return_value=[99999, 88888])),
-            params=[66666, 77777],
+        lfr = LinearForecastResult(
+            params=np.array([66666, 77777]),
+            pvalues=np.array([99999, 88888]),
+            rsquared=0.5,
+            prediction=np.array([1, 2]),
+            confidence_lower=np.array([0, 1]),
+            confidence_upper=np.array([2, 3]),
         )
 
-        lfr = LinearForecastResult(fake_results)
-
         self.assertEqual(lfr.pvalues, ["99999.00000000", "88888.00000000"])
         self.assertEqual(lfr.slope, 77777)
         self.assertEqual(lfr.intercept, 66666)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "forecast-cache",
+            "KEY_FUNCTION": "tenant_schemas.cache.make_key",
+            "REVERSE_KEY_FUNCTION": "tenant_schemas.cache.reverse_key",
+        }
+    }
+)
+class ForecastCacheTest(IamTestCase):
+    """Tests the precomputed forecasts."""
+
+    def tearDown(self):
+        """Clear the precomputed forecasts."""
+        caches["default"].clear()
+        super().tearDown()
+
+    def test_predict_reads_precomputed_forecast(self):
+        """Test that predict() returns the precomputed forecast without running the forecast."""
+        params = self.mocked_query_params("?", OCPCostForecastView)
+        instance = OCPForecast(params)
+        expected = [{"date": "precomputed"}]
+        with patch.object(OCPForecast, "_run_predict", return_value=expected) as mock_run_predict:
+            instance.refresh_cache()
+            mock_run_predict.reset_mock()
+            self.assertEqual(instance.predict(), expected)
+            mock_run_predict.assert_not_called()
+
+    def test_predict_without_precomputed_forecast(self):
+        """Test that predict() runs the forecast when it was not precomputed."""
+        params = self.mocked_query_params("?", OCPCostForecastView)
+        instance = OCPForecast(params)
+        with patch.object(OCPForecast, "_run_predict", return_value=[]) as mock_run_predict:
+            self.assertEqual(instance.predict(), [])
+            mock_run_predict.assert_called_once()
+
+    def test_predict_caches_computed_forecast(self):
+        """Test that a forecast computed by predict() is cached for the next request."""
+        params = self.mocked_query_params("?", OCPCostForecastView)
+        instance = OCPForecast(params)
+        with patch.object(OCPForecast, "_run_predict", return_value=[]) as mock_run_predict:
+            self.assertEqual(instance.predict(), [])
+            self.assertEqual(instance.predict(), [])
+            mock_run_predict.assert_called_once()
+
+    def test_invalidate_forecasts(self):
+        """Test that the cached forecasts of a source type are dropped."""
+        tenant = Tenant.objects.get(schema_name=self.schema_name)
+        instance = OCPForecast(CachedForecastParams(tenant))
+        with patch.object(OCPForecast, "_run_predict", return_value=[{"date": "cached"}]) as mock_run_predict:
+            instance.refresh_cache()
+            invalidate_forecasts(self.schema_name, Provider.PROVIDER_OCP)
+            mock_run_predict.reset_mock()
+            instance.predict()
+            mock_run_predict.assert_called_once()
+
+    def test_invalidate_forecasts_unknown_tenant(self):
+        """Test that invalidating the forecasts of a missing tenant does nothing."""
+        with patch.object(Forecast, "refresh_cache") as mock_refresh:
+            invalidate_forecasts("org_missing", Provider.PROVIDER_OCP)
+            precompute_forecasts("org_missing", Provider.PROVIDER_OCP)
+            mock_refresh.assert_not_called()
+
+    def test_cache_key_with_access(self):
+        """Test that forecasts restricted by access are not read from the cache."""
+        params = self.mocked_query_params("?", AWSCostForecastView)
+        params.parameters["access"] = {"account": {"read": ["589173575009"]}}
+        instance = AWSForecast(params)
+        self.assertIsNone(instance.cache_key)
+
+    def test_cache_key_cost_type(self):
+        """Test that the cache key of AWS forecasts contains the cost type."""
+        tenant = Tenant.objects.get(schema_name=self.schema_name)
+        keys = {AWSForecast(CachedForecastParams(tenant, cost_type)).cache_key for cost_type in AWS_COST_TYPES}
+        self.assertEqual(len(keys), len(AWS_COST_TYPES))
+
+    @patch.object(Forecast, "refresh_cache")
+    def test_precompute_forecasts(self, mock_refresh):
+        """Test that the forecasts of a source type are refreshed for every cost type."""
+        precompute_forecasts(self.schema_name, Provider.PROVIDER_AWS)
+        expected = len(AWS_COST_TYPES) + len(OCPAWSForecast.CACHED_COST_TYPES) + len(OCPAllForecast.CACHED_COST_TYPES)
+        self.assertEqual(mock_refresh.call_count, expected)
+
+    @patch.object(Forecast, "refresh_cache")
+    def test_precompute_forecasts_unknown_source_type(self, mock_refresh):
+        """Test that nothing is refreshed for a source type without forecasts."""
+        precompute_forecasts(self.schema_name, "UNKNOWN")
+        mock_refresh.assert_not_called()
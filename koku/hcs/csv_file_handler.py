@@ -1,10 +1,13 @@
+import io
 import logging
-import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
+from django.conf import settings
 
 from api.common import log_json
-from masu.util.aws.common import copy_local_hcs_report_file_to_s3_bucket
+from masu.config import Config
+from masu.util.aws.common import copy_hcs_data_to_s3_bucket
 
 LOG = logging.getLogger(__name__)
 
@@ -38,6 +41,35 @@ class CSVFileHandler:
         )
 
         LOG.info(log_json(tracing_id, "preparing to write file to object storage"))
-        my_df.to_csv(filename, header=cols, index=False)
-        copy_local_hcs_report_file_to_s3_bucket(tracing_id, s3_csv_path, filename, filename, finalize, date)
-        os.remove(filename)
+        # the CSV is built in memory and streamed to object storage without a local file
+        csv_buffer = io.BytesIO()
+        my_df.to_csv(csv_buffer, header=cols, index=False)
+        csv_buffer.seek(0)
+        if settings.ENABLE_S3_ARCHIVING:
+            LOG.info(f"copy_HCS_report_to_s3_bucket: {s3_csv_path} {filename}")
+            context = {"schema": self._schema_name, "provider_uuid": self._provider_uuid}
+            copy_hcs_data_to_s3_bucket(tracing_id, s3_csv_path, filename, csv_buffer, finalize, context)
+
+    def write_daily_csvs_to_s3(self, daily_data, cols, finalize=False, tracing_id=None):
+        """
+        Generates the HCS CSV of every day, uploading up to Config.HCS_UPLOAD_MAX_WORKERS at a time.
+        :param daily_data (dict) rows of each date, keyed by date
+        :param cols
+        :param finalize
+        :param tracing_id
+
+        :return none
+        """
+        max_workers = min(Config.HCS_UPLOAD_MAX_WORKERS, len(daily_data))
+        if max_workers <= 1:
+            for date, data in daily_data.items():
+                self.write_csv_to_s3(date, data, cols, finalize, tracing_id)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hcs-upload") as executor:
+            futures = [
+                executor.submit(self.write_csv_to_s3, date, data, cols, finalize, tracing_id)
+                for date, data in daily_data.items()
+            ]
+            for future in futures:
+                future.result()
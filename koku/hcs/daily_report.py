@@ -4,6 +4,7 @@
 #
 """HCS daily report builder"""
 import logging
+from itertools import groupby
 
 from api.common import log_json
 from hcs.database.report_db_accessor import HCSReportDBAccessor
@@ -37,9 +38,19 @@ class ReportHCS:
 
         with HCSReportDBAccessor(self._schema_name) as accessor:
             try:
-                for date in date_range(start_date, end_date, step=1):
-                    accessor.get_hcs_daily_summary(
-                        date, self._provider, self._provider_uuid, sql_file, self._tracing_id, finalize
+                # one query per month, because the daily tables are partitioned by year and month
+                for _, month_dates in groupby(
+                    date_range(start_date, end_date, step=1), key=lambda d: (d.year, d.month)
+                ):
+                    month_dates = list(month_dates)
+                    accessor.get_hcs_summary(
+                        month_dates[0],
+                        month_dates[-1],
+                        self._provider,
+                        self._provider_uuid,
+                        sql_file,
+                        self._tracing_id,
+                        finalize,
                     )
 
             except HCSTableNotFoundError as tnfe:
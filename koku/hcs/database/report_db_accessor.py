@@ -4,17 +4,18 @@
 #
 """Database accessor for report data."""
 import logging
-import pkgutil
-
-from jinjasql import JinjaSql
+from collections import defaultdict
 
 from api.common import log_json
 from api.iam.models import Customer
 from api.provider.models import Provider
 from hcs.csv_file_handler import CSVFileHandler
 from hcs.exceptions import HCSTableNotFoundError
+from koku.sql_templates import get_sql
+from koku.sql_templates import JINJA_SQL
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
 from masu.external.date_accessor import DateAccessor
+from masu.util.common import date_range
 from reporting.provider.aws.models import PRESTO_LINE_ITEM_DAILY_TABLE as AWS_PRESTO_LINE_ITEM_DAILY_TABLE
 from reporting.provider.azure.models import PRESTO_LINE_ITEM_DAILY_TABLE as AZURE_PRESTO_LINE_ITEM_DAILY_TABLE
 from reporting.provider.gcp.models import PRESTO_LINE_ITEM_DAILY_TABLE as GCP_PRESTO_LINE_ITEM_DAILY_TABLE
@@ -26,6 +27,8 @@ HCS_TABLE_MAP = {
     Provider.PROVIDER_AZURE: AZURE_PRESTO_LINE_ITEM_DAILY_TABLE,
     Provider.PROVIDER_GCP: GCP_PRESTO_LINE_ITEM_DAILY_TABLE,
 }
+# the usage date of each row, selected by the HCS summary SQL to split the results into daily reports
+HCS_REPORT_DATE_COLUMN = "hcs_report_date"
 
 
 class HCSReportDBAccessor(ReportDBAccessorBase):
@@ -41,7 +44,7 @@ class HCSReportDBAccessor(ReportDBAccessorBase):
         self._ebs_acct_num = hcs_cust.account_id
         self._org_id = hcs_cust.org_id
         self.date_accessor = DateAccessor()
-        self.jinja_sql = JinjaSql()
+        self.jinja_sql = JINJA_SQL
 
     def get_hcs_daily_summary(self, date, provider, provider_uuid, sql_summary_file, tracing_id, finalize=False):
         """Build HCS daily report.
@@ -52,20 +55,40 @@ class HCSReportDBAccessor(ReportDBAccessorBase):
         :param tracing_id       (id)            Logging identifier
         :param finalize         (bool)          Set True when report is finalized(default=False)
 
+        :returns (None)
+        """
+        self.get_hcs_summary(date, date, provider, provider_uuid, sql_summary_file, tracing_id, finalize)
+
+    def get_hcs_summary(
+        self, start_date, end_date, provider, provider_uuid, sql_summary_file, tracing_id, finalize=False
+    ):
+        """Build the HCS daily reports of a date range with a single query.
+        :param start_date       (datetime.date) The first date to process
+        :param end_date         (datetime.date) The last date to process, in the same month as start_date
+        :param provider         (str)           The provider name
+        :param provider_uuid    (uuid)          ID for cost source
+        :param sql_summary_file (str)           The sql file used for processing
+        :param tracing_id       (id)            Logging identifier
+        :param finalize         (bool)          Set True when report is finalized(default=False)
+
         :returns (None)
         """
         LOG.info(log_json(tracing_id, "acquiring marketplace data..."))
+        if start_date == end_date:
+            dates = f"date: {start_date}"
+        else:
+            dates = f"start date: {start_date}, end date: {end_date}"
         LOG.info(
             log_json(
                 tracing_id,
                 f"schema: {self.schema}, provider: {provider}, "
-                + f"date: {date}, org_id: {self._org_id}, ebs_num: {self._ebs_acct_num}",
+                + f"{dates}, org_id: {self._org_id}, "
+                + f"ebs_num: {self._ebs_acct_num}",
             )
         )
 
         try:
-            sql = pkgutil.get_data("hcs.database", sql_summary_file)
-            sql = sql.decode("utf-8")
+            sql = get_sql("hcs.database", sql_summary_file)
             table = HCS_TABLE_MAP.get(provider.strip("-local"))
 
             if not self.table_exists_trino(table):
@@ -73,9 +96,10 @@ class HCSReportDBAccessor(ReportDBAccessorBase):
 
             sql_params = {
                 "provider_uuid": provider_uuid,
-                "year": date.year,
-                "month": date.strftime("%m"),
-                "date": date,
+                "year": start_date.year,
+                "month": start_date.strftime("%m"),
+                "start_date": start_date,
+                "end_date": end_date,
                 "schema": self.schema,
                 "ebs_acct_num": self._ebs_acct_num,
                 "org_id": self._org_id,
@@ -93,17 +117,29 @@ class HCSReportDBAccessor(ReportDBAccessorBase):
             # col[0] grabs the column names from the query results
             cols = [col[0] for col in description]
 
+            # partition the rows by day, dropping the report date column that is only used for the partitioning
+            daily_data = defaultdict(list)
             if len(data) > 0:
-                LOG.info(log_json(tracing_id, f"data found for date: {date}"))
-                csv_handler = CSVFileHandler(self.schema, provider, provider_uuid)
-                csv_handler.write_csv_to_s3(date, data, cols, finalize, tracing_id)
-            else:
-                LOG.info(
-                    log_json(
-                        tracing_id,
-                        f"no data found for date: {date}, " f"provider: {provider}, provider_uuid: {provider_uuid}",
+                date_idx = cols.index(HCS_REPORT_DATE_COLUMN)
+                cols = cols[:date_idx] + cols[date_idx + 1 :]  # noqa: E203
+                for row in data:
+                    daily_data[row[date_idx]].append(row[:date_idx] + row[date_idx + 1 :])  # noqa: E203
+
+            for date in date_range(start_date, end_date, step=1):
+                if date in daily_data:
+                    LOG.info(log_json(tracing_id, f"data found for date: {date}"))
+                else:
+                    LOG.info(
+                        log_json(
+                            tracing_id,
+                            f"no data found for date: {date}, "
+                            f"provider: {provider}, provider_uuid: {provider_uuid}",
+                        )
                     )
-                )
+
+            if daily_data:
+                csv_handler = CSVFileHandler(self.schema, provider, provider_uuid)
+                csv_handler.write_daily_csvs_to_s3(daily_data, cols, finalize, tracing_id)
 
         except FileNotFoundError:
             LOG.error(log_json(tracing_id, f"unable to locate SQL file: {sql_summary_file}"))
@@ -3,12 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Test HCSReportDBAccessor."""
+from datetime import date
 from datetime import timedelta
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from api.models import Provider
 from api.utils import DateHelper
+from hcs.database.report_db_accessor import HCS_REPORT_DATE_COLUMN
 from hcs.database.report_db_accessor import HCSReportDBAccessor
 from hcs.test import HCSTestCase
 
@@ -88,3 +90,30 @@ class TestHCSReportDBAccessor(HCSTestCase):
             self.assertIn("acquiring marketplace data...", _logs.output[0])
             self.assertIn(f"schema: {self.schema}, provider: {self.provider}, date: {self.today}", _logs.output[1])
             self.assertIn("data found for date", _logs.output[2])
+
+    @patch("hcs.csv_file_handler.CSVFileHandler.write_daily_csvs_to_s3")
+    @patch("hcs.database.report_db_accessor.HCSReportDBAccessor.table_exists_trino", return_value=True)
+    @patch("masu.database.report_db_accessor_base.ReportDBAccessorBase._execute_presto_raw_sql_query_with_description")
+    def test_hcs_summary_partitioned_by_day(self, mock_dba_query, mock_table_exists, mock_fh_writer):
+        """Test that a single query builds the report of every day in the range."""
+        start_date = date(2022, 4, 1)
+        end_date = date(2022, 4, 3)
+        description = [("cost",), (HCS_REPORT_DATE_COLUMN,), ("org_id",)]
+        data = [[1, start_date, "1234567"], [2, end_date, "1234567"], [3, start_date, "1234567"]]
+        mock_dba_query.return_value = (data, description)
+
+        with self.assertLogs("hcs.database", "INFO") as _logs:
+            hcs_accessor = HCSReportDBAccessor(self.schema)
+            hcs_accessor.get_hcs_summary(
+                start_date,
+                end_date,
+                self.provider,
+                self.provider_uuid,
+                "sql/reporting_aws_hcs_daily_summary.sql",
+                "1234-1234-1234",
+            )
+            self.assertIn("no data found for date: 2022-04-02", "".join(_logs.output))
+
+        mock_dba_query.assert_called_once()
+        expected = {start_date: [[1, "1234567"], [3, "1234567"]], end_date: [[2, "1234567"]]}
+        mock_fh_writer.assert_called_once_with(expected, ["cost", "org_id"], False, "1234-1234-1234")
@@ -4,6 +4,9 @@
 #
 """Test HCS csv_file_handler."""
 import logging
+import os
+from datetime import date
+from unittest.mock import patch
 
 from dateutil import parser
 
@@ -40,3 +43,32 @@ class TestHCSCSVFileHandler(HCSTestCase):
             fh.write_csv_to_s3(parser.parse("2022-04-04"), data.items(), "1234-1234-1234")
 
             self.assertIn("preparing to write file to object storage", _logs.output[0])
+
+    @patch("hcs.csv_file_handler.copy_hcs_data_to_s3_bucket")
+    def test_write_csv_to_s3_streams_data(self, mock_copy):
+        """Test that the CSV is uploaded from memory."""
+        date = parser.parse("2022-04-04")
+        with patch("hcs.csv_file_handler.settings.ENABLE_S3_ARCHIVING", True):
+            fh = CSVFileHandler(self.schema, self.provider, self.provider_uuid)
+            fh.write_csv_to_s3(date, [[1, 2]], ["x", "y"], True, "1234-1234-1234")
+
+        mock_copy.assert_called_once()
+        args = mock_copy.call_args[0]
+        self.assertEqual(args[1], f"hcs/csv/org1234567/AWS/source={self.provider_uuid}/year=2022/month=04")
+        self.assertEqual(args[2], f"hcs_{date}.csv")
+        self.assertEqual(args[3].read(), b"x,y\n1,2\n")
+        self.assertTrue(args[4])
+        self.assertFalse(os.path.exists(f"hcs_{date}.csv"))
+
+    @patch("hcs.csv_file_handler.CSVFileHandler.write_csv_to_s3")
+    def test_write_daily_csvs_to_s3(self, mock_write):
+        """Test that the CSV of every day is written."""
+        daily_data = {date(2022, 4, day): [[day]] for day in range(1, 6)}
+        for workers in (1, 3):
+            mock_write.reset_mock()
+            with self.subTest(workers=workers), patch("hcs.csv_file_handler.Config.HCS_UPLOAD_MAX_WORKERS", workers):
+                fh = CSVFileHandler(self.schema, self.provider, self.provider_uuid)
+                fh.write_daily_csvs_to_s3(daily_data, ["x"], False, "1234-1234-1234")
+                self.assertEqual(mock_write.call_count, len(daily_data))
+                for day, data in daily_data.items():
+                    mock_write.assert_any_call(day, data, ["x"], False, "1234-1234-1234")
@@ -4,7 +4,9 @@
 #
 """Test HCS csv_file_handler."""
 import logging
+from datetime import date
 from datetime import timedelta
+from unittest.mock import patch
 
 from api.utils import DateHelper
 from hcs.daily_report import ReportHCS
@@ -31,3 +33,31 @@ class TestReportHCS(HCSTestCase):
         self.assertEqual(dr._provider, self.aws_provider_type)
         self.assertEqual(dr._provider_uuid, self.aws_provider_uuid)
         self.assertEqual(dr._tracing_id, self.tracing_id)
+
+    @patch("hcs.daily_report.HCSReportDBAccessor")
+    def test_generate_report_one_query_per_month(self, mock_accessor):
+        """Test that the report of a date range is generated with one query per month."""
+        dr = ReportHCS(self.schema, self.aws_provider_type, self.aws_provider_uuid, self.tracing_id)
+        dr.generate_report("2022-04-28", "2022-05-02", True)
+
+        mock_get_summary = mock_accessor.return_value.__enter__.return_value.get_hcs_summary
+        sql_file = f"sql/reporting_{self.aws_provider_type.lower()}_hcs_daily_summary.sql"
+        self.assertEqual(mock_get_summary.call_count, 2)
+        mock_get_summary.assert_any_call(
+            date(2022, 4, 28),
+            date(2022, 4, 30),
+            self.aws_provider_type,
+            self.aws_provider_uuid,
+            sql_file,
+            self.tracing_id,
+            True,
+        )
+        mock_get_summary.assert_any_call(
+            date(2022, 5, 1),
+            date(2022, 5, 2),
+            self.aws_provider_type,
+            self.aws_provider_uuid,
+            sql_file,
+            self.tracing_id,
+            True,
+        )
@@ -6,7 +6,6 @@
 import json
 import logging
 import os
-import pkgutil
 import random
 import re
 import threading
@@ -29,15 +28,16 @@ from django.db.models.fields.json import KeyTextTransform
 from django.db.models.sql.compiler import SQLDeleteCompiler
 from django.db.utils import DatabaseError as d_DBError
 from django.db.utils import ProgrammingError
-from jinjasql import JinjaSql
 from psycopg2 import DatabaseError as p_DBError
 from sqlparse import format as format_sql
-from sqlparse import split as sql_split
 
 from .configurator import CONFIGURATOR
 from .env import ENVIRONMENT
 from .migration_sql_helpers import apply_sql_file
 from .migration_sql_helpers import find_db_functions_dir
+from .sql_templates import get_sql
+from .sql_templates import JINJA_SQL
+from .sql_templates import split_sql
 
 
 LOG = logging.getLogger(__name__)
@@ -590,30 +590,28 @@ class SQLScriptAtomicExecutorMixin:
     """This mixin accetps a jinja_sql sql script and parameters (dict) and process each statement
     in the script individually for better logging within PostgreSQL"""
 
-    DEFAULT_SQL_RENDERER = JinjaSql()
+    DEFAULT_SQL_RENDERER = JINJA_SQL
     DEFAULT_SQL_RENDERER_METHOD = DEFAULT_SQL_RENDERER.prepare_query
 
     def _execute_processing_script(
         self, base_module, script_file_path, sql_params, sql_renderer=DEFAULT_SQL_RENDERER_METHOD
     ):
         conn = transaction.get_connection()
-        sql = pkgutil.get_data(base_module, script_file_path).decode("utf-8")
-        for sql_stmt in sql_split(sql):
-            sql_stmt = sql_stmt.strip()
-            if sql_stmt:
-                sql_stmt, params = sql_renderer(sql_stmt, sql_params)
-                with conn.cursor() as cur:
-                    try:
-                        cur.execute(sql_stmt, params)
-                    except (ProgrammingError, IndexError) as exc:
-                        if isinstance(sql_stmt, bytes):
-                            sql_stmt = sql_stmt.decode("utf-8")
-                        msg = [
-                            f"ERROR in SQL statement: '{exc}'",
-                            f"Script file {os.path.join(base_module.replace('.', os.path.sep), script_file_path)}",
-                            f"STATEMENT: {sql_stmt}",
-                            f"PARAMS: {params}",
-                            f"INPUT_PARAMS: {sql_params}",
-                        ]
-                        LOG.error(os.linesep.join(msg))
-                        raise exc
+        sql = get_sql(base_module, script_file_path)
+        for sql_stmt in split_sql(sql):
+            sql_stmt, params = sql_renderer(sql_stmt, sql_params)
+            with conn.cursor() as cur:
+                try:
+                    cur.execute(sql_stmt, params)
+                except (ProgrammingError, IndexError) as exc:
+                    if isinstance(sql_stmt, bytes):
+                        sql_stmt = sql_stmt.decode("utf-8")
+                    msg = [
+                        f"ERROR in SQL statement: '{exc}'",
+                        f"Script file {os.path.join(base_module.replace('.', os.path.sep), script_file_path)}",
+                        f"STATEMENT: {sql_stmt}",
+                        f"PARAMS: {params}",
+                        f"INPUT_PARAMS: {sql_params}",
+                    ]
+                    LOG.error(os.linesep.join(msg))
+                    raise exc
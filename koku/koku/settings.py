@@ -191,6 +191,8 @@ WSGI_APPLICATION = "koku.wsgi.application"
 
 WORKER_CACHE_KEY = "worker"
 WORKER_CACHE_TIMEOUT = ENVIRONMENT.get_value("WORKER_CACHE_TIMEOUT", default=3600)
+# The worker cache holds the running task claims, so it must never reach MAX_ENTRIES and cull live entries
+WORKER_CACHE_MAX_ENTRIES = ENVIRONMENT.int("WORKER_CACHE_MAX_ENTRIES", default=1000000)
 CACHE_MIDDLEWARE_SECONDS = ENVIRONMENT.get_value("CACHE_TIMEOUT", default=3600)
 
 HOSTNAME = ENVIRONMENT.get_value("HOSTNAME", default="localhost")
@@ -250,6 +252,7 @@ else:
             "BACKEND": "django.core.cache.backends.db.DatabaseCache",
             "LOCATION": "worker_cache_table",
             "TIMEOUT": 86400,  # 24 hours
+            "OPTIONS": {"MAX_ENTRIES": WORKER_CACHE_MAX_ENTRIES},
         },
     }
 
@@ -497,6 +500,9 @@ IBM_SERVICE_URL = ENVIRONMENT.get_value("IBM_SERVICE_URL", default="https://ente
 # Time to wait between cold storage retrieval for data export. Default is 3 hours
 COLD_STORAGE_RETRIVAL_WAIT_TIME = ENVIRONMENT.int("COLD_STORAGE_RETRIVAL_WAIT_TIME", default=10800)
 
+# Concurrent object copies when syncing a data export to a customer bucket
+DATA_EXPORT_SYNC_MAX_WORKERS = ENVIRONMENT.int("DATA_EXPORT_SYNC_MAX_WORKERS", default=16)
+
 # Sources Client API Endpoints
 KOKU_SOURCES_CLIENT_HOST = CONFIGURATOR.get_endpoint_host("koku", "sources-client", "localhost")
 KOKU_SOURCES_CLIENT_PORT = CONFIGURATOR.get_endpoint_port("koku", "sources-client", "4000")
@@ -0,0 +1,67 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Process-wide cache of SQL templates rendered with JinjaSql."""
+import functools
+import os
+import pkgutil
+
+import sqlparse
+from jinja2 import Template
+from jinjasql import JinjaSql
+
+from masu.prometheus_stats import SQL_TEMPLATE_RENDER_DURATION
+
+
+SQL_TEMPLATE_CACHE_SIZE = int(os.environ.get("SQL_TEMPLATE_CACHE_SIZE", 1024))
+
+
+class CachedJinjaSql(JinjaSql):
+    """JinjaSql that compiles each distinct template source only once."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the renderer and its compiled template cache."""
+        super().__init__(*args, **kwargs)
+        self._compile = functools.lru_cache(maxsize=SQL_TEMPLATE_CACHE_SIZE)(self.env.from_string)
+
+    def prepare_query(self, source, data):
+        """
+        Render a template to SQL and bind parameters.
+        Params:
+            source (str, jinja2.Template) : template source or a template compiled by this renderer
+            data (dict) : template parameters
+        Returns:
+            tuple : (SQL, bind parameters)
+        """
+        template = source if isinstance(source, Template) else self._compile(source)
+        with SQL_TEMPLATE_RENDER_DURATION.time():
+            return self._prepare_query(template, data)
+
+
+JINJA_SQL = CachedJinjaSql()
+
+
+@functools.lru_cache(maxsize=SQL_TEMPLATE_CACHE_SIZE)
+def get_sql(base_module, sql_file_path):
+    """
+    Read a SQL file shipped with a package, once per process.
+    Params:
+        base_module (str) : package containing the file
+        sql_file_path (str) : path of the file relative to the package
+    Returns:
+        str : file contents
+    """
+    return pkgutil.get_data(base_module, sql_file_path).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=SQL_TEMPLATE_CACHE_SIZE)
+def split_sql(sql):
+    """
+    Split a SQL script into its statements, once per distinct script.
+    Params:
+        sql (str) : buffer of one or more semicolon-terminated SQL statements
+    Returns:
+        tuple : non-empty statements, stripped of surrounding whitespace
+    """
+    return tuple(stmt for stmt in (str(s).strip() for s in sqlparse.split(sql)) if stmt)
@@ -138,3 +138,31 @@ select a from b;
             with self.assertRaises(trino_db.TrinoStatementExecError):
                 conn = FakePrestoConn()
                 trino_db.executescript(conn, sqlscript)
+
+    def test_connect_reuses_connection(self):
+        """
+        Test that connections are reused per schema and share one http session
+        """
+        trino_db.reset_connections()
+        conn = trino_db.connect(schema=self.schema_name)
+        self.assertIs(trino_db.connect(schema=self.schema_name), conn)
+        other = trino_db.connect(schema="acct10002")
+        self.assertIsNot(other, conn)
+        self.assertIs(other._http_session, conn._http_session)
+        self.assertIs(conn._http_session, trino_db.get_http_session())
+
+        conn._client_session.schema = "acct10002"
+        self.assertIsNot(trino_db.connect(schema=self.schema_name), conn)
+
+    def test_get_http_session_recycled(self):
+        """
+        Test that the http session is rebuilt after a fork or once it is too old
+        """
+        trino_db.reset_connections()
+        session = trino_db.get_http_session()
+        self.assertIs(trino_db.get_http_session(), session)
+        with patch("koku.trino_database.os.getpid", return_value=-1):
+            self.assertIsNot(trino_db.get_http_session(), session)
+        session = trino_db.get_http_session()
+        with patch("koku.trino_database.TRINO_SESSION_MAX_AGE", -1):
+            self.assertIsNot(trino_db.get_http_session(), session)
@@ -0,0 +1,47 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Test the SQL template cache."""
+from unittest.mock import patch
+
+from django.test import TestCase
+from jinjasql import JinjaSql
+
+from koku.sql_templates import get_sql
+from koku.sql_templates import JINJA_SQL
+from koku.sql_templates import split_sql
+
+
+class SQLTemplatesTest(TestCase):
+    """Test cases for the SQL template cache."""
+
+    def test_prepare_query_matches_jinjasql(self):
+        """Test that cached rendering matches JinjaSql and compiles a source once."""
+        sql = "SELECT * FROM {{schema | sqlsafe}}.eek WHERE id IN {{ids | inclause}} AND day = {{day}}"
+        params = {"schema": "org1234567", "ids": [1, 2], "day": "2022-06-01"}
+        JINJA_SQL._compile.cache_clear()
+        for _ in range(3):
+            self.assertEqual(JINJA_SQL.prepare_query(sql, params), JinjaSql().prepare_query(sql, params))
+        cache_info = JINJA_SQL._compile.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 2)
+
+    def test_get_sql(self):
+        """Test that SQL files are read and decoded once."""
+        get_sql.cache_clear()
+        path = "sql/reporting_awstags_summary.sql"
+        with patch("koku.sql_templates.pkgutil.get_data", return_value=b"SELECT 1;") as mock_get_data:
+            self.assertEqual(get_sql("masu.database", path), "SELECT 1;")
+            self.assertEqual(get_sql("masu.database", path), "SELECT 1;")
+        mock_get_data.assert_called_once_with("masu.database", path)
+        get_sql.cache_clear()
+
+    def test_split_sql(self):
+        """Test that scripts are split into stripped, non-empty statements."""
+        script = """
+SELECT 1;
+
+  SELECT 2 ;
+"""
+        self.assertEqual(split_sql(script), ("SELECT 1;", "SELECT 2 ;"))
@@ -1,15 +1,34 @@
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from decimal import Decimal
 
-import sqlparse
+import requests
 import trino
+from requests.adapters import HTTPAdapter
 from trino.transaction import IsolationLevel
 
+from koku.sql_templates import split_sql
+from masu.prometheus_stats import TRINO_CONNECTION_CREATED_COUNTER
+from masu.prometheus_stats import TRINO_QUERY_DURATION
+
 
 LOG = logging.getLogger(__name__)
 
+# Size of the keep-alive pool shared by every trino connection in a process
+TRINO_POOL_MAXSIZE = int(os.environ.get("TRINO_POOL_MAXSIZE", 10))
+# Number of idle connections kept per thread, keyed by their connect arguments
+TRINO_CONNECTION_CACHE_SIZE = int(os.environ.get("TRINO_CONNECTION_CACHE_SIZE", 8))
+# Seconds before the shared http session is dropped and its sockets reopened
+TRINO_SESSION_MAX_AGE = int(os.environ.get("TRINO_SESSION_MAX_AGE", 600))
+
+_SESSION_LOCK = threading.Lock()
+_SESSION = {"session": None, "pid": None, "created": 0}
+_LOCAL = threading.local()
+
 POSITIONAL_VARS = re.compile("%s")
 NAMED_VARS = re.compile(r"%(.+)s")
 EOT = re.compile(r",\s*\)$")  # pylint: disable=anomalous-backslash-in-string
@@ -81,9 +100,63 @@ def sql_mogrify(sql, params=None):
         return sql
 
 
+def _new_http_session():
+    """Create a keep-alive http session sized for the trino connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=TRINO_POOL_MAXSIZE, pool_maxsize=TRINO_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    TRINO_CONNECTION_CREATED_COUNTER.labels(kind="session").inc()
+    return session
+
+
+def get_http_session():
+    """
+    Return the http session shared by trino connections in this process.
+    The session is rebuilt after a fork, since sockets cannot be shared with the parent,
+    and once it is older than TRINO_SESSION_MAX_AGE seconds.
+    Returns:
+        requests.Session : keep-alive session
+    """
+    with _SESSION_LOCK:
+        pid = os.getpid()
+        now = time.monotonic()
+        if _SESSION["session"] is None or _SESSION["pid"] != pid or now - _SESSION["created"] > TRINO_SESSION_MAX_AGE:
+            if _SESSION["session"] is not None and _SESSION["pid"] == pid:
+                _SESSION["session"].close()
+            _SESSION.update(session=_new_http_session(), pid=pid, created=now)
+        return _SESSION["session"]
+
+
+def reset_connections():
+    """Drop the shared http session and this thread's cached connections."""
+    with _SESSION_LOCK:
+        if _SESSION["session"] is not None and _SESSION["pid"] == os.getpid():
+            _SESSION["session"].close()
+        _SESSION.update(session=None, pid=None, created=0)
+    _LOCAL.__dict__.pop("connections", None)
+
+
+def _connection_is_reusable(conn, http_session, presto_connect_args):
+    """
+    Check that a cached connection can serve a new caller.
+    Queries can change the catalog, schema or transaction held by a connection,
+    so a connection is only handed out again while it still matches its connect arguments.
+    """
+    return (
+        conn._http_session is http_session
+        and conn.transaction is None
+        and conn._client_session.catalog == presto_connect_args["catalog"]
+        and conn._client_session.schema == presto_connect_args["schema"]
+        and not conn._client_session.properties
+    )
+
+
 def connect(**connect_args):
     """
     Establish a trino connection.
+    Autocommit connections share a per-process keep-alive http session and are
+    reused per thread for the same connect arguments.
     Keyword Params:
         schema (str) : trino schema (required)
         host (str) : trino hostname (can set from environment)
@@ -113,7 +186,23 @@ def connect(**connect_args):
         ),
         "schema": connect_args["schema"],
     }
-    conn = trino.dbapi.connect(**presto_connect_args)
+    http_session = get_http_session()
+    if presto_connect_args["isolation_level"] != IsolationLevel.AUTOCOMMIT:
+        TRINO_CONNECTION_CREATED_COUNTER.labels(kind="connection").inc()
+        return trino.dbapi.connect(**presto_connect_args, http_session=http_session)
+
+    key = tuple(str(presto_connect_args[arg]) for arg in ("host", "port", "user", "catalog", "schema"))
+    connections = _LOCAL.__dict__.setdefault("connections", OrderedDict())
+    conn = connections.get(key)
+    if conn is not None and _connection_is_reusable(conn, http_session, presto_connect_args):
+        connections.move_to_end(key)
+        return conn
+
+    TRINO_CONNECTION_CREATED_COUNTER.labels(kind="connection").inc()
+    conn = trino.dbapi.connect(**presto_connect_args, http_session=http_session)
+    connections[key] = conn
+    while len(connections) > TRINO_CONNECTION_CACHE_SIZE:
+        connections.popitem(last=False)
     return conn
 
 
@@ -148,7 +237,8 @@ def _execute(presto_cur, presto_stmt):
     Returns:
         trino.dbapi.Cursor : Cursor after execute method called
     """
-    presto_cur.execute(presto_stmt)
+    with TRINO_QUERY_DURATION.time():
+        presto_cur.execute(presto_stmt)
     return presto_cur
 
 
@@ -197,46 +287,44 @@ def executescript(presto_conn, sqlscript, params=None, preprocessor=None):
     """
     all_results = []
     stmt_count = 0
-    # sqlparse.split() should be a safer means to split a sql script into discrete statements
-    for stmt_num, p_stmt in enumerate(sqlparse.split(sqlscript)):
+    # split_sql() caches the sqlparse.split() of each distinct script
+    for stmt_num, p_stmt in enumerate(split_sql(sqlscript)):
         stmt_count = stmt_count + 1
-        p_stmt = str(p_stmt).strip()
-        if p_stmt:
-            # A semicolon statement terminator is invalid in the Presto dbapi interface
-            if p_stmt.endswith(";"):
-                p_stmt = p_stmt[:-1]
-
-            # This is typically for jinjasql templated sql
-            if preprocessor and params:
-                try:
-                    stmt, s_params = preprocessor(p_stmt, params)
-                # If a different preprocessor is used, we can't know what the exception type is.
-                except Exception as e:
-                    LOG.warning(
-                        f"Preprocessor Error ({e.__class__.__name__}) : {str(e)}"
-                        + os.linesep
-                        + f"Statement template : {p_stmt}"
-                        + os.linesep
-                        + f"Parameters : {params}"
-                    )
-                    exc_type = e.__class__.__name__
-                    raise PreprocessStatementError(f"{exc_type} :: {e}")
-            else:
-                stmt, s_params = p_stmt, params
+        # A semicolon statement terminator is invalid in the Presto dbapi interface
+        if p_stmt.endswith(";"):
+            p_stmt = p_stmt[:-1]
 
+        # This is typically for jinjasql templated sql
+        if preprocessor and params:
             try:
-                results, _ = execute(presto_conn, stmt, params=s_params)
+                stmt, s_params = preprocessor(p_stmt, params)
+            # If a different preprocessor is used, we can't know what the exception type is.
             except Exception as e:
-                exc_msg = (
-                    f"Trino Query Error ({e.__class__.__name__}) : {str(e)} statement number {stmt_num}"
+                LOG.warning(
+                    f"Preprocessor Error ({e.__class__.__name__}) : {str(e)}"
                     + os.linesep
-                    + f"Statement: {stmt}"
+                    + f"Statement template : {p_stmt}"
                     + os.linesep
-                    + f"Parameters: {s_params}"
+                    + f"Parameters : {params}"
                 )
-                LOG.warning(exc_msg)
-                raise TrinoStatementExecError(exc_msg)
-
-            all_results.extend(results)
+                exc_type = e.__class__.__name__
+                raise PreprocessStatementError(f"{exc_type} :: {e}")
+        else:
+            stmt, s_params = p_stmt, params
+
+        try:
+            results, _ = execute(presto_conn, stmt, params=s_params)
+        except Exception as e:
+            exc_msg = (
+                f"Trino Query Error ({e.__class__.__name__}) : {str(e)} statement number {stmt_num}"
+                + os.linesep
+                + f"Statement: {stmt}"
+                + os.linesep
+                + f"Parameters: {s_params}"
+            )
+            LOG.warning(exc_msg)
+            raise TrinoStatementExecError(exc_msg)
+
+        all_results.extend(results)
 
     return all_results
@@ -7,7 +7,6 @@
 import logging
 
 import requests
-import trino
 from django.conf import settings
 from django.views.decorators.cache import never_cache
 from rest_framework import status
@@ -19,6 +18,8 @@ from rest_framework.response import Response
 from rest_framework.settings import api_settings
 from rest_framework_csv.renderers import CSVRenderer
 
+import koku.trino_database as trino_db
+
 LOG = logging.getLogger(__name__)
 
 
@@ -49,7 +50,7 @@ def trino_query(request):
         msg = f"Running Trino query: {query}"
         LOG.info(msg)
 
-        with trino.dbapi.connect(
+        with trino_db.connect(
             host=settings.PRESTO_HOST, port=settings.PRESTO_PORT, user="admin", catalog="hive", schema=schema_name
         ) as conn:
             cur = conn.cursor()
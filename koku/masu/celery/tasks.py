@@ -4,16 +4,14 @@
 #
 """Asynchronous tasks."""
 import logging
-import math
 import os
-from datetime import datetime
+import re
 from datetime import timedelta
 
 import requests
 from botocore.exceptions import ClientError
 from celery.exceptions import MaxRetriesExceededError
 from django.conf import settings
-from django.utils import timezone
 from tenant_schemas.utils import schema_context
 
 from api.currency.currencies import CURRENCIES
@@ -42,11 +40,15 @@ from masu.processor.tasks import DEFAULT
 from masu.processor.tasks import PRIORITY_QUEUE
 from masu.processor.tasks import REMOVE_EXPIRED_DATA_QUEUE
 from masu.prometheus_stats import QUEUES
+from masu.prometheus_stats import VOLUME_CLEANUP_DURATION
+from masu.prometheus_stats import VOLUME_CLEANUP_FILES_COUNTER
+from masu.util.aws.common import delete_s3_objects
 from masu.util.aws.common import get_s3_resource
 from masu.util.ocp.common import REPORT_TYPES
 
 LOG = logging.getLogger(__name__)
 _DB_FETCH_BATCH_SIZE = 2000
+VOLUME_CLEANUP_BATCH_SIZE = 1000  # expired files removed and logged at a time by clean_volume
 
 
 @celery_app.task(name="masu.celery.tasks.check_report_updates", queue=DEFAULT)
@@ -142,22 +144,19 @@ def deleted_archived_with_prefix(s3_bucket_name, prefix):
     """
     Delete data from archive with given prefix.
 
+    The prefix is listed page by page and each page is deleted concurrently while the next one is listed.
+
     Args:
         s3_bucket_name (str): The s3 bucket name
         prefix (str): The prefix for deletion
+
+    Returns:
+        (list) the keys that could not be deleted
     """
     s3_resource = get_s3_resource()
     s3_bucket = s3_resource.Bucket(s3_bucket_name)
-    object_keys = [{"Key": s3_object.key} for s3_object in s3_bucket.objects.filter(Prefix=prefix)]
-    LOG.info(f"Starting objects: {len(object_keys)}")
-    batch_size = 1000  # AWS S3 delete API limits to 1000 objects per request.
-    for batch_number in range(math.ceil(len(object_keys) / batch_size)):
-        batch_start = batch_size * batch_number
-        batch_end = batch_start + batch_size
-        object_keys_batch = object_keys[batch_start:batch_end]
-        s3_bucket.delete_objects(Delete={"Objects": object_keys_batch})
-
-    remaining_objects = list(s3_bucket.objects.filter(Prefix=prefix))
+    object_keys = (s3_object.key for s3_object in s3_bucket.objects.filter(Prefix=prefix))
+    remaining_objects = delete_s3_objects(None, s3_bucket, object_keys, {"prefix": prefix})
     if remaining_objects:
         LOG.warning(
             "Found %s objects after attempting to delete all objects with prefix %s", len(remaining_objects), prefix
@@ -269,10 +268,13 @@ def sync_data_to_customer(dump_request_uuid):
 
     try:
         syncer = AwsS3Syncer(settings.S3_BUCKET_NAME)
+        # files synced by a previous attempt are skipped, so a retry resumes where the last one stopped
         syncer.sync_bucket(
             dump_request.created_by.customer.schema_name,
             dump_request.bucket_name,
             (dump_request.start_date, dump_request.end_date),
+            synced_keys=dump_request.get_synced_keys(),
+            checkpoint=dump_request.save_synced_keys,
         )
     except ClientError:
         LOG.exception(
@@ -320,6 +322,43 @@ def autovacuum_tune_schemas():
         autovacuum_tune_schema.delay(schema_name)
 
 
+def _scan_volume_files(path):
+    """Generate the directory entries of the files below path, without following directory symlinks."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_volume_files(entry.path)
+                elif not entry.is_dir():
+                    yield entry
+    except OSError as err:
+        LOG.warning("Unable to scan %s: %s", path, err)
+
+
+def _remove_volume_files(file_paths):
+    """Remove a batch of expired files from the volume and return the paths that were removed."""
+    deleted_files = []
+    for file_path in file_paths:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            continue
+        deleted_files.append(file_path)
+    VOLUME_CLEANUP_FILES_COUNTER.labels(result="deleted").inc(len(deleted_files))
+    LOG.info("The following files were deleted: %s", deleted_files)
+    return deleted_files
+
+
+def _get_exclude_pattern(assembly_ids):
+    """Compile one pattern matching a filename that contains any of the assembly ids."""
+    # an empty alternative would match every filename, so empty ids are dropped
+    # and a pattern that never matches is used when no ids are left
+    alternatives = [re.escape(str(assembly_id)) for assembly_id in assembly_ids if assembly_id]
+    if not alternatives:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(alternatives))
+
+
 @celery_app.task(name="masu.celery.tasks.clean_volume", queue=DEFAULT)
 def clean_volume():
     """Clean up the volume in the worker pod."""
@@ -333,34 +372,38 @@ def clean_volume():
     for month in months:
         assembly_ids = db_accessor.get_last_seen_manifest_ids(month)
         assembly_ids_to_exclude.extend(assembly_ids)
-    # now we want to loop through the files and clean up the ones that are not in the exclude list
-    deleted_files = []
-    retain_files = []
+    exclude_pattern = _get_exclude_pattern(assembly_ids_to_exclude)
 
+    # now we want to loop through the files and clean up the ones that are not in the exclude list
     datehelper = DateHelper()
     now = datehelper.now
     expiration_date = now - timedelta(seconds=Config.VOLUME_FILE_RETENTION)
-    for [root, _, filenames] in os.walk(Config.PVC_DIR):
-        for file in filenames:
-            match = False
-            for assembly_id in assembly_ids_to_exclude:
-                if assembly_id in file:
-                    match = True
+    expiration_timestamp = expiration_date.timestamp()
+    LOG.info("Removing all files older than %s", expiration_date)
+    delete_batch = []
+    deleted_count = 0
+    retained_count = 0
+    with VOLUME_CLEANUP_DURATION.time():
+        for entry in _scan_volume_files(Config.PVC_DIR):
             # if none of the assembly_ids that we care about were in the filename - we can safely delete it
-            if not match:
-                potential_delete = os.path.join(root, file)
-                if os.path.exists(potential_delete):
-                    file_datetime = datetime.fromtimestamp(os.path.getmtime(potential_delete))
-                    file_datetime = timezone.make_aware(file_datetime)
-                    if file_datetime < expiration_date:
-                        os.remove(potential_delete)
-                        deleted_files.append(potential_delete)
-                    else:
-                        retain_files.append(potential_delete)
+            if exclude_pattern.search(entry.name):
+                continue
+            try:
+                file_mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if file_mtime < expiration_timestamp:
+                delete_batch.append(entry.path)
+                if len(delete_batch) >= VOLUME_CLEANUP_BATCH_SIZE:
+                    deleted_count += len(_remove_volume_files(delete_batch))
+                    delete_batch = []
+            else:
+                retained_count += 1
+        if delete_batch:
+            deleted_count += len(_remove_volume_files(delete_batch))
 
-    LOG.info("Removing all files older than %s", expiration_date)
-    LOG.info("The following files were too new to delete: %s", retain_files)
-    LOG.info("The following files were deleted: %s", deleted_files)
+    VOLUME_CLEANUP_FILES_COUNTER.labels(result="retained").inc(retained_count)
+    LOG.info("Deleted %s files. %s files were too new to delete.", deleted_count, retained_count)
 
 
 @celery_app.task(name="masu.celery.tasks.get_daily_currency_rates", queue=DEFAULT)
@@ -22,6 +22,17 @@ DEFAULT_RETRY_SECONDS = 10
 DEFAULT_DEL_RECORD_LIMIT = 5000
 DEFAULT_MAX_ITERATIONS = 3
 DEFAULT_ENABLE_PARQUET_PROCESSING = False
+DEFAULT_POLLING_MAX_WORKERS = 10
+DEFAULT_POLLING_PROVIDER_TIMEOUT = 60 * 15
+DEFAULT_SUMMARY_COALESCE_WINDOW = 60
+DEFAULT_S3_TRANSFER_MAX_CONCURRENCY = 10
+DEFAULT_S3_TRANSFER_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_TRINO_COPY_PAGE_SIZE = 50000
+DEFAULT_UI_SUMMARY_MAX_WORKERS = 4
+DEFAULT_ENABLED_TAG_KEYS_CACHE_TTL = 300
+DEFAULT_HCS_UPLOAD_MAX_WORKERS = 4
+DEFAULT_S3_DELETE_MAX_WORKERS = 8
+DEFAULT_S3_DELETE_MAX_RETRIES = 3
 
 
 class Config:
@@ -49,6 +60,42 @@ class Config:
     CSV_DATA_TYPE = "csv"
     PARQUET_DATA_TYPE = "parquet"
 
+    # Number of providers polled concurrently by the orchestrator and the time (in seconds)
+    # the orchestrator waits on a single provider before moving on without it
+    POLLING_MAX_WORKERS = ENVIRONMENT.int("POLLING_MAX_WORKERS", default=DEFAULT_POLLING_MAX_WORKERS)
+    POLLING_PROVIDER_TIMEOUT = ENVIRONMENT.int("POLLING_PROVIDER_TIMEOUT", default=DEFAULT_POLLING_PROVIDER_TIMEOUT)
+
+    # Window (in seconds) in which repeated summary requests for a provider and month are merged
+    # into one trailing summary run. 0 disables coalescing.
+    SUMMARY_COALESCE_WINDOW = ENVIRONMENT.int("SUMMARY_COALESCE_WINDOW", default=DEFAULT_SUMMARY_COALESCE_WINDOW)
+
+    # Multipart transfer tuning for report file downloads and archive uploads
+    S3_TRANSFER_MAX_CONCURRENCY = ENVIRONMENT.int(
+        "S3_TRANSFER_MAX_CONCURRENCY", default=DEFAULT_S3_TRANSFER_MAX_CONCURRENCY
+    )
+    S3_TRANSFER_CHUNK_SIZE = ENVIRONMENT.int("S3_TRANSFER_CHUNK_SIZE", default=DEFAULT_S3_TRANSFER_CHUNK_SIZE)
+
+    # Rows fetched from trino and copied into Postgres per page by the COPY loader
+    TRINO_COPY_PAGE_SIZE = ENVIRONMENT.int("TRINO_COPY_PAGE_SIZE", default=DEFAULT_TRINO_COPY_PAGE_SIZE)
+
+    # Database connections used to populate the UI summary tables concurrently. 1 runs them serially.
+    UI_SUMMARY_MAX_WORKERS = ENVIRONMENT.int("UI_SUMMARY_MAX_WORKERS", default=DEFAULT_UI_SUMMARY_MAX_WORKERS)
+
+    # Daily HCS report CSVs uploaded to object storage concurrently. 1 uploads them serially.
+    HCS_UPLOAD_MAX_WORKERS = ENVIRONMENT.int("HCS_UPLOAD_MAX_WORKERS", default=DEFAULT_HCS_UPLOAD_MAX_WORKERS)
+
+    # Concurrent 1000 key delete requests sent while listing an object storage prefix for deletion
+    S3_DELETE_MAX_WORKERS = ENVIRONMENT.int("S3_DELETE_MAX_WORKERS", default=DEFAULT_S3_DELETE_MAX_WORKERS)
+
+    # Attempts of an object storage delete request before its keys are reported as not deleted
+    S3_DELETE_MAX_RETRIES = ENVIRONMENT.int("S3_DELETE_MAX_RETRIES", default=DEFAULT_S3_DELETE_MAX_RETRIES)
+
+    # Seconds a worker trusts its in-process copy of a tenant's known enabled tag keys;
+    # a key deleted from the enabled keys table can go un-recreated by a worker for this long
+    ENABLED_TAG_KEYS_CACHE_TTL = ENVIRONMENT.int(
+        "ENABLED_TAG_KEYS_CACHE_TTL", default=DEFAULT_ENABLED_TAG_KEYS_CACHE_TTL
+    )
+
     REPORT_PROCESSING_BATCH_SIZE = ENVIRONMENT.int(
         "REPORT_PROCESSING_BATCH_SIZE", default=DEFAULT_REPORT_PROCESSING_BATCH_SIZE
     )
@@ -5,20 +5,20 @@
 """Database accessor for report data."""
 import json
 import logging
-import pkgutil
 import uuid
 
 from dateutil.parser import parse
 from django.conf import settings
 from django.db import connection
 from django.db.models import F
-from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 from trino.exceptions import TrinoExternalError
 
 from api.utils import DateHelper
 from koku.database import get_model
 from koku.database import SQLScriptAtomicExecutorMixin
+from koku.sql_templates import get_sql
+from koku.sql_templates import JINJA_SQL
 from masu.config import Config
 from masu.database import AWS_CUR_TABLE_MAP
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
@@ -56,7 +56,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         super().__init__(schema)
         self._datetime_format = Config.AWS_DATETIME_STR_FORMAT
         self.date_accessor = DateAccessor()
-        self.jinja_sql = JinjaSql()
+        self.jinja_sql = JINJA_SQL
         self._table_map = AWS_CUR_TABLE_MAP
 
     @property
@@ -225,8 +225,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """
         table_name = self._table_map["line_item_daily"]
 
-        daily_sql = pkgutil.get_data("masu.database", "sql/reporting_awscostentrylineitem_daily.sql")
-        daily_sql = daily_sql.decode("utf-8")
+        daily_sql = get_sql("masu.database", "sql/reporting_awscostentrylineitem_daily.sql")
         daily_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -249,8 +248,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
         """
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_awscostentrylineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_awscostentrylineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -265,9 +263,9 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def populate_ui_summary_tables(self, start_date, end_date, source_uuid, tables=UI_SUMMARY_TABLES):
         """Populate our UI summary tables (formerly materialized views)."""
+        queries = []
         for table_name in tables:
-            summary_sql = pkgutil.get_data("masu.database", f"sql/aws/{table_name}.sql")
-            summary_sql = summary_sql.decode("utf-8")
+            summary_sql = get_sql("masu.database", f"sql/aws/{table_name}.sql")
             summary_sql_params = {
                 "start_date": start_date,
                 "end_date": end_date,
@@ -275,14 +273,30 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                 "source_uuid": source_uuid,
             }
             summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
-            self._execute_raw_sql_query(
-                table_name,
-                summary_sql,
-                start_date,
-                end_date,
-                bind_params=list(summary_sql_params),
-                operation="DELETE/INSERT",
-            )
+            queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries, start_date, end_date)
+
+    def populate_resource_dimension_tables(self, start_date, end_date, source_uuid):
+        """Add the accounts, regions, and services seen in the UI summary tables to the dimension tables."""
+        table_name = "reporting_aws_resource_dimensions"
+        dimension_sql = get_sql("masu.database", f"sql/aws/{table_name}.sql")
+        dimension_sql_params = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "schema": self.schema,
+            "source_uuid": source_uuid,
+        }
+        dimension_sql, dimension_sql_params = self.jinja_sql.prepare_query(dimension_sql, dimension_sql_params)
+        self._execute_raw_sql_query(
+            table_name, dimension_sql, start_date, end_date, bind_params=list(dimension_sql_params), operation="INSERT"
+        )
+
+    def delete_expired_resource_dimensions(self):
+        """Remove the accounts, regions, and services that no longer appear in the UI summary tables."""
+        table_name = "reporting_aws_resource_dimensions_expired"
+        expired_sql = get_sql("masu.database", f"sql/aws/{table_name}.sql")
+        expired_sql, expired_sql_params = self.jinja_sql.prepare_query(expired_sql, {"schema": self.schema})
+        self._execute_raw_sql_query(table_name, expired_sql, bind_params=list(expired_sql_params), operation="DELETE")
 
     def populate_line_item_daily_summary_table_presto(self, start_date, end_date, source_uuid, bill_id, markup_value):
         """Populate the daily aggregated summary of line items table.
@@ -295,8 +309,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
 
         """
-        summary_sql = pkgutil.get_data("masu.database", "presto_sql/reporting_awscostentrylineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "presto_sql/reporting_awscostentrylineitem_daily_summary.sql")
         uuid_str = str(uuid.uuid4()).replace("-", "_")
         summary_sql_params = {
             "uuid": uuid_str,
@@ -312,7 +325,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         }
         summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
 
-        self._execute_presto_raw_sql_query(
+        self._execute_presto_copy_query(
             self.schema, summary_sql, log_ref="reporting_awscostentrylineitem_daily_summary.sql"
         )
 
@@ -330,8 +343,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the line item aggregated totals data table."""
         table_name = self._table_map["tags_summary"]
 
-        agg_sql = pkgutil.get_data("masu.database", "sql/reporting_awstags_summary.sql")
-        agg_sql = agg_sql.decode("utf-8")
+        agg_sql = get_sql("masu.database", "sql/reporting_awstags_summary.sql")
         agg_sql_params = {"schema": self.schema, "bill_ids": bill_ids, "start_date": start_date, "end_date": end_date}
         agg_sql, agg_sql_params = self.jinja_sql.prepare_query(agg_sql, agg_sql_params)
         self._execute_raw_sql_query(table_name, agg_sql, bind_params=list(agg_sql_params))
@@ -348,8 +360,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
         """
         table_name = self._table_map["ocp_on_aws_daily_summary"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpawscostlineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_ocpawscostlineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -367,11 +378,12 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def populate_ocp_on_aws_ui_summary_tables(self, sql_params, tables=OCPAWS_UI_SUMMARY_TABLES):
         """Populate our UI summary tables (formerly materialized views)."""
+        queries = []
         for table_name in tables:
-            summary_sql = pkgutil.get_data("masu.database", f"sql/aws/openshift/{table_name}.sql")
-            summary_sql = summary_sql.decode("utf-8")
+            summary_sql = get_sql("masu.database", f"sql/aws/openshift/{table_name}.sql")
             summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, sql_params)
-            self._execute_raw_sql_query(table_name, summary_sql, bind_params=list(summary_sql_params))
+            queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries, operation="UPDATE")
 
     def delete_ocp_on_aws_hive_partition_by_day(self, days, aws_source, ocp_source, year, month):
         """Deletes partitions individually for each day in days list."""
@@ -449,8 +461,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             pod_column = "pod_effective_usage_memory_gigabyte_hours"
             node_column = "node_capacity_memory_gigabyte_hours"
 
-        summary_sql = pkgutil.get_data("masu.database", "presto_sql/reporting_ocpawscostlineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "presto_sql/reporting_ocpawscostlineitem_daily_summary.sql")
         summary_sql_params = {
             "schema": self.schema,
             "start_date": start_date,
@@ -474,10 +485,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the OCP on AWS and OCP daily summary tables. after populating the project table via trino."""
         table_name = AWS_CUR_TABLE_MAP["ocp_on_aws_daily_summary"]
 
-        sql = pkgutil.get_data(
-            "masu.database", "sql/reporting_ocpawscostentrylineitem_daily_summary_back_populate.sql"
-        )
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "sql/reporting_ocpawscostentrylineitem_daily_summary_back_populate.sql")
         sql_params = {
             "schema": self.schema,
             "start_date": start_date,
@@ -491,8 +499,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the line item aggregated totals data table."""
         table_name = self._table_map["ocp_on_aws_tags_summary"]
 
-        agg_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpawstags_summary.sql")
-        agg_sql = agg_sql.decode("utf-8")
+        agg_sql = get_sql("masu.database", "sql/reporting_ocpawstags_summary.sql")
         agg_sql_params = {"schema": self.schema, "bill_ids": bill_ids, "start_date": start_date, "end_date": end_date}
         agg_sql, agg_sql_params = self.jinja_sql.prepare_query(agg_sql, agg_sql_params)
         self._execute_raw_sql_query(table_name, agg_sql, bind_params=list(agg_sql_params))
@@ -542,8 +549,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["enabled_tag_keys"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_awsenabledtagkeys.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_awsenabledtagkeys.sql")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -567,10 +573,9 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data(
+        summary_sql = get_sql(
             "masu.database", "sql/reporting_awscostentryline_item_daily_summary_update_enabled_tags.sql"
         )
-        summary_sql = summary_sql.decode("utf-8")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -584,8 +589,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def get_openshift_on_cloud_matched_tags(self, aws_bill_id):
         """Return a list of matched tags."""
-        sql = pkgutil.get_data("masu.database", "sql/reporting_ocpaws_matched_tags.sql")
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "sql/reporting_ocpaws_matched_tags.sql")
         sql_params = {"bill_id": aws_bill_id, "schema": self.schema}
         sql, bind_params = self.jinja_sql.prepare_query(sql, sql_params)
         with connection.cursor() as cursor:
@@ -597,8 +601,7 @@ class AWSReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def get_openshift_on_cloud_matched_tags_trino(self, aws_source_uuid, ocp_source_uuids, start_date, end_date):
         """Return a list of matched tags."""
-        sql = pkgutil.get_data("masu.database", "presto_sql/reporting_ocpaws_matched_tags.sql")
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "presto_sql/reporting_ocpaws_matched_tags.sql")
 
         days = DateHelper().list_days(start_date, end_date)
         days_str = "','".join([str(day.day) for day in days])
@@ -5,7 +5,6 @@
 """Database accessor for Azure report data."""
 import json
 import logging
-import pkgutil
 import uuid
 from datetime import datetime
 
@@ -13,13 +12,14 @@ from dateutil.parser import parse
 from django.conf import settings
 from django.db import connection
 from django.db.models import F
-from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 from trino.exceptions import TrinoExternalError
 
 from api.utils import DateHelper
 from koku.database import get_model
 from koku.database import SQLScriptAtomicExecutorMixin
+from koku.sql_templates import get_sql
+from koku.sql_templates import JINJA_SQL
 from masu.config import Config
 from masu.database import AZURE_REPORT_TABLE_MAP
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
@@ -54,7 +54,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         super().__init__(schema)
         self._datetime_format = Config.AZURE_DATETIME_STR_FORMAT
         self.date_accessor = DateAccessor()
-        self.jinja_sql = JinjaSql()
+        self.jinja_sql = JINJA_SQL
         self._table_map = AZURE_REPORT_TABLE_MAP
 
     @property
@@ -139,8 +139,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         _end_date = end_date.date() if isinstance(end_date, datetime) else end_date
 
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_azurecostentrylineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_azurecostentrylineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": _start_date,
@@ -164,10 +163,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
 
         """
-        summary_sql = pkgutil.get_data(
-            "masu.database", "presto_sql/reporting_azurecostentrylineitem_daily_summary.sql"
-        )
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "presto_sql/reporting_azurecostentrylineitem_daily_summary.sql")
         uuid_str = str(uuid.uuid4()).replace("-", "_")
         summary_sql_params = {
             "uuid": uuid_str,
@@ -183,7 +179,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         }
         summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
 
-        self._execute_presto_raw_sql_query(
+        self._execute_presto_copy_query(
             self.schema, summary_sql, log_ref="reporting_azurecostentrylineitem_daily_summary.sql"
         )
 
@@ -191,8 +187,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the line item aggregated totals data table."""
         table_name = self._table_map["tags_summary"]
 
-        agg_sql = pkgutil.get_data("masu.database", "sql/reporting_azuretags_summary.sql")
-        agg_sql = agg_sql.decode("utf-8")
+        agg_sql = get_sql("masu.database", "sql/reporting_azuretags_summary.sql")
         agg_sql_params = {"schema": self.schema, "bill_ids": bill_ids, "start_date": start_date, "end_date": end_date}
         agg_sql, agg_sql_params = self.jinja_sql.prepare_query(agg_sql, agg_sql_params)
         self._execute_raw_sql_query(table_name, agg_sql, bind_params=list(agg_sql_params))
@@ -273,8 +268,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
         """
         table_name = self._table_map["ocp_on_azure_daily_summary"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpazurecostlineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_ocpazurecostlineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -294,17 +288,16 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the line item aggregated totals data table."""
         table_name = self._table_map["ocp_on_azure_tags_summary"]
 
-        agg_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpazuretags_summary.sql")
-        agg_sql = agg_sql.decode("utf-8")
+        agg_sql = get_sql("masu.database", "sql/reporting_ocpazuretags_summary.sql")
         agg_sql_params = {"schema": self.schema, "bill_ids": bill_ids, "start_date": start_date, "end_date": end_date}
         agg_sql, agg_sql_params = self.jinja_sql.prepare_query(agg_sql, agg_sql_params)
         self._execute_raw_sql_query(table_name, agg_sql, bind_params=list(agg_sql_params))
 
     def populate_ui_summary_tables(self, start_date, end_date, source_uuid, tables=UI_SUMMARY_TABLES):
         """Populate our UI summary tables (formerly materialized views)."""
+        queries = []
         for table_name in tables:
-            summary_sql = pkgutil.get_data("masu.database", f"sql/azure/{table_name}.sql")
-            summary_sql = summary_sql.decode("utf-8")
+            summary_sql = get_sql("masu.database", f"sql/azure/{table_name}.sql")
             summary_sql_params = {
                 "start_date": start_date,
                 "end_date": end_date,
@@ -312,22 +305,17 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                 "source_uuid": source_uuid,
             }
             summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
-            self._execute_raw_sql_query(
-                table_name,
-                summary_sql,
-                start_date,
-                end_date,
-                bind_params=list(summary_sql_params),
-                operation="DELETE/INSERT",
-            )
+            queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries, start_date, end_date)
 
     def populate_ocp_on_azure_ui_summary_tables(self, sql_params, tables=OCPAZURE_UI_SUMMARY_TABLES):
         """Populate our UI summary tables (formerly materialized views)."""
+        queries = []
         for table_name in tables:
-            summary_sql = pkgutil.get_data("masu.database", f"sql/azure/openshift/{table_name}.sql")
-            summary_sql = summary_sql.decode("utf-8")
+            summary_sql = get_sql("masu.database", f"sql/azure/openshift/{table_name}.sql")
             summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, sql_params)
-            self._execute_raw_sql_query(table_name, summary_sql, bind_params=list(summary_sql_params))
+            queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries, operation="UPDATE")
 
     def delete_ocp_on_azure_hive_partition_by_day(self, days, az_source, ocp_source, year, month):
         """Deletes partitions individually for each day in days list."""
@@ -396,8 +384,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             pod_column = "pod_effective_usage_memory_gigabyte_hours"
             node_column = "node_capacity_memory_gigabyte_hours"
 
-        summary_sql = pkgutil.get_data("masu.database", "presto_sql/reporting_ocpazurecostlineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "presto_sql/reporting_ocpazurecostlineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(openshift_provider_uuid).replace("-", "_"),
             "schema": self.schema,
@@ -428,8 +415,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["enabled_tag_keys"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_azureenabledtagkeys.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_azureenabledtagkeys.sql")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -451,10 +437,9 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data(
+        summary_sql = get_sql(
             "masu.database", "sql/reporting_azurecostentryline_item_daily_summary_update_enabled_tags.sql"
         )
-        summary_sql = summary_sql.decode("utf-8")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -468,8 +453,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def get_openshift_on_cloud_matched_tags(self, azure_bill_id):
         """Return a list of matched tags."""
-        sql = pkgutil.get_data("masu.database", "sql/reporting_ocpazure_matched_tags.sql")
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "sql/reporting_ocpazure_matched_tags.sql")
         sql_params = {"bill_id": azure_bill_id, "schema": self.schema}
         sql, bind_params = self.jinja_sql.prepare_query(sql, sql_params)
         with connection.cursor() as cursor:
@@ -481,8 +465,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def get_openshift_on_cloud_matched_tags_trino(self, azure_source_uuid, ocp_source_uuids, start_date, end_date):
         """Return a list of matched tags."""
-        sql = pkgutil.get_data("masu.database", "presto_sql/reporting_ocpazure_matched_tags.sql")
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "presto_sql/reporting_ocpazure_matched_tags.sql")
 
         days = DateHelper().list_days(start_date, end_date)
         days_str = "','".join([str(day.day) for day in days])
@@ -509,10 +492,7 @@ class AzureReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the OCP on Azure and OCP daily summary tables. after populating the project table via trino."""
         table_name = AZURE_REPORT_TABLE_MAP["ocp_on_azure_daily_summary"]
 
-        sql = pkgutil.get_data(
-            "masu.database", "sql/reporting_ocpazurecostentrylineitem_daily_summary_back_populate.sql"
-        )
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "sql/reporting_ocpazurecostentrylineitem_daily_summary_back_populate.sql")
         sql_params = {
             "schema": self.schema,
             "start_date": start_date,
@@ -6,7 +6,6 @@
 import datetime
 import json
 import logging
-import pkgutil
 import uuid
 from os import path
 
@@ -15,12 +14,13 @@ from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from django.db import connection
 from django.db.models import F
-from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 from trino.exceptions import TrinoExternalError
 
 from api.utils import DateHelper
 from koku.database import SQLScriptAtomicExecutorMixin
+from koku.sql_templates import get_sql
+from koku.sql_templates import JINJA_SQL
 from masu.database import GCP_REPORT_TABLE_MAP
 from masu.database.koku_database_access import mini_transaction_delete
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
@@ -53,7 +53,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """
         super().__init__(schema)
         self.date_accessor = DateAccessor()
-        self.jinja_sql = JinjaSql()
+        self.jinja_sql = JINJA_SQL
         self._table_map = GCP_REPORT_TABLE_MAP
 
     @property
@@ -72,13 +72,13 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate our UI summary tables (formerly materialized views)."""
         dh = DateHelper()
         invoice_month_list = dh.gcp_find_invoice_months_in_date_range(start_date, end_date)
+        # Extend the end date past the end of the month & add the invoice month
+        # in order to include cross over data.
+        extended_end_date = end_date + relativedelta(days=2)
+        queries = []
         for invoice_month in invoice_month_list:
             for table_name in tables:
-                summary_sql = pkgutil.get_data("masu.database", f"sql/gcp/{table_name}.sql")
-                summary_sql = summary_sql.decode("utf-8")
-                # Extend the end date past the end of the month & add the invoice month
-                # in order to include cross over data.
-                extended_end_date = end_date + relativedelta(days=2)
+                summary_sql = get_sql("masu.database", f"sql/gcp/{table_name}.sql")
                 summary_sql_params = {
                     "start_date": start_date,
                     "end_date": extended_end_date,
@@ -87,14 +87,8 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                     "invoice_month": invoice_month,
                 }
                 summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
-                self._execute_raw_sql_query(
-                    table_name,
-                    summary_sql,
-                    start_date,
-                    extended_end_date,
-                    bind_params=list(summary_sql_params),
-                    operation="DELETE/INSERT",
-                )
+                queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries, start_date, extended_end_date)
 
     def get_cost_entry_bills(self):
         """Get all cost entry bill objects."""
@@ -175,8 +169,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """
         table_name = self._table_map["line_item_daily"]
 
-        daily_sql = pkgutil.get_data("masu.database", "sql/reporting_gcpcostentrylineitem_daily.sql")
-        daily_sql = daily_sql.decode("utf-8")
+        daily_sql = get_sql("masu.database", "sql/reporting_gcpcostentrylineitem_daily.sql")
         daily_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -221,8 +214,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
         """
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_gcpcostentrylineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_gcpcostentrylineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -259,8 +251,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             self.delete_line_item_daily_summary_entries_for_date_range(source_uuid, end_date, new_end_date)
             end_date = new_end_date
 
-        summary_sql = pkgutil.get_data("masu.database", "presto_sql/reporting_gcpcostentrylineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "presto_sql/reporting_gcpcostentrylineitem_daily_summary.sql")
         uuid_str = str(uuid.uuid4()).replace("-", "_")
         summary_sql_params = {
             "uuid": uuid_str,
@@ -276,7 +267,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         }
         summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
 
-        self._execute_presto_raw_sql_query(
+        self._execute_presto_copy_query(
             self.schema, summary_sql, log_ref="reporting_gcpcostentrylineitem_daily_summary.sql"
         )
 
@@ -284,8 +275,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the line item aggregated totals data table."""
         table_name = self._table_map["tags_summary"]
 
-        agg_sql = pkgutil.get_data("masu.database", "sql/reporting_gcptags_summary.sql")
-        agg_sql = agg_sql.decode("utf-8")
+        agg_sql = get_sql("masu.database", "sql/reporting_gcptags_summary.sql")
         agg_sql_params = {"schema": self.schema, "bill_ids": bill_ids, "start_date": start_date, "end_date": end_date}
         agg_sql, agg_sql_params = self.jinja_sql.prepare_query(agg_sql, agg_sql_params)
         self._execute_raw_sql_query(table_name, agg_sql, bind_params=list(agg_sql_params))
@@ -354,8 +344,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["enabled_tag_keys"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_gcpenabledtagkeys.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_gcpenabledtagkeys.sql")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -379,10 +368,9 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data(
+        summary_sql = get_sql(
             "masu.database", "sql/reporting_gcpcostentryline_item_daily_summary_update_enabled_tags.sql"
         )
-        summary_sql = summary_sql.decode("utf-8")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -525,10 +513,9 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             pod_column = "pod_effective_usage_memory_gigabyte_hours"
             cluster_column = "cluster_capacity_memory_gigabyte_hours"
 
-        summary_sql = pkgutil.get_data(
+        summary_sql = get_sql(
             "masu.database", "presto_sql/gcp/openshift/reporting_ocpgcpcostlineitem_daily_summary_by_node.sql"
         )
-        summary_sql = summary_sql.decode("utf-8")
         summary_sql_params = {
             "schema": self.schema,
             "start_date": start_date,
@@ -603,8 +590,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             sql_level = "reporting_ocpgcpcostlineitem_daily_summary"
             matching_type = "tag"
 
-        summary_sql = pkgutil.get_data("masu.database", f"presto_sql/gcp/openshift/{sql_level}.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", f"presto_sql/gcp/openshift/{sql_level}.sql")
         summary_sql_params = {
             "schema": self.schema,
             "start_date": start_date,
@@ -631,15 +617,14 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate our UI summary tables (formerly materialized views)."""
         dh = DateHelper()
         invoice_month_list = dh.gcp_find_invoice_months_in_date_range(sql_params["start_date"], sql_params["end_date"])
+        queries = []
         for invoice_month in invoice_month_list:
             for table_name in tables:
                 sql_params["invoice_month"] = invoice_month
-                summary_sql = pkgutil.get_data("masu.database", f"sql/gcp/openshift/{table_name}.sql")
-                summary_sql = summary_sql.decode("utf-8")
+                summary_sql = get_sql("masu.database", f"sql/gcp/openshift/{table_name}.sql")
                 summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, sql_params)
-                self._execute_raw_sql_query(
-                    table_name, summary_sql, bind_params=list(summary_sql_params), operation="DELETE/INSERT"
-                )
+                queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries)
 
     def delete_ocp_on_gcp_hive_partition_by_day(self, days, gcp_source, ocp_source, year, month):
         """Deletes partitions individually for each day in days list."""
@@ -681,8 +666,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                             raise err
 
     def get_openshift_on_cloud_matched_tags(self, gcp_bill_id):
-        sql = pkgutil.get_data("masu.database", "sql/reporting_ocpgcp_matched_tags.sql")
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "sql/reporting_ocpgcp_matched_tags.sql")
         sql_params = {"bill_id": gcp_bill_id, "schema": self.schema}
         sql, bind_params = self.jinja_sql.prepare_query(sql, sql_params)
         with connection.cursor() as cursor:
@@ -696,8 +680,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         self, gcp_source_uuid, ocp_source_uuids, start_date, end_date, invoice_month_date
     ):
         """Return a list of matched tags."""
-        sql = pkgutil.get_data("masu.database", "presto_sql/gcp/openshift/reporting_ocpgcp_matched_tags.sql")
-        sql = sql.decode("utf-8")
+        sql = get_sql("masu.database", "presto_sql/gcp/openshift/reporting_ocpgcp_matched_tags.sql")
 
         days = DateHelper().list_days(start_date, end_date)
         days_str = "','".join([str(day.day) for day in days])
@@ -723,8 +706,7 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the line item aggregated totals data table."""
         table_name = self._table_map["ocp_on_gcp_tags_summary"]
 
-        agg_sql = pkgutil.get_data("masu.database", "sql/gcp/openshift/reporting_ocpgcptags_summary.sql")
-        agg_sql = agg_sql.decode("utf-8")
+        agg_sql = get_sql("masu.database", "sql/gcp/openshift/reporting_ocpgcptags_summary.sql")
         agg_sql_params = {
             "schema": self.schema,
             "gcp_bill_ids": gcp_bill_ids,
@@ -738,11 +720,10 @@ class GCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the OCP on GCP and OCP daily summary tables. after populating the project table."""
         # table_name = GCP_REPORT_TABLE_MAP["ocp_on_gcp_daily_summary"]
 
-        sql = pkgutil.get_data(
+        sql = get_sql(
             "masu.database",
             "presto_sql/gcp/openshift/reporting_ocpgcpcostentrylineitem_daily_summary_back_populate.sql",
         )
-        sql = sql.decode("utf-8")
         sql_params = {
             "schema": self.schema,
             "start_date": start_date,
@@ -4,15 +4,15 @@
 #
 """Database accessor for report data."""
 import logging
-import pkgutil
 import uuid
 
 from dateutil.parser import parse
 from django.db.models import F
-from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 
 from koku.database import SQLScriptAtomicExecutorMixin
+from koku.sql_templates import get_sql
+from koku.sql_templates import JINJA_SQL
 from masu.config import Config
 from masu.database import OCI_CUR_TABLE_MAP
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
@@ -36,7 +36,7 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         super().__init__(schema)
         self._datetime_format = Config.OCI_DATETIME_STR_FORMAT
         self.date_accessor = DateAccessor()
-        self.jinja_sql = JinjaSql()
+        self.jinja_sql = JINJA_SQL
         self._table_map = OCI_CUR_TABLE_MAP
 
     @property
@@ -99,9 +99,9 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def populate_ui_summary_tables(self, start_date, end_date, source_uuid, tables=UI_SUMMARY_TABLES):
         """Populate our UI summary tables (formerly materialized views)."""
+        queries = []
         for table_name in tables:
-            summary_sql = pkgutil.get_data("masu.database", f"sql/oci/{table_name}.sql")
-            summary_sql = summary_sql.decode("utf-8")
+            summary_sql = get_sql("masu.database", f"sql/oci/{table_name}.sql")
             summary_sql_params = {
                 "start_date": start_date,
                 "end_date": end_date,
@@ -109,14 +109,8 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                 "source_uuid": source_uuid,
             }
             summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
-            self._execute_raw_sql_query(
-                table_name,
-                summary_sql,
-                start_date,
-                end_date,
-                bind_params=list(summary_sql_params),
-                operation="DELETE/INSERT",
-            )
+            queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries, start_date, end_date)
 
     def populate_line_item_daily_summary_table_presto(self, start_date, end_date, source_uuid, bill_id, markup_value):
         """Populate the daily aggregated summary of line items table.
@@ -129,8 +123,7 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
 
         """
-        summary_sql = pkgutil.get_data("masu.database", "presto_sql/reporting_ocicostentrylineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "presto_sql/reporting_ocicostentrylineitem_daily_summary.sql")
         uuid_str = str(uuid.uuid4()).replace("-", "_")
         summary_sql_params = {
             "uuid": uuid_str,
@@ -146,7 +139,7 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
 
         LOG.info(f"Summary SQL: {str(summary_sql)}")
-        self._execute_presto_raw_sql_query(self.schema, summary_sql)
+        self._execute_presto_copy_query(self.schema, summary_sql)
 
     def mark_bill_as_finalized(self, bill_id):
         """Mark a bill in the database as finalized."""
@@ -162,8 +155,7 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """Populate the line item aggregated totals data table."""
         table_name = self._table_map["tags_summary"]
 
-        agg_sql = pkgutil.get_data("masu.database", "sql/oci/reporting_ocitags_summary.sql")
-        agg_sql = agg_sql.decode("utf-8")
+        agg_sql = get_sql("masu.database", "sql/oci/reporting_ocitags_summary.sql")
         agg_sql_params = {"schema": self.schema, "bill_ids": bill_ids, "start_date": start_date, "end_date": end_date}
         agg_sql, agg_sql_params = self.jinja_sql.prepare_query(agg_sql, agg_sql_params)
         self._execute_raw_sql_query(table_name, agg_sql, bind_params=list(agg_sql_params))
@@ -193,8 +185,7 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["enabled_tag_keys"]
-        summary_sql = pkgutil.get_data("masu.database", "sql/oci/reporting_ocienabledtagkeys.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/oci/reporting_ocienabledtagkeys.sql")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -218,10 +209,9 @@ class OCIReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data(
+        summary_sql = get_sql(
             "masu.database", "sql/oci/reporting_ocicostentryline_item_daily_summary_update_enabled_tags.sql"
         )
-        summary_sql = summary_sql.decode("utf-8")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -3,12 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Database accessor for OCP report data."""
-import copy
 import datetime
 import json
 import logging
 import os
-import pkgutil
 import uuid
 from decimal import Decimal
 
@@ -19,12 +17,10 @@ from dateutil.rrule import rrule
 from django.conf import settings
 from django.db import connection
 from django.db.models import DecimalField
-from django.db.models import ExpressionWrapper
 from django.db.models import F
-from django.db.models import Sum
+from django.db.models import Max
 from django.db.models import Value
 from django.db.models.functions import Coalesce
-from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 from trino.exceptions import TrinoExternalError
 
@@ -33,6 +29,8 @@ from api.metrics import constants as metric_constants
 from api.utils import DateHelper
 from koku.database import JSONBBuildObject
 from koku.database import SQLScriptAtomicExecutorMixin
+from koku.sql_templates import get_sql
+from koku.sql_templates import JINJA_SQL
 from masu.config import Config
 from masu.database import AWS_CUR_TABLE_MAP
 from masu.database import OCP_REPORT_TABLE_MAP
@@ -46,6 +44,7 @@ from reporting.provider.azure.models import PRESTO_LINE_ITEM_DAILY_TABLE as AZUR
 from reporting.provider.gcp.models import PRESTO_LINE_ITEM_DAILY_TABLE as GCP_PRESTO_LINE_ITEM_DAILY_TABLE
 from reporting.provider.ocp.models import OCPCluster
 from reporting.provider.ocp.models import OCPNode
+from reporting.provider.ocp.models import OCPNodeLabelLineItemDaily
 from reporting.provider.ocp.models import OCPProject
 from reporting.provider.ocp.models import OCPPVC
 from reporting.provider.ocp.models import OCPUsageLineItemDailySummary
@@ -74,6 +73,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     #  Empty string will put a path seperator on the end
     OCP_ON_ALL_SQL_PATH = os.path.join("sql", "openshift", "all", "")
+    OCP_COST_MODEL_SQL_PATH = os.path.join("sql", "openshift", "cost_model", "")
 
     def __init__(self, schema):
         """Establish the database connection.
@@ -83,7 +83,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """
         super().__init__(schema)
         self._datetime_format = Config.OCP_DATETIME_STR_FORMAT
-        self.jinja_sql = JinjaSql()
+        self.jinja_sql = JINJA_SQL
         self.date_helper = DateHelper()
         self._table_map = OCP_REPORT_TABLE_MAP
         self._aws_table_map = AWS_CUR_TABLE_MAP
@@ -346,8 +346,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
         table_name = self._table_map["line_item_daily"]
 
-        daily_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpusagelineitem_daily.sql")
-        daily_sql = daily_sql.decode("utf-8")
+        daily_sql = get_sql("masu.database", "sql/reporting_ocpusagelineitem_daily.sql")
         daily_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -360,9 +359,9 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
     def populate_ui_summary_tables(self, start_date, end_date, source_uuid, tables=UI_SUMMARY_TABLES):
         """Populate our UI summary tables (formerly materialized views)."""
+        queries = []
         for table_name in tables:
-            summary_sql = pkgutil.get_data("masu.database", f"sql/openshift/{table_name}.sql")
-            summary_sql = summary_sql.decode("utf-8")
+            summary_sql = get_sql("masu.database", f"sql/openshift/{table_name}.sql")
             summary_sql_params = {
                 "start_date": start_date,
                 "end_date": end_date,
@@ -370,14 +369,8 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                 "source_uuid": source_uuid,
             }
             summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
-            self._execute_raw_sql_query(
-                table_name,
-                summary_sql,
-                start_date,
-                end_date,
-                bind_params=list(summary_sql_params),
-                operation="DELETE/INSERT",
-            )
+            queries.append((table_name, summary_sql, list(summary_sql_params)))
+        self._execute_ui_summary_queries(queries, start_date, end_date)
 
     def update_line_item_daily_summary_with_enabled_tags(self, start_date, end_date, report_period_ids):
         """Populate the enabled tag key table.
@@ -389,10 +382,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             (None)
         """
         table_name = self._table_map["line_item_daily_summary"]
-        summary_sql = pkgutil.get_data(
-            "masu.database", "sql/reporting_ocpusagelineitem_daily_summary_update_enabled_tags.sql"
-        )
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_ocpusagelineitem_daily_summary_update_enabled_tags.sql")
         summary_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -425,8 +415,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         if isinstance(start_date, str):
             start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
             end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        infra_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpinfrastructure_provider_map.sql")
-        infra_sql = infra_sql.decode("utf-8")
+        infra_sql = get_sql("masu.database", "sql/reporting_ocpinfrastructure_provider_map.sql")
         infra_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -497,8 +486,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         if isinstance(start_date, str):
             start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
             end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        infra_sql = pkgutil.get_data("masu.database", "presto_sql/reporting_ocpinfrastructure_provider_map.sql")
-        infra_sql = infra_sql.decode("utf-8")
+        infra_sql = get_sql("masu.database", "presto_sql/reporting_ocpinfrastructure_provider_map.sql")
         infra_sql_params = {
             "start_date": start_date,
             "end_date": end_date,
@@ -550,8 +538,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             end_date = end_date.date()
         table_name = self._table_map["storage_line_item_daily"]
 
-        daily_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpstoragelineitem_daily.sql")
-        daily_sql = daily_sql.decode("utf-8")
+        daily_sql = get_sql("masu.database", "sql/reporting_ocpstoragelineitem_daily.sql")
         daily_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -575,8 +562,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """
         table_name = self._table_map["line_item_daily_summary"]
 
-        daily_charge_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpusagelineitem_daily_pod_charge.sql")
-        charge_line_sql = daily_charge_sql.decode("utf-8")
+        charge_line_sql = get_sql("masu.database", "sql/reporting_ocpusagelineitem_daily_pod_charge.sql")
         charge_line_sql_params = {"cpu_temp": cpu_temp_table, "mem_temp": mem_temp_table, "schema": self.schema}
         charge_line_sql, charge_line_sql_params = self.jinja_sql.prepare_query(charge_line_sql, charge_line_sql_params)
         self._execute_raw_sql_query(table_name, charge_line_sql, bind_params=list(charge_line_sql_params))
@@ -593,8 +579,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         """
         table_name = self._table_map["line_item_daily_summary"]
 
-        daily_charge_sql = pkgutil.get_data("masu.database", "sql/reporting_ocp_storage_charge.sql")
-        charge_line_sql = daily_charge_sql.decode("utf-8")
+        charge_line_sql = get_sql("masu.database", "sql/reporting_ocp_storage_charge.sql")
         charge_line_sql_params = {"temp_table": temp_table_name, "schema": self.schema}
         charge_line_sql, charge_line_sql_params = self.jinja_sql.prepare_query(charge_line_sql, charge_line_sql_params)
         self._execute_raw_sql_query(table_name, charge_line_sql, bind_params=list(charge_line_sql_params))
@@ -621,8 +606,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             end_date = end_date.date()
         table_name = self._table_map["line_item_daily_summary"]
 
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpusagelineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_ocpusagelineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -658,8 +642,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             end_date = end_date.date()
         table_name = self._table_map["line_item_daily_summary"]
 
-        summary_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpstoragelineitem_daily_summary.sql")
-        summary_sql = summary_sql.decode("utf-8")
+        summary_sql = get_sql("masu.database", "sql/reporting_ocpstoragelineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -742,8 +725,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         year = start_date.strftime("%Y")
         month = start_date.strftime("%m")
         self.delete_ocp_hive_partition_by_day(days_list, source, year, month)
-        tmpl_summary_sql = pkgutil.get_data("masu.database", "presto_sql/reporting_ocpusagelineitem_daily_summary.sql")
-        tmpl_summary_sql = tmpl_summary_sql.decode("utf-8")
+        tmpl_summary_sql = get_sql("masu.database", "presto_sql/reporting_ocpusagelineitem_daily_summary.sql")
         summary_sql_params = {
             "uuid": str(source).replace("-", "_"),
             "start_date": start_date,
@@ -1077,133 +1059,82 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                     first_curr_month, first_next_month, cluster_id, cluster_alias, rate_type, rate_dict, provider_uuid
                 )
 
-    def get_node_to_project_distribution(self, start_date, end_date, cluster_id, node_cost):
-        """Returns a list of dictionaries containing the distributed cost.
+    def _upsert_monthly_cost_line_items(
+        self,
+        sql_file,
+        start_date,
+        end_date,
+        cluster_id,
+        cluster_alias,
+        rate_type,
+        distribution,
+        provider_uuid,
+        **template_params,
+    ):
+        """Update existing monthly cost line items and insert the missing ones in a single pass.
 
         args:
+            sql_file (str): The cost model template to run. ex: "monthly_cost_node.sql"
             start_date (datetime, str): The start_date to calculate monthly_cost.
             end_date (datetime, str): The end_date to calculate monthly_cost.
             cluster_id (str): The id of the cluster
-            cluster_cost (dec): The flat cost of the cluster
+            cluster_alias: The name of the cluster
+            rate_type (str): Contains the cost type. ex: "Infrastructure"
+            distribution: Choice of monthly distribution ex. memory
+            provider_uuid (str): The provider the line items belong to
+            template_params: Additional template parameters ex. node_cost
+        """
+        if rate_type not in (metric_constants.INFRASTRUCTURE_COST_TYPE, metric_constants.SUPPLEMENTARY_COST_TYPE):
+            return
 
-        Node to Project Distribution:
-            - Node to project distribution is based on a per node scenario
-            - (node_cost) / (number of projects)
+        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
+        if not report_period:
+            LOG.info("No report period for cluster %s from %s to %s.", cluster_id, start_date, end_date)
+            return
 
-        Return nested dictionaries:
-        - ex {'master_3': {'namespaces': ['openshift', 'kube-system'], 'distributed_cost': Decimal('500.0000000000')}
+        if isinstance(start_date, datetime.datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime.datetime):
+            end_date = end_date.date()
 
-        """
-        with schema_context(self.schema):
-            distributed_project_list = (
-                OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start__gte=start_date, usage_start__lt=end_date, cluster_id=cluster_id
-                )
-                .filter(namespace__isnull=False)
-                .filter(node__isnull=False)
-                .values("namespace", "node")
-                .distinct()
-            )
-            node_mappings = {}
-            for project in distributed_project_list:
-                node_value = project.get("node")
-                namespace_value = project.get("namespace")
-                node_map = node_mappings.get(node_value)
-                if node_map:
-                    namespaces = copy.deepcopy(node_map.get("namespaces", []))
-                    namespaces.append(namespace_value)
-                    node_map["namespaces"] = namespaces
-                    node_map["distributed_cost"] = Decimal(node_cost) / Decimal(len(namespaces))
-                    node_mappings[node_value] = node_map
-                else:
-                    initial_map = {"namespaces": [namespace_value], "distributed_cost": Decimal(node_cost)}
-                    node_mappings[node_value] = initial_map
-        return node_mappings
+        table_name = self._table_map["line_item_daily_summary"]
+        sql_params = {
+            "schema": self.schema,
+            "start_date": start_date,
+            "end_date": end_date,
+            "report_period_id": report_period.id,
+            "cluster_id": cluster_id,
+            "cluster_alias": cluster_alias,
+            "source_uuid": str(provider_uuid),
+            "cost_type": rate_type.lower(),
+            "distribution": distribution,
+            **template_params,
+        }
+        LOG.info(f"Updating {table_name} monthly costs using {sql_file} from {start_date} to {end_date}")
+        self._execute_processing_script("masu.database", f"{self.OCP_COST_MODEL_SQL_PATH}{sql_file}", sql_params)
 
     def upsert_monthly_node_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, node_cost, distribution, provider_uuid
     ):
-        """Update or insert daily summary line item for node cost."""
-        unique_nodes = self.get_distinct_nodes(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        project_distrib_map = self.get_node_to_project_distribution(start_date, end_date, cluster_id, node_cost)
-        with schema_context(self.schema):
-            for node in unique_nodes:
-                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start=start_date,
-                    report_period=report_period,
-                    cluster_id=cluster_id,
-                    cluster_alias=cluster_alias,
-                    monthly_cost_type="Node",
-                    node=node,
-                    data_source="Pod",
-                    namespace__isnull=True,
-                ).first()
-                if not line_item:
-                    line_item = OCPUsageLineItemDailySummary(
-                        uuid=uuid.uuid4(),
-                        usage_start=start_date,
-                        usage_end=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="Node",
-                        node=node,
-                        data_source="Pod",
-                        source_uuid=provider_uuid,
-                    )
-                monthly_cost = self.generate_monthly_cost_json_object(distribution, node_cost)
-                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                    LOG.debug("Node (%s) has a monthly infrastructure cost of %s.", node, node_cost)
-                    line_item.infrastructure_monthly_cost_json = monthly_cost
-                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                    LOG.debug("Node (%s) has a monthly supplemenarty cost of %s.", node, node_cost)
-                    line_item.supplementary_monthly_cost_json = monthly_cost
-                line_item.save()
-            # How are we gonna handle distributing the node cost to the projects.
-            project_nodes = project_distrib_map.keys()
-            for project_node in project_nodes:
-                for namespace in project_distrib_map[project_node]["namespaces"]:
-                    distributed_cost = project_distrib_map[project_node]["distributed_cost"]
-                    project_line_item = OCPUsageLineItemDailySummary.objects.filter(
-                        usage_start=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="Node",
-                        node=project_node,
-                        namespace=namespace,
-                        data_source="Pod",
-                    ).first()
-                    if not project_line_item:
-                        project_line_item = OCPUsageLineItemDailySummary(
-                            uuid=uuid.uuid4(),
-                            usage_start=start_date,
-                            usage_end=start_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            monthly_cost_type="Node",
-                            node=project_node,
-                            namespace=namespace,
-                            data_source="Pod",
-                            source_uuid=provider_uuid,
-                        )
-                    monthly_cost = self.generate_monthly_cost_json_object(distribution, distributed_cost)
-                    log_statement = (
-                        f"Distributing Node Cost to Project:\n"
-                        f" node ({project_node}) cost: {node_cost} \n"
-                        f" project ({namespace}) distributed cost: {distributed_cost}\n"
-                        f" distribution type: {distribution}\n"
-                    )
-                    if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                        project_line_item.infrastructure_project_monthly_cost = monthly_cost
-                    elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                        project_line_item.supplementary_project_monthly_cost = monthly_cost
-                    project_line_item.save()
-                    LOG.debug(log_statement)
-
-    def tag_upsert_monthly_node_cost_line_item(  # noqa: C901
+        """Update or insert daily summary line item for node cost.
+
+        Node to Project Distribution:
+            - Node to project distribution is based on a per node scenario
+            - (node_cost) / (number of projects)
+        """
+        self._upsert_monthly_cost_line_items(
+            "monthly_cost_node.sql",
+            start_date,
+            end_date,
+            cluster_id,
+            cluster_alias,
+            rate_type,
+            distribution,
+            provider_uuid,
+            node_cost=node_cost,
+        )
+
+    def tag_upsert_monthly_node_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict, distribution, provider_uuid
     ):
         """
@@ -1213,69 +1144,22 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         that contains the tag key:value pair,
         if it does then the price is added to the monthly cost.
         """
-        unique_nodes = self.get_distinct_nodes(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for node in unique_nodes:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        for value_name, rate_value in tag_values.items():
-                            # this makes sure that there is an entry for that node
-                            # that contains the specified key_value pair
-                            item_check = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start__gte=start_date,
-                                usage_start__lte=end_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                node=node,
-                                pod_labels__contains={tag_key: value_name},
-                            ).first()
-                            if item_check:
-                                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                    usage_start=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="Node",
-                                    node=node,
-                                    data_source="Pod",
-                                ).first()
-                                if not line_item:
-                                    line_item = OCPUsageLineItemDailySummary(
-                                        uuid=uuid.uuid4(),
-                                        usage_start=start_date,
-                                        usage_end=start_date,
-                                        report_period=report_period,
-                                        cluster_id=cluster_id,
-                                        cluster_alias=cluster_alias,
-                                        monthly_cost_type="Node",
-                                        node=node,
-                                        data_source="Pod",
-                                        source_uuid=provider_uuid,
-                                    )
-                                node_cost = rate_value
-                                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                    LOG.debug("Node (%s) has a monthly infrastructure cost of %s.", node, rate_value)
-                                    if line_item.infrastructure_monthly_cost_json:
-                                        node_cost = (
-                                            line_item.infrastructure_monthly_cost_json.get(distribution, 0)
-                                            + rate_value
-                                        )
-                                    monthly_cost = self.generate_monthly_cost_json_object(distribution, node_cost)
-                                    line_item.infrastructure_monthly_cost_json = monthly_cost
-                                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                    LOG.debug("Node (%s) has a monthly supplemenarty cost of %s.", node, rate_value)
-                                    if line_item.supplementary_monthly_cost_json:
-                                        node_cost = (
-                                            line_item.supplementary_monthly_cost_json.get(distribution, 0) + rate_value
-                                        )
-                                    monthly_cost = self.generate_monthly_cost_json_object(distribution, node_cost)
-                                    line_item.supplementary_monthly_cost_json = monthly_cost
-                                line_item.save()
+        if rate_dict is None:
+            return
+        self._upsert_monthly_cost_line_items(
+            "monthly_cost_node_by_tag.sql",
+            start_date,
+            end_date,
+            cluster_id,
+            cluster_alias,
+            rate_type,
+            distribution,
+            provider_uuid,
+            rate_dict=json.dumps(rate_dict, default=str),
+            default_rates=False,
+        )
 
-    def tag_upsert_monthly_default_node_cost_line_item(  # noqa: C901
+    def tag_upsert_monthly_default_node_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict, distribution, provider_uuid
     ):
         """
@@ -1284,245 +1168,44 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         that contains the tag key:value pair,
         if it does then the price is added to the monthly cost.
         """
-        unique_nodes = self.get_distinct_nodes(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for node in unique_nodes:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        tag_default = tag_values.get("default_value")
-                        values_to_skip = tag_values.get("defined_keys")
-                        item_check = OCPUsageLineItemDailySummary.objects.filter(
-                            usage_start__gte=start_date,
-                            usage_start__lte=end_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            node=node,
-                            pod_labels__has_key=tag_key,
-                        )
-                        for value in values_to_skip:
-                            item_check = item_check.exclude(pod_labels__contains={tag_key: value})
-                        # this won't run if there are no matching items and item_check will continue to be
-                        # filtered until there are no items left
-                        while item_check:
-                            # get the first value for our tag key and exclude it from the queryset for the next check
-                            # will remove values until there are none left
-                            tag_key_value = item_check.first().pod_labels.get(tag_key)
-                            item_check = item_check.exclude(pod_labels__contains={tag_key: tag_key_value})
-                            line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start=start_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                monthly_cost_type="Node",
-                                node=node,
-                                data_source="Pod",
-                            ).first()
-                            if not line_item:
-                                line_item = OCPUsageLineItemDailySummary(
-                                    uuid=uuid.uuid4(),
-                                    usage_start=start_date,
-                                    usage_end=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="Node",
-                                    node=node,
-                                    data_source="Pod",
-                                    source_uuid=provider_uuid,
-                                )
-                            node_cost = tag_default
-                            if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                LOG.info(
-                                    "Node (%s) has a default monthly infrastructure cost of %s.", node, tag_default
-                                )
-                                if line_item.infrastructure_monthly_cost_json:
-                                    node_cost = (
-                                        line_item.infrastructure_monthly_cost_json.get(distribution, 0) + tag_default
-                                    )
-                                monthly_cost = self.generate_monthly_cost_json_object(distribution, node_cost)
-                                line_item.infrastructure_monthly_cost_json = monthly_cost
-                            elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                LOG.info(
-                                    "Node (%s) has a default monthly supplemenarty cost of %s.", node, tag_default
-                                )
-                                if line_item.supplementary_monthly_cost_json:
-                                    node_cost = (
-                                        line_item.supplementary_monthly_cost_json.get(distribution, 0) + tag_default
-                                    )
-                                monthly_cost = self.generate_monthly_cost_json_object(distribution, node_cost)
-                                line_item.supplementary_monthly_cost_json = monthly_cost
-                            line_item.save()
+        if rate_dict is None:
+            return
+        self._upsert_monthly_cost_line_items(
+            "monthly_cost_node_by_tag.sql",
+            start_date,
+            end_date,
+            cluster_id,
+            cluster_alias,
+            rate_type,
+            distribution,
+            provider_uuid,
+            rate_dict=json.dumps(rate_dict, default=str),
+            default_rates=True,
+        )
 
-    def tag_upsert_monthly_default_pvc_cost_line_item(  # noqa: C901
+    def tag_upsert_monthly_default_pvc_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict, provider_uuid
     ):
         """
-        Update or insert daily summary line item for node cost.
-        It checks to see if a line item exists for each node
+        Update or insert daily summary line item for PVC cost.
+        It checks to see if a line item exists for each PVC
         that contains the tag key:value pair,
         if it does then the price is added to the monthly cost.
         """
-        distribution = metric_constants.PVC_DISTRIBUTION
-        unique_pvcs = self.get_distinct_pvcs(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for pvc, node, namespace in unique_pvcs:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        tag_default = tag_values.get("default_value")
-                        values_to_skip = tag_values.get("defined_keys")
-                        item_check = OCPUsageLineItemDailySummary.objects.filter(
-                            usage_start__gte=start_date,
-                            usage_start__lte=end_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            persistentvolumeclaim=pvc,
-                            node=node,
-                            volume_labels__has_key=tag_key,
-                            namespace=namespace,
-                        )
-                        for value in values_to_skip:
-                            item_check = item_check.exclude(volume_labels__contains={tag_key: value})
-                        # this won't run if there are no matching items and item_check will continue to be
-                        # filtered until there are no items left
-                        while item_check:
-                            # get the first value for our tag key and exclude it from the queryset for the next check
-                            # will remove values until there are none left
-                            tag_key_value = item_check.first().volume_labels.get(tag_key)
-                            item_check = item_check.exclude(volume_labels__contains={tag_key: tag_key_value})
-                            line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start=start_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                monthly_cost_type="PVC",
-                                persistentvolumeclaim=pvc,
-                                node=node,
-                                data_source="Storage",
-                                namespace=namespace,
-                            ).first()
-                            if not line_item:
-                                line_item = OCPUsageLineItemDailySummary(
-                                    uuid=uuid.uuid4(),
-                                    usage_start=start_date,
-                                    usage_end=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="PVC",
-                                    persistentvolumeclaim=pvc,
-                                    node=node,
-                                    data_source="Storage",
-                                    namespace=namespace,
-                                    source_uuid=provider_uuid,
-                                )
-                            pvc_cost = tag_default
-                            if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                LOG.info("PVC (%s) has a default monthly infrastructure cost of %s.", pvc, tag_default)
-                                if line_item.infrastructure_monthly_cost_json:
-                                    pvc_cost = (
-                                        line_item.infrastructure_monthly_cost_json.get(distribution, 0) + tag_default
-                                    )
-                                monthly_cost = self.generate_monthly_cost_json_object(distribution, pvc_cost)
-                                line_item.infrastructure_monthly_cost_json = monthly_cost
-                            elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                LOG.info("PVC (%s) has a default monthly supplemenarty cost of %s.", pvc, tag_default)
-                                if line_item.supplementary_monthly_cost_json:
-                                    pvc_cost = (
-                                        line_item.supplementary_monthly_cost_json.get(distribution, 0) + tag_default
-                                    )
-                                monthly_cost = self.generate_monthly_cost_json_object(distribution, pvc_cost)
-                                line_item.supplementary_monthly_cost_json = monthly_cost
-                            line_item.save()
-
-    def get_cluster_to_node_distribution(self, start_date, end_date, cluster_id, distribution, cluster_cost):
-        """Returns a list of dictionaries containing the distributed cost.
-
-        args:
-            start_date (datetime, str): The start_date to calculate monthly_cost.
-            end_date (datetime, str): The end_date to calculate monthly_cost.
-            cluster_id (str): The id of the cluster
-            cluster_cost (dec): The flat cost of the cluster
-            distribution: Choice of monthly distribution ex. (memory or cpu)
-
-        Memory Distribution:
-            - (node memory capacity/cluster memory capacity) x cluster_cost
-        CPU Distribution:
-            - (node cpu capacity/cluster cpu capacity) x cluster_cost
-
-        Return list of dictionaries: ex [{"node":"aws_compute2", "distributed_cost": 285.71}]
-
-        """
-        node_column = "node_capacity_cpu_core_hours"
-        cluster_column = "cluster_capacity_cpu_core_hours"
-        if "memory" in distribution:
-            node_column = "node_capacity_memory_gigabyte_hours"
-            cluster_column = "cluster_capacity_memory_gigabyte_hours"
-
-        with schema_context(self.schema):
-            distributed_node_list = (
-                OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start__gte=start_date, usage_start__lt=end_date, cluster_id=cluster_id
-                )
-                .values("node")
-                .annotate(
-                    distributed_cost=ExpressionWrapper(
-                        Sum(node_column) / Sum(cluster_column) * cluster_cost, output_field=DecimalField()
-                    )
-                )
-            )
-        # TIP: For debugging add these to the annotation
-        # node_hours=Sum(node_column),
-        # cluster_hours=Sum(cluster_column),
-        # node_to_cluster_ratio=Sum(node_column)/Sum(cluster_column)
-        return distributed_node_list
-
-    def get_cluster_to_project_distribution(self, start_date, end_date, cluster_id, distribution, cluster_cost):
-        """Returns a list of dictionaries containing the distributed cost.
-
-        args:
-            start_date (datetime, str): The start_date to calculate monthly_cost.
-            end_date (datetime, str): The end_date to calculate monthly_cost.
-            cluster_id (str): The id of the cluster
-            cluster_cost (dec): The flat cost of the cluster
-            distribution: Choice of monthly distribution ex. (memory or cpu)
-
-        Project Distribution:
-            - Project distribution is a rolling window estimate of month to date.
-            - (project_usage / cluster_usage) x cluster_cost
-
-        Return list of dictionaries:
-        - ex [{'namespace': 'openshift', 'distributed_cost': Decimal('71.84')}
-
-        """
-        usage_column = "pod_usage_cpu_core_hours"
-        if "memory" in distribution:
-            usage_column = "pod_usage_memory_gigabyte_hours"
-
-        with schema_context(self.schema):
-            cluster_hours = (
-                OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start__gte=start_date, usage_start__lt=end_date, cluster_id=cluster_id
-                ).aggregate(cluster_hours=Sum(usage_column))
-            ).get("cluster_hours")
-            distributed_project_list = (
-                OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start__gte=start_date, usage_start__lt=end_date, cluster_id=cluster_id
-                )
-                .filter(namespace__isnull=False)
-                .values("namespace")
-                .annotate(
-                    distributed_cost=ExpressionWrapper(
-                        Sum(usage_column) / cluster_hours * cluster_cost, output_field=DecimalField()
-                    )
-                )
-            )
-        return distributed_project_list
+        if rate_dict is None:
+            return
+        self._upsert_monthly_cost_line_items(
+            "monthly_cost_persistentvolumeclaim_by_tag.sql",
+            start_date,
+            end_date,
+            cluster_id,
+            cluster_alias,
+            rate_type,
+            metric_constants.PVC_DISTRIBUTION,
+            provider_uuid,
+            rate_dict=json.dumps(rate_dict, default=str),
+            default_rates=True,
+        )
 
     def upsert_monthly_cluster_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, cluster_cost, distribution, provider_uuid
@@ -1539,101 +1222,27 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             rate_type (str): Contains the metric name. ex: "node_cost_per_month"
             cluster_cost (dec): The flat cost of the cluster
             distribution: Choice of monthly distribution ex. (memory or cpu)
+
+        Node Distribution:
+            - Memory: (node memory capacity/cluster memory capacity) x cluster_cost
+            - CPU: (node cpu capacity/cluster cpu capacity) x cluster_cost
+        Project Distribution:
+            - Project distribution is a rolling window estimate of month to date.
+            - (project_usage / cluster_usage) x cluster_cost
         """
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        distribution_list = self.get_cluster_to_node_distribution(
-            start_date, end_date, cluster_id, distribution, cluster_cost
+        self._upsert_monthly_cost_line_items(
+            "monthly_cost_cluster.sql",
+            start_date,
+            end_date,
+            cluster_id,
+            cluster_alias,
+            rate_type,
+            distribution,
+            provider_uuid,
+            cluster_cost=cluster_cost,
         )
-        if report_period:
-            with schema_context(self.schema):
-                # NOTE: I implemented a logic change here, now instead of one entry per cluster cost
-                # We now have multiple cluster cost entries for each node.
-                LOG.debug("Cluster (%s) has a monthly cost of %s.", cluster_id, cluster_cost)
-                LOG.debug("Distributing the cluster cost to nodes using %s distribution.", distribution)
-                for node_dikt in distribution_list:
-                    node = node_dikt.get("node")
-                    distributed_cost = node_dikt.get("distributed_cost", Decimal(0))
-                    line_item = OCPUsageLineItemDailySummary.objects.filter(
-                        usage_start=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="Cluster",
-                        node=node,
-                        data_source="Pod",
-                        namespace__isnull=True,
-                    ).first()
-                    if not line_item:
-                        line_item = OCPUsageLineItemDailySummary(
-                            uuid=uuid.uuid4(),
-                            usage_start=start_date,
-                            usage_end=start_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            monthly_cost_type="Cluster",
-                            node=node,
-                            data_source="Pod",
-                            source_uuid=provider_uuid,
-                        )
-                    monthly_cost = self.generate_monthly_cost_json_object(distribution, distributed_cost)
-                    log_statement = (
-                        f"Distributing Cluster Cost to Nodes:\n"
-                        f" cluster ({cluster_id}) cost: {cluster_cost} \n"
-                        f" node ({node}) distributed cost: {distributed_cost}\n"
-                        f" distribution type: {distribution}\n"
-                    )
-                    if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                        line_item.infrastructure_monthly_cost_json = monthly_cost
-                    elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                        line_item.supplementary_monthly_cost_json = monthly_cost
-                    LOG.debug(log_statement)
-                    line_item.save()
-            # Project Distribution
-            project_distribution_list = self.get_cluster_to_project_distribution(
-                start_date, end_date, cluster_id, distribution, cluster_cost
-            )
-            with schema_context(self.schema):
-                for project_dikt in project_distribution_list:
-                    namespace = project_dikt.get("namespace")
-                    distributed_cost = project_dikt.get("distributed_cost", Decimal(0))
-                    project_line_item = OCPUsageLineItemDailySummary.objects.filter(
-                        usage_start=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="Cluster",
-                        namespace=namespace,
-                        data_source="Pod",
-                    ).first()
-                    if not project_line_item:
-                        project_line_item = OCPUsageLineItemDailySummary(
-                            uuid=uuid.uuid4(),
-                            usage_start=start_date,
-                            usage_end=start_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            monthly_cost_type="Cluster",
-                            namespace=namespace,
-                            data_source="Pod",
-                            source_uuid=provider_uuid,
-                        )
-                    monthly_cost = self.generate_monthly_cost_json_object(distribution, distributed_cost)
-                    log_statement = (
-                        f"Distributing Cluster Cost to Project:\n"
-                        f" cluster ({cluster_id}) cost: {cluster_cost} \n"
-                        f" project ({namespace}) distributed cost: {distributed_cost}\n"
-                        f" distribution type: {distribution}\n"
-                    )
-                    if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                        project_line_item.infrastructure_project_monthly_cost = monthly_cost
-                    elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                        project_line_item.supplementary_project_monthly_cost = monthly_cost
-                    project_line_item.save()
-                    LOG.debug(log_statement)
-
-    def tag_upsert_monthly_pvc_cost_line_item(  # noqa: C901
+
+    def tag_upsert_monthly_pvc_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict, provider_uuid
     ):
         """
@@ -1643,154 +1252,36 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         that contains the tag key:value pair,
         if it does then the price is added to the monthly cost.
         """
-        distribution = metric_constants.PVC_DISTRIBUTION
-        unique_pvcs = self.get_distinct_pvcs(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for pvc, node, namespace in unique_pvcs:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        for value_name, rate_value in tag_values.items():
-                            item_check = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start__gte=start_date,
-                                usage_start__lte=end_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                persistentvolumeclaim=pvc,
-                                node=node,
-                                volume_labels__contains={tag_key: value_name},
-                                namespace=namespace,
-                            ).first()
-                            if item_check:
-                                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                    usage_start=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="PVC",
-                                    persistentvolumeclaim=pvc,
-                                    node=node,
-                                    data_source="Storage",
-                                    namespace=namespace,
-                                ).first()
-                                if not line_item:
-                                    line_item = OCPUsageLineItemDailySummary(
-                                        uuid=uuid.uuid4(),
-                                        usage_start=start_date,
-                                        usage_end=start_date,
-                                        report_period=report_period,
-                                        cluster_id=cluster_id,
-                                        cluster_alias=cluster_alias,
-                                        monthly_cost_type="PVC",
-                                        persistentvolumeclaim=pvc,
-                                        node=node,
-                                        data_source="Storage",
-                                        namespace=namespace,
-                                        source_uuid=provider_uuid,
-                                    )
-                                pvc_cost = rate_value
-                                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                    LOG.debug("PVC (%s) has a monthly infrastructure cost of %s.", pvc, rate_value)
-                                    if line_item.infrastructure_monthly_cost_json:
-                                        pvc_cost = (
-                                            line_item.infrastructure_monthly_cost_json.get(distribution, 0)
-                                            + rate_value
-                                        )
-                                    monthly_cost = self.generate_monthly_cost_json_object(distribution, pvc_cost)
-                                    line_item.infrastructure_monthly_cost_json = monthly_cost
-                                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                    LOG.debug("PVC (%s) has a monthly supplemenarty cost of %s.", pvc, rate_value)
-                                    if line_item.supplementary_monthly_cost_json:
-                                        pvc_cost = (
-                                            line_item.supplementary_monthly_cost_json.get(distribution, 0) + rate_value
-                                        )
-                                    monthly_cost = self.generate_monthly_cost_json_object(distribution, pvc_cost)
-                                    line_item.supplementary_monthly_cost_json = monthly_cost
-                                line_item.save()
+        if rate_dict is None:
+            return
+        self._upsert_monthly_cost_line_items(
+            "monthly_cost_persistentvolumeclaim_by_tag.sql",
+            start_date,
+            end_date,
+            cluster_id,
+            cluster_alias,
+            rate_type,
+            metric_constants.PVC_DISTRIBUTION,
+            provider_uuid,
+            rate_dict=json.dumps(rate_dict, default=str),
+            default_rates=False,
+        )
 
     def upsert_monthly_pvc_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, pvc_cost, provider_uuid
     ):
         """Update or insert daily summary line item for pvc cost."""
-        unique_pvcs = self.get_distinct_pvcs(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for pvc, node, namespace in unique_pvcs:
-                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start=start_date,
-                    report_period=report_period,
-                    cluster_id=cluster_id,
-                    cluster_alias=cluster_alias,
-                    monthly_cost_type="PVC",
-                    persistentvolumeclaim=pvc,
-                    node=node,
-                    data_source="Storage",
-                    namespace=namespace,
-                    infrastructure_project_monthly_cost__isnull=True,
-                    supplementary_project_monthly_cost__isnull=True,
-                ).first()
-                if not line_item:
-                    line_item = OCPUsageLineItemDailySummary(
-                        uuid=uuid.uuid4(),
-                        usage_start=start_date,
-                        usage_end=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="PVC",
-                        persistentvolumeclaim=pvc,
-                        node=node,
-                        data_source="Storage",
-                        namespace=namespace,
-                        source_uuid=provider_uuid,
-                    )
-                monthly_cost = self.generate_monthly_cost_json_object(metric_constants.PVC_DISTRIBUTION, pvc_cost)
-                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                    LOG.debug("PVC (%s) has a monthly infrastructure cost of %s.", pvc, pvc_cost)
-                    line_item.infrastructure_monthly_cost_json = monthly_cost
-                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                    LOG.debug("PVC (%s) has a monthly supplemenarty cost of %s.", pvc, pvc_cost)
-                    line_item.supplementary_monthly_cost_json = monthly_cost
-                line_item.save()
-                # PVC to project Distribution
-                project_line_item = OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start=start_date,
-                    report_period=report_period,
-                    cluster_id=cluster_id,
-                    cluster_alias=cluster_alias,
-                    monthly_cost_type="PVC",
-                    persistentvolumeclaim=pvc,
-                    node=node,
-                    namespace=namespace,
-                    data_source="Storage",
-                    infrastructure_monthly_cost_json__isnull=True,
-                    supplementary_monthly_cost_json__isnull=True,
-                ).first()
-                if not project_line_item:
-                    project_line_item = OCPUsageLineItemDailySummary(
-                        uuid=uuid.uuid4(),
-                        usage_start=start_date,
-                        usage_end=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="PVC",
-                        persistentvolumeclaim=pvc,
-                        node=node,
-                        namespace=namespace,
-                        data_source="Storage",
-                        source_uuid=provider_uuid,
-                    )
-                monthly_cost = self.generate_monthly_cost_json_object(metric_constants.PVC_DISTRIBUTION, pvc_cost)
-                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                    LOG.debug("PVC (%s) has a monthly project infrastructure cost of %s.", pvc, pvc_cost)
-                    project_line_item.infrastructure_project_monthly_cost = monthly_cost
-                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                    LOG.debug("PVC (%s) has a monthly project supplemenarty cost of %s.", pvc, pvc_cost)
-                    project_line_item.supplementary_project_monthly_cost = monthly_cost
-                project_line_item.save()
+        self._upsert_monthly_cost_line_items(
+            "monthly_cost_persistentvolumeclaim.sql",
+            start_date,
+            end_date,
+            cluster_id,
+            cluster_alias,
+            rate_type,
+            metric_constants.PVC_DISTRIBUTION,
+            provider_uuid,
+            pvc_cost=pvc_cost,
+        )
 
     def tag_upsert_monthly_cluster_cost_line_item(  # noqa: C901
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict, distribution, provider_uuid
@@ -1998,8 +1489,7 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             end_date = end_date.date()
         table_name = self._table_map["node_label_line_item_daily"]
 
-        daily_sql = pkgutil.get_data("masu.database", "sql/reporting_ocpnodelabellineitem_daily.sql")
-        daily_sql = daily_sql.decode("utf-8")
+        daily_sql = get_sql("masu.database", "sql/reporting_ocpnodelabellineitem_daily.sql")
         daily_sql_params = {
             "uuid": str(uuid.uuid4()).replace("-", "_"),
             "start_date": start_date,
@@ -2099,14 +1589,52 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
             ),
         )
 
-    def populate_tag_usage_costs(  # noqa: C901
-        self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id
+    def _populate_tag_usage_costs(
+        self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id, default_rates
     ):
+        """Insert the tag based usage costs for every rate of each cost type in a single statement.
+
+        The whole price list is handed to the SQL as one JSON document, so the
+        daily summary is scanned once per cost type regardless of the number of
+        metrics, tag keys and tag values that carry a rate.
+        """
+        # Cast start_date and end_date to date object, if they aren't already
+        if isinstance(start_date, str):
+            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        if isinstance(start_date, datetime.datetime):
+            start_date = start_date.date()
+            end_date = end_date.date()
+
+        table_name = self._table_map["line_item_daily_summary"]
+        rate_types = (
+            (metric_constants.INFRASTRUCTURE_COST_TYPE, infrastructure_rates),
+            (metric_constants.SUPPLEMENTARY_COST_TYPE, supplementary_rates),
+        )
+        for rate_type, rates in rate_types:
+            if not rates:
+                continue
+            sql_params = {
+                "schema": self.schema,
+                "start_date": start_date,
+                "end_date": end_date,
+                "cluster_id": cluster_id,
+                "cost_type": rate_type.lower(),
+                "rate_dict": json.dumps(rates, default=str),
+                "default_rates": default_rates,
+            }
+            LOG.info(
+                f"Updating {table_name} {rate_type.lower()} tag usage costs for cluster {cluster_id} "
+                f"from {start_date} to {end_date}"
+            )
+            self._execute_processing_script(
+                "masu.database", f"{self.OCP_COST_MODEL_SQL_PATH}usage_cost_by_tag.sql", sql_params
+            )
+
+    def populate_tag_usage_costs(self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id):
         """
         Update the reporting_ocpusagelineitem_daily_summary table with
         usage costs based on tag rates.
-        Due to the way the tag_keys are stored it loops through all of
-        the tag keys to filter and update costs.
 
         The data structure for infrastructure and supplementary rates are
         a dictionary that include the metric name, the tag key,
@@ -2118,70 +1646,11 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                 }
             }
         """
-        # defines the usage type for each metric
-        metric_usage_type_map = {
-            "cpu_core_usage_per_hour": "cpu",
-            "cpu_core_request_per_hour": "cpu",
-            "cpu_core_effective_usage_per_hour": "cpu",
-            "memory_gb_usage_per_hour": "memory",
-            "memory_gb_request_per_hour": "memory",
-            "memory_gb_effective_usage_per_hour": "memory",
-            "storage_gb_usage_per_month": "storage",
-            "storage_gb_request_per_month": "storage",
-        }
-        # define the rates so the loop can operate on both rate types
-        rate_types = [
-            {"rates": infrastructure_rates, "sql_file": "sql/infrastructure_tag_rates.sql"},
-            {"rates": supplementary_rates, "sql_file": "sql/supplementary_tag_rates.sql"},
-        ]
-        # Cast start_date and end_date to date object, if they aren't already
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        if isinstance(start_date, datetime.datetime):
-            start_date = start_date.date()
-            end_date = end_date.date()
-        # updates costs from tags
-        for rate_type in rate_types:
-            rate = rate_type.get("rates")
-            sql_file = rate_type.get("sql_file")
-            for metric in rate:
-                tags = rate.get(metric, {})
-                usage_type = metric_usage_type_map.get(metric)
-                if usage_type == "storage":
-                    labels_field = "volume_labels"
-                else:
-                    labels_field = "pod_labels"
-                table_name = self._table_map["line_item_daily_summary"]
-                for tag_key in tags:
-                    tag_vals = tags.get(tag_key, {})
-                    value_names = list(tag_vals.keys())
-                    for val_name in value_names:
-                        rate_value = tag_vals[val_name]
-                        key_value_pair = json.dumps({tag_key: val_name})
-                        tag_rates_sql = pkgutil.get_data("masu.database", sql_file)
-                        tag_rates_sql = tag_rates_sql.decode("utf-8")
-                        tag_rates_sql_params = {
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "rate": rate_value,
-                            "cluster_id": cluster_id,
-                            "schema": self.schema,
-                            "usage_type": usage_type,
-                            "metric": metric,
-                            "k_v_pair": key_value_pair,
-                            "labels_field": labels_field,
-                        }
-                        tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(
-                            tag_rates_sql, tag_rates_sql_params
-                        )
-                        msg = f"Running populate_tag_usage_costs SQL with params: {tag_rates_sql_params}"
-                        LOG.info(msg)
-                        self._execute_raw_sql_query(
-                            table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
-                        )
+        self._populate_tag_usage_costs(
+            infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id, default_rates=False
+        )
 
-    def populate_tag_usage_default_costs(  # noqa: C901
+    def populate_tag_usage_default_costs(
         self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id
     ):
         """
@@ -2201,74 +1670,9 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
                 }
             }
         """
-        # defines the usage type for each metric
-        metric_usage_type_map = {
-            "cpu_core_usage_per_hour": "cpu",
-            "cpu_core_request_per_hour": "cpu",
-            "cpu_core_effective_usage_per_hour": "cpu",
-            "memory_gb_usage_per_hour": "memory",
-            "memory_gb_request_per_hour": "memory",
-            "memory_gb_effective_usage_per_hour": "memory",
-            "storage_gb_usage_per_month": "storage",
-            "storage_gb_request_per_month": "storage",
-        }
-        # define the rates so the loop can operate on both rate types
-        rate_types = [
-            {"rates": infrastructure_rates, "sql_file": "sql/default_infrastructure_tag_rates.sql"},
-            {"rates": supplementary_rates, "sql_file": "sql/default_supplementary_tag_rates.sql"},
-        ]
-        # Cast start_date and end_date to date object, if they aren't already
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        if isinstance(start_date, datetime.datetime):
-            start_date = start_date.date()
-            end_date = end_date.date()
-
-        # updates costs from tags
-        for rate_type in rate_types:
-            rate = rate_type.get("rates")
-            sql_file = rate_type.get("sql_file")
-            for metric in rate:
-                tags = rate.get(metric, {})
-                usage_type = metric_usage_type_map.get(metric)
-                if usage_type == "storage":
-                    labels_field = "volume_labels"
-                else:
-                    labels_field = "pod_labels"
-                table_name = self._table_map["line_item_daily_summary"]
-                for tag_key in tags:
-                    key_value_pair = []
-                    tag_vals = tags.get(tag_key)
-                    rate_value = tag_vals.get("default_value", 0)
-                    if rate_value == 0:
-                        continue
-                    value_names = tag_vals.get("defined_keys", [])
-                    for value_to_skip in value_names:
-                        key_value_pair.append(json.dumps({tag_key: value_to_skip}))
-                    json.dumps(key_value_pair)
-                    tag_rates_sql = pkgutil.get_data("masu.database", sql_file)
-                    tag_rates_sql = tag_rates_sql.decode("utf-8")
-                    tag_rates_sql_params = {
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "rate": rate_value,
-                        "cluster_id": cluster_id,
-                        "schema": self.schema,
-                        "usage_type": usage_type,
-                        "metric": metric,
-                        "tag_key": tag_key,
-                        "k_v_pair": key_value_pair,
-                        "labels_field": labels_field,
-                    }
-                    tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(
-                        tag_rates_sql, tag_rates_sql_params
-                    )
-                    msg = f"Running populate_tag_usage_default_costs SQL with params: {tag_rates_sql_params}"
-                    LOG.info(msg)
-                    self._execute_raw_sql_query(
-                        table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
-                    )
+        self._populate_tag_usage_costs(
+            infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id, default_rates=True
+        )
 
     def populate_openshift_cluster_information_tables(self, provider, cluster_id, cluster_alias, start_date, end_date):
         """Populate the cluster, node, PVC, and project tables for the cluster."""
@@ -2284,6 +1688,20 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         self.populate_pvc_table(cluster, pvcs)
         self.populate_project_table(cluster, projects)
 
+    def populate_openshift_cluster_information_tables_from_summary(
+        self, provider, cluster_id, cluster_alias, start_date, end_date
+    ):
+        """Populate the cluster, node, PVC, and project tables for the cluster from the daily summary."""
+        cluster = self.populate_cluster_table(provider, cluster_id, cluster_alias)
+
+        nodes = self.get_nodes_from_summary(provider.uuid, start_date, end_date)
+        pvcs = self.get_pvcs_from_summary(provider.uuid, start_date, end_date)
+        projects = self.get_projects_from_summary(provider.uuid, start_date, end_date)
+
+        self.populate_node_table(cluster, nodes)
+        self.populate_pvc_table(cluster, pvcs)
+        self.populate_project_table(cluster, projects)
+
     def populate_cluster_table(self, provider, cluster_id, cluster_alias):
         """Get or create an entry in the OCP cluster table."""
         with schema_context(self.schema):
@@ -2298,39 +1716,74 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
         return cluster
 
     def populate_node_table(self, cluster, nodes):
-        """Get or create an entry in the OCP node table."""
+        """Create missing entries in the OCP node table and fill in missing node roles."""
         LOG.info("Populating reporting_ocp_nodes table.")
+
+        def node_key(node, resource_id, node_capacity_cpu_cores):
+            if node_capacity_cpu_cores is not None:
+                node_capacity_cpu_cores = Decimal(str(node_capacity_cpu_cores)).quantize(Decimal("0.01"))
+            return (node, resource_id, node_capacity_cpu_cores)
+
         with schema_context(self.schema):
+            existing_nodes = {
+                node_key(node.node, node.resource_id, node.node_capacity_cpu_cores): node
+                for node in OCPNode.objects.filter(cluster=cluster)
+            }
+            new_nodes = {}
+            updated_nodes = []
             for node in nodes:
-                tmp_node = OCPNode.objects.filter(
-                    node=node[0], resource_id=node[1], node_capacity_cpu_cores=node[2], cluster=cluster
-                ).first()
-                if not tmp_node:
-                    OCPNode.objects.create(
-                        node=node[0],
-                        resource_id=node[1],
-                        node_capacity_cpu_cores=node[2],
-                        node_role=node[3],
-                        cluster=cluster,
+                key = node_key(node[0], node[1], node[2])
+                existing_node = existing_nodes.get(key)
+                if not existing_node:
+                    new_nodes.setdefault(
+                        key,
+                        OCPNode(
+                            node=node[0],
+                            resource_id=node[1],
+                            node_capacity_cpu_cores=node[2],
+                            node_role=node[3],
+                            cluster=cluster,
+                        ),
                     )
                 # if the node entry already exists but does not have a role assigned, update the node role
-                elif not tmp_node.node_role:
-                    tmp_node.node_role = node[3]
-                    tmp_node.save()
+                elif not existing_node.node_role:
+                    existing_node.node_role = node[3]
+                    updated_nodes.append(existing_node)
+            OCPNode.objects.bulk_create(list(new_nodes.values()), ignore_conflicts=True)
+            OCPNode.objects.bulk_update(updated_nodes, ["node_role"])
+        LOG.info(f"Added {len(new_nodes)} and updated {len(updated_nodes)} reporting_ocp_nodes entries.")
 
     def populate_pvc_table(self, cluster, pvcs):
-        """Get or create an entry in the OCP cluster table."""
+        """Create missing entries in the OCP PVC table."""
         LOG.info("Populating reporting_ocp_pvcs table.")
         with schema_context(self.schema):
-            for pvc in pvcs:
-                OCPPVC.objects.get_or_create(persistent_volume=pvc[0], persistent_volume_claim=pvc[1], cluster=cluster)
+            existing_pvcs = set(
+                OCPPVC.objects.filter(cluster=cluster).values_list("persistent_volume", "persistent_volume_claim")
+            )
+            new_pvcs = {(pvc[0], pvc[1]) for pvc in pvcs} - existing_pvcs
+            OCPPVC.objects.bulk_create(
+                [
+                    OCPPVC(
+                        persistent_volume=persistent_volume,
+                        persistent_volume_claim=persistent_volume_claim,
+                        cluster=cluster,
+                    )
+                    for persistent_volume, persistent_volume_claim in new_pvcs
+                ],
+                ignore_conflicts=True,
+            )
+        LOG.info(f"Added {len(new_pvcs)} reporting_ocp_pvcs entries.")
 
     def populate_project_table(self, cluster, projects):
-        """Get or create an entry in the OCP cluster table."""
+        """Create missing entries in the OCP project table."""
         LOG.info("Populating reporting_ocp_projects table.")
         with schema_context(self.schema):
-            for project in projects:
-                OCPProject.objects.get_or_create(project=project, cluster=cluster)
+            existing_projects = set(OCPProject.objects.filter(cluster=cluster).values_list("project", flat=True))
+            new_projects = set(projects) - existing_projects
+            OCPProject.objects.bulk_create(
+                [OCPProject(project=project, cluster=cluster) for project in new_projects], ignore_conflicts=True
+            )
+        LOG.info(f"Added {len(new_projects)} reporting_ocp_projects entries.")
 
     def get_nodes_presto(self, source_uuid, start_date, end_date):
         """Get the nodes from an OpenShift cluster."""
@@ -2397,6 +1850,82 @@ class OCPReportDBAccessor(SQLScriptAtomicExecutorMixin, ReportDBAccessorBase):
 
         return [project[0] for project in projects]
 
+    def get_nodes_from_summary(self, source_uuid, start_date, end_date):
+        """Get the nodes from an OpenShift cluster's daily summary."""
+        with schema_context(self.schema):
+            summary = OCPUsageLineItemDailySummary.objects.filter(
+                source_uuid=source_uuid,
+                usage_start__gte=start_date,
+                usage_start__lte=end_date,
+                data_source="Pod",
+                node__isnull=False,
+            )
+            master_nodes = set(
+                summary.filter(namespace="openshift-kube-apiserver").values_list("node", flat=True).distinct()
+            )
+            infra_nodes = set(
+                OCPNodeLabelLineItemDaily.objects.filter(
+                    report_period__provider_id=source_uuid,
+                    usage_start__gte=start_date,
+                    usage_start__lte=end_date,
+                    node_labels__node_role_kubernetes_io="infra",
+                )
+                .values_list("node", flat=True)
+                .distinct()
+            )
+            nodes = (
+                summary.values_list("node", "resource_id")
+                .annotate(node_capacity_cpu_cores=Max("node_capacity_cpu_cores"))
+                .order_by()
+            )
+            return [
+                (
+                    node,
+                    resource_id,
+                    node_capacity_cpu_cores,
+                    "master" if node in master_nodes else "infra" if node in infra_nodes else "worker",
+                )
+                for node, resource_id, node_capacity_cpu_cores in nodes
+            ]
+
+    def get_pvcs_from_summary(self, source_uuid, start_date, end_date):
+        """Get the PVCs from an OpenShift cluster's daily summary."""
+        with schema_context(self.schema):
+            return list(
+                OCPUsageLineItemDailySummary.objects.filter(
+                    source_uuid=source_uuid,
+                    usage_start__gte=start_date,
+                    usage_start__lte=end_date,
+                    data_source="Storage",
+                    persistentvolume__isnull=False,
+                    persistentvolumeclaim__isnull=False,
+                )
+                .values_list("persistentvolume", "persistentvolumeclaim")
+                .distinct()
+            )
+
+    def get_projects_from_summary(self, source_uuid, start_date, end_date):
+        """Get the projects from an OpenShift cluster's daily summary."""
+        with schema_context(self.schema):
+            return list(
+                OCPUsageLineItemDailySummary.objects.filter(
+                    source_uuid=source_uuid,
+                    usage_start__gte=start_date,
+                    usage_start__lte=end_date,
+                    data_source="Pod",
+                    namespace__isnull=False,
+                )
+                .values_list("namespace", flat=True)
+                .distinct()
+            )
+
+    def delete_expired_resource_dimensions(self):
+        """Remove the nodes and projects that no longer appear in the daily summary once its data has expired."""
+        table_name = "reporting_ocp_resource_dimensions_expired"
+        expired_sql = get_sql("masu.database", f"sql/openshift/{table_name}.sql")
+        expired_sql, expired_sql_params = self.jinja_sql.prepare_query(expired_sql, {"schema": self.schema})
+        self._execute_raw_sql_query(table_name, expired_sql, bind_params=list(expired_sql_params), operation="DELETE")
+
     def get_cluster_for_provider(self, provider_uuid):
         """Return the cluster entry for a provider UUID."""
         with schema_context(self.schema):
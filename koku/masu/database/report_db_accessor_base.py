@@ -3,10 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Database accessor for report data."""
+import csv
+import io
+import json
 import logging
 import os
+import re
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from decimal import InvalidOperation
 
@@ -16,21 +21,54 @@ from dateutil.relativedelta import relativedelta
 from django.db import connection
 from django.db import OperationalError
 from django.db import transaction
-from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 
 import koku.trino_database as trino_db
 from api.common import log_json
 from koku.database import execute_delete_sql as exec_del_sql
 from koku.database_exc import get_extended_exception_by_type
+from koku.sql_templates import JINJA_SQL
 from masu.config import Config
 from masu.database.koku_database_access import KokuDBAccess
 from masu.database.koku_database_access import mini_transaction_delete
+from masu.prometheus_stats import TRINO_QUERY_DURATION
+from masu.prometheus_stats import UI_SUMMARY_TABLE_DURATION
 from reporting.models import PartitionedTable
 from reporting_common import REPORT_COLUMN_MAP
 
 LOG = logging.getLogger(__name__)
 
+# Trino statements that write a SELECT through the postgres connector
+PRESTO_POSTGRES_INSERT = re.compile(
+    r"^\s*INSERT\s+INTO\s+postgres\.\w+\.(?P<table>\w+)\s*\((?P<columns>[^)]*)\)\s*(?P<query>.+)$",
+    re.IGNORECASE | re.DOTALL,
+)
+COPY_NULL = r"\N"
+
+
+def _copy_value(value):
+    """Convert a trino result value to its Postgres COPY CSV text."""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (list, tuple)):
+        elements = (
+            "NULL" if v is None else '"' + str(v).replace("\\", "\\\\").replace('"', '\\"') + '"' for v in value
+        )
+        return "{" + ",".join(elements) + "}"
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
+
+def _rows_to_copy_buffer(rows):
+    """Write a page of trino result rows to an in-memory CSV buffer for COPY."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(value) for value in row])
+    buffer.seek(0)
+    return buffer
+
 
 class ReportDBAccessorException(Exception):
     """An error in the DB accessor."""
@@ -146,7 +184,7 @@ class ReportDBAccessorBase(KokuDBAccess):
             delete_sql = f"DELETE FROM {temp_table_name}"
             cursor.execute(delete_sql)
 
-    def bulk_insert_rows(self, file_obj, table, columns, sep=","):
+    def bulk_insert_rows(self, file_obj, table, columns, sep=",", null=None):
         """Insert many rows using Postgres copy functionality.
 
         Args:
@@ -154,12 +192,15 @@ class ReportDBAccessorBase(KokuDBAccess):
             table (str): The table name in the databse to copy to
             columns (list): A list of columns in the order of the CSV file
             sep (str): The separator in the file. Default: ','
+            null (str): The unquoted string that represents a null value. Default: empty string
 
         """
         columns = ", ".join(columns)
         with connection.cursor() as cursor:
             cursor.db.set_schema(self.schema)
             statement = f"COPY {table} ({columns}) FROM STDIN WITH CSV DELIMITER '{sep}'"
+            if null is not None:
+                statement += f" NULL '{null}'"
             cursor.copy_expert(statement, file_obj)
 
     def _get_db_obj_query(self, table, columns=None):
@@ -362,6 +403,63 @@ class ReportDBAccessorBase(KokuDBAccess):
 
         LOG.info("Finished %s on %s in %f seconds.", operation, table, t2 - t1)
 
+    def _execute_ui_summary_query(self, table, sql, start=None, end=None, bind_params=None, operation="DELETE/INSERT"):
+        """Run a UI summary statement and record its duration."""
+        with UI_SUMMARY_TABLE_DURATION.labels(table=table).time():
+            self._execute_raw_sql_query(table, sql, start, end, bind_params=bind_params, operation=operation)
+
+    def _execute_ui_summary_query_in_thread(self, *args, **kwargs):
+        """Run a UI summary statement on this worker thread's own database connection."""
+        try:
+            self._execute_ui_summary_query(*args, **kwargs)
+        finally:
+            # Each worker thread holds its own database connection
+            connection.close()
+
+    def _execute_ui_summary_queries(self, queries, start=None, end=None, operation="DELETE/INSERT"):
+        """Populate independent UI summary tables concurrently.
+
+        Args:
+            queries (list) (table, sql, bind_params) tuples
+            start (datetime.date) start of the summarized range, for logging
+            end (datetime.date) end of the summarized range, for logging
+            operation (str) operation name, for logging
+
+        The statements run on up to Config.UI_SUMMARY_MAX_WORKERS connections. They run
+        serially on the current connection when it is inside a transaction, because the
+        other connections could not see its uncommitted rows.
+        """
+        max_workers = min(Config.UI_SUMMARY_MAX_WORKERS, len(queries))
+        if max_workers <= 1 or connection.in_atomic_block:
+            for table, sql, bind_params in queries:
+                self._execute_ui_summary_query(table, sql, start, end, bind_params=bind_params, operation=operation)
+            return
+
+        t1 = time.time()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="masu-ui-summary") as executor:
+            futures = [
+                executor.submit(
+                    self._execute_ui_summary_query_in_thread,
+                    table,
+                    sql,
+                    start,
+                    end,
+                    bind_params=bind_params,
+                    operation=operation,
+                )
+                for table, sql, bind_params in queries
+            ]
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            raise errors[0]
+        LOG.info(
+            "Finished %s on %d UI summary tables with %d connections in %f seconds.",
+            operation,
+            len(queries),
+            max_workers,
+            time.time() - t1,
+        )
+
     def _execute_presto_raw_sql_query(self, schema, sql, bind_params=None, log_ref=None, attempts_left=0):
         """Execute a single presto query returning only the fetchall results"""
         results, _ = self._execute_presto_raw_sql_query_with_description(
@@ -377,7 +475,8 @@ class ReportDBAccessorBase(KokuDBAccess):
             t1 = time.time()
             presto_conn = trino_db.connect(schema=schema)
             presto_cur = presto_conn.cursor()
-            presto_cur.execute(sql, bind_params)
+            with TRINO_QUERY_DURATION.time():
+                presto_cur.execute(sql, bind_params)
             results = presto_cur.fetchall()
             description = presto_cur.description
             t2 = time.time()
@@ -393,9 +492,60 @@ class ReportDBAccessorBase(KokuDBAccess):
                 LOG.error(msg)
             raise ex
 
-    def _execute_presto_multipart_sql_query(
-        self, schema, sql, bind_params=None, preprocessor=JinjaSql().prepare_query
-    ):
+    def _execute_presto_copy_query(self, schema, sql, bind_params=None, log_ref=None):
+        """Load the result of a trino INSERT INTO postgres ... SELECT with Postgres COPY.
+
+        Only the SELECT runs in trino. Its result pages are streamed into a temporary
+        staging table with COPY and then merged into the target table in one statement,
+        so a single page of Config.TRINO_COPY_PAGE_SIZE rows is held in memory and
+        Postgres never sees the row-by-row writes of the trino postgres connector.
+
+        Args:
+            schema (str): The trino schema
+            sql (str): A rendered "INSERT INTO postgres.<schema>.<table> (<columns>) SELECT ..." statement
+            bind_params (list): Trino query parameters
+            log_ref (str): A reference to the query used in log messages
+
+        Returns:
+            (int): The number of rows loaded
+
+        """
+        match = PRESTO_POSTGRES_INSERT.match(sql)
+        if not match:
+            raise ReportDBAccessorException("Trino COPY loads require an INSERT INTO postgres ... SELECT statement.")
+        table = match.group("table")
+        columns = [column.strip() for column in match.group("columns").split(",")]
+        column_list = ", ".join(columns)
+        staging_table = f"copy_staging_{uuid.uuid4().hex}"
+
+        t1 = time.time()
+        row_count = 0
+        presto_conn = trino_db.connect(schema=schema)
+        presto_cur = presto_conn.cursor()
+        with TRINO_QUERY_DURATION.time():
+            presto_cur.execute(match.group("query").strip(), bind_params)
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.db.set_schema(self.schema)
+                cursor.execute(f"CREATE TEMPORARY TABLE {staging_table} (LIKE {table}) ON COMMIT DROP")
+            while True:
+                rows = presto_cur.fetchmany(Config.TRINO_COPY_PAGE_SIZE)
+                if not rows:
+                    break
+                self.bulk_insert_rows(_rows_to_copy_buffer(rows), staging_table, columns, null=COPY_NULL)
+                row_count += len(rows)
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging_table}")
+        t2 = time.time()
+
+        log_ref = log_ref or f"Trino COPY load of {table}"
+        LOG.info(
+            f"{log_ref} for {schema} \n\tloaded {row_count} rows in {t2 - t1} seconds "
+            f"({row_count / max(t2 - t1, 0.001):.0f} rows/sec)."
+        )
+        return row_count
+
+    def _execute_presto_multipart_sql_query(self, schema, sql, bind_params=None, preprocessor=JINJA_SQL.prepare_query):
         """Execute multiple related SQL queries in Presto."""
         presto_conn = trino_db.connect(schema=self.schema)
         return trino_db.executescript(presto_conn, sql, params=bind_params, preprocessor=preprocessor)
@@ -461,6 +611,8 @@ class ReportDBAccessorBase(KokuDBAccess):
     def delete_line_item_daily_summary_entries_for_date_range(
         self, source_uuid, start_date, end_date, table=None, filters=None
     ):
+        # Rows are deleted rather than swapping in a rebuilt partition: partitions hold a whole tenant-month
+        # for every source, and the summary SQL writes through the partitioned parent table
         if table is None:
             table = self.line_item_daily_summary_table
         msg = f"Deleting records from {table} from {start_date} to {end_date}"
@@ -3,8 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Report manifest database accessor for cost usage reports."""
+import json
 import logging
 
+from django.db import connection
 from django.db.models import DateField
 from django.db.models import DateTimeField
 from django.db.models import F
@@ -236,6 +238,42 @@ class ReportManifestDBAccessor(KokuDBAccess):
             manifest.s3_parquet_cleared = True
             manifest.save()
 
+    def add_changed_days(self, manifest_id, days):
+        """Record the usage days that received new parquet data for a manifest.
+
+        Files of a manifest are converted concurrently, so the days are merged
+        into the stored set by a single UPDATE.
+        """
+        if not days:
+            return
+        sql = f"""
+            UPDATE {self._table._meta.db_table}
+               SET changed_days = (
+                       SELECT jsonb_agg(DISTINCT day ORDER BY day)
+                         FROM jsonb_array_elements_text(coalesce(changed_days, '[]'::jsonb) || %s::jsonb) AS day
+                   )
+             WHERE id = %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [json.dumps(sorted(days)), manifest_id])
+
+    def get_changed_days(self, manifest_list):
+        """Return the usage days that received new parquet data for a list of manifests.
+
+        Returns:
+            (list) Sorted YYYY-MM-DD strings, or None if any manifest was not tracked
+
+        """
+        if not manifest_list:
+            return None
+        changed_days = set()
+        manifests = self._get_db_obj_query().filter(id__in=manifest_list).values_list("changed_days", flat=True)
+        for days in manifests:
+            if days is None:
+                return None
+            changed_days.update(days)
+        return sorted(changed_days) if changed_days else None
+
     def get_manifest_list_for_provider_and_date_range(self, provider_uuid, start_date, end_date):
         """Return a list of GCP manifests for a date range."""
         manifests = (
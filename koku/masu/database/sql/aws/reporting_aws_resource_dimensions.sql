@@ -0,0 +1,57 @@
+-- Record any account, region and service first seen in this date range so the
+-- resource-type endpoints never have to scan the summary tables
+INSERT INTO {{schema | sqlsafe}}.reporting_aws_accounts (
+    uuid,
+    usage_account_id,
+    account_alias_id,
+    provider_id
+)
+    SELECT uuid_generate_v4() as uuid,
+        usage_account_id,
+        max(account_alias_id) as account_alias_id,
+        {{source_uuid}}::uuid as provider_id
+    FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_account_p
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start <= {{end_date}}::date
+        AND source_uuid = {{source_uuid}}
+    GROUP BY usage_account_id
+ON CONFLICT (usage_account_id, provider_id) DO UPDATE
+    SET account_alias_id = coalesce(EXCLUDED.account_alias_id, reporting_aws_accounts.account_alias_id)
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_aws_regions (
+    uuid,
+    region,
+    usage_account_id,
+    provider_id
+)
+    SELECT uuid_generate_v4() as uuid,
+        region,
+        usage_account_id,
+        {{source_uuid}}::uuid as provider_id
+    FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_region_p
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start <= {{end_date}}::date
+        AND source_uuid = {{source_uuid}}
+        AND region IS NOT NULL
+    GROUP BY region, usage_account_id
+ON CONFLICT (region, usage_account_id, provider_id) DO NOTHING
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_aws_services (
+    uuid,
+    product_code,
+    usage_account_id,
+    provider_id
+)
+    SELECT uuid_generate_v4() as uuid,
+        product_code,
+        usage_account_id,
+        {{source_uuid}}::uuid as provider_id
+    FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_service_p
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start <= {{end_date}}::date
+        AND source_uuid = {{source_uuid}}
+    GROUP BY product_code, usage_account_id
+ON CONFLICT (product_code, usage_account_id, provider_id) DO NOTHING
+;
@@ -0,0 +1,30 @@
+-- Once expired data is removed, drop the accounts, regions and services
+-- that no longer appear in the remaining UI summary tables
+DELETE FROM {{schema | sqlsafe}}.reporting_aws_accounts AS a
+ WHERE NOT EXISTS (
+        SELECT 1
+          FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_account_p AS s
+         WHERE s.source_uuid = a.provider_id
+           AND s.usage_account_id = a.usage_account_id
+   )
+;
+
+DELETE FROM {{schema | sqlsafe}}.reporting_aws_regions AS r
+ WHERE NOT EXISTS (
+        SELECT 1
+          FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_region_p AS s
+         WHERE s.source_uuid = r.provider_id
+           AND s.usage_account_id = r.usage_account_id
+           AND s.region = r.region
+   )
+;
+
+DELETE FROM {{schema | sqlsafe}}.reporting_aws_services AS sv
+ WHERE NOT EXISTS (
+        SELECT 1
+          FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_service_p AS s
+         WHERE s.source_uuid = sv.provider_id
+           AND s.usage_account_id = sv.usage_account_id
+           AND s.product_code = sv.product_code
+   )
+;
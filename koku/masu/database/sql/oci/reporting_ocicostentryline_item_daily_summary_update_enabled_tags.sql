@@ -7,6 +7,8 @@ update {{schema | sqlsafe}}.reporting_ocicostentrylineitem_daily_summary as lids
    set tags = tags - array_subtract(array(select jsonb_object_keys(tags))::text[], keys::text[])
   from cte_enabled_keys as ek
  where ek.keys != '{}'::text[]
+   -- rows already carrying only enabled keys are not rewritten
+   and not array(select jsonb_object_keys(lids.tags))::text[] <@ ek.keys
    and lids.usage_start >= date({{start_date}})
    and lids.usage_start <= date({{end_date}})
 {% if bill_ids %}
@@ -0,0 +1,162 @@
+-- Distribute the monthly cluster cost to nodes by their share of cluster capacity
+WITH cte_node_cost AS (
+    SELECT node,
+{%- if distribution == 'memory' %}
+        coalesce(
+            sum(node_capacity_memory_gigabyte_hours) / nullif(sum(cluster_capacity_memory_gigabyte_hours), 0) * {{cluster_cost}}::numeric,
+            0
+        ) as distributed_cost
+{%- else %}
+        coalesce(
+            sum(node_capacity_cpu_core_hours) / nullif(sum(cluster_capacity_cpu_core_hours), 0) * {{cluster_cost}}::numeric,
+            0
+        ) as distributed_cost
+{%- endif %}
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start < {{end_date}}::date
+        AND cluster_id = {{cluster_id}}
+        AND node IS NOT NULL
+    GROUP BY node
+),
+cte_monthly_cost AS (
+    SELECT node,
+        CASE
+            WHEN {{distribution}} = 'cpu'
+                THEN jsonb_build_object('cpu', distributed_cost, 'memory', 0, 'pvc', 0)
+            WHEN {{distribution}} = 'memory'
+                THEN jsonb_build_object('cpu', 0, 'memory', distributed_cost, 'pvc', 0)
+            ELSE jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', 0)
+        END as monthly_cost
+    FROM cte_node_cost
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_monthly_cost_json = mc.monthly_cost
+    FROM cte_monthly_cost AS mc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'Cluster'
+        AND lids.node = mc.node
+        AND lids.data_source = 'Pod'
+        AND lids.namespace IS NULL
+    RETURNING mc.node
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    node,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_monthly_cost_json
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'Cluster' as monthly_cost_type,
+    mc.node,
+    'Pod' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    mc.monthly_cost
+FROM cte_monthly_cost AS mc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.node = mc.node
+)
+;
+
+-- Distribute the monthly cluster cost to projects by their share of month to date usage
+WITH cte_cluster_usage AS (
+    SELECT
+{%- if distribution == 'memory' %}
+        sum(pod_usage_memory_gigabyte_hours) as cluster_hours
+{%- else %}
+        sum(pod_usage_cpu_core_hours) as cluster_hours
+{%- endif %}
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start < {{end_date}}::date
+        AND cluster_id = {{cluster_id}}
+),
+cte_project_cost AS (
+    SELECT lids.namespace,
+{%- if distribution == 'memory' %}
+        coalesce(sum(lids.pod_usage_memory_gigabyte_hours) / nullif(cu.cluster_hours, 0) * {{cluster_cost}}::numeric, 0) as distributed_cost
+{%- else %}
+        coalesce(sum(lids.pod_usage_cpu_core_hours) / nullif(cu.cluster_hours, 0) * {{cluster_cost}}::numeric, 0) as distributed_cost
+{%- endif %}
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    CROSS JOIN cte_cluster_usage AS cu
+    WHERE lids.usage_start >= {{start_date}}::date
+        AND lids.usage_start < {{end_date}}::date
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.namespace IS NOT NULL
+    GROUP BY lids.namespace,
+        cu.cluster_hours
+),
+cte_monthly_cost AS (
+    SELECT namespace,
+        CASE
+            WHEN {{distribution}} = 'cpu'
+                THEN jsonb_build_object('cpu', distributed_cost, 'memory', 0, 'pvc', 0)
+            WHEN {{distribution}} = 'memory'
+                THEN jsonb_build_object('cpu', 0, 'memory', distributed_cost, 'pvc', 0)
+            ELSE jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', 0)
+        END as monthly_cost
+    FROM cte_project_cost
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_project_monthly_cost = mc.monthly_cost
+    FROM cte_monthly_cost AS mc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'Cluster'
+        AND lids.namespace = mc.namespace
+        AND lids.data_source = 'Pod'
+    RETURNING mc.namespace
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    namespace,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_project_monthly_cost
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'Cluster' as monthly_cost_type,
+    mc.namespace,
+    'Pod' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    mc.monthly_cost
+FROM cte_monthly_cost AS mc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.namespace = mc.namespace
+)
+;
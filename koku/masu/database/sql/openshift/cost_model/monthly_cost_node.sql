@@ -0,0 +1,140 @@
+-- Apply the monthly node cost to every node in the cluster
+WITH cte_node_cost AS (
+    SELECT node,
+        CASE
+            WHEN {{distribution}} = 'cpu'
+                THEN jsonb_build_object('cpu', {{node_cost}}::numeric, 'memory', 0, 'pvc', 0)
+            WHEN {{distribution}} = 'memory'
+                THEN jsonb_build_object('cpu', 0, 'memory', {{node_cost}}::numeric, 'pvc', 0)
+            ELSE jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', 0)
+        END as monthly_cost
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start < {{end_date}}::date
+        AND cluster_id = {{cluster_id}}
+        AND node IS NOT NULL
+    GROUP BY node
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_monthly_cost_json = nc.monthly_cost
+    FROM cte_node_cost AS nc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'Node'
+        AND lids.node = nc.node
+        AND lids.data_source = 'Pod'
+        AND lids.namespace IS NULL
+    RETURNING nc.node
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    node,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_monthly_cost_json
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'Node' as monthly_cost_type,
+    nc.node,
+    'Pod' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    nc.monthly_cost
+FROM cte_node_cost AS nc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.node = nc.node
+)
+;
+
+-- Distribute the monthly node cost evenly across the projects running on each node
+WITH cte_project_cost AS (
+    SELECT node,
+        namespace,
+        {{node_cost}}::numeric / count(*) OVER (PARTITION BY node) as distributed_cost
+    FROM (
+        SELECT DISTINCT node,
+            namespace
+        FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+        WHERE usage_start >= {{start_date}}::date
+            AND usage_start < {{end_date}}::date
+            AND cluster_id = {{cluster_id}}
+            AND node IS NOT NULL
+            AND namespace IS NOT NULL
+    ) AS node_projects
+),
+cte_monthly_cost AS (
+    SELECT node,
+        namespace,
+        CASE
+            WHEN {{distribution}} = 'cpu'
+                THEN jsonb_build_object('cpu', distributed_cost, 'memory', 0, 'pvc', 0)
+            WHEN {{distribution}} = 'memory'
+                THEN jsonb_build_object('cpu', 0, 'memory', distributed_cost, 'pvc', 0)
+            ELSE jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', 0)
+        END as monthly_cost
+    FROM cte_project_cost
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_project_monthly_cost = mc.monthly_cost
+    FROM cte_monthly_cost AS mc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'Node'
+        AND lids.node = mc.node
+        AND lids.namespace = mc.namespace
+        AND lids.data_source = 'Pod'
+    RETURNING mc.node,
+        mc.namespace
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    node,
+    namespace,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_project_monthly_cost
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'Node' as monthly_cost_type,
+    mc.node,
+    mc.namespace,
+    'Pod' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    mc.monthly_cost
+FROM cte_monthly_cost AS mc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.node = mc.node
+        AND upd.namespace = mc.namespace
+)
+;
@@ -0,0 +1,111 @@
+-- Add the tag based monthly node cost to every node carrying a rated tag
+WITH cte_tag_rates AS (
+{%- if default_rates %}
+    -- Every tag value without its own rate is charged the default rate for its key
+    SELECT key_rates.tag_key,
+        (key_rates.rates ->> 'default_value')::numeric as rate,
+        coalesce(key_rates.rates -> 'defined_keys', '[]'::jsonb) as defined_keys
+    FROM jsonb_each({{rate_dict}}::jsonb) AS key_rates(tag_key, rates)
+{%- else %}
+    SELECT key_rates.tag_key,
+        value_rates.tag_value,
+        (value_rates.rate #>> '{}')::numeric as rate
+    FROM jsonb_each({{rate_dict}}::jsonb) AS key_rates(tag_key, rates),
+        jsonb_each(key_rates.rates) AS value_rates(tag_value, rate)
+{%- endif %}
+),
+cte_node_tags AS (
+    SELECT DISTINCT lids.node,
+        tr.tag_key,
+{%- if default_rates %}
+        lids.pod_labels ->> tr.tag_key as tag_value,
+{%- else %}
+        tr.tag_value,
+{%- endif %}
+        tr.rate
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    JOIN cte_tag_rates AS tr
+{%- if default_rates %}
+        ON lids.pod_labels ? tr.tag_key
+            AND NOT tr.defined_keys ? (lids.pod_labels ->> tr.tag_key)
+{%- else %}
+        ON lids.pod_labels @> jsonb_build_object(tr.tag_key, tr.tag_value)
+{%- endif %}
+    WHERE lids.usage_start >= {{start_date}}::date
+        AND lids.usage_start <= {{end_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.node IS NOT NULL
+),
+cte_node_cost AS (
+    SELECT node,
+        sum(rate) as tag_cost
+    FROM cte_node_tags
+    GROUP BY node
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_monthly_cost_json = CASE
+            WHEN {{distribution}} = 'cpu'
+                THEN jsonb_build_object(
+                    'cpu', coalesce((lids.{{cost_type | sqlsafe}}_monthly_cost_json ->> 'cpu')::numeric, 0) + nc.tag_cost,
+                    'memory', 0,
+                    'pvc', 0
+                )
+            WHEN {{distribution}} = 'memory'
+                THEN jsonb_build_object(
+                    'cpu', 0,
+                    'memory', coalesce((lids.{{cost_type | sqlsafe}}_monthly_cost_json ->> 'memory')::numeric, 0) + nc.tag_cost,
+                    'pvc', 0
+                )
+            ELSE jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', 0)
+        END
+    FROM cte_node_cost AS nc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'Node'
+        AND lids.node = nc.node
+        AND lids.data_source = 'Pod'
+        AND lids.namespace IS NULL
+    RETURNING nc.node
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    node,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_monthly_cost_json
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'Node' as monthly_cost_type,
+    nc.node,
+    'Pod' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    CASE
+        WHEN {{distribution}} = 'cpu'
+            THEN jsonb_build_object('cpu', nc.tag_cost, 'memory', 0, 'pvc', 0)
+        WHEN {{distribution}} = 'memory'
+            THEN jsonb_build_object('cpu', 0, 'memory', nc.tag_cost, 'pvc', 0)
+        ELSE jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', 0)
+    END as {{cost_type | sqlsafe}}_monthly_cost_json
+FROM cte_node_cost AS nc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.node = nc.node
+)
+;
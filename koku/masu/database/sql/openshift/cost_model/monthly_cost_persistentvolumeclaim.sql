@@ -0,0 +1,139 @@
+-- Apply the monthly PVC cost to every persistent volume claim in the cluster
+WITH cte_pvc_cost AS (
+    SELECT DISTINCT persistentvolumeclaim,
+        node,
+        namespace,
+        jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', {{pvc_cost}}::numeric) as monthly_cost
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start < {{end_date}}::date
+        AND cluster_id = {{cluster_id}}
+        AND persistentvolumeclaim IS NOT NULL
+        AND namespace IS NOT NULL
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_monthly_cost_json = pc.monthly_cost
+    FROM cte_pvc_cost AS pc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'PVC'
+        AND lids.persistentvolumeclaim = pc.persistentvolumeclaim
+        AND lids.node IS NOT DISTINCT FROM pc.node
+        AND lids.namespace = pc.namespace
+        AND lids.data_source = 'Storage'
+        AND lids.infrastructure_project_monthly_cost IS NULL
+        AND lids.supplementary_project_monthly_cost IS NULL
+    RETURNING pc.persistentvolumeclaim,
+        pc.node,
+        pc.namespace
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    persistentvolumeclaim,
+    node,
+    namespace,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_monthly_cost_json
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'PVC' as monthly_cost_type,
+    pc.persistentvolumeclaim,
+    pc.node,
+    pc.namespace,
+    'Storage' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    pc.monthly_cost
+FROM cte_pvc_cost AS pc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.persistentvolumeclaim = pc.persistentvolumeclaim
+        AND upd.node IS NOT DISTINCT FROM pc.node
+        AND upd.namespace = pc.namespace
+)
+;
+
+-- Apply the monthly PVC cost to the project that owns each persistent volume claim
+WITH cte_pvc_cost AS (
+    SELECT DISTINCT persistentvolumeclaim,
+        node,
+        namespace,
+        jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', {{pvc_cost}}::numeric) as monthly_cost
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+    WHERE usage_start >= {{start_date}}::date
+        AND usage_start < {{end_date}}::date
+        AND cluster_id = {{cluster_id}}
+        AND persistentvolumeclaim IS NOT NULL
+        AND namespace IS NOT NULL
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_project_monthly_cost = pc.monthly_cost
+    FROM cte_pvc_cost AS pc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'PVC'
+        AND lids.persistentvolumeclaim = pc.persistentvolumeclaim
+        AND lids.node IS NOT DISTINCT FROM pc.node
+        AND lids.namespace = pc.namespace
+        AND lids.data_source = 'Storage'
+        AND lids.infrastructure_monthly_cost_json IS NULL
+        AND lids.supplementary_monthly_cost_json IS NULL
+    RETURNING pc.persistentvolumeclaim,
+        pc.node,
+        pc.namespace
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    persistentvolumeclaim,
+    node,
+    namespace,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_project_monthly_cost
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'PVC' as monthly_cost_type,
+    pc.persistentvolumeclaim,
+    pc.node,
+    pc.namespace,
+    'Storage' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    pc.monthly_cost
+FROM cte_pvc_cost AS pc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.persistentvolumeclaim = pc.persistentvolumeclaim
+        AND upd.node IS NOT DISTINCT FROM pc.node
+        AND upd.namespace = pc.namespace
+)
+;
@@ -0,0 +1,113 @@
+-- Add the tag based monthly PVC cost to every persistent volume claim carrying a rated tag
+WITH cte_tag_rates AS (
+{%- if default_rates %}
+    -- Every tag value without its own rate is charged the default rate for its key
+    SELECT key_rates.tag_key,
+        (key_rates.rates ->> 'default_value')::numeric as rate,
+        coalesce(key_rates.rates -> 'defined_keys', '[]'::jsonb) as defined_keys
+    FROM jsonb_each({{rate_dict}}::jsonb) AS key_rates(tag_key, rates)
+{%- else %}
+    SELECT key_rates.tag_key,
+        value_rates.tag_value,
+        (value_rates.rate #>> '{}')::numeric as rate
+    FROM jsonb_each({{rate_dict}}::jsonb) AS key_rates(tag_key, rates),
+        jsonb_each(key_rates.rates) AS value_rates(tag_value, rate)
+{%- endif %}
+),
+cte_pvc_tags AS (
+    SELECT DISTINCT lids.persistentvolumeclaim,
+        lids.node,
+        lids.namespace,
+        tr.tag_key,
+{%- if default_rates %}
+        lids.volume_labels ->> tr.tag_key as tag_value,
+{%- else %}
+        tr.tag_value,
+{%- endif %}
+        tr.rate
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    JOIN cte_tag_rates AS tr
+{%- if default_rates %}
+        ON lids.volume_labels ? tr.tag_key
+            AND NOT tr.defined_keys ? (lids.volume_labels ->> tr.tag_key)
+{%- else %}
+        ON lids.volume_labels @> jsonb_build_object(tr.tag_key, tr.tag_value)
+{%- endif %}
+    WHERE lids.usage_start >= {{start_date}}::date
+        AND lids.usage_start <= {{end_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.persistentvolumeclaim IS NOT NULL
+        AND lids.namespace IS NOT NULL
+),
+cte_pvc_cost AS (
+    SELECT persistentvolumeclaim,
+        node,
+        namespace,
+        sum(rate) as tag_cost
+    FROM cte_pvc_tags
+    GROUP BY persistentvolumeclaim,
+        node,
+        namespace
+),
+cte_update AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_type | sqlsafe}}_monthly_cost_json = jsonb_build_object(
+            'cpu', 0,
+            'memory', 0,
+            'pvc', coalesce((lids.{{cost_type | sqlsafe}}_monthly_cost_json ->> 'pvc')::numeric, 0) + pc.tag_cost
+        )
+    FROM cte_pvc_cost AS pc
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.report_period_id = {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = 'PVC'
+        AND lids.persistentvolumeclaim = pc.persistentvolumeclaim
+        AND lids.node IS NOT DISTINCT FROM pc.node
+        AND lids.namespace = pc.namespace
+        AND lids.data_source = 'Storage'
+        AND lids.infrastructure_project_monthly_cost IS NULL
+        AND lids.supplementary_project_monthly_cost IS NULL
+    RETURNING pc.persistentvolumeclaim,
+        pc.node,
+        pc.namespace
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    persistentvolumeclaim,
+    node,
+    namespace,
+    data_source,
+    source_uuid,
+    {{cost_type | sqlsafe}}_monthly_cost_json
+)
+SELECT uuid_generate_v4() as uuid,
+    {{report_period_id}} as report_period_id,
+    {{cluster_id}} as cluster_id,
+    {{cluster_alias}} as cluster_alias,
+    {{start_date}}::date as usage_start,
+    {{start_date}}::date as usage_end,
+    'PVC' as monthly_cost_type,
+    pc.persistentvolumeclaim,
+    pc.node,
+    pc.namespace,
+    'Storage' as data_source,
+    {{source_uuid}}::uuid as source_uuid,
+    jsonb_build_object('cpu', 0, 'memory', 0, 'pvc', pc.tag_cost) as {{cost_type | sqlsafe}}_monthly_cost_json
+FROM cte_pvc_cost AS pc
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_update AS upd
+    WHERE upd.persistentvolumeclaim = pc.persistentvolumeclaim
+        AND upd.node IS NOT DISTINCT FROM pc.node
+        AND upd.namespace = pc.namespace
+)
+;
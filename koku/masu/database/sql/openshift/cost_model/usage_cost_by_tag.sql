@@ -0,0 +1,150 @@
+-- Rate every metric, tag key and tag value of the price list in a single pass over the daily summary
+WITH cte_tag_rates AS (
+{%- if default_rates %}
+    -- Every tag value without its own rate is charged the default rate for its key
+    SELECT metric_rates.metric,
+        key_rates.tag_key,
+        (key_rates.rates ->> 'default_value')::numeric as rate,
+        coalesce(key_rates.rates -> 'defined_keys', '[]'::jsonb) as defined_keys
+    FROM jsonb_each({{rate_dict}}::jsonb) AS metric_rates(metric, tag_rates),
+        jsonb_each(metric_rates.tag_rates) AS key_rates(tag_key, rates)
+    WHERE (key_rates.rates ->> 'default_value')::numeric != 0
+{%- else %}
+    SELECT metric_rates.metric,
+        key_rates.tag_key,
+        value_rates.tag_value,
+        (value_rates.rate #>> '{}')::numeric as rate
+    FROM jsonb_each({{rate_dict}}::jsonb) AS metric_rates(metric, tag_rates),
+        jsonb_each(metric_rates.tag_rates) AS key_rates(tag_key, rates),
+        jsonb_each(key_rates.rates) AS value_rates(tag_value, rate)
+{%- endif %}
+),
+cte_metric_rates AS (
+    SELECT tr.*,
+        -- metric names are prefixed with their usage type: cpu, memory or storage
+        split_part(tr.metric, '_', 1) as usage_type,
+        CASE split_part(tr.metric, '_', 1) WHEN 'storage' THEN 'volume_labels' ELSE 'pod_labels' END as labels_field
+    FROM cte_tag_rates AS tr
+),
+cte_rated_usage AS (
+    SELECT lids.report_period_id,
+        lids.cluster_id,
+        lids.cluster_alias,
+        lids.data_source,
+        lids.usage_start,
+        lids.namespace,
+        lids.node,
+        lids.resource_id,
+        lids.persistentvolumeclaim,
+        lids.persistentvolume,
+        lids.storageclass,
+        lids.source_uuid,
+        mr.metric,
+        mr.usage_type,
+        mr.labels_field,
+        mr.rate,
+{%- if default_rates %}
+        labels.labels,
+{%- else %}
+        jsonb_build_object(mr.tag_key, mr.tag_value) as labels,
+{%- endif %}
+        CASE
+            WHEN mr.metric='cpu_core_usage_per_hour' THEN sum(lids.pod_usage_cpu_core_hours)
+            WHEN mr.metric='cpu_core_request_per_hour' THEN sum(lids.pod_request_cpu_core_hours)
+            WHEN mr.metric='cpu_core_effective_usage_per_hour' THEN sum(lids.pod_effective_usage_cpu_core_hours)
+            WHEN mr.metric='memory_gb_usage_per_hour' THEN sum(lids.pod_usage_memory_gigabyte_hours)
+            WHEN mr.metric='memory_gb_request_per_hour' THEN sum(lids.pod_request_memory_gigabyte_hours)
+            WHEN mr.metric='memory_gb_effective_usage_per_hour' THEN sum(lids.pod_effective_usage_memory_gigabyte_hours)
+            WHEN mr.metric='storage_gb_usage_per_month' THEN sum(lids.persistentvolumeclaim_usage_gigabyte_months)
+            WHEN mr.metric='storage_gb_request_per_month' THEN sum(lids.volume_request_storage_gigabyte_months)
+        END as usage
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    -- Expand each row into its labels once so every rate is matched with a hash join
+    CROSS JOIN LATERAL (
+        SELECT 'pod_labels' as labels_field, pod_label.key, pod_label.value, lids.pod_labels as labels
+        FROM jsonb_each_text(lids.pod_labels) AS pod_label
+        UNION ALL
+        SELECT 'volume_labels' as labels_field, volume_label.key, volume_label.value, lids.volume_labels as labels
+        FROM jsonb_each_text(lids.volume_labels) AS volume_label
+    ) AS labels
+    JOIN cte_metric_rates AS mr
+        ON mr.labels_field = labels.labels_field
+            AND mr.tag_key = labels.key
+{%- if default_rates %}
+            AND NOT mr.defined_keys ? labels.value
+{%- else %}
+            AND mr.tag_value = labels.value
+{%- endif %}
+    WHERE lids.cluster_id = {{cluster_id}}
+        AND lids.usage_start >= {{start_date}}
+        AND lids.usage_start <= {{end_date}}
+    GROUP BY lids.report_period_id,
+        lids.cluster_id,
+        lids.cluster_alias,
+        lids.data_source,
+        lids.usage_start,
+        lids.namespace,
+        lids.node,
+        lids.resource_id,
+        lids.persistentvolumeclaim,
+        lids.persistentvolume,
+        lids.storageclass,
+        lids.source_uuid,
+        mr.metric,
+        mr.usage_type,
+        mr.labels_field,
+        mr.tag_key,
+        mr.rate,
+{%- if default_rates %}
+        labels.labels
+{%- else %}
+        mr.tag_value
+{%- endif %}
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    data_source,
+    usage_start,
+    usage_end,
+    namespace,
+    node,
+    resource_id,
+    persistentvolumeclaim,
+    persistentvolume,
+    storageclass,
+    source_uuid,
+    {{cost_type | sqlsafe}}_usage_cost,
+    pod_labels,
+    volume_labels,
+    monthly_cost_type
+)
+SELECT uuid_generate_v4() as uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    data_source,
+    usage_start,
+    usage_start as usage_end,
+    namespace,
+    node,
+    resource_id,
+    persistentvolumeclaim,
+    persistentvolume,
+    storageclass,
+    source_uuid,
+    CASE
+        WHEN usage_type = 'cpu'
+            THEN jsonb_build_object('cpu', coalesce((rate * usage), 0.0), 'memory', 0.0, 'storage', 0.0)
+        WHEN usage_type = 'memory'
+            THEN jsonb_build_object('cpu', 0.0, 'memory', coalesce((rate * usage), 0.0), 'storage', 0.0)
+        WHEN usage_type = 'storage'
+            THEN jsonb_build_object('cpu', 0.0, 'memory', 0.0, 'storage', coalesce((rate * usage), 0.0))
+    END as {{cost_type | sqlsafe}}_usage_cost,
+    CASE WHEN labels_field = 'pod_labels' THEN labels END as pod_labels,
+    CASE WHEN labels_field = 'volume_labels' THEN labels END as volume_labels,
+    'Tag' as monthly_cost_type -- We are borrowing the monthly field here, although this is a daily usage cost
+FROM cte_rated_usage
+;
@@ -0,0 +1,23 @@
+-- Once expired data is removed, drop the projects and nodes that no
+-- longer appear in the remaining daily summary of their cluster
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_projects AS p
+ USING {{schema | sqlsafe}}.reporting_ocp_clusters AS c
+ WHERE p.cluster_id = c.uuid
+   AND NOT EXISTS (
+        SELECT 1
+          FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+         WHERE lids.source_uuid = c.provider_id
+           AND lids.namespace = p.project
+   )
+;
+
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_nodes AS n
+ USING {{schema | sqlsafe}}.reporting_ocp_clusters AS c
+ WHERE n.cluster_id = c.uuid
+   AND NOT EXISTS (
+        SELECT 1
+          FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+         WHERE lids.source_uuid = c.provider_id
+           AND lids.node = n.node
+   )
+;
@@ -8,6 +8,11 @@ update {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary as lids
        volume_labels = volume_labels - array_subtract(array(select jsonb_object_keys(coalesce(volume_labels, '{}'::jsonb)))::text[], keys::text[])
   from cte_enabled_keys as ek
  where ek.keys != '{}'::text[]
+   -- rows already carrying only enabled keys are not rewritten
+   and not (
+       array(select jsonb_object_keys(coalesce(lids.pod_labels, '{}'::jsonb)))::text[] <@ ek.keys
+       and array(select jsonb_object_keys(coalesce(lids.volume_labels, '{}'::jsonb)))::text[] <@ ek.keys
+   )
    and lids.usage_start >= date({{start_date}})
    and lids.usage_start <= date({{end_date}})
 {% if report_period_ids %}
@@ -57,6 +57,7 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
 
         """
         super().__init__(**kwargs)
+        self._s3_object_metadata = {}
 
         arn = credentials.get("role_arn")
         bucket = data_source.get("bucket")
@@ -115,27 +116,32 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
         """Set the AWS manifest date format."""
         return "%Y%m%dT000000.000Z"
 
-    def _check_size(self, s3key, check_inflate=False):
-        """Check the size of an S3 file.
+    def _get_object_metadata(self, s3key):
+        """Return the metadata of an S3 object without reading its body.
 
-        Determine if there is enough local space to download and decompress the
-        file.
+        The result of the HEAD request is memoized so that repeated probes
+        for the same key (ETag, size checks) only hit S3 once.
 
         Args:
-            s3key (str): the key name of the S3 object to check
-            check_inflate (bool): if the file is compressed, evaluate the file's decompressed size.
+            s3key (str): the key name of the S3 object to probe
 
         Returns:
-            (bool): whether the file can be safely stored (and decompressed)
+            (dict): the head_object response for the key
 
         """
-        size_ok = False
+        if s3key in self._s3_object_metadata:
+            return self._s3_object_metadata[s3key]
 
+        s3_filename = s3key.split("/")[-1]
         try:
-            s3fileobj = self.s3_client.get_object(Bucket=self.report.get("S3Bucket"), Key=s3key)
-            size = int(s3fileobj.get("ContentLength", -1))
+            metadata = self.s3_client.head_object(Bucket=self.report.get("S3Bucket"), Key=s3key)
         except ClientError as ex:
-            if ex.response["Error"]["Code"] == "AccessDenied":
+            # HEAD responses carry no body, so a missing key surfaces as a bare 404
+            if ex.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                msg = "Unable to find {} in S3 Bucket: {}".format(s3_filename, self.report.get("S3Bucket"))
+                LOG.info(log_json(self.tracing_id, msg, self.context))
+                raise AWSReportDownloaderNoFileError(msg)
+            if ex.response["Error"]["Code"] in ("AccessDenied", "403"):
                 msg = "Unable to access S3 Bucket {}: (AccessDenied)".format(self.report.get("S3Bucket"))
                 LOG.info(log_json(self.tracing_id, msg, self.context))
                 raise AWSReportDownloaderNoFileError(msg)
@@ -143,6 +149,28 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
             LOG.error(log_json(self.tracing_id, msg, self.context))
             raise AWSReportDownloaderError(str(ex))
 
+        self._s3_object_metadata[s3key] = metadata
+        return metadata
+
+    def _check_size(self, s3key, check_inflate=False):
+        """Check the size of an S3 file.
+
+        Determine if there is enough local space to download and decompress the
+        file.
+
+        Args:
+            s3key (str): the key name of the S3 object to check
+            check_inflate (bool): if the file is compressed, evaluate the file's decompressed size.
+
+        Returns:
+            (bool): whether the file can be safely stored (and decompressed)
+
+        """
+        size_ok = False
+
+        s3fileobj = self._get_object_metadata(s3key)
+        size = int(s3fileobj.get("ContentLength", -1))
+
         if size < 0:
             raise AWSReportDownloaderError(f"Invalid size for S3 object: {s3fileobj}")
 
@@ -231,7 +259,6 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
             (String): The path and file name of the saved file
 
         """
-        s3_filename = key.split("/")[-1]
         directory_path = f"{DATA_DIR}/{self.customer_name}/aws/{self.bucket}"
 
         local_s3_filename = utils.get_local_file_name(key)
@@ -241,24 +268,9 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
 
         # Make sure the data directory exists
         os.makedirs(directory_path, exist_ok=True)
-        s3_etag = None
-        file_creation_date = None
-        try:
-            s3_file = self.s3_client.get_object(Bucket=self.report.get("S3Bucket"), Key=key)
-            s3_etag = s3_file.get("ETag")
-            file_creation_date = s3_file.get("LastModified")
-        except ClientError as ex:
-            if ex.response["Error"]["Code"] == "NoSuchKey":
-                msg = "Unable to find {} in S3 Bucket: {}".format(s3_filename, self.report.get("S3Bucket"))
-                LOG.info(log_json(self.tracing_id, msg, self.context))
-                raise AWSReportDownloaderNoFileError(msg)
-            if ex.response["Error"]["Code"] == "AccessDenied":
-                msg = "Unable to access S3 Bucket {}: (AccessDenied)".format(self.report.get("S3Bucket"))
-                LOG.info(log_json(self.tracing_id, msg, self.context))
-                raise AWSReportDownloaderNoFileError(msg)
-            msg = f"Error downloading file: Error: {str(ex)}"
-            LOG.error(log_json(self.tracing_id, msg, self.context))
-            raise AWSReportDownloaderError(str(ex))
+        s3_file = self._get_object_metadata(key)
+        s3_etag = s3_file.get("ETag")
+        file_creation_date = s3_file.get("LastModified")
 
         if not self._check_size(key, check_inflate=True):
             msg = f"Insufficient disk space to download file: {s3_file}"
@@ -268,7 +280,10 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
         if s3_etag != stored_etag or not os.path.isfile(full_file_path):
             msg = f"Downloading key: {key} to file path: {full_file_path}"
             LOG.info(log_json(self.tracing_id, msg, self.context))
-            self.s3_client.download_file(self.report.get("S3Bucket"), key, full_file_path)
+            # Ranged multipart GETs so each report file is read from the customer bucket exactly once
+            self.s3_client.download_file(
+                self.report.get("S3Bucket"), key, full_file_path, Config=utils.get_s3_transfer_config()
+            )
             # Push to S3
             s3_csv_path = get_path_prefix(
                 self.account, Provider.PROVIDER_AWS, self._provider_uuid, start_date, Config.CSV_DATA_TYPE
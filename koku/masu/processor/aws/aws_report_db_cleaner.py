@@ -124,6 +124,8 @@ class AWSReportDBCleaner:
                     )
                 )
                 LOG.info(f"Deleted {del_count} table partitions")
+                with AWSReportDBAccessor(self._schema) as accessor:
+                    accessor.delete_expired_resource_dimensions()
 
             LOG.info(
                 f"Deleting data related to billing account ids {all_account_ids} "
@@ -122,6 +122,7 @@ class AWSReportParquetSummaryUpdater(PartitionHandlerMixin):
                 accessor.populate_ui_summary_tables(start, end, self._provider.uuid)
                 # accessor.populate_enabled_tag_keys(start, end, bill_ids)
             accessor.populate_tags_summary_table(bill_ids, start_date, end_date)
+            accessor.populate_resource_dimension_tables(start_date, end_date, self._provider.uuid)
 
             # accessor.update_line_item_daily_summary_with_enabled_tags(start_date, end_date, bill_ids)
             for bill in bills:
@@ -109,6 +109,7 @@ class AWSReportSummaryUpdater(PartitionHandlerMixin):
                 accessor.populate_line_item_daily_summary_table(start, end, bill_ids)
                 accessor.populate_ui_summary_tables(start, end, self._provider.uuid)
             accessor.populate_tags_summary_table(bill_ids, start_date, end_date)
+            accessor.populate_resource_dimension_tables(start_date, end_date, self._provider.uuid)
 
             for bill in bills:
                 if bill.summary_data_creation_datetime is None:
@@ -135,5 +135,7 @@ class OCPReportDBCleaner:
                     )
                 )
                 LOG.info(f"Deleted {del_count} table partitions")
+                with OCPReportDBAccessor(self._schema) as accessor:
+                    accessor.delete_expired_resource_dimensions()
 
         return removed_items
@@ -15,6 +15,7 @@ from koku.pg_partition import PartitionHandlerMixin
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
 from masu.external.date_accessor import DateAccessor
 from masu.processor.ocp.ocp_cloud_updater_base import OCPCloudUpdaterBase
+from masu.util.common import contiguous_date_ranges
 from masu.util.common import date_range_pair
 from masu.util.common import determine_if_full_summary_update_needed
 from masu.util.ocp.common import get_cluster_alias_from_cluster_id
@@ -40,6 +41,7 @@ class OCPReportParquetSummaryUpdater(PartitionHandlerMixin):
         self._cluster_id = get_cluster_id_from_provider(self._provider.uuid)
         self._cluster_alias = get_cluster_alias_from_cluster_id(self._cluster_id)
         self._date_accessor = DateAccessor()
+        self._full_month_update = False
 
     def _get_sql_inputs(self, start_date, end_date):
         """Get the required inputs for running summary SQL."""
@@ -59,6 +61,7 @@ class OCPReportParquetSummaryUpdater(PartitionHandlerMixin):
                     last_day_of_month = calendar.monthrange(bill_date.year, bill_date.month)[1]
                     start_date = bill_date
                     end_date = bill_date.replace(day=last_day_of_month)
+                    self._full_month_update = True
                     LOG.info("Overriding start and end date to process full month.")
 
         if isinstance(start_date, str):
@@ -77,6 +80,25 @@ class OCPReportParquetSummaryUpdater(PartitionHandlerMixin):
                 start_date = min_timestamp.date()
         return start_date, end_date
 
+    def _get_summary_date_ranges(self, start_date, end_date, changed_days):
+        """Return the date ranges to summarize.
+
+        When the manifests being summarized tracked which day partitions received new
+        parquet data, only runs of those days in the billing month are recomputed.
+        Otherwise the whole start_date to end_date range is.
+        """
+        if not changed_days or self._full_month_update:
+            return [(start_date, end_date)]
+        month_start = start_date.replace(day=1)
+        month_end = month_start.replace(day=calendar.monthrange(month_start.year, month_start.month)[1])
+        days = {ciso8601.parse_datetime(day).date() for day in changed_days}
+        days = [day for day in days if month_start <= day <= month_end]
+        if not days:
+            return [(start_date, end_date)]
+        date_ranges = contiguous_date_ranges(days)
+        LOG.info(f"Summarizing changed days {date_ranges} instead of {start_date} - {end_date}.")
+        return date_ranges
+
     def update_daily_tables(self, start_date, end_date):
         """Populate the daily tables for reporting.
 
@@ -93,12 +115,13 @@ class OCPReportParquetSummaryUpdater(PartitionHandlerMixin):
 
         return start_date, end_date
 
-    def update_summary_tables(self, start_date, end_date):
+    def update_summary_tables(self, start_date, end_date, changed_days=None):
         """Populate the summary tables for reporting.
 
         Args:
             start_date (str) The date to start populating the table.
             end_date   (str) The date to end on.
+            changed_days (list) YYYY-MM-DD days that received new parquet data, or None if unknown.
 
         Returns
             (str, str) A start date and end date.
@@ -106,6 +129,9 @@ class OCPReportParquetSummaryUpdater(PartitionHandlerMixin):
         """
         start_date, end_date = self._get_sql_inputs(start_date, end_date)
         start_date, end_date = self._check_parquet_date_range(start_date, end_date)
+        # Only the daily summary is limited to the changed days. The label, cluster and
+        # enabled tag steps and the returned cost model range keep the full range.
+        date_ranges = self._get_summary_date_ranges(start_date, end_date, changed_days)
 
         with schema_context(self._schema):
             self._handle_partitions(self._schema, UI_SUMMARY_TABLES, start_date, end_date)
@@ -118,27 +144,28 @@ class OCPReportParquetSummaryUpdater(PartitionHandlerMixin):
                     return start_date, end_date
                 report_period_id = report_period.id
 
-            for start, end in date_range_pair(start_date, end_date, step=settings.TRINO_DATE_STEP):
-                LOG.info(
-                    "Updating OpenShift report summary tables for \n\tSchema: %s "
-                    "\n\tProvider: %s \n\tCluster: %s \n\tReport Period ID: %s \n\tDates: %s - %s",
-                    self._schema,
-                    self._provider.uuid,
-                    self._cluster_id,
-                    report_period_id,
-                    start,
-                    end,
-                )
-                # This will process POD and STORAGE together
-                # "delete_all_except_infrastructure_raw_cost_from_daily_summary" specificallly excludes
-                # the cost rows generated through the OCPCloudParquetReportSummaryUpdater
-                accessor.delete_all_except_infrastructure_raw_cost_from_daily_summary(
-                    self._provider.uuid, report_period_id, start, end
-                )
-                accessor.populate_line_item_daily_summary_table_presto(
-                    start, end, report_period_id, self._cluster_id, self._cluster_alias, self._provider.uuid
-                )
-                accessor.populate_ui_summary_tables(start, end, self._provider.uuid)
+            for range_start, range_end in date_ranges:
+                for start, end in date_range_pair(range_start, range_end, step=settings.TRINO_DATE_STEP):
+                    LOG.info(
+                        "Updating OpenShift report summary tables for \n\tSchema: %s "
+                        "\n\tProvider: %s \n\tCluster: %s \n\tReport Period ID: %s \n\tDates: %s - %s",
+                        self._schema,
+                        self._provider.uuid,
+                        self._cluster_id,
+                        report_period_id,
+                        start,
+                        end,
+                    )
+                    # This will process POD and STORAGE together
+                    # "delete_all_except_infrastructure_raw_cost_from_daily_summary" specificallly excludes
+                    # the cost rows generated through the OCPCloudParquetReportSummaryUpdater
+                    accessor.delete_all_except_infrastructure_raw_cost_from_daily_summary(
+                        self._provider.uuid, report_period_id, start, end
+                    )
+                    accessor.populate_line_item_daily_summary_table_presto(
+                        start, end, report_period_id, self._cluster_id, self._cluster_alias, self._provider.uuid
+                    )
+                    accessor.populate_ui_summary_tables(start, end, self._provider.uuid)
 
             # This will process POD and STORAGE together
             LOG.info(
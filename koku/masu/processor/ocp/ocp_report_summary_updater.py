@@ -14,6 +14,7 @@ from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.external.date_accessor import DateAccessor
 from masu.processor.ocp.ocp_cloud_updater_base import OCPCloudUpdaterBase
 from masu.util.common import date_range_pair
+from masu.util.ocp.common import get_cluster_alias_from_cluster_id
 from masu.util.ocp.common import get_cluster_id_from_provider
 from reporting.provider.ocp.models import UI_SUMMARY_TABLES
 
@@ -34,6 +35,7 @@ class OCPReportSummaryUpdater(PartitionHandlerMixin):
         self._provider = provider
         self._manifest = manifest
         self._cluster_id = get_cluster_id_from_provider(self._provider.uuid)
+        self._cluster_alias = get_cluster_alias_from_cluster_id(self._cluster_id)
         self._date_accessor = DateAccessor()
 
     def update_daily_tables(self, start_date, end_date):
@@ -102,6 +104,9 @@ class OCPReportSummaryUpdater(PartitionHandlerMixin):
                 accessor.populate_ui_summary_tables(start, end, self._provider.uuid)
             accessor.populate_pod_label_summary_table(report_period_ids, start_date, end_date)
             accessor.populate_volume_label_summary_table(report_period_ids, start_date, end_date)
+            accessor.populate_openshift_cluster_information_tables_from_summary(
+                self._provider, self._cluster_id, self._cluster_alias, start_date, end_date
+            )
             accessor.update_line_item_daily_summary_with_enabled_tags(start_date, end_date, report_period_ids)
 
             if report_period.summary_data_creation_datetime is None:
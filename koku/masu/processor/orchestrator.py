@@ -4,9 +4,14 @@
 #
 """Report Processing Orchestrator."""
 import logging
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 
 from celery import chord
 from celery import group
+from django.db import connection
 
 from api.common import log_json
 from api.models import Provider
@@ -30,9 +35,20 @@ from masu.processor.tasks import remove_expired_data
 from masu.processor.tasks import summarize_reports
 from masu.processor.tasks import SUMMARIZE_REPORTS_QUEUE
 from masu.processor.worker_cache import WorkerCache
+from masu.prometheus_stats import PROVIDER_POLLING_DURATION
+from masu.prometheus_stats import PROVIDER_POLLING_TIMEOUT_COUNTER
 
 LOG = logging.getLogger(__name__)
 
+# How often (in seconds) prepare() checks polling threads for timeouts
+POLLING_WAIT_INTERVAL = 5
+CONTINUOUS_REPORT_PROVIDERS = [
+    Provider.PROVIDER_OCI,
+    Provider.PROVIDER_OCI_LOCAL,
+    Provider.PROVIDER_GCP,
+    Provider.PROVIDER_GCP_LOCAL,
+]
+
 
 class Orchestrator:
     """
@@ -262,22 +278,66 @@ class Orchestrator:
         """
         Select the correct prepare function based on source type for processing each account.
 
+        Accounts are polled concurrently on a bounded thread pool so that a slow
+        cloud API only delays its own provider. Providers that exceed
+        Config.POLLING_PROVIDER_TIMEOUT are logged and left to finish in the background.
+
         """
+        polling_jobs = []
         for account in self._polling_accounts:
             provider_uuid = account.get("provider_uuid")
             with ProviderDBAccessor(provider_uuid) as provider_accessor:
                 provider_type = provider_accessor.get_type()
+            polling_jobs.append((account, provider_uuid, provider_type))
+
+        if not polling_jobs:
+            return
+
+        started = {}
+        executor = ThreadPoolExecutor(max_workers=Config.POLLING_MAX_WORKERS, thread_name_prefix="masu-polling")
+        futures = {executor.submit(self.poll_account, started, *job): job for job in polling_jobs}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=POLLING_WAIT_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                _, provider_uuid, _ = futures[future]
+                if future.exception():
+                    LOG.error(f"Unexpected polling error for provider: {provider_uuid}. Error: {future.exception()}.")
+
+            now = time.monotonic()
+            for future in list(pending):
+                _, provider_uuid, provider_type = futures[future]
+                start = started.get(provider_uuid)
+                if start is not None and now - start > Config.POLLING_PROVIDER_TIMEOUT:
+                    LOG.warning(
+                        f"Polling for provider: {provider_uuid} exceeded {Config.POLLING_PROVIDER_TIMEOUT} seconds. "
+                        "Continuing without waiting for it."
+                    )
+                    PROVIDER_POLLING_TIMEOUT_COUNTER.labels(provider_type=provider_type).inc()
+                    pending.discard(future)
+        executor.shutdown(wait=False)
+
+    def poll_account(self, started, account, provider_uuid, provider_type):
+        """
+        Poll a single account for new report manifests.
 
-            if provider_type in [
-                Provider.PROVIDER_OCI,
-                Provider.PROVIDER_OCI_LOCAL,
-                Provider.PROVIDER_GCP,
-                Provider.PROVIDER_GCP_LOCAL,
-            ]:
+        Args:
+            started (Dict) shared map of provider uuid to polling start time
+            account (Dict) account to poll
+            provider_uuid (String) provider unique identifier
+            provider_type (String) provider type
 
-                self.prepare_continious_report_sources(account, provider_uuid)
-            else:
-                self.prepare_monthly_report_sources(account, provider_uuid)
+        """
+        started[provider_uuid] = time.monotonic()
+        try:
+            with PROVIDER_POLLING_DURATION.labels(provider_type=provider_type).time():
+                if provider_type in CONTINUOUS_REPORT_PROVIDERS:
+                    self.prepare_continious_report_sources(account, provider_uuid)
+                else:
+                    self.prepare_monthly_report_sources(account, provider_uuid)
+        finally:
+            # Each polling thread holds its own database connection
+            connection.close()
 
     def prepare_monthly_report_sources(self, account, provider_uuid):
         """
@@ -90,6 +90,7 @@ class ParquetReportProcessor:
             self.invoice_month_date = DateHelper().invoice_month_start(self.invoice_month).date()
         self.presto_table_exists = {}
         self.files_to_remove = []
+        self.enabled_tag_keys = set()
 
     @property
     def schema_name(self):
@@ -401,9 +402,20 @@ class ParquetReportProcessor:
             if not success:
                 failed_conversion.append(csv_filename)
 
+        # Tag keys of every converted file are created together
+        create_enabled_keys(self._schema_name, self.enabled_tags_model, self.enabled_tag_keys)
         if failed_conversion:
             msg = f"Failed to convert the following files to parquet:{','.join(failed_conversion)}."
             LOG.warn(log_json(self.tracing_id, msg, self.error_context))
+        if self.provider_type == Provider.PROVIDER_OCP:
+            # Summaries only need to recompute the day partitions rewritten here
+            changed_days = {
+                day
+                for daily_frame in daily_data_frames
+                if not daily_frame.empty
+                for day in daily_frame["interval_start"].dt.strftime("%Y-%m-%d").unique()
+            }
+            manifest_accessor.add_changed_days(self.manifest_id, changed_days)
         return parquet_base_filename, daily_data_frames
 
     def create_parquet_table(self, parquet_file, daily=False):
@@ -463,7 +475,7 @@ class ParquetReportProcessor:
                         return parquet_base_filename, daily_data_frames, False
             if self.create_table and not self.presto_table_exists.get(self.report_type):
                 self.create_parquet_table(parquet_file)
-            create_enabled_keys(self._schema_name, self.enabled_tags_model, unique_keys)
+            self.enabled_tag_keys.update(unique_keys)
         except Exception as err:
             msg = (
                 f"File {csv_filename} could not be written as parquet to temp file {parquet_file}. Reason: {str(err)}"
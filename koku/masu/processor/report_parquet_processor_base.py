@@ -6,13 +6,13 @@
 import logging
 
 import pyarrow.parquet as pq
-import trino
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from trino.exceptions import TrinoExternalError
 from trino.exceptions import TrinoQueryError
 from trino.exceptions import TrinoUserError
 
+import koku.trino_database as trino_db
 from api.models import Provider
 from koku.pg_partition import get_or_create_partition
 from masu.util.common import strip_characters_from_column_name
@@ -50,7 +50,7 @@ class ReportParquetProcessorBase:
         """Execute Trino SQL."""
         rows = []
         try:
-            with trino.dbapi.connect(
+            with trino_db.connect(
                 host=settings.PRESTO_HOST, port=settings.PRESTO_PORT, user="admin", catalog="hive", schema=schema_name
             ) as conn:
                 cur = conn.cursor()
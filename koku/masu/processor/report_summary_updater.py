@@ -50,18 +50,20 @@ class ReportSummaryUpdaterProviderNotFoundError(ReportSummaryUpdaterError):
 class ReportSummaryUpdater:
     """Update reporting summary tables."""
 
-    def __init__(self, customer_schema, provider_uuid, manifest_id=None, tracing_id=None):
+    def __init__(self, customer_schema, provider_uuid, manifest_id=None, tracing_id=None, manifest_list=None):
         """
         Initializer.
 
         Args:
             customer_schema (str): Schema name for given customer.
             provider (str): The provider type.
+            manifest_list (list): All manifests covered by this summary. Default: [manifest_id]
 
         """
         self._schema = customer_schema
         self._provider_uuid = provider_uuid
         self._manifest = None
+        self._manifest_list = manifest_list or ([manifest_id] if manifest_id is not None else [])
         self._tracing_id = tracing_id
         if manifest_id is not None:
             with ReportManifestDBAccessor() as manifest_accessor:
@@ -186,6 +188,10 @@ class ReportSummaryUpdater:
 
         if invoice_month:
             start_date, end_date = self._updater.update_summary_tables(start_date, end_date, invoice_month)
+        elif isinstance(self._updater, OCPReportParquetSummaryUpdater):
+            with ReportManifestDBAccessor() as manifest_accessor:
+                changed_days = manifest_accessor.get_changed_days(self._manifest_list)
+            start_date, end_date = self._updater.update_summary_tables(start_date, end_date, changed_days=changed_days)
         else:
             start_date, end_date = self._updater.update_summary_tables(start_date, end_date)
 
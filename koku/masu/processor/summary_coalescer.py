@@ -0,0 +1,117 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Coalesce overlapping summary requests for a provider and billing month."""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from masu.config import Config
+
+LOG = logging.getLogger(__name__)
+
+SUMMARY_KEY_PREFIX = "summary"
+MUTEX_TIMEOUT = 5
+MUTEX_WAIT = 2
+MUTEX_POLL_INTERVAL = 0.05
+
+
+class SummaryCoalescer:
+    """Debounce summary requests for a single (schema, provider, month) key.
+
+    The first request for a key opens a window of Config.SUMMARY_COALESCE_WINDOW seconds
+    and is dispatched right away. Requests that arrive while the window is open are merged
+    into a single pending request whose date range is the union of theirs. The first of
+    those schedules one trailing dispatch for the end of the window, which pops the merged
+    request and runs a single summary for it.
+
+    Example:
+
+        cache_key                                   |       value
+        ":1:summary:org1234567:{uuid}:2022-06:window" | True
+        ":1:summary:org1234567:{uuid}:2022-06:pending"| {"start": "2022-06-01", "end": "2022-06-03", ...}
+
+    """
+
+    cache = caches["worker"]
+
+    def __init__(self, schema_name, provider_uuid, month):
+        """Initialize the coalescer for a schema, provider and billing month."""
+        self.key = f"{SUMMARY_KEY_PREFIX}:{schema_name}:{provider_uuid}:{month}"
+        self.window = Config.SUMMARY_COALESCE_WINDOW
+
+    @property
+    def enabled(self):
+        """Return whether summary requests are coalesced."""
+        return self.window > 0
+
+    def open_window(self):
+        """Open the coalescing window.
+
+        Returns:
+            (bool) True if no window was open and the request should be dispatched now
+
+        """
+        return self.cache.add(f"{self.key}:window", True, self.window)
+
+    def _acquire(self):
+        """Acquire the mutex guarding the pending request."""
+        deadline = time.monotonic() + MUTEX_WAIT
+        while not self.cache.add(f"{self.key}:mutex", True, MUTEX_TIMEOUT):
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(MUTEX_POLL_INTERVAL)
+        return True
+
+    def _release(self):
+        """Release the mutex guarding the pending request."""
+        self.cache.delete(f"{self.key}:mutex")
+
+    def add_pending(self, request):
+        """Merge a summary request into the pending request for this key.
+
+        Args:
+            request (dict) summary request with start, end and manifest_list
+
+        Returns:
+            (bool|None) True if this created the pending request and the caller must schedule
+                its dispatch, False if it was merged into an already scheduled request and
+                None if the pending request could not be updated
+
+        """
+        if not self._acquire():
+            LOG.warning(f"Unable to lock pending summary request {self.key}.")
+            return None
+        try:
+            pending = self.cache.get(f"{self.key}:pending")
+            if pending:
+                pending["start"] = min(pending["start"], request["start"])
+                pending["end"] = max(pending["end"], request["end"])
+                pending["manifest_list"] = sorted(
+                    set(pending["manifest_list"]) | set(request["manifest_list"]), key=str
+                )
+                pending["coalesced"] += 1
+            else:
+                pending = dict(request, coalesced=0)
+            # Outlive the trailing dispatch so a slow queue cannot drop the request
+            self.cache.set(f"{self.key}:pending", pending, self.window + int(settings.WORKER_CACHE_TIMEOUT))
+            return pending["coalesced"] == 0
+        finally:
+            self._release()
+
+    def pop_pending(self):
+        """Remove and return the pending request for this key."""
+        if not self._acquire():
+            LOG.warning(f"Unable to lock pending summary request {self.key}. Dispatching without lock.")
+            pending = self.cache.get(f"{self.key}:pending")
+            self.cache.delete(f"{self.key}:pending")
+            return pending
+        try:
+            pending = self.cache.get(f"{self.key}:pending")
+            self.cache.delete(f"{self.key}:pending")
+            return pending
+        finally:
+            self._release()
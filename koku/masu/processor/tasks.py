@@ -25,6 +25,8 @@ from api.common import log_json
 from api.iam.models import Tenant
 from api.provider.models import Provider
 from api.utils import get_months_in_date_range
+from forecast.forecast import invalidate_forecasts
+from forecast.forecast import precompute_forecasts
 from koku import celery_app
 from koku.middleware import KokuTenantMiddleware
 from masu.database.cost_model_db_accessor import CostModelDBAccessor
@@ -50,6 +52,8 @@ from masu.processor.report_processor import ReportProcessorError
 from masu.processor.report_summary_updater import ReportSummaryUpdater
 from masu.processor.report_summary_updater import ReportSummaryUpdaterCloudError
 from masu.processor.report_summary_updater import ReportSummaryUpdaterProviderNotFoundError
+from masu.processor.summary_coalescer import SummaryCoalescer
+from masu.processor.worker_cache import get_requeue_countdown
 from masu.processor.worker_cache import WorkerCache
 from masu.util.aws.common import remove_files_not_in_set_from_s3_bucket
 from masu.util.common import execute_trino_query
@@ -63,6 +67,7 @@ GET_REPORT_FILES_QUEUE = "download"
 OCP_QUEUE = "ocp"
 PRIORITY_QUEUE = "priority"
 MARK_MANIFEST_COMPLETE_QUEUE = "priority"
+REFRESH_FORECAST_CACHE_QUEUE = "celery"
 REMOVE_EXPIRED_DATA_QUEUE = "summary"
 SUMMARIZE_REPORTS_QUEUE = "summary"
 UPDATE_COST_MODEL_COSTS_QUEUE = "cost_model"
@@ -175,7 +180,12 @@ def get_report_files(  # noqa: C901
         report_file = report_context.get("key")
         cache_key = f"{provider_uuid}:{report_file}"
         tracing_id = report_context.get("assembly_id", "no-tracing-id")
-        WorkerCache().add_task_to_cache(cache_key)
+        worker_cache = WorkerCache()
+        if not worker_cache.add_task_to_cache(cache_key):
+            LOG.info(
+                log_json(tracing_id, f"Report {report_file} is already being processed by another worker.", context)
+            )
+            return
 
         try:
             report_dict = _get_report_files(
@@ -190,7 +200,7 @@ def get_report_files(  # noqa: C901
             )
         except (MasuProcessingError, MasuProviderError, ReportDownloaderError) as err:
             worker_stats.REPORT_FILE_DOWNLOAD_ERROR_COUNTER.labels(provider_type=provider_type).inc()
-            WorkerCache().remove_task_from_cache(cache_key)
+            worker_cache.remove_task_from_cache(cache_key)
             LOG.warning(log_json(tracing_id, str(err), context))
             return
 
@@ -208,7 +218,7 @@ def get_report_files(  # noqa: C901
                 stmt += f" Invoice_month: {report_dict['invoice_month']}"
             LOG.info(log_json(tracing_id, stmt, context))
         else:
-            WorkerCache().remove_task_from_cache(cache_key)
+            worker_cache.remove_task_from_cache(cache_key)
             stmt = (
                 f"No report to be processed: "
                 f" schema_name: {customer_name} "
@@ -248,13 +258,13 @@ def get_report_files(  # noqa: C901
         except (ReportProcessorError, ReportProcessorDBError) as processing_error:
             worker_stats.PROCESS_REPORT_ERROR_COUNTER.labels(provider_type=provider_type).inc()
             LOG.error(log_json(tracing_id, str(processing_error), context))
-            WorkerCache().remove_task_from_cache(cache_key)
+            worker_cache.remove_task_from_cache(cache_key)
             raise processing_error
         except NotImplementedError as err:
             LOG.info(log_json(tracing_id, str(err), context))
-            WorkerCache().remove_task_from_cache(cache_key)
+            worker_cache.remove_task_from_cache(cache_key)
 
-        WorkerCache().remove_task_from_cache(cache_key)
+        worker_cache.remove_task_from_cache(cache_key)
 
         return report_meta
     except ReportDownloaderWarning as err:
@@ -348,18 +358,93 @@ def summarize_reports(reports_to_summarize, queue_name=None, manifest_list=None)
                 tracing_id = report.get("tracing_id", report.get("manifest_uuid", "no-tracing-id"))
                 LOG.info(log_json(tracing_id, msg))
                 for month in months:
-                    update_summary_tables.s(
-                        report.get("schema_name"),
-                        report.get("provider_type"),
-                        report.get("provider_uuid"),
-                        start_date=month[0],
-                        end_date=month[1],
-                        manifest_id=report.get("manifest_id"),
-                        queue_name=queue_name,
-                        tracing_id=tracing_id,
-                        manifest_list=manifest_list,
-                        invoice_month=month[2],
-                    ).apply_async(queue=queue_name or UPDATE_SUMMARY_TABLES_QUEUE)
+                    summary_request = {
+                        "provider_type": report.get("provider_type"),
+                        "start": month[0],
+                        "end": month[1],
+                        "manifest_id": report.get("manifest_id"),
+                        "manifest_list": manifest_list
+                        or ([report.get("manifest_id")] if report.get("manifest_id") else []),
+                        "invoice_month": month[2],
+                        "queue_name": queue_name,
+                        "tracing_id": tracing_id,
+                    }
+                    schedule_summary(report.get("schema_name"), report.get("provider_uuid"), summary_request)
+
+
+def schedule_summary(schema_name, provider_uuid, summary_request):
+    """Dispatch a summary request, merging it with overlapping requests for the same month.
+
+    Args:
+        schema_name (str) The DB schema name.
+        provider_uuid (str) The provider uuid.
+        summary_request (dict) The provider type, date range, manifests and queue for the summary.
+
+    Returns
+        None
+
+    """
+    month = summary_request.get("invoice_month") or str(summary_request.get("start"))[:7]
+    coalescer = SummaryCoalescer(schema_name, provider_uuid, month)
+    queue_name = summary_request.get("queue_name")
+    if coalescer.enabled and not coalescer.open_window():
+        created = coalescer.add_pending(summary_request)
+        if created is False:
+            msg = f"Merged summary request for {coalescer.key} into the pending summary."
+            LOG.info(log_json(summary_request.get("tracing_id"), msg))
+            worker_stats.SUMMARY_RUNS_COALESCED_COUNTER.labels(
+                provider_type=summary_request.get("provider_type")
+            ).inc()
+            return
+        if created:
+            dispatch_pending_summary.s(schema_name, provider_uuid, month).apply_async(
+                queue=queue_name or UPDATE_SUMMARY_TABLES_QUEUE, countdown=coalescer.window
+            )
+            return
+
+    _dispatch_summary(schema_name, provider_uuid, summary_request)
+
+
+def _dispatch_summary(schema_name, provider_uuid, summary_request):
+    """Queue update_summary_tables for a summary request."""
+    queue_name = summary_request.get("queue_name")
+    update_summary_tables.s(
+        schema_name,
+        summary_request.get("provider_type"),
+        provider_uuid,
+        start_date=summary_request.get("start"),
+        end_date=summary_request.get("end"),
+        manifest_id=summary_request.get("manifest_id"),
+        queue_name=queue_name,
+        tracing_id=summary_request.get("tracing_id"),
+        manifest_list=summary_request.get("manifest_list"),
+        invoice_month=summary_request.get("invoice_month"),
+    ).apply_async(queue=queue_name or UPDATE_SUMMARY_TABLES_QUEUE)
+
+
+@celery_app.task(name="masu.processor.tasks.dispatch_pending_summary", queue=UPDATE_SUMMARY_TABLES_QUEUE)
+def dispatch_pending_summary(schema_name, provider_uuid, month):
+    """Dispatch the merged summary request collected for a provider and month.
+
+    Args:
+        schema_name (str) The DB schema name.
+        provider_uuid (str) The provider uuid.
+        month (str) The billing month (or invoice month) of the pending request.
+
+    Returns
+        None
+
+    """
+    summary_request = SummaryCoalescer(schema_name, provider_uuid, month).pop_pending()
+    if not summary_request:
+        return
+    msg = (
+        f"Dispatching merged summary for {schema_name} {provider_uuid} {month}: "
+        f"{summary_request.get('start')} - {summary_request.get('end')}, "
+        f"{summary_request.get('coalesced')} summary runs avoided."
+    )
+    LOG.info(log_json(summary_request.get("tracing_id"), msg))
+    _dispatch_summary(schema_name, provider_uuid, summary_request)
 
 
 @celery_app.task(name="masu.processor.tasks.update_summary_tables", queue=UPDATE_SUMMARY_TABLES_QUEUE)  # noqa: C901
@@ -376,6 +461,7 @@ def update_summary_tables(  # noqa: C901
     ocp_on_cloud=True,
     manifest_list=None,
     invoice_month=None,
+    requeue_attempt=0,
 ):
     """Populate the summary tables for reporting.
 
@@ -386,6 +472,7 @@ def update_summary_tables(  # noqa: C901
         report_dict (dict) The report data dict from previous task.
         start_date  (str) The date to start populating the table.
         end_date    (str) The date to end on.
+        requeue_attempt (int) Times the task was requeued because the same task was already running.
 
     Returns
         None
@@ -410,9 +497,11 @@ def update_summary_tables(  # noqa: C901
 
     if not synchronous:
         worker_cache = WorkerCache()
-        if worker_cache.single_task_is_running(task_name, cache_args):
-            msg = f"Task {task_name} already running for {cache_args}. Requeuing."
+        if not worker_cache.lock_single_task(task_name, cache_args, timeout=settings.WORKER_CACHE_TIMEOUT):
+            countdown = get_requeue_countdown(requeue_attempt + 1)
+            msg = f"Task {task_name} already running for {cache_args}. Requeuing in {countdown} seconds."
             LOG.info(log_json(tracing_id, msg))
+            worker_stats.SINGLE_TASK_REQUEUE_COUNTER.labels(task_name=task_name).inc()
             update_summary_tables.s(
                 schema_name,
                 provider,
@@ -424,9 +513,10 @@ def update_summary_tables(  # noqa: C901
                 queue_name=queue_name,
                 tracing_id=tracing_id,
                 ocp_on_cloud=ocp_on_cloud,
-            ).apply_async(queue=queue_name or UPDATE_SUMMARY_TABLES_QUEUE)
+                manifest_list=manifest_list,
+                requeue_attempt=requeue_attempt + 1,
+            ).apply_async(queue=queue_name or UPDATE_SUMMARY_TABLES_QUEUE, countdown=countdown)
             return
-        worker_cache.lock_single_task(task_name, cache_args, timeout=settings.WORKER_CACHE_TIMEOUT)
 
     stmt = (
         f"update_summary_tables called with args: "
@@ -441,7 +531,7 @@ def update_summary_tables(  # noqa: C901
     LOG.info(log_json(tracing_id, stmt))
 
     try:
-        updater = ReportSummaryUpdater(schema_name, provider_uuid, manifest_id, tracing_id)
+        updater = ReportSummaryUpdater(schema_name, provider_uuid, manifest_id, tracing_id, manifest_list)
         if provider in (Provider.PROVIDER_GCP, Provider.PROVIDER_GCP_LOCAL):
             start_date, end_date = updater.update_daily_tables(start_date, end_date, invoice_month)
             updater.update_summary_tables(start_date, end_date, tracing_id, invoice_month)
@@ -560,6 +650,7 @@ def update_openshift_on_cloud(
     queue_name=None,
     synchronous=False,
     tracing_id=None,
+    requeue_attempt=0,
 ):
     """Update OpenShift on Cloud for a specific OpenShift and cloud source."""
     task_name = "masu.processor.tasks.update_openshift_on_cloud"
@@ -570,9 +661,11 @@ def update_openshift_on_cloud(
     cache_args = [schema_name, infrastructure_provider_uuid, cache_arg_date]
     if not synchronous:
         worker_cache = WorkerCache()
-        if worker_cache.single_task_is_running(task_name, cache_args):
-            msg = f"Task {task_name} already running for {cache_args}. Requeuing."
+        if not worker_cache.lock_single_task(task_name, cache_args, timeout=settings.WORKER_CACHE_TIMEOUT):
+            countdown = get_requeue_countdown(requeue_attempt + 1)
+            msg = f"Task {task_name} already running for {cache_args}. Requeuing in {countdown} seconds."
             LOG.info(log_json(tracing_id, msg))
+            worker_stats.SINGLE_TASK_REQUEUE_COUNTER.labels(task_name=task_name).inc()
             update_openshift_on_cloud.s(
                 schema_name,
                 openshift_provider_uuid,
@@ -584,9 +677,9 @@ def update_openshift_on_cloud(
                 queue_name=queue_name,
                 synchronous=synchronous,
                 tracing_id=tracing_id,
-            ).apply_async(queue=queue_name or UPDATE_SUMMARY_TABLES_QUEUE)
+                requeue_attempt=requeue_attempt + 1,
+            ).apply_async(queue=queue_name or UPDATE_SUMMARY_TABLES_QUEUE, countdown=countdown)
             return
-        worker_cache.lock_single_task(task_name, cache_args, timeout=settings.WORKER_CACHE_TIMEOUT)
     stmt = (
         f"update_openshift_on_cloud called with args: "
         f" schema_name: {schema_name}, "
@@ -666,7 +759,14 @@ def update_all_summary_tables(start_date, end_date=None):
 
 @celery_app.task(name="masu.processor.tasks.update_cost_model_costs", queue=UPDATE_COST_MODEL_COSTS_QUEUE)
 def update_cost_model_costs(
-    schema_name, provider_uuid, start_date=None, end_date=None, queue_name=None, synchronous=False, tracing_id=None
+    schema_name,
+    provider_uuid,
+    start_date=None,
+    end_date=None,
+    queue_name=None,
+    synchronous=False,
+    tracing_id=None,
+    requeue_attempt=0,
 ):
     """Update usage charge information.
 
@@ -675,6 +775,7 @@ def update_cost_model_costs(
         provider_uuid (str) The provider uuid.
         start_date (str, Optional) - Start date of range to update derived cost.
         end_date (str, Optional) - End date of range to update derived cost.
+        requeue_attempt (int) - Times the task was requeued because the same task was already running.
 
     Returns
         None
@@ -684,9 +785,11 @@ def update_cost_model_costs(
     cache_args = [schema_name, provider_uuid, start_date, end_date]
     if not synchronous:
         worker_cache = WorkerCache()
-        if worker_cache.single_task_is_running(task_name, cache_args):
-            msg = f"Task {task_name} already running for {cache_args}. Requeuing."
+        if not worker_cache.lock_single_task(task_name, cache_args, timeout=settings.WORKER_CACHE_TIMEOUT):
+            countdown = get_requeue_countdown(requeue_attempt + 1)
+            msg = f"Task {task_name} already running for {cache_args}. Requeuing in {countdown} seconds."
             LOG.info(log_json(tracing_id, msg))
+            worker_stats.SINGLE_TASK_REQUEUE_COUNTER.labels(task_name=task_name).inc()
             update_cost_model_costs.s(
                 schema_name,
                 provider_uuid,
@@ -695,9 +798,9 @@ def update_cost_model_costs(
                 queue_name=queue_name,
                 synchronous=synchronous,
                 tracing_id=tracing_id,
-            ).apply_async(queue=queue_name or UPDATE_COST_MODEL_COSTS_QUEUE)
+                requeue_attempt=requeue_attempt + 1,
+            ).apply_async(queue=queue_name or UPDATE_COST_MODEL_COSTS_QUEUE, countdown=countdown)
             return
-        worker_cache.lock_single_task(task_name, cache_args, timeout=settings.WORKER_CACHE_TIMEOUT)
 
     worker_stats.COST_MODEL_COST_UPDATE_ATTEMPTS_COUNTER.inc()
 
@@ -716,7 +819,12 @@ def update_cost_model_costs(
         if updater:
             updater.update_cost_model_costs(start_date, end_date)
         if provider_uuid:
-            ProviderDBAccessor(provider_uuid).set_data_updated_timestamp()
+            with ProviderDBAccessor(provider_uuid) as provider_accessor:
+                provider_accessor.set_data_updated_timestamp()
+                provider_type = provider_accessor.get_type()
+            # Cost model changes from the API do not reach mark_manifest_complete, so the
+            # cached forecasts are dropped here and recomputed on their next request
+            invalidate_forecasts(schema_name, provider_type)
     except Exception as ex:
         if not synchronous:
             worker_cache.release_single_task(task_name, cache_args)
@@ -756,6 +864,18 @@ def mark_manifest_complete(  # noqa: C901
         ProviderDBAccessor(provider_uuid).set_data_updated_timestamp()
     with ReportManifestDBAccessor() as manifest_accessor:
         manifest_accessor.mark_manifests_as_completed(manifest_list)
+    # The forecasts served by the API only change when new data has been summarized
+    refresh_forecast_cache.s(schema_name, provider_type, tracing_id=tracing_id).apply_async(
+        queue=REFRESH_FORECAST_CACHE_QUEUE
+    )
+
+
+@celery_app.task(name="masu.processor.tasks.refresh_forecast_cache", queue=REFRESH_FORECAST_CACHE_QUEUE)
+def refresh_forecast_cache(schema_name, provider_type, tracing_id=None):
+    """Precompute the forecasts of a tenant after a source of the provider type was summarized."""
+    stmt = f"refresh_forecast_cache called with args: schema_name: {schema_name}, provider_type: {provider_type}"
+    LOG.info(log_json(tracing_id, stmt))
+    precompute_forecasts(schema_name, provider_type)
 
 
 @celery_app.task(name="masu.processor.tasks.vacuum_schema", queue=DEFAULT)
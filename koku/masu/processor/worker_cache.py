@@ -4,6 +4,7 @@
 #
 """Cache of worker tasks currently running."""
 import logging
+import random
 import re
 
 from django.conf import settings
@@ -12,6 +13,10 @@ from django.core.cache import caches
 from koku import CELERY_INSPECT
 
 TASK_CACHE_EXPIRE = 30
+TASK_CLAIM_EXPIRE = 86400  # a running task holds its claim for up to 24 hours
+TASK_KEY_PREFIX = "task"
+REQUEUE_BACKOFF_BASE = 10
+REQUEUE_BACKOFF_MAX = 600
 LOG = logging.getLogger(__name__)
 
 
@@ -24,13 +29,34 @@ def create_single_task_cache_key(task_name, task_args=None):
     return cache_str
 
 
+def get_requeue_countdown(attempt):
+    """Return the delay in seconds before a locked single task is retried for the given requeue attempt.
+
+    The delay doubles with each requeue of the same task, starting at REQUEUE_BACKOFF_BASE and capped
+    at REQUEUE_BACKOFF_MAX, with jitter so that waiting tasks do not all wake up at the same time.
+    """
+    countdown = min(REQUEUE_BACKOFF_MAX, REQUEUE_BACKOFF_BASE * 2 ** max(attempt - 1, 0))
+    return countdown + random.randint(0, countdown // 2)
+
+
+def create_task_cache_key(task_key):
+    """Create the cache key for an individual running task entry."""
+    return f"{TASK_KEY_PREFIX}:{task_key}"
+
+
 class WorkerCache:
     """A cache to track celery tasks across container/pod.
 
     Each worker has a cache_key in the form :{host}:worker. A set containing each
-    cache_key is stored in a separate cache entry called 'keys'. The worker cache_keys
-    stores a list of task_keys for the task the worker is running. The WorkerCache takes
-    all the entries in the 'keys' cache to build the list of currently running tasks.
+    cache_key is stored in a separate cache entry called 'keys'.
+
+    Every running task has its own cache entry, "task:{task_key}", whose value is the
+    host running it and which expires on its own. Entries are claimed with an atomic
+    cache add, so membership checks and add/remove are a single cache operation no
+    matter how many workers or tasks exist. An entry only counts as running while
+    its host is in the 'keys' set. The worker cache_keys additionally keep a list of
+    the task_keys claimed by that host so a host's entries can be dropped when it
+    goes offline.
 
     The task_keys are keyed on the provider uuid and the billing month. This ensures that
     we are only ever running a single task for a provider and billing period at one time.
@@ -39,10 +65,10 @@ class WorkerCache:
 
     Example:
 
-        cache_key               |                           value                              |        expires
-        ":1:keys:               | {"koku-worker-1", "koku-worker2"}                            |        datetime
-        ":koku-worker-0:worker" | ["10c0fb01-9d65-4605-bbf1-6089107ec5e5:2020-02-01 00:00:00"] |        datetime
-        ":koku-worker-1:worker" | ["10c0fb01-9d65-4605-bbf1-6089107ec5e5:2020-01-01 00:00:00"] |        datetime
+        cache_key                                                  |       value                          |  expires
+        ":1:keys:                                                  | {"koku-worker-1", "koku-worker2"}    |  datetime
+        ":1:task:10c0fb01-9d65-4605-bbf1-6089107ec5e5:2020-02-01"   | "koku-worker-0"                      |  datetime
+        ":koku-worker-0:worker"                                    | ["10c0fb01-...:2020-02-01 00:00:00"] |  datetime
 
     """
 
@@ -111,17 +137,56 @@ class WorkerCache:
         """Invalidate the cache for a particular host."""
         if not host:
             host = self._hostname
+        task_list = self.cache.get(settings.WORKER_CACHE_KEY, default=[], version=host)
+        task_entries = self.cache.get_many([create_task_cache_key(task_key) for task_key in task_list])
+        self.cache.delete_many([key for key, holder in task_entries.items() if holder == host])
         self.cache.delete(settings.WORKER_CACHE_KEY, version=host)
 
-    def add_task_to_cache(self, task_key):
-        """Add an entry to the cache for a task."""
+    def _claim(self, cache_key, timeout):
+        """Atomically claim a cache entry for this host.
+
+        An entry held by a host that is no longer a known worker is treated as stale
+        and reclaimed.
+
+        Returns:
+            (bool) whether this host now holds the entry
+
+        """
+        if self.cache.add(cache_key, self._hostname, timeout):
+            return True
+        if self._is_held(cache_key):
+            return False
+        self.cache.delete(cache_key)
+        return self.cache.add(cache_key, self._hostname, timeout)
+
+    def _is_held(self, cache_key):
+        """Check whether a cache entry is held by a known worker."""
+        host = self.cache.get(cache_key)
+        return bool(host) and host in self.worker_cache_keys
+
+    def add_task_to_cache(self, task_key, timeout=None):
+        """Add an entry to the cache for a task.
+
+        Returns:
+            (bool) False if another worker is already running the task
+
+        """
+        timeout = timeout or TASK_CLAIM_EXPIRE
+        if not self._claim(create_task_cache_key(task_key), timeout):
+            return False
         task_list = self.worker_cache
-        task_list.append(task_key)
-        self.cache.set(settings.WORKER_CACHE_KEY, task_list, version=self._hostname)
+        if task_key not in task_list:
+            task_list.append(task_key)
+            self.cache.set(settings.WORKER_CACHE_KEY, task_list, version=self._hostname)
         LOG.debug(f"Added task key {task_key} to cache.")
+        return True
 
     def remove_task_from_cache(self, task_key):
         """Remove an entry from the cache for a task."""
+        task_cache_key = create_task_cache_key(task_key)
+        # Only the holder releases the entry, so a host that lost the claim leaves the winner's claim in place
+        if self.cache.get(task_cache_key) == self._hostname:
+            self.cache.delete(task_cache_key)
         task_list = self.worker_cache
         try:
             task_list.remove(task_key)
@@ -140,20 +205,22 @@ class WorkerCache:
 
     def task_is_running(self, task_key):
         """Check if a task is in the cache."""
-        task_list = self.get_all_running_tasks()
-        return task_key in task_list
+        return self._is_held(create_task_cache_key(task_key))
 
     def single_task_is_running(self, task_name, task_args=None):
         """Check for a single task key in the cache."""
-        cache_str = create_single_task_cache_key(task_name, task_args)
-        host = self.cache.get(cache_str)
-        return host and host in self.worker_cache_keys
+        return self._is_held(create_single_task_cache_key(task_name, task_args))
 
     def lock_single_task(self, task_name, task_args=None, timeout=TASK_CACHE_EXPIRE):
-        """Add a cache entry for a single task to lock a specific task."""
+        """Add a cache entry for a single task to lock a specific task.
+
+        Returns:
+            (bool) whether the lock was acquired by this host
+
+        """
         cache_str = create_single_task_cache_key(task_name, task_args)
         # Expire the cache so we don't infinite loop waiting
-        self.cache.set(cache_str, self._hostname, timeout)
+        return self._claim(cache_str, timeout)
 
     def release_single_task(self, task_name, task_args=None):
         """Delete the cache entry for a single task."""
@@ -6,6 +6,7 @@
 from prometheus_client import CollectorRegistry
 from prometheus_client import Counter
 from prometheus_client import Gauge
+from prometheus_client import Histogram
 from prometheus_client import multiprocess
 
 
@@ -44,6 +45,33 @@ COST_SUMMARY_ATTEMPTS_COUNTER = Counter(
     "cost_summary_attempts_count", "Number of cost summary update attempts", registry=WORKER_REGISTRY
 )
 
+SINGLE_TASK_REQUEUE_COUNTER = Counter(
+    "single_task_requeue_count",
+    "Number of tasks requeued because the same task was already running",
+    ["task_name"],
+    registry=WORKER_REGISTRY,
+)
+
+SUMMARY_RUNS_COALESCED_COUNTER = Counter(
+    "summary_runs_coalesced_count",
+    "Number of summary runs avoided by merging overlapping summary requests",
+    ["provider_type"],
+    registry=WORKER_REGISTRY,
+)
+
+PROVIDER_POLLING_DURATION = Histogram(
+    "provider_polling_duration_seconds",
+    "Time spent polling a provider for new manifests",
+    ["provider_type"],
+    registry=WORKER_REGISTRY,
+)
+PROVIDER_POLLING_TIMEOUT_COUNTER = Counter(
+    "provider_polling_timeout_count",
+    "Number of providers that exceeded the polling timeout",
+    ["provider_type"],
+    registry=WORKER_REGISTRY,
+)
+
 KAFKA_CONNECTION_ERRORS_COUNTER = Counter(
     "kafka_connection_errors", "Number of Kafka connection errors", registry=WORKER_REGISTRY
 )
@@ -116,3 +144,53 @@ SOURCES_PROVIDER_OP_RETRY_LOOP_COUNTER = Counter(
 SOURCES_HTTP_CLIENT_ERROR_COUNTER = Counter(
     "sources_http_client_errors", "Number of sources http client errors", registry=WORKER_REGISTRY
 )
+
+SOURCES_PROCESS_LANE_DEPTH = Gauge(
+    "sources_process_lane_depth",
+    "Number of provider operations waiting in each sources processing lane",
+    ["lane"],
+    registry=WORKER_REGISTRY,
+    multiprocess_mode="livesum",
+)
+
+TRINO_CONNECTION_CREATED_COUNTER = Counter(
+    "trino_connection_created_count",
+    "Number of trino http sessions and connections created",
+    ["kind"],
+    registry=WORKER_REGISTRY,
+)
+TRINO_QUERY_DURATION = Histogram(
+    "trino_query_duration_seconds", "Time spent executing trino queries", registry=WORKER_REGISTRY
+)
+SQL_TEMPLATE_RENDER_DURATION = Histogram(
+    "sql_template_render_duration_seconds", "Time spent rendering jinja sql templates", registry=WORKER_REGISTRY
+)
+UI_SUMMARY_TABLE_DURATION = Histogram(
+    "ui_summary_table_duration_seconds",
+    "Time spent populating a UI summary table",
+    ["table"],
+    registry=WORKER_REGISTRY,
+)
+S3_OBJECTS_DELETED_COUNTER = Counter(
+    "s3_objects_deleted_count", "Number of objects deleted from object storage", registry=WORKER_REGISTRY
+)
+S3_DELETE_FAILURES_COUNTER = Counter(
+    "s3_delete_failures_count",
+    "Number of objects that could not be deleted from object storage after retries",
+    registry=WORKER_REGISTRY,
+)
+DATA_EXPORT_SYNCED_OBJECTS_COUNTER = Counter(
+    "data_export_synced_objects_count", "Number of objects copied to customer buckets", registry=WORKER_REGISTRY
+)
+DATA_EXPORT_SYNCED_BYTES_COUNTER = Counter(
+    "data_export_synced_bytes_count", "Number of bytes copied to customer buckets", registry=WORKER_REGISTRY
+)
+VOLUME_CLEANUP_DURATION = Histogram(
+    "volume_cleanup_duration_seconds", "Time spent cleaning up the worker volume", registry=WORKER_REGISTRY
+)
+VOLUME_CLEANUP_FILES_COUNTER = Counter(
+    "volume_cleanup_files_count",
+    "Number of expired files deleted or retained by the worker volume cleanup",
+    ["result"],
+    registry=WORKER_REGISTRY,
+)
@@ -18,7 +18,7 @@ class TrinoQueryTest(MasuTestCase):
     """Test Cases for the trino_query endpoint."""
 
     @patch("koku.middleware.MASU", return_value=True)
-    @patch("masu.api.trino.trino")
+    @patch("masu.api.trino.trino_db")
     def test_trino_query(self, mock_trino, _):
         """Test the GET trino/query endpoint."""
         data = {"query": "SELECT 1", "schema": "org1234567"}
@@ -27,7 +27,7 @@ class TrinoQueryTest(MasuTestCase):
         self.assertEqual(response.status_code, 200)
 
     @patch("koku.middleware.MASU", return_value=True)
-    @patch("masu.api.trino.trino")
+    @patch("masu.api.trino.trino_db")
     def test_trino_query_no_query(self, mock_trino, _):
         """Test the GET trino/query endpoint with no query."""
         data = {"schema": "org1234567"}
@@ -38,7 +38,7 @@ class TrinoQueryTest(MasuTestCase):
         self.assertEqual(response.json(), expected)
 
     @patch("koku.middleware.MASU", return_value=True)
-    @patch("masu.api.trino.trino")
+    @patch("masu.api.trino.trino_db")
     def test_trino_query_no_schema(self, mock_trino, _):
         """Test the GET trino/query endpoint with no schema."""
         data = {"query": "select 1"}
@@ -49,7 +49,7 @@ class TrinoQueryTest(MasuTestCase):
         self.assertEqual(response.json(), expected)
 
     @patch("koku.middleware.MASU", return_value=True)
-    @patch("masu.api.trino.trino")
+    @patch("masu.api.trino.trino_db")
     def test_trino_query_dissallowed_query(self, mock_trino, _):
         """Test the GET trino/query endpoint with bad queries."""
         dissallowed_keywords = ["delete", "insert", "update", "alter", "create", "drop", "grant"]
@@ -21,6 +21,7 @@ from api.dataexport.syncer import SyncedFileInColdStorageError
 from api.models import Provider
 from api.utils import DateHelper
 from masu.celery import tasks
+from masu.config import Config
 from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.processor.orchestrator import Orchestrator
 from masu.test import MasuTestCase
@@ -101,6 +102,22 @@ class TestCeleryTasks(MasuTestCase):
         mock_sync.assert_called_once()
         mock_sync.return_value.sync_bucket.assert_called_once()
 
+    @patch("masu.celery.tasks.DataExportRequest.objects")
+    @patch("masu.celery.tasks.AwsS3Syncer")
+    def test_sync_data_to_customer_resumes(self, mock_sync, mock_data_export_request):
+        """Test that the sync skips the files synced by a previous attempt and checkpoints its progress."""
+        data_export_object = Mock()
+        data_export_object.uuid = fake.uuid4()
+        data_export_object.get_synced_keys.return_value = {"synced/file.csv.gz"}
+        mock_data_export_request.get.return_value = data_export_object
+
+        tasks.sync_data_to_customer(data_export_object.uuid)
+
+        kwargs = mock_sync.return_value.sync_bucket.call_args[1]
+        self.assertEqual(kwargs["synced_keys"], {"synced/file.csv.gz"})
+        self.assertEqual(kwargs["checkpoint"], data_export_object.save_synced_keys)
+        self.assertEqual(data_export_object.status, APIExportRequest.COMPLETE)
+
     @patch("masu.celery.tasks.LOG")
     @patch("masu.celery.tasks.DataExportRequest")
     @patch("masu.celery.tasks.AwsS3Syncer")
@@ -207,8 +224,9 @@ class TestCeleryTasks(MasuTestCase):
         mock_resource.assert_not_called()
 
     @override_settings(ENABLE_S3_ARCHIVING=True)
+    @patch("masu.util.aws.common.time.sleep")
     @patch("masu.celery.tasks.get_s3_resource")
-    def test_deleted_archived_with_prefix_success(self, mock_resource):
+    def test_deleted_archived_with_prefix_success(self, mock_resource, mock_sleep):
         """Test that delete_archived_data correctly interacts with AWS S3."""
         expected_prefix = "data/csv/10001/00000000-0000-0000-0000-000000000001/"
 
@@ -216,19 +234,49 @@ class TestCeleryTasks(MasuTestCase):
         mock_bucket = mock_resource.return_value.Bucket.return_value
         bucket_objects = [DummyS3Object(key=fake.file_path()) for _ in range(1234)]
         expected_keys = [{"Key": bucket_object.key} for bucket_object in bucket_objects]
+        mock_bucket.objects.filter.return_value = iter(bucket_objects)
 
-        # Leave one object mysteriously not deleted to cover the LOG.warning use case.
-        mock_bucket.objects.filter.side_effect = [bucket_objects, bucket_objects[:1]]
+        # Leave one object mysteriously not deleted to cover the retries and the LOG.warning use case.
+        def delete_objects(Bucket, Delete):
+            if expected_keys[0] in Delete["Objects"]:
+                return {"Errors": [{"Key": expected_keys[0]["Key"], "Code": "InternalError"}]}
+            return {}
+
+        mock_client = mock_bucket.meta.client
+        mock_client.delete_objects.side_effect = delete_objects
 
         with self.assertLogs("masu.celery.tasks", "WARNING") as captured_logs:
-            tasks.deleted_archived_with_prefix(mock_bucket, expected_prefix)
+            remaining = tasks.deleted_archived_with_prefix(mock_bucket, expected_prefix)
         mock_resource.assert_called()
-        mock_bucket.delete_objects.assert_has_calls(
-            [call(Delete={"Objects": expected_keys[:1000]}), call(Delete={"Objects": expected_keys[1000:]})]
+        mock_client.delete_objects.assert_has_calls(
+            [
+                call(Bucket=mock_bucket.name, Delete={"Objects": expected_keys[:1000], "Quiet": True}),
+                call(Bucket=mock_bucket.name, Delete={"Objects": expected_keys[1000:], "Quiet": True}),
+            ],
+            any_order=True,
+        )
+        # the failed key is retried on its own until the retries are exhausted
+        retries = Config.S3_DELETE_MAX_RETRIES - 1
+        self.assertEqual(mock_client.delete_objects.call_count, 2 + retries)
+        mock_client.delete_objects.assert_called_with(
+            Bucket=mock_bucket.name, Delete={"Objects": expected_keys[:1], "Quiet": True}
         )
-        mock_bucket.objects.filter.assert_has_calls([call(Prefix=expected_prefix), call(Prefix=expected_prefix)])
+        mock_bucket.objects.filter.assert_called_once_with(Prefix=expected_prefix)
+        self.assertEqual(remaining, [expected_keys[0]["Key"]])
         self.assertIn("Found 1 objects after attempting", captured_logs.output[-1])
 
+    @patch("masu.util.aws.common.time.sleep")
+    @patch("masu.celery.tasks.get_s3_resource")
+    def test_deleted_archived_with_prefix_client_error(self, mock_resource, mock_sleep):
+        """Test that S3 errors are raised once the delete retries are exhausted."""
+        mock_bucket = mock_resource.return_value.Bucket.return_value
+        mock_bucket.objects.filter.return_value = iter([DummyS3Object(key=fake.file_path())])
+        mock_bucket.meta.client.delete_objects.side_effect = ClientError({}, "Error")
+
+        with self.assertRaises(ClientError):
+            tasks.deleted_archived_with_prefix(mock_bucket, "data/csv/")
+        self.assertEqual(mock_bucket.meta.client.delete_objects.call_count, Config.S3_DELETE_MAX_RETRIES)
+
     @override_settings(ENABLE_S3_ARCHIVING=True)
     @patch("masu.celery.tasks.deleted_archived_with_prefix")
     def test_delete_archived_data_success(self, mock_delete):
@@ -324,6 +372,65 @@ class TestCeleryTasks(MasuTestCase):
         # test no files found for codecov
         tasks.clean_volume()
 
+    @patch("masu.celery.tasks.VOLUME_CLEANUP_BATCH_SIZE", 2)
+    @patch("masu.celery.tasks.ReportManifestDBAccessor.get_last_seen_manifest_ids", return_value=["5678"])
+    @patch("masu.celery.tasks.Config")
+    @patch("masu.external.date_accessor.DateAccessor.get_billing_months", return_value=["2020-02-01"])
+    def test_clean_volume_nested_batches(self, mock_date, mock_config, mock_manifest_ids):
+        """Test that expired files in nested directories are deleted in batches."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            mock_config.PVC_DIR = tmpdirname
+            mock_config.VOLUME_FILE_RETENTION = 60 * 60 * 24
+            nested_dir = os.path.join(tmpdirname, "processing", "nested")
+            os.makedirs(nested_dir)
+            expired_files = [os.path.join(nested_dir, f"oldfile{i}.csv") for i in range(5)]
+            matching_file = os.path.join(nested_dir, "5678-report.csv")
+            oldtime = (DateHelper().now - timedelta(seconds=mock_config.VOLUME_FILE_RETENTION * 2)).timestamp()
+            for path in expired_files + [matching_file]:
+                open(path, "a").close()
+                os.utime(path, (oldtime, oldtime))
+
+            with self.assertLogs("masu.celery.tasks", "INFO") as captured_logs:
+                tasks.clean_volume()
+
+            for path in expired_files:
+                self.assertFalse(os.path.exists(path))
+            self.assertTrue(os.path.exists(matching_file))
+            deleted_logs = [log for log in captured_logs.output if "The following files were deleted" in log]
+            self.assertEqual(len(deleted_logs), 3)
+            self.assertIn("Deleted 5 files. 0 files were too new to delete.", captured_logs.output[-1])
+
+    def test_get_exclude_pattern(self):
+        """Test that the exclude pattern matches only filenames containing an assembly id."""
+        table = [
+            {"assembly_ids": [], "filename": "expired_file.csv", "expected": False},
+            {"assembly_ids": ["", None], "filename": "expired_file.csv", "expected": False},
+            {"assembly_ids": [".gitkeep", "1234"], "filename": "1234-report.csv", "expected": True},
+            {"assembly_ids": [".gitkeep", "1234"], "filename": "expired_file.csv", "expected": False},
+            {"assembly_ids": ["a.b"], "filename": "axb.csv", "expected": False},
+        ]
+        for test in table:
+            with self.subTest(test=test):
+                pattern = tasks._get_exclude_pattern(test["assembly_ids"])
+                self.assertEqual(bool(pattern.search(test["filename"])), test["expected"])
+
+    @patch("masu.celery.tasks.ReportManifestDBAccessor.get_last_seen_manifest_ids", return_value=[""])
+    @patch("masu.celery.tasks.Config")
+    @patch("masu.external.date_accessor.DateAccessor.get_billing_months", return_value=["2020-02-01"])
+    def test_clean_volume_empty_assembly_id(self, mock_date, mock_config, mock_manifest_ids):
+        """Test that an empty assembly id does not keep every expired file."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            mock_config.PVC_DIR = tmpdirname
+            mock_config.VOLUME_FILE_RETENTION = 60 * 60 * 24
+            expired_file = os.path.join(tmpdirname, "expired_file.csv")
+            open(expired_file, "a").close()
+            oldtime = (DateHelper().now - timedelta(seconds=mock_config.VOLUME_FILE_RETENTION * 2)).timestamp()
+            os.utime(expired_file, (oldtime, oldtime))
+
+            tasks.clean_volume()
+
+            self.assertFalse(os.path.exists(expired_file))
+
     @patch("masu.celery.tasks.AWSOrgUnitCrawler")
     def test_crawl_account_hierarchy_with_provider_uuid(self, mock_crawler):
         """Test that only accounts associated with the provider_uuid are polled."""
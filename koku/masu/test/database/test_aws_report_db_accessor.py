@@ -34,15 +34,23 @@ from masu.database import AWS_CUR_TABLE_MAP
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.cost_model_db_accessor import CostModelDBAccessor
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
+from masu.database.report_db_accessor_base import ReportDBAccessorException
 from masu.database.report_db_accessor_base import ReportSchema
 from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.external.date_accessor import DateAccessor
 from masu.test import MasuTestCase
 from masu.test.database.helpers import map_django_field_type_to_python_type
 from masu.test.database.helpers import ReportObjectCreator
+from reporting.provider.aws.models import AWSAccount
 from reporting.provider.aws.models import AWSCostEntryLineItemDailySummary
+from reporting.provider.aws.models import AWSCostSummaryByAccountP
+from reporting.provider.aws.models import AWSCostSummaryByRegionP
+from reporting.provider.aws.models import AWSCostSummaryByServiceP
 from reporting.provider.aws.models import AWSEnabledTagKeys
+from reporting.provider.aws.models import AWSRegion
+from reporting.provider.aws.models import AWSService
 from reporting.provider.aws.models import AWSTagsSummary
+from reporting.provider.aws.models import UI_SUMMARY_TABLES
 from reporting.provider.aws.openshift.models import OCPAWSCostLineItemProjectDailySummaryP
 from reporting_common import REPORT_COLUMN_MAP
 
@@ -590,7 +598,7 @@ class AWSReportDBAccessorTest(MasuTestCase):
             actual_markup = query.get("markup_cost__sum")
             self.assertAlmostEqual(actual_markup, expected_markup, 6)
 
-    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_presto_raw_sql_query")
+    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_presto_copy_query")
     def test_populate_line_item_daily_summary_table_presto(self, mock_presto):
         """Test that we construst our SQL and query using Presto."""
         dh = DateHelper()
@@ -610,6 +618,149 @@ class AWSReportDBAccessorTest(MasuTestCase):
         )
         mock_presto.assert_called()
 
+    @patch("masu.database.report_db_accessor_base.Config.TRINO_COPY_PAGE_SIZE", 2)
+    @patch("masu.database.report_db_accessor_base.trino_db.connect")
+    def test_execute_presto_copy_query(self, mock_connect):
+        """Test that trino results are copied into Postgres page by page."""
+        rows = [["copy_key_1", True], ["copy_key_2", False], ["copy_key_3", True]]
+        mock_cursor = mock_connect.return_value.cursor.return_value
+        mock_cursor.fetchmany.side_effect = [rows[:2], rows[2:], []]
+        sql = f"""
+INSERT INTO postgres.{self.schema}.reporting_awsenabledtagkeys (
+    key,
+    enabled
+)
+SELECT key, enabled FROM hive.{self.schema}.eek
+"""
+        row_count = self.accessor._execute_presto_copy_query(self.schema, sql)
+
+        self.assertEqual(row_count, 3)
+        mock_cursor.execute.assert_called_with(f"SELECT key, enabled FROM hive.{self.schema}.eek", None)
+        self.assertEqual(mock_cursor.fetchmany.call_count, 3)
+        with schema_context(self.schema):
+            loaded = AWSEnabledTagKeys.objects.filter(key__startswith="copy_key_").values_list("key", "enabled")
+            self.assertEqual(sorted(loaded), [tuple(row) for row in rows])
+
+    def test_execute_presto_copy_query_requires_insert(self):
+        """Test that only INSERT INTO postgres statements can be loaded with COPY."""
+        with self.assertRaises(ReportDBAccessorException):
+            self.accessor._execute_presto_copy_query(self.schema, "SELECT 1")
+
+    @patch("masu.database.report_db_accessor_base.connection")
+    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_raw_sql_query")
+    def test_populate_ui_summary_tables_parallel(self, mock_sql, mock_connection):
+        """Test that UI summary tables are populated concurrently on their own connections."""
+        mock_connection.in_atomic_block = False
+        start_date = DateHelper().this_month_start.date()
+        end_date = DateHelper().this_month_end.date()
+        tables = ["reporting_aws_cost_summary_p", "reporting_aws_compute_summary_p"]
+
+        self.accessor.populate_ui_summary_tables(start_date, end_date, self.aws_provider_uuid, tables)
+
+        self.assertEqual(sorted(call.args[0] for call in mock_sql.call_args_list), sorted(tables))
+        self.assertEqual(mock_connection.close.call_count, len(tables))
+
+    @patch("masu.database.report_db_accessor_base.connection")
+    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_raw_sql_query")
+    def test_populate_ui_summary_tables_parallel_error(self, mock_sql, mock_connection):
+        """Test that an error from one UI summary table is raised after all tables have run."""
+        mock_connection.in_atomic_block = False
+        mock_sql.side_effect = [OperationalError("bad"), None]
+        start_date = DateHelper().this_month_start.date()
+        end_date = DateHelper().this_month_end.date()
+        tables = ["reporting_aws_cost_summary_p", "reporting_aws_compute_summary_p"]
+
+        with self.assertRaises(OperationalError):
+            self.accessor.populate_ui_summary_tables(start_date, end_date, self.aws_provider_uuid, tables)
+        self.assertEqual(mock_sql.call_count, len(tables))
+
+    @patch("masu.database.report_db_accessor_base.Config.UI_SUMMARY_MAX_WORKERS", 1)
+    @patch("masu.database.report_db_accessor_base.connection")
+    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_raw_sql_query")
+    def test_populate_ui_summary_tables_serial(self, mock_sql, mock_connection):
+        """Test that UI summary tables run serially on the current connection when concurrency is 1."""
+        mock_connection.in_atomic_block = False
+        start_date = DateHelper().this_month_start.date()
+        end_date = DateHelper().this_month_end.date()
+
+        self.accessor.populate_ui_summary_tables(start_date, end_date, self.aws_provider_uuid)
+
+        self.assertEqual(mock_sql.call_count, len(UI_SUMMARY_TABLES))
+        mock_connection.close.assert_not_called()
+
+    def test_populate_resource_dimension_tables(self):
+        """Test that accounts, regions, and services are recorded once per source."""
+        start_date = DateHelper().last_month_start.date()
+        end_date = DateHelper().this_month_end.date()
+        summary_filter = {
+            "usage_start__gte": start_date,
+            "usage_start__lte": end_date,
+            "source_uuid": self.aws_provider,
+        }
+        dimension_filter = {"provider": self.aws_provider}
+
+        with schema_context(self.schema):
+            AWSAccount.objects.filter(**dimension_filter).delete()
+            AWSRegion.objects.filter(**dimension_filter).delete()
+            AWSService.objects.filter(**dimension_filter).delete()
+            expected_accounts = set(
+                AWSCostSummaryByAccountP.objects.filter(**summary_filter).values_list("usage_account_id", flat=True)
+            )
+            expected_regions = set(
+                AWSCostSummaryByRegionP.objects.filter(region__isnull=False, **summary_filter).values_list(
+                    "region", "usage_account_id"
+                )
+            )
+            expected_services = set(
+                AWSCostSummaryByServiceP.objects.filter(**summary_filter).values_list(
+                    "product_code", "usage_account_id"
+                )
+            )
+
+        # Running twice shows the tables are only added to, never duplicated
+        for _ in range(2):
+            self.accessor.populate_resource_dimension_tables(start_date, end_date, self.aws_provider_uuid)
+
+        with schema_context(self.schema):
+            accounts = list(AWSAccount.objects.filter(**dimension_filter).values_list("usage_account_id", flat=True))
+            regions = list(AWSRegion.objects.filter(**dimension_filter).values_list("region", "usage_account_id"))
+            services = list(
+                AWSService.objects.filter(**dimension_filter).values_list("product_code", "usage_account_id")
+            )
+
+        self.assertNotEqual(accounts, [])
+        self.assertEqual(len(accounts), len(expected_accounts))
+        self.assertEqual(set(accounts), expected_accounts)
+        self.assertEqual(len(regions), len(expected_regions))
+        self.assertEqual(set(regions), expected_regions)
+        self.assertEqual(len(services), len(expected_services))
+        self.assertEqual(set(services), expected_services)
+
+    def test_delete_expired_resource_dimensions(self):
+        """Test that only the accounts, regions, and services missing from the summary tables are removed."""
+        start_date = DateHelper().last_month_start.date()
+        end_date = DateHelper().this_month_end.date()
+        self.accessor.populate_resource_dimension_tables(start_date, end_date, self.aws_provider_uuid)
+
+        with schema_context(self.schema):
+            dimension_filter = {"provider": self.aws_provider}
+            account_count = AWSAccount.objects.filter(**dimension_filter).count()
+            region_count = AWSRegion.objects.filter(**dimension_filter).count()
+            service_count = AWSService.objects.filter(**dimension_filter).count()
+            AWSAccount.objects.create(usage_account_id="expired-account", **dimension_filter)
+            AWSRegion.objects.create(region="expired-region", usage_account_id="expired-account", **dimension_filter)
+            AWSService.objects.create(
+                product_code="expired-service", usage_account_id="expired-account", **dimension_filter
+            )
+
+        self.accessor.delete_expired_resource_dimensions()
+
+        with schema_context(self.schema):
+            self.assertNotEqual(account_count, 0)
+            self.assertEqual(AWSAccount.objects.filter(**dimension_filter).count(), account_count)
+            self.assertEqual(AWSRegion.objects.filter(**dimension_filter).count(), region_count)
+            self.assertEqual(AWSService.objects.filter(**dimension_filter).count(), service_count)
+
     @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor.delete_ocp_on_aws_hive_partition_by_day")
     @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_presto_multipart_sql_query")
     def test_populate_ocp_on_aws_cost_daily_summary_presto(self, mock_presto, mock_delete):
@@ -164,7 +164,7 @@ class GCPReportDBAccessorTest(MasuTestCase):
             cost_entries = self.accessor.get_bill_query_before_date(earlier_cutoff)
             self.assertEqual(cost_entries.count(), 0)
 
-    @patch("masu.database.gcp_report_db_accessor.GCPReportDBAccessor._execute_presto_raw_sql_query")
+    @patch("masu.database.gcp_report_db_accessor.GCPReportDBAccessor._execute_presto_copy_query")
     def test_populate_line_item_daily_summary_table_presto(self, mock_presto):
         """Test that we construst our SQL and query using Presto."""
         dh = DateHelper()
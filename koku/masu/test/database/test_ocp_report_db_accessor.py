@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Test the OCPReportDBAccessor utility object."""
+import json
 import random
 import string
 import uuid
@@ -15,11 +16,13 @@ from dateutil import relativedelta
 from dateutil.rrule import MONTHLY
 from dateutil.rrule import rrule
 from django.conf import settings
+from django.db import connection
 from django.db.models import Max
 from django.db.models import Min
 from django.db.models import Q
 from django.db.models import Sum
 from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
 from tenant_schemas.utils import schema_context
 from trino.exceptions import TrinoExternalError
 
@@ -1012,7 +1015,7 @@ class OCPReportDBAccessorTest(MasuTestCase):
 
     # @patch("masu.util.common.trino_table_exists")
     @patch("masu.database.ocp_report_db_accessor.trino_table_exists")
-    @patch("masu.database.ocp_report_db_accessor.pkgutil.get_data")
+    @patch("masu.database.ocp_report_db_accessor.get_sql")
     @patch("masu.database.ocp_report_db_accessor.trino_db.connect")
     def test_populate_line_item_daily_summary_table_presto_preprocess_exception(
         self, mock_connect, mock_get_data, mock_table_exists
@@ -1023,7 +1026,7 @@ class OCPReportDBAccessorTest(MasuTestCase):
         presto_conn = FakePrestoConn()
         mock_table_exists.return_value = True
         mock_connect.return_value = presto_conn
-        mock_get_data.return_value = b"""
+        mock_get_data.return_value = """
 select * from eek where val1 in {{report_period_id}} ;
 """
         start_date = "2020-01-01"
@@ -1109,6 +1112,79 @@ select * from eek where val1 in {{report_period_id}} ;
                     query = self.accessor._get_db_obj_query(summary_table_name)
                     self.assertFalse(query.filter(cluster_id=self.cluster_id).exists())
 
+    def test_upsert_monthly_node_cost_line_item_set_based(self):
+        """Test that monthly node costs are written with one statement per row type regardless of node count."""
+        dh = DateHelper()
+        start_date, end_date = month_date_range_tuple(dh.this_month_start)
+        self.cluster_id = self.ocpaws_ocp_cluster_id
+        node_rate = random.randrange(1, 100)
+        summary_table = OCPUsageLineItemDailySummary._meta.db_table
+
+        with CaptureQueriesContext(connection) as captured:
+            self.accessor.upsert_monthly_node_cost_line_item(
+                start_date,
+                end_date,
+                self.cluster_id,
+                self.cluster_id,
+                metric_constants.INFRASTRUCTURE_COST_TYPE,
+                node_rate,
+                metric_constants.CPU_DISTRIBUTION,
+                self.ocpaws_provider_uuid,
+            )
+        statements = [query for query in captured.captured_queries if summary_table in query["sql"]]
+        self.assertEqual(len(statements), 2)
+
+        nodes = self.accessor.get_distinct_nodes(start_date, end_date, self.cluster_id)
+        with schema_context(self.schema):
+            monthly_cost_rows = OCPUsageLineItemDailySummary.objects.filter(
+                usage_start=start_date,
+                cluster_id=self.cluster_id,
+                monthly_cost_type="Node",
+                namespace__isnull=True,
+                infrastructure_monthly_cost_json__isnull=False,
+            )
+            self.assertEqual(monthly_cost_rows.count(), len(nodes))
+            for monthly_cost_row in monthly_cost_rows:
+                self.assertEqual(
+                    monthly_cost_row.infrastructure_monthly_cost_json.get(metric_constants.CPU_DISTRIBUTION), node_rate
+                )
+
+    def test_upsert_monthly_cost_line_items_null_cluster_alias(self):
+        """Test that re-running the monthly costs of a cluster without an alias updates its rows in place."""
+        dh = DateHelper()
+        start_date, end_date = month_date_range_tuple(dh.this_month_start)
+        cluster_id = self.ocpaws_ocp_cluster_id
+        cost_type = metric_constants.INFRASTRUCTURE_COST_TYPE
+        upserts = (
+            (
+                self.accessor.upsert_monthly_node_cost_line_item,
+                (cost_type, 10, metric_constants.CPU_DISTRIBUTION, self.ocpaws_provider_uuid),
+            ),
+            (
+                self.accessor.upsert_monthly_cluster_cost_line_item,
+                (cost_type, 10, metric_constants.CPU_DISTRIBUTION, self.ocpaws_provider_uuid),
+            ),
+            (self.accessor.upsert_monthly_pvc_cost_line_item, (cost_type, 10, self.ocpaws_provider_uuid)),
+        )
+
+        def monthly_cost_row_count():
+            with schema_context(self.schema):
+                return OCPUsageLineItemDailySummary.objects.filter(
+                    usage_start=start_date,
+                    cluster_id=cluster_id,
+                    cluster_alias__isnull=True,
+                    monthly_cost_type__isnull=False,
+                ).count()
+
+        for upsert, args in upserts:
+            upsert(start_date, end_date, cluster_id, None, *args)
+        row_count = monthly_cost_row_count()
+        self.assertNotEqual(row_count, 0)
+
+        for upsert, args in upserts:
+            upsert(start_date, end_date, cluster_id, None, *args)
+        self.assertEqual(monthly_cost_row_count(), row_count)
+
     # tag based testing is below
     def test_populate_monthly_tag_cost_node_infrastructure_cost(self):
         """
@@ -2601,6 +2677,32 @@ select * from eek where val1 in {{report_period_id}} ;
                                     actual_diff = float(post_record[1] - vals[1])
                                 self.assertAlmostEqual(actual_diff, expected_diff)
 
+    @patch("masu.database.ocp_report_db_accessor.OCPReportDBAccessor._execute_processing_script")
+    def test_populate_tag_usage_costs_single_statement_per_cost_type(self, mock_execute):
+        """Test that every tag rate of a cost type is applied by one statement."""
+        dh = DateHelper()
+        rates = {
+            "cpu_core_usage_per_hour": {"app": {"banking": 1, "mobile": 2}, "env": {"prod": 3}},
+            "memory_gb_request_per_hour": {"app": {"weather": 4}},
+            "storage_gb_usage_per_month": {"app": {"banking": 5}},
+        }
+        self.accessor.populate_tag_usage_costs(rates, rates, dh.this_month_start, dh.this_month_end, self.cluster_id)
+        self.assertEqual(mock_execute.call_count, 2)
+        cost_types = [call.args[2]["cost_type"] for call in mock_execute.call_args_list]
+        self.assertEqual(cost_types, ["infrastructure", "supplementary"])
+        for call in mock_execute.call_args_list:
+            self.assertEqual(json.loads(call.args[2]["rate_dict"]), rates)
+            self.assertFalse(call.args[2]["default_rates"])
+
+        mock_execute.reset_mock()
+        default_rates = {"cpu_core_usage_per_hour": {"app": {"default_value": 1, "defined_keys": ["banking"]}}}
+        self.accessor.populate_tag_usage_default_costs(
+            {}, default_rates, dh.this_month_start, dh.this_month_end, self.cluster_id
+        )
+        mock_execute.assert_called_once()
+        self.assertEqual(mock_execute.call_args.args[2]["cost_type"], "supplementary")
+        self.assertTrue(mock_execute.call_args.args[2]["default_rates"])
+
     def test_update_line_item_daily_summary_with_enabled_tags(self):
         """Test that we filter the daily summary table's tags with only enabled tags."""
         dh = DateHelper()
@@ -2757,6 +2859,57 @@ select * from eek where val1 in {{report_period_id}} ;
             for project in projects:
                 self.assertIsNotNone(OCPProject.objects.filter(project=project).first())
 
+    def test_populate_openshift_cluster_information_tables_from_summary(self):
+        """Test that we populate cluster info from the daily summary."""
+        cluster_id = str(uuid.uuid4())
+        dh = DateHelper()
+        start_date = dh.last_month_start.date()
+        end_date = dh.this_month_end.date()
+
+        self.accessor.populate_openshift_cluster_information_tables_from_summary(
+            self.ocp_provider, cluster_id, "summary-cluster", start_date, end_date
+        )
+
+        with schema_context(self.schema):
+            summary = OCPUsageLineItemDailySummary.objects.filter(
+                source_uuid=self.ocp_provider.uuid,
+                usage_start__gte=start_date,
+                usage_start__lte=end_date,
+                data_source="Pod",
+            )
+            expected_nodes = set(summary.filter(node__isnull=False).values_list("node", flat=True))
+            expected_projects = set(summary.filter(namespace__isnull=False).values_list("namespace", flat=True))
+            cluster = OCPCluster.objects.get(cluster_id=cluster_id)
+            nodes = OCPNode.objects.filter(cluster=cluster)
+            projects = list(OCPProject.objects.filter(cluster=cluster).values_list("project", flat=True))
+
+            self.assertNotEqual(projects, [])
+            self.assertEqual({node.node for node in nodes}, expected_nodes)
+            for node in nodes:
+                self.assertIn(node.node_role, ("master", "infra", "worker"))
+            self.assertEqual(len(projects), len(expected_projects))
+            self.assertEqual(set(projects), expected_projects)
+
+    def test_delete_expired_resource_dimensions(self):
+        """Test that only the nodes and projects missing from the daily summary are removed."""
+        cluster = self.accessor.populate_cluster_table(self.ocp_provider, str(uuid.uuid4()), "expired-test")
+        with schema_context(self.schema):
+            summary = OCPUsageLineItemDailySummary.objects.filter(
+                source_uuid=self.ocp_provider.uuid, data_source="Pod", namespace__isnull=False, node__isnull=False
+            ).first()
+            OCPProject.objects.create(project=summary.namespace, cluster=cluster)
+            OCPNode.objects.create(node=summary.node, cluster=cluster)
+            OCPProject.objects.create(project="expired-project", cluster=cluster)
+            OCPNode.objects.create(node="expired-node", cluster=cluster)
+
+        self.accessor.delete_expired_resource_dimensions()
+
+        with schema_context(self.schema):
+            self.assertFalse(OCPProject.objects.filter(project="expired-project").exists())
+            self.assertFalse(OCPNode.objects.filter(node="expired-node").exists())
+            self.assertTrue(OCPProject.objects.filter(cluster=cluster, project=summary.namespace).exists())
+            self.assertTrue(OCPNode.objects.filter(cluster=cluster, node=summary.node).exists())
+
     @patch("masu.database.ocp_report_db_accessor.OCPReportDBAccessor.get_projects_presto")
     @patch("masu.database.ocp_report_db_accessor.OCPReportDBAccessor.get_pvcs_presto")
     @patch("masu.database.ocp_report_db_accessor.OCPReportDBAccessor.get_nodes_presto")
@@ -2836,6 +2989,30 @@ select * from eek where val1 in {{report_period_id}} ;
             ).count()
             self.assertEqual(node_count, 1)
 
+    def test_populate_topology_tables_bulk(self):
+        """Test that the topology tables are synced with a fixed number of queries per table."""
+        cluster_id = str(uuid.uuid4())
+        cluster = self.accessor.populate_cluster_table(self.aws_provider, cluster_id, "bulk_topology_test")
+        nodes = [(f"node_{i}", f"id_{i}", 4, "worker") for i in range(50)]
+        pvcs = [(f"vol_{i}", f"pvc_{i}") for i in range(50)]
+        projects = [f"project_{i}" for i in range(50)]
+        tables = [OCPNode._meta.db_table, OCPPVC._meta.db_table, OCPProject._meta.db_table]
+
+        for expected_queries in (2, 1):
+            with self.subTest(expected_queries=expected_queries):
+                with CaptureQueriesContext(connection) as captured:
+                    self.accessor.populate_node_table(cluster, nodes)
+                    self.accessor.populate_pvc_table(cluster, pvcs)
+                    self.accessor.populate_project_table(cluster, projects)
+                for table in tables:
+                    queries = [query for query in captured.captured_queries if table in query["sql"]]
+                    self.assertEqual(len(queries), expected_queries)
+
+        with schema_context(self.schema):
+            self.assertEqual(OCPNode.objects.filter(cluster=cluster).count(), len(nodes))
+            self.assertEqual(OCPPVC.objects.filter(cluster=cluster).count(), len(pvcs))
+            self.assertEqual(OCPProject.objects.filter(cluster=cluster).count(), len(projects))
+
     def test_delete_infrastructure_raw_cost_from_daily_summary(self):
         """Test that infra raw cost is deleted."""
         dh = DateHelper()
@@ -232,3 +232,28 @@ class ReportManifestDBAccessorTest(IamTestCase):
             manifest_list = []
             value = self.manifest_accessor.bulk_delete_manifests(self.provider_uuid, manifest_list)
             self.assertIsNone(value)
+
+    def test_add_and_get_changed_days(self):
+        """Test that changed days are merged per manifest and unioned across manifests."""
+        with schema_context(self.schema):
+            manifest = self.manifest_accessor.add(**self.manifest_dict)
+            self.manifest_dict["assembly_id"] = "54321"
+            other_manifest = self.manifest_accessor.add(**self.manifest_dict)
+
+            self.assertIsNone(self.manifest_accessor.get_changed_days([manifest.id]))
+
+            self.manifest_accessor.add_changed_days(manifest.id, ["2022-06-03", "2022-06-01"])
+            self.manifest_accessor.add_changed_days(manifest.id, ["2022-06-03", "2022-06-02"])
+            self.manifest_accessor.add_changed_days(manifest.id, [])
+            self.assertEqual(
+                self.manifest_accessor.get_changed_days([manifest.id]), ["2022-06-01", "2022-06-02", "2022-06-03"]
+            )
+            # A manifest that did not track its days means the days are unknown
+            self.assertIsNone(self.manifest_accessor.get_changed_days([manifest.id, other_manifest.id]))
+
+            self.manifest_accessor.add_changed_days(other_manifest.id, ["2022-06-10"])
+            self.assertEqual(
+                self.manifest_accessor.get_changed_days([manifest.id, other_manifest.id]),
+                ["2022-06-01", "2022-06-02", "2022-06-03", "2022-06-10"],
+            )
+            self.assertIsNone(self.manifest_accessor.get_changed_days([]))
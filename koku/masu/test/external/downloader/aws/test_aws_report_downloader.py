@@ -128,7 +128,7 @@ class FakeSessionDownloadError:
         if "cur" in service:
             return Mock(**{"describe_report_definitions.return_value": fake_report})
         elif "s3" in service:
-            return Mock(**{"get_object.side_effect": mock_kwargs_error})
+            return Mock(**{"head_object.side_effect": mock_kwargs_error})
         else:
             return Mock()
 
@@ -256,7 +256,7 @@ class AWSReportDownloaderTest(MasuTestCase):
     def test_check_size_success(self, fake_session, fake_shutil):
         """Test _check_size is successful."""
         fake_client = Mock()
-        fake_client.get_object.return_value = {"ContentLength": 123456, "Body": Mock()}
+        fake_client.head_object.return_value = {"ContentLength": 123456}
         fake_shutil.disk_usage.return_value = (10, 10, 4096 * 1024 * 1024)
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
@@ -271,7 +271,7 @@ class AWSReportDownloaderTest(MasuTestCase):
     def test_check_size_fail_nospace(self, fake_session, fake_shutil):
         """Test _check_size fails if there is no more space."""
         fake_client = Mock()
-        fake_client.get_object.return_value = {"ContentLength": 123456, "Body": Mock()}
+        fake_client.head_object.return_value = {"ContentLength": 123456}
         fake_shutil.disk_usage.return_value = (10, 10, 10)
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
@@ -285,7 +285,7 @@ class AWSReportDownloaderTest(MasuTestCase):
     def test_check_size_fail_nosize(self, fake_session):
         """Test _check_size fails if there report has no size."""
         fake_client = Mock()
-        fake_client.get_object.return_value = {}
+        fake_client.head_object.return_value = {}
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
         downloader.s3_client = fake_client
@@ -299,7 +299,7 @@ class AWSReportDownloaderTest(MasuTestCase):
         """Test _check_size fails if there report has no size."""
         fake_response = {"Error": {"Code": "AccessDenied"}}
         fake_client = Mock()
-        fake_client.get_object.side_effect = ClientError(fake_response, "masu-test")
+        fake_client.head_object.side_effect = ClientError(fake_response, "masu-test")
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
         downloader.s3_client = fake_client
@@ -313,7 +313,7 @@ class AWSReportDownloaderTest(MasuTestCase):
         """Test _check_size fails if there report has no size."""
         fake_response = {"Error": {"Code": "Unknown"}}
         fake_client = Mock()
-        fake_client.get_object.side_effect = ClientError(fake_response, "masu-test")
+        fake_client.head_object.side_effect = ClientError(fake_response, "masu-test")
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
         downloader.s3_client = fake_client
@@ -327,7 +327,8 @@ class AWSReportDownloaderTest(MasuTestCase):
     def test_check_size_inflate_success(self, fake_session, fake_shutil):
         """Test _check_size inflation succeeds."""
         fake_client = Mock()
-        fake_client.get_object.return_value = {"ContentLength": 123456, "Body": io.BytesIO(b"\xd2\x02\x96I")}
+        fake_client.head_object.return_value = {"ContentLength": 123456}
+        fake_client.get_object.return_value = {"Body": io.BytesIO(b"\xd2\x02\x96I")}
         fake_shutil.disk_usage.return_value = (10, 10, 4096 * 1024 * 1024)
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
@@ -342,7 +343,8 @@ class AWSReportDownloaderTest(MasuTestCase):
     def test_check_size_inflate_fail(self, fake_session, fake_shutil):
         """Test _check_size fails when inflation fails."""
         fake_client = Mock()
-        fake_client.get_object.return_value = {"ContentLength": 123456, "Body": io.BytesIO(b"\xd2\x02\x96I")}
+        fake_client.head_object.return_value = {"ContentLength": 123456}
+        fake_client.get_object.return_value = {"Body": io.BytesIO(b"\xd2\x02\x96I")}
         fake_shutil.disk_usage.return_value = (10, 10, 1234567)
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
@@ -357,7 +359,8 @@ class AWSReportDownloaderTest(MasuTestCase):
     def test_download_file_check_size_fail(self, fake_session, fake_shutil):
         """Test _check_size fails when key is fake."""
         fake_client = Mock()
-        fake_client.get_object.return_value = {"ContentLength": 123456, "Body": io.BytesIO(b"\xd2\x02\x96I")}
+        fake_client.head_object.return_value = {"ContentLength": 123456}
+        fake_client.get_object.return_value = {"Body": io.BytesIO(b"\xd2\x02\x96I")}
         fake_shutil.disk_usage.return_value = (10, 10, 1234567)
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
@@ -372,7 +375,7 @@ class AWSReportDownloaderTest(MasuTestCase):
         """Test _check_size fails when there is a downloader error."""
         fake_response = {"Error": {"Code": self.fake.word()}}
         fake_client = Mock()
-        fake_client.get_object.side_effect = ClientError(fake_response, "masu-test")
+        fake_client.head_object.side_effect = ClientError(fake_response, "masu-test")
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
         downloader.s3_client = fake_client
@@ -385,7 +388,7 @@ class AWSReportDownloaderTest(MasuTestCase):
         """Test that downloading a nonexistent file fails with AWSReportDownloaderNoFileError."""
         fake_response = {"Error": {"Code": "NoSuchKey"}}
         fake_client = Mock()
-        fake_client.get_object.side_effect = ClientError(fake_response, "masu-test")
+        fake_client.head_object.side_effect = ClientError(fake_response, "masu-test")
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
         downloader.s3_client = fake_client
@@ -398,7 +401,7 @@ class AWSReportDownloaderTest(MasuTestCase):
         """Test that downloading a fails when accessdenied occurs."""
         fake_response = {"Error": {"Code": "AccessDenied"}}
         fake_client = Mock()
-        fake_client.get_object.side_effect = ClientError(fake_response, "masu-test")
+        fake_client.head_object.side_effect = ClientError(fake_response, "masu-test")
 
         downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
         downloader.s3_client = fake_client
@@ -406,6 +409,35 @@ class AWSReportDownloaderTest(MasuTestCase):
         with self.assertRaises(AWSReportDownloaderNoFileError):
             downloader.download_file(self.fake.file_path())
 
+    @patch("masu.util.aws.common.get_assume_role_session", return_value=FakeSession)
+    def test_get_object_metadata_memoized(self, fake_session):
+        """Test that repeated metadata probes for a key issue a single HEAD request."""
+        fake_client = Mock()
+        fake_client.head_object.return_value = {"ContentLength": 123456, "ETag": "etag"}
+
+        downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
+        downloader.s3_client = fake_client
+
+        fakekey = self.fake.file_path(depth=random.randint(1, 5), extension="csv.gz")
+        first = downloader._get_object_metadata(fakekey)
+        second = downloader._get_object_metadata(fakekey)
+        self.assertEqual(first, second)
+        fake_client.head_object.assert_called_once()
+        fake_client.get_object.assert_not_called()
+
+    @patch("masu.util.aws.common.get_assume_role_session", return_value=FakeSession)
+    def test_get_object_metadata_head_not_found(self, fake_session):
+        """Test that a bare 404 from a HEAD request is treated as a missing file."""
+        fake_response = {"Error": {"Code": "404"}}
+        fake_client = Mock()
+        fake_client.head_object.side_effect = ClientError(fake_response, "masu-test")
+
+        downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
+        downloader.s3_client = fake_client
+
+        with self.assertRaises(AWSReportDownloaderNoFileError):
+            downloader._get_object_metadata(self.fake.file_path())
+
     def test_remove_manifest_file(self):
         """Test that we remove the manifest file."""
         manifest_file = f"{DATA_DIR}/test_manifest.json"
@@ -79,10 +79,13 @@ class AWSReportParquetSummaryUpdaterTest(MasuTestCase):
         "masu.processor.aws.aws_report_parquet_summary_updater.AWSReportDBAccessor.delete_line_item_daily_summary_entries_for_date_range_raw"  # noqa: E501
     )
     @patch("masu.processor.aws.aws_report_parquet_summary_updater.AWSReportDBAccessor.populate_tags_summary_table")
+    @patch(
+        "masu.processor.aws.aws_report_parquet_summary_updater.AWSReportDBAccessor.populate_resource_dimension_tables"  # noqa: E501
+    )
     @patch(
         "masu.processor.aws.aws_report_parquet_summary_updater.AWSReportDBAccessor.populate_line_item_daily_summary_table_presto"  # noqa: E501
     )
-    def test_update_daily_summary_tables(self, mock_presto, mock_tag_update, mock_delete):
+    def test_update_daily_summary_tables(self, mock_presto, mock_dimensions, mock_tag_update, mock_delete):
         """Test that we run Presto summary."""
         start_str = self.dh.this_month_start.isoformat()
         end_str = self.dh.this_month_end.isoformat()
@@ -110,6 +113,7 @@ class AWSReportParquetSummaryUpdaterTest(MasuTestCase):
             expected_start, expected_end, self.aws_provider.uuid, current_bill_id, markup_value
         )
         mock_tag_update.assert_called_with(bill_ids, start, end)
+        mock_dimensions.assert_called_with(start, end, self.aws_provider.uuid)
 
         self.assertEqual(start_return, start)
         self.assertEqual(end_return, end)
@@ -181,3 +181,143 @@ class OCPReportSummaryUpdaterTest(MasuTestCase):
                 if found_it:
                     break
             self.assertTrue(found_it)
+
+    def test_get_summary_date_ranges(self):
+        """Test that only runs of changed days in the billing month are summarized."""
+        start_date = datetime.date(2022, 6, 1)
+        end_date = datetime.date(2022, 6, 30)
+        changed_days = ["2022-05-31", "2022-06-02", "2022-06-03", "2022-06-07"]
+
+        result = self.updater._get_summary_date_ranges(start_date, end_date, changed_days)
+        expected = [
+            (datetime.date(2022, 6, 2), datetime.date(2022, 6, 3)),
+            (datetime.date(2022, 6, 7), datetime.date(2022, 6, 7)),
+        ]
+        self.assertEqual(result, expected)
+
+        self.assertEqual(self.updater._get_summary_date_ranges(start_date, end_date, None), [(start_date, end_date)])
+        self.assertEqual(
+            self.updater._get_summary_date_ranges(start_date, end_date, ["2022-07-01"]), [(start_date, end_date)]
+        )
+
+        self.updater._full_month_update = True
+        self.assertEqual(
+            self.updater._get_summary_date_ranges(start_date, end_date, changed_days), [(start_date, end_date)]
+        )
+
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportParquetSummaryUpdater.check_cluster_infrastructure"  # noqa: E501
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportParquetSummaryUpdater._check_parquet_date_range"
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportDBAccessor.populate_openshift_cluster_information_tables"  # noqa: E501
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportDBAccessor.delete_all_except_infrastructure_raw_cost_from_daily_summary"  # noqa: E501
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater."
+        "OCPReportDBAccessor.populate_volume_label_summary_table"
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater." "OCPReportDBAccessor.populate_pod_label_summary_table"
+    )
+    @patch("masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportDBAccessor.populate_ui_summary_tables")
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater."
+        "OCPReportDBAccessor.populate_line_item_daily_summary_table_presto"
+    )
+    def test_update_summary_tables_changed_days(
+        self,
+        mock_sum,
+        mock_ui_sum,
+        mock_tag_sum,
+        mock_vol_tag_sum,
+        mock_delete,
+        mock_cluster_populate,
+        mock_date_check,
+        mock_infra_check,
+    ):
+        """Test that only the changed days are deleted and summarized."""
+        start_date = self.dh.this_month_start.date()
+        end_date = self.dh.this_month_end.date()
+        mock_date_check.return_value = (start_date, end_date)
+        changed_days = [start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")]
+
+        with OCPReportDBAccessor(self.schema) as accessor:
+            with schema_context(self.schema):
+                report_period = accessor.report_periods_for_provider_uuid(self.provider.uuid, start_date)
+                report_period_id = report_period.id
+
+        with patch.object(self.updater, "_get_sql_inputs", return_value=(start_date, end_date)):
+            self.updater.update_summary_tables(start_date, end_date, changed_days=changed_days)
+
+        mock_delete.assert_any_call(self.ocp_provider.uuid, report_period_id, start_date, start_date)
+        mock_delete.assert_any_call(self.ocp_provider.uuid, report_period_id, end_date, end_date)
+        self.assertEqual(mock_delete.call_count, 2)
+        self.assertEqual(mock_sum.call_count, 2)
+        self.assertEqual(mock_ui_sum.call_count, 2)
+
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportParquetSummaryUpdater.check_cluster_infrastructure"  # noqa: E501
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportParquetSummaryUpdater._check_parquet_date_range"
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportDBAccessor.update_line_item_daily_summary_with_enabled_tags"  # noqa: E501
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportDBAccessor.populate_openshift_cluster_information_tables"  # noqa: E501
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportDBAccessor.delete_all_except_infrastructure_raw_cost_from_daily_summary"  # noqa: E501
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater."
+        "OCPReportDBAccessor.populate_volume_label_summary_table"
+    )
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater." "OCPReportDBAccessor.populate_pod_label_summary_table"
+    )
+    @patch("masu.processor.ocp.ocp_report_parquet_summary_updater.OCPReportDBAccessor.populate_ui_summary_tables")
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater."
+        "OCPReportDBAccessor.populate_line_item_daily_summary_table_presto"
+    )
+    def test_update_summary_tables_changed_days_keeps_full_range(
+        self,
+        mock_sum,
+        mock_ui_sum,
+        mock_tag_sum,
+        mock_vol_tag_sum,
+        mock_delete,
+        mock_cluster_populate,
+        mock_enabled_tags,
+        mock_date_check,
+        mock_infra_check,
+    ):
+        """Test that only the daily summary is limited to the changed days."""
+        start_date = self.dh.this_month_start.date()
+        end_date = self.dh.this_month_end.date()
+        changed_day = start_date + datetime.timedelta(days=1)
+        mock_date_check.return_value = (start_date, end_date)
+
+        with OCPReportDBAccessor(self.schema) as accessor:
+            with schema_context(self.schema):
+                report_period = accessor.report_periods_for_provider_uuid(self.provider.uuid, start_date)
+                report_period_id = report_period.id
+
+        with patch.object(self.updater, "_get_sql_inputs", return_value=(start_date, end_date)):
+            result = self.updater.update_summary_tables(
+                start_date, end_date, changed_days=[changed_day.strftime("%Y-%m-%d")]
+            )
+
+        self.assertEqual(result, (start_date, end_date))
+        mock_delete.assert_called_once_with(self.ocp_provider.uuid, report_period_id, changed_day, changed_day)
+        mock_tag_sum.assert_called_once_with([report_period_id], start_date, end_date)
+        mock_vol_tag_sum.assert_called_once_with([report_period_id], start_date, end_date)
+        mock_enabled_tags.assert_called_once_with(start_date, end_date, [report_period_id])
+        mock_infra_check.assert_called_once_with(start_date, end_date)
@@ -68,6 +68,10 @@ class OCPReportSummaryUpdaterTest(MasuTestCase):
         self.manifest.save()
         self.updater = OCPReportSummaryUpdater(self.schema, self.provider, self.manifest)
 
+    @patch(
+        "masu.processor.ocp.ocp_report_summary_updater."
+        "OCPReportDBAccessor.populate_openshift_cluster_information_tables_from_summary"
+    )
     @patch(
         "masu.processor.ocp.ocp_report_summary_updater."
         "OCPReportDBAccessor.populate_storage_line_item_daily_summary_table"
@@ -75,7 +79,7 @@ class OCPReportSummaryUpdaterTest(MasuTestCase):
     @patch(
         "masu.processor.ocp.ocp_report_summary_updater." "OCPReportDBAccessor.populate_line_item_daily_summary_table"
     )
-    def test_update_summary_tables_with_manifest(self, mock_sum, mock_storage_summary):
+    def test_update_summary_tables_with_manifest(self, mock_sum, mock_storage_summary, mock_cluster_info):
         """Test that summary tables are properly run."""
         self.manifest.num_processed_files = self.manifest.num_total_files
         self.manifest.save()
@@ -101,6 +105,7 @@ class OCPReportSummaryUpdaterTest(MasuTestCase):
         self.updater.update_summary_tables(start_date_str, end_date_str)
         mock_sum.assert_called()
         mock_storage_summary.assert_called()
+        mock_cluster_info.assert_called_once()
 
         with OCPReportDBAccessor(self.schema) as accessor:
             period = accessor.get_usage_periods_by_date(bill_date).filter(provider_id=self.ocp_provider_uuid)[0]
@@ -5,6 +5,7 @@
 """Test the Orchestrator object."""
 import logging
 import random
+import threading
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -262,6 +263,36 @@ class OrchestratorTest(MasuTestCase):
         orchestrator.prepare()
         mock_labeler.assert_called()
 
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    @patch("masu.processor.orchestrator.Orchestrator.prepare_continious_report_sources")
+    @patch("masu.processor.orchestrator.Orchestrator.prepare_monthly_report_sources")
+    def test_prepare_polls_every_account(self, mock_monthly, mock_continuous, mock_inspect):
+        """Test that Orchestrator.prepare() polls each account once across the thread pool."""
+        orchestrator = Orchestrator()
+        orchestrator.prepare()
+        polled = [call.args[1] for call in mock_monthly.call_args_list + mock_continuous.call_args_list]
+        expected = [account.get("provider_uuid") for account in orchestrator._polling_accounts]
+        self.assertCountEqual(polled, expected)
+
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    @patch("masu.processor.orchestrator.POLLING_WAIT_INTERVAL", 0.01)
+    @patch("masu.processor.orchestrator.PROVIDER_POLLING_TIMEOUT_COUNTER")
+    @patch("masu.processor.orchestrator.Orchestrator.poll_account")
+    def test_prepare_provider_timeout(self, mock_poll, mock_counter, mock_inspect):
+        """Test that Orchestrator.prepare() stops waiting on a provider that exceeds the timeout."""
+        release = threading.Event()
+
+        def slow_poll(started, account, provider_uuid, provider_type):
+            started[provider_uuid] = 0
+            release.wait(5)
+
+        mock_poll.side_effect = slow_poll
+        orchestrator = Orchestrator()
+        with patch.object(Config, "POLLING_PROVIDER_TIMEOUT", 0):
+            orchestrator.prepare()
+        release.set()
+        mock_counter.labels.return_value.inc.assert_called()
+
     @patch("masu.processor.worker_cache.CELERY_INSPECT")
     @patch("masu.processor.orchestrator.AccountLabel", spec=True)
     @patch("masu.processor.orchestrator.get_report_files.apply_async", return_value=True)
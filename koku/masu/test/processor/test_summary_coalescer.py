@@ -0,0 +1,54 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Test the SummaryCoalescer object."""
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.core.cache import caches
+
+from masu.processor.summary_coalescer import SummaryCoalescer
+from masu.test import MasuTestCase
+
+
+class SummaryCoalescerTest(MasuTestCase):
+    """Test cases for the SummaryCoalescer."""
+
+    def setUp(self):
+        """Set up the test."""
+        super().setUp()
+        caches["worker"].clear()
+        self.coalescer = SummaryCoalescer(self.schema, str(uuid4()), "2022-06")
+
+    def tearDown(self):
+        """Tear down the test."""
+        super().tearDown()
+        caches["worker"].clear()
+
+    def test_open_window(self):
+        """Test that only the first request in a window is dispatched immediately."""
+        self.assertTrue(self.coalescer.open_window())
+        self.assertFalse(self.coalescer.open_window())
+
+    def test_add_and_pop_pending(self):
+        """Test that pending requests are merged and popped once."""
+        first = {"start": "2022-06-03", "end": "2022-06-04", "manifest_list": [2]}
+        second = {"start": "2022-06-01", "end": "2022-06-03", "manifest_list": [1, 2]}
+
+        self.assertTrue(self.coalescer.add_pending(first))
+        self.assertFalse(self.coalescer.add_pending(second))
+
+        pending = self.coalescer.pop_pending()
+        self.assertEqual(pending.get("start"), "2022-06-01")
+        self.assertEqual(pending.get("end"), "2022-06-04")
+        self.assertEqual(pending.get("manifest_list"), [1, 2])
+        self.assertEqual(pending.get("coalesced"), 1)
+        self.assertIsNone(self.coalescer.pop_pending())
+
+    @patch("masu.processor.summary_coalescer.MUTEX_WAIT", 0)
+    def test_add_pending_locked(self):
+        """Test that a request is not merged when the pending request is locked."""
+        self.coalescer.cache.add(f"{self.coalescer.key}:mutex", True)
+        request = {"start": "2022-06-01", "end": "2022-06-02", "manifest_list": [1]}
+        self.assertIsNone(self.coalescer.add_pending(request))
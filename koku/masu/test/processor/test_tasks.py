@@ -52,6 +52,7 @@ from masu.processor.report_summary_updater import ReportSummaryUpdaterCloudError
 from masu.processor.report_summary_updater import ReportSummaryUpdaterError
 from masu.processor.report_summary_updater import ReportSummaryUpdaterProviderNotFoundError
 from masu.processor.tasks import autovacuum_tune_schema
+from masu.processor.tasks import dispatch_pending_summary
 from masu.processor.tasks import get_report_files
 from masu.processor.tasks import mark_manifest_complete
 from masu.processor.tasks import MARK_MANIFEST_COMPLETE_QUEUE
@@ -59,8 +60,11 @@ from masu.processor.tasks import normalize_table_options
 from masu.processor.tasks import process_openshift_on_cloud
 from masu.processor.tasks import record_all_manifest_files
 from masu.processor.tasks import record_report_status
+from masu.processor.tasks import refresh_forecast_cache
+from masu.processor.tasks import REFRESH_FORECAST_CACHE_QUEUE
 from masu.processor.tasks import remove_expired_data
 from masu.processor.tasks import remove_stale_tenants
+from masu.processor.tasks import schedule_summary
 from masu.processor.tasks import summarize_reports
 from masu.processor.tasks import update_all_summary_tables
 from masu.processor.tasks import update_cost_model_costs
@@ -345,6 +349,7 @@ class ProcessReportFileTests(MasuTestCase):
         summarize_reports([])
         mock_update_summary.delay.assert_not_called()
 
+    @patch("masu.processor.summary_coalescer.Config.SUMMARY_COALESCE_WINDOW", 0)
     @patch("masu.processor.tasks.update_summary_tables")
     def test_summarize_reports_processing_list(self, mock_update_summary):
         """Test that the summarize_reports task is called when a processing list is provided."""
@@ -411,6 +416,37 @@ class ProcessReportFileTests(MasuTestCase):
         summarize_reports(reports_to_summarize)
         mock_update_summary.s.assert_not_called()
 
+    @patch("masu.processor.tasks.dispatch_pending_summary")
+    @patch("masu.processor.tasks.update_summary_tables")
+    def test_schedule_summary_coalesces_requests(self, mock_update_summary, mock_dispatch_pending):
+        """Test that overlapping summary requests in the window become one trailing summary."""
+        caches["worker"].clear()
+        provider_uuid = str(uuid4())
+        requests = [
+            {"provider_type": Provider.PROVIDER_OCP, "start": start, "end": end, "manifest_list": [i]}
+            for i, (start, end) in enumerate(
+                [("2022-06-01", "2022-06-02"), ("2022-06-02", "2022-06-03"), ("2022-06-01", "2022-06-05")]
+            )
+        ]
+        with patch("masu.processor.tasks.worker_stats.SUMMARY_RUNS_COALESCED_COUNTER") as mock_counter:
+            for request in requests + [dict(requests[0])]:
+                schedule_summary(self.schema, provider_uuid, request)
+
+        mock_update_summary.s.assert_called_once()
+        mock_dispatch_pending.s.assert_called_once_with(self.schema, provider_uuid, "2022-06")
+        self.assertEqual(mock_counter.labels.return_value.inc.call_count, 2)
+
+        dispatch_pending_summary(self.schema, provider_uuid, "2022-06")
+        self.assertEqual(mock_update_summary.s.call_count, 2)
+        kwargs = mock_update_summary.s.call_args.kwargs
+        self.assertEqual(kwargs.get("start_date"), "2022-06-01")
+        self.assertEqual(kwargs.get("end_date"), "2022-06-05")
+        self.assertEqual(kwargs.get("manifest_list"), [0, 1, 2])
+
+        # Nothing left to dispatch once the pending request has been popped
+        dispatch_pending_summary(self.schema, provider_uuid, "2022-06")
+        self.assertEqual(mock_update_summary.s.call_count, 2)
+
 
 class TestProcessorTasks(MasuTestCase):
     """Test cases for Processor Celery tasks."""
@@ -472,6 +508,18 @@ class TestProcessorTasks(MasuTestCase):
                     mock_cache_remove.assert_called()
                     mock_process_files.assert_not_called()
 
+    @patch("masu.processor.tasks.WorkerCache.add_task_to_cache", return_value=False)
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    @patch("masu.processor.tasks._get_report_files")
+    @patch("masu.processor.tasks._process_report_file")
+    def test_get_report_files_already_claimed(self, mock_process_files, mock_get_files, mock_inspect, mock_add):
+        """Test that a report claimed by another worker is not downloaded or processed again."""
+        with self.assertLogs("masu.processor.tasks", level="INFO") as logger:
+            self.assertIsNone(get_report_files(**self.get_report_args))
+            self.assertIn("is already being processed by another worker", logger.output[0])
+        mock_get_files.assert_not_called()
+        mock_process_files.assert_not_called()
+
     @patch("masu.processor.tasks.WorkerCache.remove_task_from_cache")
     @patch("masu.processor.worker_cache.CELERY_INSPECT")
     @patch("masu.processor.tasks._process_report_file")
@@ -1108,7 +1156,8 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
 class TestMarkManifestCompleteTask(MasuTestCase):
     """Test cases for Processor summary table Celery tasks."""
 
-    def test_mark_manifest_complete(self):
+    @patch("masu.processor.tasks.refresh_forecast_cache")
+    def test_mark_manifest_complete(self, mock_refresh):
         """Test that we mark a manifest complete."""
         provider = self.ocp_provider
         initial_update_time = provider.data_updated_timestamp
@@ -1123,15 +1172,23 @@ class TestMarkManifestCompleteTask(MasuTestCase):
         )
         manifest.save()
         mark_manifest_complete(
-            self.schema, provider.type, manifest_list=[manifest.id], provider_uuid=str(provider.uuid), tracing_id=1
+            self.schema,
+            provider.type,
+            manifest_list=[manifest.id],
+            provider_uuid=str(provider.uuid),
+            queue_name="priority",
+            tracing_id=1,
         )
 
         provider = Provider.objects.filter(uuid=self.ocp_provider.uuid).first()
         manifest = CostUsageReportManifest.objects.filter(id=manifest.id).first()
         self.assertGreater(provider.data_updated_timestamp, initial_update_time)
         self.assertIsNotNone(manifest.manifest_completed_datetime)
+        mock_refresh.s.assert_called_with(self.schema, provider.type, tracing_id=1)
+        mock_refresh.s.return_value.apply_async.assert_called_with(queue=REFRESH_FORECAST_CACHE_QUEUE)
 
-    def test_mark_manifest_complete_no_manifest(self):
+    @patch("masu.processor.tasks.refresh_forecast_cache")
+    def test_mark_manifest_complete_no_manifest(self, mock_refresh):
         """Test that we mark a manifest complete."""
         provider = self.ocp_provider
         initial_update_time = provider.data_updated_timestamp
@@ -1142,6 +1199,12 @@ class TestMarkManifestCompleteTask(MasuTestCase):
         provider = Provider.objects.filter(uuid=self.ocp_provider.uuid).first()
         self.assertGreater(provider.data_updated_timestamp, initial_update_time)
 
+    @patch("masu.processor.tasks.precompute_forecasts")
+    def test_refresh_forecast_cache(self, mock_precompute):
+        """Test that the forecasts of the summarized provider type are precomputed."""
+        refresh_forecast_cache(self.schema, Provider.PROVIDER_OCP, tracing_id=1)
+        mock_precompute.assert_called_once_with(self.schema, Provider.PROVIDER_OCP)
+
 
 @override_settings(HOSTNAME="kokuworker")
 class TestWorkerCacheThrottling(MasuTestCase):
@@ -1157,7 +1220,7 @@ class TestWorkerCacheThrottling(MasuTestCase):
         """Add a cache entry for a single task to lock a specific task."""
         cache = caches["worker"]
         cache_str = create_single_task_cache_key(task_name, task_args)
-        cache.add(cache_str, "kokuworker", 3)
+        return cache.add(cache_str, "kokuworker", 3)
 
     @patch("masu.processor.tasks.group")
     @patch("masu.processor.tasks.update_summary_tables.s")
@@ -1196,6 +1259,8 @@ class TestWorkerCacheThrottling(MasuTestCase):
         mock_delay.assert_not_called()
         update_summary_tables(self.schema, Provider.PROVIDER_AWS, self.aws_provider_uuid, start_date, end_date)
         mock_delay.assert_called()
+        self.assertGreater(mock_delay.return_value.apply_async.call_args.kwargs.get("countdown"), 0)
+        self.assertEqual(mock_delay.call_args.kwargs.get("requeue_attempt"), 1)
         self.assertTrue(self.single_task_is_running(task_name, cache_args))
         # Let the cache entry expire
         time.sleep(3)
@@ -1365,6 +1430,13 @@ class TestWorkerCacheThrottling(MasuTestCase):
             update_cost_model_costs(self.schema, self.aws_provider_uuid, expected_start_date, expected_end_date)
             self.assertFalse(self.single_task_is_running(task_name, cache_args))
 
+    @patch("masu.processor.tasks.invalidate_forecasts")
+    @patch("masu.processor.tasks.CostModelCostUpdater")
+    def test_update_cost_model_costs_invalidates_forecasts(self, mock_updater, mock_invalidate):
+        """Test that updating cost model costs drops the tenant's cached forecasts."""
+        update_cost_model_costs(self.schema, self.ocp_test_provider_uuid, synchronous=True)
+        mock_invalidate.assert_called_once_with(self.schema, Provider.PROVIDER_OCP)
+
     @patch("masu.processor.tasks.ReportSummaryUpdater.update_openshift_on_cloud_summary_tables")
     @patch("masu.processor.tasks.update_openshift_on_cloud.s")
     @patch("masu.processor.tasks.WorkerCache.release_single_task")
@@ -7,8 +7,14 @@ import logging
 from unittest.mock import patch
 
 from django.core.cache import cache
+from django.core.cache import caches
 from django.test.utils import override_settings
 
+from masu.processor.worker_cache import create_task_cache_key
+from masu.processor.worker_cache import get_requeue_countdown
+from masu.processor.worker_cache import REQUEUE_BACKOFF_BASE
+from masu.processor.worker_cache import REQUEUE_BACKOFF_MAX
+from masu.processor.worker_cache import TASK_CLAIM_EXPIRE
 from masu.processor.worker_cache import WorkerCache
 from masu.test import MasuTestCase
 
@@ -22,11 +28,13 @@ class WorkerCacheTest(MasuTestCase):
         """Set up the test."""
         super().setUp()
         cache.clear()
+        caches["worker"].clear()
 
     def tearDown(self):
         """Tear down the test."""
         super().tearDown()
         cache.clear()
+        caches["worker"].clear()
 
     @patch("masu.processor.worker_cache.CELERY_INSPECT")
     def test_worker_cache(self, mock_inspect):
@@ -59,6 +67,17 @@ class WorkerCacheTest(MasuTestCase):
         _cache.add_task_to_cache(task_key)
         self.assertEqual(_cache.worker_cache, [task_key])
 
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    def test_add_task_to_cache_claim_expiry(self, mock_inspect):
+        """Test that a running task holds its claim for at least a day."""
+        task_key = "task_key"
+        _cache = WorkerCache()
+
+        with patch.object(WorkerCache, "_claim", return_value=True) as mock_claim:
+            _cache.add_task_to_cache(task_key)
+        mock_claim.assert_called_once_with(create_task_cache_key(task_key), TASK_CLAIM_EXPIRE)
+        self.assertGreaterEqual(TASK_CLAIM_EXPIRE, 86400)
+
     @patch("masu.processor.worker_cache.CELERY_INSPECT")
     def test_remove_task_from_cache(self, mock_inspect):
         """Test that a task is removed."""
@@ -200,3 +219,65 @@ class WorkerCacheTest(MasuTestCase):
         self.assertTrue(cache.single_task_is_running(task_name, task_args))
         cache.release_single_task(task_name, task_args)
         self.assertFalse(cache.single_task_is_running(task_name, task_args))
+
+    @override_settings(HOSTNAME="kokuworker")
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    def test_add_task_to_cache_already_claimed(self, mock_inspect):
+        """Test that a task claimed by another active worker is not claimed again."""
+        second_host = "kokuworker2"
+        mock_inspect.reserved.return_value = {"celery@kokuworker": "", f"celery@{second_host}": ""}
+        task_key = "claimed_task_key"
+
+        _cache = WorkerCache()
+        self.assertTrue(_cache.add_task_to_cache(task_key))
+
+        with override_settings(HOSTNAME=second_host):
+            _cache = WorkerCache()
+            self.assertFalse(_cache.add_task_to_cache(task_key))
+            self.assertNotIn(task_key, _cache.worker_cache)
+            # the host that lost the claim must not release the winner's claim
+            _cache.remove_task_from_cache(task_key)
+            self.assertTrue(_cache.task_is_running(task_key))
+
+        _cache = WorkerCache()
+        _cache.remove_task_from_cache(task_key)
+        self.assertFalse(_cache.task_is_running(task_key))
+
+    @override_settings(HOSTNAME="kokuworker")
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    def test_add_task_to_cache_reclaims_offline_host(self, mock_inspect):
+        """Test that a task entry held by an offline worker is reclaimed."""
+        task_key = "stale_task_key"
+        mock_inspect.reserved.return_value = {"celery@kokuworker": ""}
+        _cache = WorkerCache()
+        _cache.cache.set(create_task_cache_key(task_key), "offline-worker")
+
+        self.assertFalse(_cache.task_is_running(task_key))
+        self.assertTrue(_cache.add_task_to_cache(task_key))
+        self.assertTrue(_cache.task_is_running(task_key))
+        _cache.remove_task_from_cache(task_key)
+
+    @override_settings(HOSTNAME="kokuworker")
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    def test_lock_single_task_is_atomic(self, mock_inspect):
+        """Test that a single task lock can only be acquired once."""
+        mock_inspect.reserved.return_value = {"celery@kokuworker": []}
+        _cache = WorkerCache()
+
+        task_name = "test_atomic_task"
+        task_args = ["schema1", "AWS"]
+
+        self.assertTrue(_cache.lock_single_task(task_name, task_args))
+        self.assertFalse(_cache.lock_single_task(task_name, task_args))
+        _cache.release_single_task(task_name, task_args)
+        self.assertTrue(_cache.lock_single_task(task_name, task_args))
+        _cache.release_single_task(task_name, task_args)
+
+    @patch("masu.processor.worker_cache.random.randint", return_value=0)
+    def test_get_requeue_countdown_backoff(self, mock_jitter):
+        """Test that requeue countdowns back off exponentially with the task's own requeue attempt."""
+        countdowns = [get_requeue_countdown(attempt) for attempt in range(1, 11)]
+        self.assertEqual(countdowns[:3], [REQUEUE_BACKOFF_BASE, REQUEUE_BACKOFF_BASE * 2, REQUEUE_BACKOFF_BASE * 4])
+        self.assertEqual(countdowns[-1], REQUEUE_BACKOFF_MAX)
+        # other waiting tasks do not advance a task's backoff
+        self.assertEqual(get_requeue_countdown(1), REQUEUE_BACKOFF_BASE)
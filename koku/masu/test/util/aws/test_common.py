@@ -335,6 +335,7 @@ class TestAWSUtils(MasuTestCase):
         with patch("masu.util.aws.common.settings", ENABLE_S3_ARCHIVING=True):
             with patch("masu.util.aws.common.get_s3_resource") as mock_s3:
                 mock_s3.return_value.Bucket.return_value.objects.filter.return_value = [mock_summary]
+                mock_s3.return_value.Bucket.return_value.meta.client.delete_objects.return_value = {}
                 removed = utils.remove_files_not_in_set_from_s3_bucket("request_id", s3_csv_path, "manifest_id")
                 self.assertEqual(removed, [expected_key])
 
@@ -344,6 +345,31 @@ class TestAWSUtils(MasuTestCase):
                 removed = utils.remove_files_not_in_set_from_s3_bucket("request_id", s3_csv_path, "manifest_id")
                 self.assertEqual(removed, [])
 
+    @patch("masu.util.aws.common.time.sleep")
+    def test_delete_s3_objects(self, mock_sleep):
+        """Test that keys are deleted in batches while they are listed."""
+        keys = (f"key-{i}" for i in range(2500))
+        failed_key = "key-1500"
+        mock_bucket = Mock()
+
+        def delete_objects(Bucket, Delete):
+            # fail the first attempt of a key so that it is retried
+            if {"Key": failed_key} in Delete["Objects"] and len(Delete["Objects"]) > 1:
+                return {"Errors": [{"Key": failed_key, "Code": "SlowDown"}]}
+            return {}
+
+        mock_bucket.meta.client.delete_objects.side_effect = delete_objects
+        with patch("masu.util.aws.common.MasuConfig.S3_DELETE_MAX_WORKERS", 1):
+            not_deleted = utils.delete_s3_objects("request_id", mock_bucket, keys)
+
+        self.assertEqual(not_deleted, [])
+        self.assertEqual(next(keys, None), None)
+        batch_sizes = sorted(
+            len(kwargs["Delete"]["Objects"]) for _, kwargs in mock_bucket.meta.client.delete_objects.call_args_list
+        )
+        self.assertEqual(batch_sizes, [1, 500, 1000, 1000])
+        mock_sleep.assert_called_once()
+
     def test_copy_data_to_s3_bucket(self):
         """Test copy_data_to_s3_bucket."""
 
@@ -125,6 +125,17 @@ class CommonUtilTests(MasuTestCase):
             self.assertLessEqual(day, end_date.date())
         self.assertEqual(day, end_date.date())
 
+    def test_contiguous_date_ranges(self):
+        """Test that dates are grouped into runs of consecutive days."""
+        dates = [date(2022, 6, 5), date(2022, 6, 1), date(2022, 6, 2), date(2022, 6, 2), date(2022, 6, 30)]
+        expected = [
+            (date(2022, 6, 1), date(2022, 6, 2)),
+            (date(2022, 6, 5), date(2022, 6, 5)),
+            (date(2022, 6, 30), date(2022, 6, 30)),
+        ]
+        self.assertEqual(common_utils.contiguous_date_ranges(dates), expected)
+        self.assertEqual(common_utils.contiguous_date_ranges([]), [])
+
     def test_date_range_pair_date_args(self):
         """Test that start and end dates are returned by this generator with date args passed instead of str."""
         start_date = date(2020, 1, 1)
@@ -378,6 +389,7 @@ class CommonUtilTests(MasuTestCase):
         orig_enabled = {e.key for e in all_keys if e.enabled}
         enabled = orig_enabled.union({"ek_test1", "ek_test2"})
 
+        common_utils.KNOWN_ENABLED_KEYS.clear()
         common_utils.create_enabled_keys(self.schema, AWSEnabledTagKeys, enabled)
         with schema_context(self.schema):
             all_keys = list(AWSEnabledTagKeys.objects.all())
@@ -402,6 +414,7 @@ class CommonUtilTests(MasuTestCase):
         orig_enabled = {e.key for e in all_keys if e.enabled}
         enabled = orig_enabled.union({"ek_test1", "ek_test2"})
 
+        common_utils.KNOWN_ENABLED_KEYS.clear()
         common_utils.create_enabled_keys(self.schema, AzureEnabledTagKeys, enabled)
         with schema_context(self.schema):
             all_keys = list(AzureEnabledTagKeys.objects.all())
@@ -414,6 +427,32 @@ class CommonUtilTests(MasuTestCase):
         self.assertEqual(enabled, check_enabled)
         self.assertEqual(orig_disabled, check_disabled)
 
+    def test_create_enabled_keys_known_keys_cached(self):
+        """Test that keys already seen by this worker do not query the enabled keys table."""
+        common_utils.KNOWN_ENABLED_KEYS.clear()
+        with schema_context(self.schema):
+            orig_keys = [{"key": e.key, "enabled": e.enabled} for e in AWSEnabledTagKeys.objects.all()]
+            AWSEnabledTagKeys.objects.all().delete()
+
+        self.assertTrue(common_utils.create_enabled_keys(self.schema, AWSEnabledTagKeys, {"ek_test1", "ek_test2"}))
+        with self.assertNumQueries(0):
+            self.assertFalse(common_utils.create_enabled_keys(self.schema, AWSEnabledTagKeys, {"ek_test1"}))
+        self.assertTrue(common_utils.create_enabled_keys(self.schema, AWSEnabledTagKeys, {"ek_test1", "ek_test3"}))
+
+        # a key deleted by another process is not seen until this worker's entry expires
+        with schema_context(self.schema):
+            AWSEnabledTagKeys.objects.filter(key="ek_test3").delete()
+        self.assertFalse(common_utils.create_enabled_keys(self.schema, AWSEnabledTagKeys, {"ek_test3"}))
+        common_utils.KNOWN_ENABLED_KEYS.clear()
+        self.assertTrue(common_utils.create_enabled_keys(self.schema, AWSEnabledTagKeys, {"ek_test3"}))
+        with schema_context(self.schema):
+            all_keys = {e.key for e in AWSEnabledTagKeys.objects.all()}
+            AWSEnabledTagKeys.objects.all().delete()
+            AWSEnabledTagKeys.objects.bulk_create([AWSEnabledTagKeys(**rec) for rec in orig_keys])
+        common_utils.KNOWN_ENABLED_KEYS.clear()
+
+        self.assertEqual(all_keys, {"ek_test1", "ek_test2", "ek_test3"})
+
     def test_update_enabled_keys_aws(self):
         with schema_context(self.schema):
             orig_keys = [{"key": e.key, "enabled": e.enabled} for e in AWSEnabledTagKeys.objects.all()]
@@ -7,11 +7,17 @@ import datetime
 import json
 import logging
 import re
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
 
 import boto3
 import ciso8601
 import pandas as pd
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from botocore.exceptions import EndpointConnectionError
@@ -21,9 +27,12 @@ from tenant_schemas.utils import schema_context
 
 from api.common import log_json
 from api.provider.models import Provider
+from masu.config import Config as MasuConfig
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
 from masu.processor import enable_trino_processing
+from masu.prometheus_stats import S3_DELETE_FAILURES_COUNTER
+from masu.prometheus_stats import S3_OBJECTS_DELETED_COUNTER
 from masu.util import common as utils
 from masu.util.common import safe_float
 from masu.util.common import strip_characters_from_column_name
@@ -31,6 +40,8 @@ from masu.util.ocp.common import match_openshift_labels
 from reporting.provider.aws.models import PRESTO_REQUIRED_COLUMNS
 
 LOG = logging.getLogger(__name__)
+S3_DELETE_BATCH_SIZE = 1000  # AWS S3 delete API limits to 1000 objects per request.
+S3_DELETE_PROGRESS_INTERVAL = 10  # batches between progress logs
 
 
 def get_assume_role_session(arn, session="MasuSession"):
@@ -310,6 +321,17 @@ def get_s3_resource():  # pragma: no cover
     return s3_resource
 
 
+def get_s3_transfer_config():
+    """
+    Obtain the multipart transfer configuration used for report file transfers.
+    """
+    return TransferConfig(
+        multipart_threshold=MasuConfig.S3_TRANSFER_CHUNK_SIZE,
+        multipart_chunksize=MasuConfig.S3_TRANSFER_CHUNK_SIZE,
+        max_concurrency=MasuConfig.S3_TRANSFER_MAX_CONCURRENCY,
+    )
+
+
 def copy_data_to_s3_bucket(request_id, path, filename, data, manifest_id=None, context={}):
     """
     Copies data to s3 bucket file
@@ -329,7 +351,7 @@ def copy_data_to_s3_bucket(request_id, path, filename, data, manifest_id=None, c
         s3_resource = get_s3_resource()
         s3_obj = {"bucket_name": settings.S3_BUCKET_NAME, "key": upload_key}
         upload = s3_resource.Object(**s3_obj)
-        upload.upload_fileobj(data, ExtraArgs=extra_args)
+        upload.upload_fileobj(data, ExtraArgs=extra_args, Config=get_s3_transfer_config())
     except (EndpointConnectionError, ClientError) as err:
         msg = f"Unable to copy data to {upload_key} in bucket {settings.S3_BUCKET_NAME}.  Reason: {str(err)}"
         LOG.info(log_json(request_id, msg, context))
@@ -376,16 +398,73 @@ def copy_hcs_data_to_s3_bucket(request_id, path, filename, data, finalize=False,
     return upload
 
 
-def copy_local_hcs_report_file_to_s3_bucket(
-    request_id, s3_path, full_file_path, local_filename, finalize=False, context={}
-):
+def _delete_s3_objects_batch(s3_bucket, keys):
     """
-    Copies local report file to s3 bucket
+    Deletes a batch of keys, retrying the request and the keys that S3 failed to delete.
+
+    Returns the number of deleted keys and the keys still not deleted after the retries.
     """
-    if s3_path and settings.ENABLE_S3_ARCHIVING:
-        LOG.info(f"copy_local_HCS_report_file_to_s3_bucket: {s3_path} {full_file_path}")
-        with open(full_file_path, "rb") as fin:
-            copy_hcs_data_to_s3_bucket(request_id, s3_path, local_filename, fin, finalize, context)
+    batch_size = len(keys)
+    max_retries = max(MasuConfig.S3_DELETE_MAX_RETRIES, 1)
+    for attempt in range(max_retries):
+        if attempt:
+            time.sleep(2**attempt)
+        try:
+            # the client is thread safe, unlike the bucket resource shared by the delete threads
+            response = s3_bucket.meta.client.delete_objects(
+                Bucket=s3_bucket.name, Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+            )
+        except (EndpointConnectionError, ClientError):
+            if attempt == max_retries - 1:
+                raise
+            continue
+        keys = [error.get("Key") for error in response.get("Errors", [])]
+        if not keys:
+            break
+    return batch_size - len(keys), keys
+
+
+def delete_s3_objects(request_id, s3_bucket, keys, context={}):
+    """
+    Deletes keys from an s3 bucket in concurrent batches of S3_DELETE_BATCH_SIZE keys.
+
+    The keys are consumed lazily, so a prefix is deleted while it is still being listed and
+    only the batches in flight are held in memory.
+
+    Returns the keys that could not be deleted.
+    """
+    keys = iter(keys)
+    max_workers = max(MasuConfig.S3_DELETE_MAX_WORKERS, 1)
+    progress = {"batches": 0, "deleted": 0, "failed": []}
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="masu-s3-delete") as executor:
+        for batch_keys in iter(lambda: list(islice(keys, S3_DELETE_BATCH_SIZE)), []):
+            # two batches per worker keep the workers busy while the next page is listed
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _record_s3_delete_progress(request_id, done, progress, context)
+            pending.add(executor.submit(_delete_s3_objects_batch, s3_bucket, batch_keys))
+        done, _ = wait(pending)
+        _record_s3_delete_progress(request_id, done, progress, context)
+
+    msg = f"Deleted {progress['deleted']} objects from s3 bucket {s3_bucket.name} in {progress['batches']} batches."
+    LOG.info(log_json(request_id, msg, context))
+    return progress["failed"]
+
+
+def _record_s3_delete_progress(request_id, done, progress, context):
+    """Add the results of finished delete batches to the progress of delete_s3_objects."""
+    for future in done:
+        deleted, failed = future.result()
+        progress["batches"] += 1
+        progress["deleted"] += deleted
+        progress["failed"].extend(failed)
+        S3_OBJECTS_DELETED_COUNTER.inc(deleted)
+        if failed:
+            S3_DELETE_FAILURES_COUNTER.inc(len(failed))
+        if progress["batches"] % S3_DELETE_PROGRESS_INTERVAL == 0:
+            msg = f"Deleted {progress['deleted']} objects so far."
+            LOG.info(log_json(request_id, msg, context))
 
 
 def remove_files_not_in_set_from_s3_bucket(request_id, s3_path, manifest_id, context={}):
@@ -402,16 +481,18 @@ def remove_files_not_in_set_from_s3_bucket(request_id, s3_path, manifest_id, con
     if s3_path:
         try:
             s3_resource = get_s3_resource()
-            existing_objects = s3_resource.Bucket(settings.S3_BUCKET_NAME).objects.filter(Prefix=s3_path)
-            for obj_summary in existing_objects:
-                existing_object = obj_summary.Object()
-                metadata = existing_object.metadata
-                manifest = metadata.get("manifestid")
-                manifest_id_str = str(manifest_id)
-                key = existing_object.key
-                if manifest != manifest_id_str:
-                    s3_resource.Object(settings.S3_BUCKET_NAME, key).delete()
-                    removed.append(key)
+            s3_bucket = s3_resource.Bucket(settings.S3_BUCKET_NAME)
+            manifest_id_str = str(manifest_id)
+
+            def stale_keys():
+                for obj_summary in s3_bucket.objects.filter(Prefix=s3_path):
+                    existing_object = obj_summary.Object()
+                    if existing_object.metadata.get("manifestid") != manifest_id_str:
+                        removed.append(existing_object.key)
+                        yield existing_object.key
+
+            not_removed = set(delete_s3_objects(request_id, s3_bucket, stale_keys(), context))
+            removed = [key for key in removed if key not in not_removed]
             if removed:
                 msg = f"Removed files from s3 bucket {settings.S3_BUCKET_NAME}: {','.join(removed)}."
                 LOG.info(log_json(request_id, msg, context))
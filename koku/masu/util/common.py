@@ -15,6 +15,7 @@ from os import remove
 from tempfile import gettempdir
 from uuid import uuid4
 
+from cachetools import TTLCache
 from dateutil import parser
 from dateutil.rrule import DAILY
 from dateutil.rrule import rrule
@@ -30,6 +31,13 @@ from masu.external import POLL_INGEST
 
 LOG = logging.getLogger(__name__)
 
+# Tag keys known to exist in each tenant's enabled keys table, so converting a file
+# only queries the table when it carries a key this worker has not seen yet.
+# The cache is per process and is not invalidated by other processes: a key deleted
+# from the table (e.g. through the masu enabled_tags endpoint) is only re-created
+# by a worker once its entry expires after Config.ENABLED_TAG_KEYS_CACHE_TTL.
+KNOWN_ENABLED_KEYS = TTLCache(maxsize=1000, ttl=Config.ENABLED_TAG_KEYS_CACHE_TTL)
+
 
 def extract_uuids_from_string(source_string):
     """
@@ -208,6 +216,25 @@ def date_range(start_date, end_date, step=5):
         yield end_date.date()
 
 
+def contiguous_date_ranges(dates):
+    """Group dates into (start, end) pairs of consecutive days.
+
+    Args:
+        dates (iterable) datetime.date objects
+
+    Returns:
+        (list) Sorted (start, end) date pairs covering each run of consecutive days
+
+    """
+    ranges = []
+    for date in sorted(set(dates)):
+        if ranges and date - ranges[-1][1] == timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], date)
+        else:
+            ranges.append((date, date))
+    return ranges
+
+
 def date_range_pair(start_date, end_date, step=5):
     """Create a range generator for dates.
 
@@ -318,22 +345,28 @@ def batch(iterable, start=0, stop=None, _slice=1):
         yield res
 
 
+def _enabled_keys_cache_key(schema, enabled_keys_model):
+    return (schema, enabled_keys_model._meta.db_table)
+
+
 def create_enabled_keys(schema, enabled_keys_model, enabled_keys):
     LOG.info("Creating enabled tag key records")
     changed = False
 
     if enabled_keys:
-        with schema_context(schema):
-            new_keys = list(set(enabled_keys) - {k.key for k in enabled_keys_model.objects.all()})
-            if new_keys:
-                changed = True
-                # Processing in batches for increased efficiency
-                for batch_num, new_batch in enumerate(batch(new_keys, _slice=500)):
-                    batch_size = len(new_batch)
-                    LOG.info(f"Create batch {batch_num + 1}: batch_size {batch_size}")
-                    for ix in range(batch_size):
-                        new_batch[ix] = enabled_keys_model(key=new_batch[ix])
-                    enabled_keys_model.objects.bulk_create(new_batch, ignore_conflicts=True)
+        cache_key = _enabled_keys_cache_key(schema, enabled_keys_model)
+        known_keys = KNOWN_ENABLED_KEYS.get(cache_key, set())
+        if set(enabled_keys) - known_keys:
+            with schema_context(schema):
+                known_keys = set(enabled_keys_model.objects.values_list("key", flat=True))
+                new_keys = set(enabled_keys) - known_keys
+                if new_keys:
+                    changed = True
+                    LOG.info(f"Creating {len(new_keys)} enabled tag keys")
+                    enabled_keys_model.objects.bulk_create(
+                        [enabled_keys_model(key=key) for key in new_keys], ignore_conflicts=True
+                    )
+            KNOWN_ENABLED_KEYS[cache_key] = known_keys | new_keys
 
     if not changed:
         LOG.info("No enabled keys added.")
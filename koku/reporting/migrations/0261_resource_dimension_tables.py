@@ -0,0 +1,163 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:50
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+# The resource-type endpoints search with icontains, which compiles to UPPER(col) LIKE UPPER(%s)
+ILIKE_INDEXES = (
+    ("ocp_clusters_cluster_ilike", "reporting_ocp_clusters", "cluster_id"),
+    ("ocp_nodes_node_ilike", "reporting_ocp_nodes", "node"),
+    ("ocp_projects_project_ilike", "reporting_ocp_projects", "project"),
+    ("aws_accounts_account_ilike", "reporting_aws_accounts", "usage_account_id"),
+    ("aws_regions_region_ilike", "reporting_aws_regions", "region"),
+    ("aws_services_product_code_ilike", "reporting_aws_services", "product_code"),
+)
+
+
+POPULATE_AWS_DIMENSIONS_SQL = """
+INSERT INTO reporting_aws_accounts (uuid, usage_account_id, account_alias_id, provider_id)
+    SELECT uuid_generate_v4(), usage_account_id, max(account_alias_id), source_uuid
+      FROM reporting_aws_cost_summary_by_account_p
+     WHERE source_uuid IS NOT NULL
+     GROUP BY usage_account_id, source_uuid
+ON CONFLICT (usage_account_id, provider_id) DO NOTHING
+;
+
+INSERT INTO reporting_aws_regions (uuid, region, usage_account_id, provider_id)
+    SELECT uuid_generate_v4(), region, usage_account_id, source_uuid
+      FROM reporting_aws_cost_summary_by_region_p
+     WHERE source_uuid IS NOT NULL
+       AND region IS NOT NULL
+     GROUP BY region, usage_account_id, source_uuid
+ON CONFLICT (region, usage_account_id, provider_id) DO NOTHING
+;
+
+INSERT INTO reporting_aws_services (uuid, product_code, usage_account_id, provider_id)
+    SELECT uuid_generate_v4(), product_code, usage_account_id, source_uuid
+      FROM reporting_aws_cost_summary_by_service_p
+     WHERE source_uuid IS NOT NULL
+     GROUP BY product_code, usage_account_id, source_uuid
+ON CONFLICT (product_code, usage_account_id, provider_id) DO NOTHING
+;
+"""
+
+
+POPULATE_OCP_DIMENSIONS_SQL = """
+INSERT INTO reporting_ocp_clusters (uuid, cluster_id, cluster_alias, provider_id)
+    SELECT uuid_generate_v4(), rp.cluster_id, max(p.name), rp.provider_id
+      FROM reporting_ocpusagereportperiod AS rp
+      JOIN public.api_provider AS p
+        ON p.uuid = rp.provider_id
+     WHERE NOT EXISTS (
+            SELECT 1
+              FROM reporting_ocp_clusters AS c
+             WHERE c.provider_id = rp.provider_id
+           )
+     GROUP BY rp.cluster_id, rp.provider_id
+;
+
+-- Roles other than master need the node labels, so they are left for the next summary run to fill in
+INSERT INTO reporting_ocp_nodes (uuid, node, resource_id, node_capacity_cpu_cores, node_role, cluster_id)
+    SELECT uuid_generate_v4(),
+           lids.node,
+           lids.resource_id,
+           max(lids.node_capacity_cpu_cores),
+           CASE WHEN bool_or(lids.namespace = 'openshift-kube-apiserver') THEN 'master' END,
+           c.uuid
+      FROM reporting_ocpusagelineitem_daily_summary AS lids
+      JOIN reporting_ocp_clusters AS c
+        ON c.provider_id = lids.source_uuid
+     WHERE lids.data_source = 'Pod'
+       AND lids.node IS NOT NULL
+       AND NOT EXISTS (
+            SELECT 1
+              FROM reporting_ocp_nodes AS n
+             WHERE n.cluster_id = c.uuid
+               AND n.node = lids.node
+           )
+     GROUP BY lids.node, lids.resource_id, c.uuid
+;
+
+INSERT INTO reporting_ocp_projects (uuid, project, cluster_id)
+    SELECT uuid_generate_v4(), lids.namespace, c.uuid
+      FROM reporting_ocpusagelineitem_daily_summary AS lids
+      JOIN reporting_ocp_clusters AS c
+        ON c.provider_id = lids.source_uuid
+     WHERE lids.data_source = 'Pod'
+       AND lids.namespace IS NOT NULL
+       AND NOT EXISTS (
+            SELECT 1
+              FROM reporting_ocp_projects AS pr
+             WHERE pr.cluster_id = c.uuid
+               AND pr.project = lids.namespace
+           )
+     GROUP BY lids.namespace, c.uuid
+;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0059_dataexportsyncedkey"),
+        ("reporting", "0260_productcode_textfields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AWSService",
+            fields=[
+                ("uuid", models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ("product_code", models.TextField()),
+                ("usage_account_id", models.TextField()),
+                ("provider", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="api.provider")),
+            ],
+            options={
+                "db_table": "reporting_aws_services",
+                "unique_together": {("product_code", "usage_account_id", "provider")},
+            },
+        ),
+        migrations.CreateModel(
+            name="AWSRegion",
+            fields=[
+                ("uuid", models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ("region", models.TextField()),
+                ("usage_account_id", models.TextField()),
+                ("provider", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="api.provider")),
+            ],
+            options={
+                "db_table": "reporting_aws_regions",
+                "unique_together": {("region", "usage_account_id", "provider")},
+            },
+        ),
+        migrations.CreateModel(
+            name="AWSAccount",
+            fields=[
+                ("uuid", models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ("usage_account_id", models.TextField()),
+                (
+                    "account_alias",
+                    models.ForeignKey(
+                        null=True, on_delete=django.db.models.deletion.SET_NULL, to="reporting.awsaccountalias"
+                    ),
+                ),
+                ("provider", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="api.provider")),
+            ],
+            options={
+                "db_table": "reporting_aws_accounts",
+                "unique_together": {("usage_account_id", "provider")},
+            },
+        ),
+        migrations.RunSQL(
+            sql=[
+                f"""CREATE INDEX IF NOT EXISTS "{index}" ON "{table}" USING GIN ((upper("{column}")) gin_trgm_ops) ;"""
+                for index, table, column in ILIKE_INDEXES
+            ],
+            reverse_sql=[f"""DROP INDEX IF EXISTS "{index}" ;""" for index, _, _ in ILIKE_INDEXES],
+        ),
+        migrations.RunSQL(sql=POPULATE_AWS_DIMENSIONS_SQL, reverse_sql=migrations.RunSQL.noop),
+        migrations.RunSQL(sql=POPULATE_OCP_DIMENSIONS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -16,6 +16,7 @@ from reporting.provider.all.openshift.models import OCPAllCostSummaryPT
 from reporting.provider.all.openshift.models import OCPAllDatabaseSummaryPT
 from reporting.provider.all.openshift.models import OCPAllNetworkSummaryPT
 from reporting.provider.all.openshift.models import OCPAllStorageSummaryPT
+from reporting.provider.aws.models import AWSAccount
 from reporting.provider.aws.models import AWSAccountAlias
 from reporting.provider.aws.models import AWSComputeSummaryByAccountP
 from reporting.provider.aws.models import AWSComputeSummaryP
@@ -35,6 +36,8 @@ from reporting.provider.aws.models import AWSDatabaseSummaryP
 from reporting.provider.aws.models import AWSEnabledTagKeys
 from reporting.provider.aws.models import AWSNetworkSummaryP
 from reporting.provider.aws.models import AWSOrganizationalUnit
+from reporting.provider.aws.models import AWSRegion
+from reporting.provider.aws.models import AWSService
 from reporting.provider.aws.models import AWSStorageSummaryByAccountP
 from reporting.provider.aws.models import AWSStorageSummaryP
 from reporting.provider.aws.models import AWSTagsSummary
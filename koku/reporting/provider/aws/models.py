@@ -429,6 +429,60 @@ class AWSEnabledTagKeys(models.Model):
     enabled = models.BooleanField(default=True)
 
 
+class AWSAccount(models.Model):
+    """All usage accounts for a source."""
+
+    class Meta:
+        """Meta for AWSAccount."""
+
+        db_table = "reporting_aws_accounts"
+        unique_together = ("usage_account_id", "provider")
+        # A GIN functional index named "aws_accounts_account_ilike" was created manually
+        # via RunSQL migration operation
+        # Function: (upper(usage_account_id) gin_trgm_ops)
+
+    uuid = models.UUIDField(primary_key=True, default=uuid4)
+    usage_account_id = models.TextField()
+    account_alias = models.ForeignKey("AWSAccountAlias", on_delete=models.SET_NULL, null=True)
+    provider = models.ForeignKey("api.Provider", on_delete=models.CASCADE)
+
+
+class AWSRegion(models.Model):
+    """All regions used by an account for a source."""
+
+    class Meta:
+        """Meta for AWSRegion."""
+
+        db_table = "reporting_aws_regions"
+        unique_together = ("region", "usage_account_id", "provider")
+        # A GIN functional index named "aws_regions_region_ilike" was created manually
+        # via RunSQL migration operation
+        # Function: (upper(region) gin_trgm_ops)
+
+    uuid = models.UUIDField(primary_key=True, default=uuid4)
+    region = models.TextField()
+    usage_account_id = models.TextField()
+    provider = models.ForeignKey("api.Provider", on_delete=models.CASCADE)
+
+
+class AWSService(models.Model):
+    """All services used by an account for a source."""
+
+    class Meta:
+        """Meta for AWSService."""
+
+        db_table = "reporting_aws_services"
+        unique_together = ("product_code", "usage_account_id", "provider")
+        # A GIN functional index named "aws_services_product_code_ilike" was created manually
+        # via RunSQL migration operation
+        # Function: (upper(product_code) gin_trgm_ops)
+
+    uuid = models.UUIDField(primary_key=True, default=uuid4)
+    product_code = models.TextField()
+    usage_account_id = models.TextField()
+    provider = models.ForeignKey("api.Provider", on_delete=models.CASCADE)
+
+
 # ======================================================
 #  Partitioned Models to replace matviews
 # ======================================================
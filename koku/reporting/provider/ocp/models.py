@@ -595,6 +595,9 @@ class OCPCluster(models.Model):
         """Meta for OCPCluster."""
 
         db_table = "reporting_ocp_clusters"
+        # A GIN functional index named "ocp_clusters_cluster_ilike" was created manually
+        # via RunSQL migration operation
+        # Function: (upper(cluster_id) gin_trgm_ops)
 
     uuid = models.UUIDField(primary_key=True, default=uuid4)
     cluster_id = models.TextField()
@@ -609,6 +612,9 @@ class OCPNode(models.Model):
         """Meta for OCPNode."""
 
         db_table = "reporting_ocp_nodes"
+        # A GIN functional index named "ocp_nodes_node_ilike" was created manually
+        # via RunSQL migration operation
+        # Function: (upper(node) gin_trgm_ops)
 
     uuid = models.UUIDField(primary_key=True, default=uuid4)
     node = models.TextField()
@@ -639,6 +645,9 @@ class OCPProject(models.Model):
         """Meta for OCPProject."""
 
         db_table = "reporting_ocp_projects"
+        # A GIN functional index named "ocp_projects_project_ilike" was created manually
+        # via RunSQL migration operation
+        # Function: (upper(project) gin_trgm_ops)
 
     uuid = models.UUIDField(primary_key=True, default=uuid4)
     project = models.TextField()
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:46
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reporting_common", "0032_costusagereportmanifest_last_reports"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="costusagereportmanifest",
+            name="changed_days",
+            field=models.JSONField(null=True),
+        ),
+    ]
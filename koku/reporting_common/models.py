@@ -35,6 +35,8 @@ class CostUsageReportManifest(models.Model):
     provider = models.ForeignKey("api.Provider", on_delete=models.CASCADE)
     export_time = models.DateTimeField(null=True)
     last_reports = models.JSONField(default=dict, null=True)
+    # Usage days (YYYY-MM-DD) whose parquet was rewritten by this manifest. Null when not tracked.
+    changed_days = models.JSONField(null=True)
 
 
 class CostUsageReportStatus(models.Model):
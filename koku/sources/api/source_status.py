@@ -3,9 +3,12 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """View for Source status."""
+import hashlib
+import json
 import logging
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.views.decorators.cache import never_cache
@@ -22,12 +25,14 @@ from api.provider.models import Provider
 from api.provider.models import Sources
 from providers.provider_access import ProviderAccessor
 from providers.provider_errors import SkipStatusPush
+from sources.config import Config
 from sources.sources_http_client import SourcesHTTPClient
 from sources.sources_http_client import SourcesHTTPClientError
 from sources.sources_provider_coordinator import SourcesProviderCoordinator
 from sources.storage import source_settings_complete
 
 LOG = logging.getLogger(__name__)
+HEALTHY_STATUS_CACHE_PREFIX = "source-status-healthy"
 
 
 class SourceStatus:
@@ -55,6 +60,15 @@ class SourceStatus:
             except Provider.DoesNotExist:
                 LOG.info(f"No provider found for Source ID: {self.source.source_id}")
 
+    @property
+    def healthy_cache_key(self):
+        """Cache key for a healthy check of the source's current configuration."""
+        configuration = json.dumps(
+            [self.source.source_type, self.source.authentication, self.source.billing_source], sort_keys=True
+        )
+        digest = hashlib.sha256(configuration.encode("utf-8")).hexdigest()
+        return f"{HEALTHY_STATUS_CACHE_PREFIX}-{self.source_id}-{digest}"
+
     def determine_status(self, provider_type, source_authentication, source_billing_source):
         """Check cloud configuration status."""
         interface = ProviderAccessor(provider_type)
@@ -69,12 +83,26 @@ class SourceStatus:
         self.source.refresh_from_db()
         return error_obj
 
-    def status(self):
-        """Find the source's availability status."""
+    def status(self, use_cache=False):
+        """Find the source's availability status.
+
+        With use_cache, a healthy result for the same configuration within
+        Config.SOURCE_STATUS_HEALTHY_CACHE_SECONDS is reused instead of checking the cloud again.
+        """
+        cache_key = self.healthy_cache_key
+        if use_cache and caches["default"].get(cache_key):
+            LOG.debug(f"Reusing healthy status for Source ID: {self.source_id}")
+            return None
+
         source_billing_source = self.source.billing_source.get("data_source") or {}
         source_authentication = self.source.authentication.get("credentials") or {}
         provider_type = self.source.source_type
-        return self.determine_status(provider_type, source_authentication, source_billing_source)
+        error_obj = self.determine_status(provider_type, source_authentication, source_billing_source)
+        if error_obj:
+            caches["default"].delete(cache_key)
+        else:
+            caches["default"].set(cache_key, True, Config.SOURCE_STATUS_HEALTHY_CACHE_SECONDS)
+        return error_obj
 
     @transaction.atomic
     def update_source_name(self):
@@ -89,7 +117,7 @@ class SourceStatus:
     def push_status(self):
         """Push status_msg to platform sources."""
         try:
-            status_obj = self.status()
+            status_obj = self.status(use_cache=True)
             if self.source.source_type in (Provider.PROVIDER_GCP, Provider.PROVIDER_GCP_LOCAL):
                 builder = SourcesProviderCoordinator(self.source.source_id, self.source.auth_header)
                 if not status_obj:
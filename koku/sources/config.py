@@ -50,3 +50,17 @@ class Config:
     SOURCES_PSK = ENVIRONMENT.get_value("SOURCES_PSK", default="sources-psk")
 
     RETRY_SECONDS = ENVIRONMENT.int("RETRY_SECONDS", default=10)
+
+    # Provider operations are hashed by source_id onto this many lanes that run in parallel
+    SOURCES_PROCESS_LANES = ENVIRONMENT.int("SOURCES_PROCESS_LANES", default=8)
+
+    # Sources checked concurrently by the periodic source status sweep
+    SOURCE_STATUS_MAX_WORKERS = ENVIRONMENT.int("SOURCE_STATUS_MAX_WORKERS", default=16)
+    # Minutes between source status sweeps; celery beat schedules the sweep from the same variable
+    SOURCE_STATUS_FREQUENCY_MINUTES = ENVIRONMENT.int("SOURCE_STATUS_FREQUENCY_MINUTES", default=30)
+    # Seconds a healthy cloud credential check is reused; half a sweep interval so every sweep re-checks
+    SOURCE_STATUS_HEALTHY_CACHE_SECONDS = ENVIRONMENT.int(
+        "SOURCE_STATUS_HEALTHY_CACHE_SECONDS", default=SOURCE_STATUS_FREQUENCY_MINUTES * 30
+    )
+    # Seconds the cost management application type id is cached
+    SOURCES_APPLICATION_TYPE_CACHE_SECONDS = ENVIRONMENT.int("SOURCES_APPLICATION_TYPE_CACHE_SECONDS", default=3600)
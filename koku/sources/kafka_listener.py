@@ -12,6 +12,7 @@ import threading
 import time
 
 from confluent_kafka import TopicPartition
+from django.db import connection
 from django.db import connections
 from django.db import DEFAULT_DB_ALIAS
 from django.db import IntegrityError
@@ -28,6 +29,7 @@ from kafka_utils.utils import get_consumer
 from masu.prometheus_stats import KAFKA_CONNECTION_ERRORS_COUNTER
 from masu.prometheus_stats import SOURCES_HTTP_CLIENT_ERROR_COUNTER
 from masu.prometheus_stats import SOURCES_KAFKA_LOOP_RETRY
+from masu.prometheus_stats import SOURCES_PROCESS_LANE_DEPTH
 from masu.prometheus_stats import SOURCES_PROVIDER_OP_RETRY_LOOP_COUNTER
 from providers.provider_errors import SkipStatusPush
 from sources import storage
@@ -45,6 +47,7 @@ from sources.tasks import delete_source
 LOG = logging.getLogger(__name__)
 
 PROCESS_QUEUE = queue.PriorityQueue()
+PROCESS_LANES = []  # per-lane queues, only populated by start_process_lanes in the listener process
 COUNT = itertools.count()  # next(COUNT) returns next sequential number
 
 
@@ -106,10 +109,68 @@ def storage_callback(sender, instance, **kwargs):
 
 
 def execute_process_queue():
-    """Execute process queue to synchronize providers."""
-    while not PROCESS_QUEUE.empty():
-        msg_tuple = PROCESS_QUEUE.get()
-        process_synchronize_sources_msg(msg_tuple, PROCESS_QUEUE)
+    """
+    Execute process queue to synchronize providers.
+
+    When the processing lanes are running, each operation is handed to its source's lane
+    instead of being run here. Inside a transaction the operations stay queued until
+    listen_for_messages_loop calls this again after the commit, because the lanes use their
+    own database connections and could not see the uncommitted rows.
+    """
+    if PROCESS_LANES and connection.in_atomic_block:
+        return
+    while True:
+        # Lane threads also get here through storage_callback, so another thread may take
+        # the last item between an empty() check and a blocking get()
+        try:
+            msg_tuple = PROCESS_QUEUE.get_nowait()
+        except queue.Empty:
+            return
+        if PROCESS_LANES:
+            _route_to_lane(msg_tuple)
+        else:
+            process_synchronize_sources_msg(msg_tuple, PROCESS_QUEUE)
+
+
+def start_process_lanes(lane_count):  # pragma: no cover
+    """
+    Start the provider operation lanes.
+
+    Operations are hashed by source_id onto a lane, so the operations of one source
+    run in order while a slow operation only holds up the sources sharing its lane.
+    """
+    for lane in range(len(PROCESS_LANES), lane_count):
+        lane_queue = queue.PriorityQueue()
+        PROCESS_LANES.append(lane_queue)
+        threading.Thread(
+            target=_process_lane, args=(lane, lane_queue), name=f"sources-lane-{lane}", daemon=True
+        ).start()
+    LOG.info(f"Started {len(PROCESS_LANES)} sources processing lanes.")
+
+
+def _route_to_lane(msg_tuple):
+    """Put a provider operation on the lane for its source."""
+    _, msg = msg_tuple
+    lane = hash(msg.get("provider").source_id) % len(PROCESS_LANES)
+    lane_queue = PROCESS_LANES[lane]
+    _log_process_queue_event(lane_queue, msg, f"lane-{lane}")
+    lane_queue.put_nowait(msg_tuple)
+    SOURCES_PROCESS_LANE_DEPTH.labels(lane=lane).set(lane_queue.qsize())
+
+
+def _process_lane(lane, lane_queue):  # pragma: no cover
+    """Process a lane's provider operations for as long as the listener runs."""
+    while True:
+        _process_lane_msg(lane, lane_queue)
+
+
+def _process_lane_msg(lane, lane_queue):
+    """Process the next provider operation on a lane, waiting for one if the lane is empty."""
+    msg_tuple = lane_queue.get()
+    SOURCES_PROCESS_LANE_DEPTH.labels(lane=lane).set(lane_queue.qsize())
+    # A failed operation is re-queued with its original priority, so it is retried
+    # before any later operation for the same source.
+    process_synchronize_sources_msg(msg_tuple, lane_queue)
 
 
 def process_synchronize_sources_msg(msg_tuple, process_queue):
@@ -383,6 +444,7 @@ def sources_integration_thread():  # pragma: no cover
     if is_kafka_connected():  # Next, check that Kafka is running
         LOG.info("Kafka is running...")
 
+    start_process_lanes(Config.SOURCES_PROCESS_LANES)
     load_process_queue()
     execute_process_queue()
     listen_for_messages_loop(cost_management_type_id)
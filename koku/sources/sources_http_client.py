@@ -5,10 +5,12 @@
 """Sources HTTP Client."""
 import binascii
 import logging
+import threading
 from base64 import b64decode
 from json import loads as json_loads
 
 import requests
+from django.core.cache import caches
 from requests.exceptions import RequestException
 
 from api.provider.models import Provider
@@ -41,6 +43,17 @@ ENDPOINT_APPLICATION_TYPES = "application_types"
 ENDPOINT_AUTHENTICATIONS = "authentications"
 ENDPOINT_SOURCES = "sources"
 ENDPOINT_SOURCE_TYPES = "source_types"
+COST_MGMT_APP_TYPE_CACHE_KEY = "sources-cost-management-application-type-id"
+
+_THREAD_LOCAL = threading.local()
+
+
+def get_session():
+    """Return this thread's Sources API session so its connections are reused between requests."""
+    session = getattr(_THREAD_LOCAL, "session", None)
+    if session is None:
+        session = _THREAD_LOCAL.session = requests.Session()
+    return session
 
 
 def convert_header_to_dict(header, b64_decode=False):
@@ -106,7 +119,7 @@ class SourcesHTTPClient:
         """Helper to get network response or raise exception."""
         try:
             LOG.debug(f"[_get_network_response] url: {url} | headers: {self._identity_header}")
-            resp = requests.get(url, headers=self._identity_header)
+            resp = get_session().get(url, headers=self._identity_header)
             LOG.debug(f"[_get_network_response] status_code: {resp.status_code} | data: {resp.text}")
         except RequestException as error:
             raise SourcesHTTPClientError(f"{error_msg}. Reason: {error}")
@@ -128,6 +141,10 @@ class SourcesHTTPClient:
 
     def get_cost_management_application_type_id(self):
         """Get the cost management application type id."""
+        # The id is the same for every source, so it is looked up once rather than on every status push
+        cached_id = caches["default"].get(COST_MGMT_APP_TYPE_CACHE_KEY)
+        if cached_id is not None:
+            return cached_id
         application_types_url = (
             f"{self._base_url}/{ENDPOINT_APPLICATION_TYPES}?filter[name]=/insights/platform/cost-management"
         )
@@ -137,7 +154,9 @@ class SourcesHTTPClient:
         app_type_id_data = app_types_response.get("data")
         if not app_type_id_data or len(app_type_id_data) != 1 or not app_type_id_data[0].get("id"):
             raise SourcesHTTPClientError("cost management application type id not found")
-        return int(app_type_id_data[0].get("id"))
+        app_type_id = int(app_type_id_data[0].get("id"))
+        caches["default"].set(COST_MGMT_APP_TYPE_CACHE_KEY, app_type_id, Config.SOURCES_APPLICATION_TYPE_CACHE_SECONDS)
+        return app_type_id
 
     def get_application_type_is_cost_management(self, cost_mgmt_id=None):
         """Get application_type_id from source_id."""
@@ -306,6 +325,11 @@ class SourcesHTTPClient:
         if storage.is_known_source(self._source_id):
             storage.clear_update_flag(self._source_id)
 
+        json_data = self.build_source_status(error_msg)
+        if not storage.source_status_changed(self._source_id, json_data):
+            LOG.debug(f"[set_source_status] source_id: {self._source_id}: status unchanged")
+            return False
+
         if not cost_management_type_id:
             cost_management_type_id = self.get_cost_management_application_type_id()
 
@@ -321,10 +345,11 @@ class SourcesHTTPClient:
             application_id = response_data.get("id")
             application_url = f"{self._base_url}/{ENDPOINT_APPLICATIONS}/{application_id}"
 
-            json_data = self.build_source_status(error_msg)
             if storage.save_status(self._source_id, json_data):
                 LOG.info(f"[set_source_status] source_id: {self._source_id}: {json_data}")
-                application_response = requests.patch(application_url, json=json_data, headers=self._identity_header)
+                application_response = get_session().patch(
+                    application_url, json=json_data, headers=self._identity_header
+                )
                 error_message = (
                     f"[set_source_status] error: Status code: "
                     f"{application_response.status_code}. Response: {application_response.text}."
@@ -445,6 +445,12 @@ def save_status(source_id, status):
     return False
 
 
+def source_status_changed(source_id, status):
+    """Check if status differs from the last saved status, treating an unknown source as changed."""
+    source = get_source(source_id, f"[source_status_changed] source_id: {source_id} does not exist.", LOG.debug)
+    return not source or source.status != status
+
+
 def is_known_source(source_id):
     """Check if source exists in database."""
     LOG.debug(f"[is_known_source] checking if source_id: {source_id} is known.")
@@ -4,9 +4,12 @@
 #
 """Tasks for sources-client."""
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
 
 from api.provider.models import Sources
 from api.provider.provider_manager import ProviderProcessingError
@@ -14,6 +17,7 @@ from koku import celery_app
 from masu.processor.tasks import PRIORITY_QUEUE
 from masu.processor.tasks import REMOVE_EXPIRED_DATA_QUEUE
 from sources.api.source_status import SourceStatus
+from sources.config import Config
 from sources.sources_provider_coordinator import SourcesProviderCoordinator
 from sources.storage import load_providers_to_delete
 from sources.storage import mark_provider_as_inactive
@@ -47,14 +51,49 @@ def delete_source_beat():
         delete_source.delay(provider.source_id, provider.auth_header, provider.koku_uuid)
 
 
+def _push_source_status(source_id):
+    """Push the status of a single source."""
+    try:
+        status_pusher = SourceStatus(source_id)
+        LOG.info("Delivering source status for Source ID: %s", source_id)
+        status_pusher.push_status()
+    except ObjectDoesNotExist:
+        LOG.info(f"Source status not pushed.  Unable to find Source ID: {source_id}")
+
+
+def _push_source_status_in_thread(source_id):
+    """Push the status of a single source on this worker thread's own database connection."""
+    try:
+        _push_source_status(source_id)
+    finally:
+        # Each worker thread holds its own database connection
+        connection.close()
+
+
 @celery_app.task(name="sources.tasks.source_status_beat", queue=PRIORITY_QUEUE)
 def source_status_beat():
-    """Source Status push."""
-    sources_query = Sources.objects.filter(source_id__isnull=False).all()
-    for source in sources_query:
-        try:
-            status_pusher = SourceStatus(source.source_id)
-            LOG.info("Delivering source status for Source ID: %s", source.source_id)
-            status_pusher.push_status()
-        except ObjectDoesNotExist:
-            LOG.info(f"Source status not pushed.  Unable to find Source ID: {source.source_id}")
+    """Source Status push.
+
+    Sources are checked on up to Config.SOURCE_STATUS_MAX_WORKERS threads. They are
+    checked serially on the current connection when it is inside a transaction, because
+    the other connections could not see its uncommitted rows.
+    """
+    source_ids = list(Sources.objects.filter(source_id__isnull=False).values_list("source_id", flat=True))
+    max_workers = min(Config.SOURCE_STATUS_MAX_WORKERS, len(source_ids))
+    if max_workers <= 1 or connection.in_atomic_block:
+        for source_id in source_ids:
+            _push_source_status(source_id)
+        return
+
+    t1 = time.time()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="source-status") as executor:
+        futures = [executor.submit(_push_source_status_in_thread, source_id) for source_id in source_ids]
+    errors = [future.exception() for future in futures if future.exception()]
+    LOG.info(
+        "Delivered source status for %d sources with %d threads in %f seconds.",
+        len(source_ids),
+        max_workers,
+        time.time() - t1,
+    )
+    if errors:
+        raise errors[0]
@@ -609,3 +609,54 @@ class SourcesStatusTest(IamTestCase):
                 status_obj.status()
                 expected = f"INFO:sources.api.source_status:No provider found for Source ID: {source_id}"
                 self.assertIn(expected, logger.output)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "source-status"}}
+    )
+    def test_status_reuses_healthy_result(self):
+        """Test that a healthy check is reused until the source configuration changes."""
+        source_id = 1
+        source = Sources.objects.create(
+            source_id=source_id,
+            name="New AWS Mock Test Source",
+            source_type=Provider.PROVIDER_AWS,
+            authentication={"credentials": {"role_arn": "fake-iam"}},
+            billing_source={"data_source": {"bucket": "my-bucket"}},
+            offset=1,
+        )
+
+        with patch.object(ProviderAccessor, "cost_usage_source_ready", returns=True) as mock_ready:
+            self.assertIsNone(SourceStatus(source_id).status(use_cache=True))
+            self.assertIsNone(SourceStatus(source_id).status(use_cache=True))
+            self.assertEqual(mock_ready.call_count, 1)
+
+            # An uncached check always goes to the cloud
+            SourceStatus(source_id).status()
+            self.assertEqual(mock_ready.call_count, 2)
+
+            source.billing_source = {"data_source": {"bucket": "my-other-bucket"}}
+            source.save()
+            SourceStatus(source_id).status(use_cache=True)
+            self.assertEqual(mock_ready.call_count, 3)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "source-status"}}
+    )
+    def test_status_does_not_reuse_unhealthy_result(self):
+        """Test that a failed check is repeated on the next status check."""
+        source_id = 1
+        Sources.objects.create(
+            source_id=source_id,
+            name="New AWS Mock Test Source",
+            source_type=Provider.PROVIDER_AWS,
+            authentication={"credentials": {"role_arn": "fake-iam"}},
+            billing_source={"data_source": {"bucket": "my-bucket"}},
+            offset=1,
+        )
+
+        with patch.object(
+            ProviderAccessor, "cost_usage_source_ready", side_effect=ValidationError("test error")
+        ) as mock_ready:
+            for _ in range(2):
+                self.assertIsNotNone(SourceStatus(source_id).status(use_cache=True))
+            self.assertEqual(mock_ready.call_count, 2)
@@ -888,6 +888,62 @@ class SourcesKafkaMsgHandlerTest(IamTestCase):
             priority, _ = test_queue.get_nowait()
             self.assertEqual(priority, i)
 
+    def test_execute_process_queue_routes_to_lanes(self):
+        """Test that provider operations are hashed onto lanes by source_id, in order."""
+        lanes = [queue.PriorityQueue(), queue.PriorityQueue()]
+        msgs = [
+            (0, {"operation": "create", "provider": Sources(source_id=1)}),
+            (1, {"operation": "create", "provider": Sources(source_id=2)}),
+            (2, {"operation": "update", "provider": Sources(source_id=1)}),
+        ]
+        for msg_tuple in msgs:
+            PROCESS_QUEUE.put_nowait(msg_tuple)
+
+        with patch("sources.kafka_listener.PROCESS_LANES", lanes), patch(
+            "sources.kafka_listener.connection"
+        ) as mock_connection, patch("sources.kafka_listener.process_synchronize_sources_msg") as mock_process:
+            mock_connection.in_atomic_block = False
+            source_integration.execute_process_queue()
+            mock_process.assert_not_called()
+
+        self.assertTrue(PROCESS_QUEUE.empty())
+        self.assertEqual([lanes[1].get_nowait(), lanes[1].get_nowait()], [msgs[0], msgs[2]])
+        self.assertEqual(lanes[0].get_nowait(), msgs[1])
+
+    def test_execute_process_queue_does_not_block_on_drained_queue(self):
+        """Test that a queue drained by another thread ends the loop instead of blocking."""
+        with patch("sources.kafka_listener.PROCESS_QUEUE") as mock_queue:
+            mock_queue.empty.return_value = False
+            mock_queue.get_nowait.side_effect = queue.Empty
+            source_integration.execute_process_queue()
+            mock_queue.get.assert_not_called()
+
+    def test_execute_process_queue_lanes_wait_for_commit(self):
+        """Test that operations queued inside a transaction are not handed to the lanes."""
+        lanes = [queue.PriorityQueue()]
+        msg_tuple = (0, {"operation": "create", "provider": Sources(source_id=1)})
+        PROCESS_QUEUE.put_nowait(msg_tuple)
+
+        with patch("sources.kafka_listener.PROCESS_LANES", lanes):
+            source_integration.execute_process_queue()
+
+        self.assertTrue(lanes[0].empty())
+        self.assertEqual(PROCESS_QUEUE.get_nowait(), msg_tuple)
+
+    @patch("sources.kafka_listener.process_synchronize_sources_msg")
+    def test_process_lane_msg(self, mock_process):
+        """Test that a lane processes its next operation and re-queues onto itself."""
+        lane_queue = queue.PriorityQueue()
+        first = (0, {"operation": "create", "provider": Sources(source_id=1)})
+        second = (1, {"operation": "update", "provider": Sources(source_id=1)})
+        lane_queue.put_nowait(second)
+        lane_queue.put_nowait(first)
+
+        source_integration._process_lane_msg(0, lane_queue)
+
+        mock_process.assert_called_once_with(first, lane_queue)
+        self.assertEqual(lane_queue.get_nowait(), second)
+
     # @patch("sources.kafka_listener.execute_koku_provider_op")
     # def test_process_synchronize_sources_msg(self, mock_process_message):
     #     """Test processing synchronize messages."""
@@ -673,6 +673,18 @@ class SourcesHTTPClientTest(TestCase):
             response = client.set_source_status(error_msg, application_type_id)
             self.assertFalse(response)
 
+    @patch("sources.storage.is_known_source", return_value=True)
+    @patch("sources.storage.clear_update_flag")
+    @patch("sources.storage.source_status_changed", return_value=False)
+    def test_set_source_status_unchanged(self, *args):
+        """Test that an unchanged status is not sent to the Sources API."""
+        test_source_id = 1
+        client = SourcesHTTPClient(auth_header=Config.SOURCES_FAKE_HEADER, source_id=test_source_id)
+        with requests_mock.mock() as m:
+            response = client.set_source_status("my error")
+            self.assertFalse(response)
+            self.assertFalse(m.called)
+
     @patch("sources.storage.is_known_source", return_value=True)
     @patch("sources.storage.clear_update_flag")
     @patch("sources.storage.save_status", return_value=True)
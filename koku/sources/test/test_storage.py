@@ -682,3 +682,24 @@ class SourcesStorageTest(TestCase):
         db_obj = Sources.objects.get(source_id=test_source_id)
         self.assertEqual(db_obj.status, mock_status)
         self.assertFalse(return_code)
+
+    def test_source_status_changed(self):
+        """Test that a status is only reported as changed when it differs from the saved one."""
+        test_source_id = 3
+        mock_status = {"availability_status": "available", "availability_status_error": ""}
+        self.assertTrue(storage.source_status_changed(test_source_id, mock_status))
+
+        Sources(
+            source_id=test_source_id,
+            auth_header=self.test_header,
+            offset=3,
+            source_type=Provider.PROVIDER_AZURE,
+            name="Test AZURE Source",
+            status=mock_status,
+        ).save()
+        self.assertFalse(storage.source_status_changed(test_source_id, mock_status))
+        self.assertTrue(
+            storage.source_status_changed(
+                test_source_id, {"availability_status": "unavailable", "availability_status_error": "error"}
+            )
+        )
@@ -120,3 +120,30 @@ class SourcesTasksTest(TestCase):
         with patch.object(SourceStatus, "push_status") as mock_push:
             source_status_beat()
             mock_push.assert_not_called()
+
+    @patch("sources.tasks.connection")
+    @patch("sources.tasks._push_source_status")
+    def test_execute_source_status_beat_concurrent(self, mock_push, mock_connection):
+        """Test that the beat checks sources concurrently on their own connections."""
+        mock_connection.in_atomic_block = False
+        for source in (self.aws_source, self.aws_local_source):
+            Sources(**source).save()
+        source_ids = [self.aws_source.get("source_id"), self.aws_local_source.get("source_id")]
+
+        source_status_beat()
+
+        self.assertEqual(sorted(call.args[0] for call in mock_push.call_args_list), source_ids)
+        self.assertEqual(mock_connection.close.call_count, len(source_ids))
+
+    @patch("sources.tasks.connection")
+    @patch("sources.tasks._push_source_status")
+    def test_execute_source_status_beat_concurrent_error(self, mock_push, mock_connection):
+        """Test that an error from one source is raised after every source has been checked."""
+        mock_connection.in_atomic_block = False
+        mock_push.side_effect = [ValueError("bad"), None]
+        for source in (self.aws_source, self.aws_local_source):
+            Sources(**source).save()
+
+        with self.assertRaises(ValueError):
+            source_status_beat()
+        self.assertEqual(mock_push.call_count, 2)